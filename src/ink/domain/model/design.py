@@ -242,6 +242,34 @@ class Design:
         """
         return list(self._cells.values())
 
+    def remove_cell(self, cell_id: CellId) -> Cell | None:
+        """Remove a cell and its pins from the design.
+
+        Used for incremental edits (ECO reloads, collapsing expanded
+        hierarchy). Nets are left in place; callers that also change net
+        membership should follow up with replace_net().
+
+        Args:
+            cell_id: The cell to remove.
+
+        Returns:
+            The removed Cell entity, or None if no such cell existed.
+
+        Example:
+            >>> design.remove_cell(CellId("XI1"))
+            Cell(...)
+            >>> design.get_cell(CellId("XI1")) is None
+            True
+        """
+        cell = self._cells.pop(cell_id, None)
+        if cell is None:
+            return None
+
+        del self._cell_name_index[cell.name]
+        for pin_id in cell.pin_ids:
+            self._pins.pop(pin_id, None)
+        return cell
+
     def cell_count(self) -> int:
         """Get total number of cells in the design.
 
@@ -365,6 +393,32 @@ class Design:
         self._nets[net.id] = net
         self._net_name_index[net.name] = net.id
 
+    def replace_net(self, net: Net) -> None:
+        """Replace an existing net with an updated version.
+
+        Nets are immutable, so connectivity edits (pins joining or leaving
+        a net) are applied by swapping in a new Net with the same ID.
+
+        Args:
+            net: The updated Net entity. Its ID must already exist and its
+                 name must not collide with a different net.
+
+        Raises:
+            KeyError: If no net with net.id exists.
+            ValueError: If net.name is already used by a different net.
+        """
+        old = self._nets.get(net.id)
+        if old is None:
+            raise KeyError(f"Net {net.id} not found in design")
+
+        existing_id = self._net_name_index.get(net.name)
+        if existing_id is not None and existing_id != net.id:
+            raise ValueError(f"Net with name {net.name} already exists")
+
+        del self._net_name_index[old.name]
+        self._nets[net.id] = net
+        self._net_name_index[net.name] = net.id
+
     def get_net(self, net_id: NetId) -> Net | None:
         """Get net by ID with O(1) lookup.
 
@@ -435,6 +489,27 @@ class Design:
 
         self._pins[pin.id] = pin
 
+    def replace_pin(self, pin: Pin) -> None:
+        """Replace an existing pin with an updated version.
+
+        Pins are immutable, so reconnecting a pin to a different net (or
+        changing its direction) is done by swapping in a new Pin with the
+        same ID.
+
+        Args:
+            pin: The updated Pin entity. pin.id must already exist.
+
+        Raises:
+            KeyError: If no pin with pin.id exists.
+
+        Example:
+            >>> design.replace_pin(Pin(PinId("XI1.A"), "A", PinDirection.INPUT, NetId("n2")))
+        """
+        if pin.id not in self._pins:
+            raise KeyError(f"Pin {pin.id} not found in design")
+
+        self._pins[pin.id] = pin
+
     def get_pin(self, pin_id: PinId) -> Pin | None:
         """Get pin by ID with O(1) lookup.
 
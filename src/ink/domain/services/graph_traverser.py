@@ -13,6 +13,7 @@ The protocol defines operations needed by application services:
 - Connectivity queries: cells on a net, pins of a cell, net of a pin
 - Fanin/fanout traversal: with configurable hop count and sequential boundaries
 - Path finding: shortest path between cells
+- Cut points: cells every fanin path into a cell converges through
 
 All methods return domain entities (Cell, Pin, Net), not raw graph nodes,
 maintaining clean separation between domain and infrastructure layers.
@@ -72,6 +73,7 @@ class GraphTraverser(Protocol):
         get_fanout_from_pin: Get fanout from a specific pin
         get_fanin_to_pin: Get fanin to a specific pin
         find_path: Find shortest path between cells
+        get_fanin_cut_points: Get the convergence points of a cell's fanin
 
     Example:
         >>> class MockTraverser:
@@ -302,3 +304,32 @@ class GraphTraverser(Protocol):
             ...     print(" -> ".join(cell.name for cell in path))
         """
         ...
+
+    def get_fanin_cut_points(
+        self,
+        cell_id: CellId,
+        stop_at_sequential: bool = True,
+    ) -> list[Cell]:
+        """Get the cells that every fanin path into a cell passes through.
+
+        Considers the full transitive fanin cone of the cell: a cut point is
+        a cell that lies on every signal path from every input of the cone
+        (a cell with no further fanin, or a sequential boundary) to the
+        cell. These are the convergence points worth highlighting when
+        exploring a flop's fanin, found without enumerating paths.
+
+        Args:
+            cell_id: Sink cell whose fanin is analyzed (not included).
+            stop_at_sequential: If True, sequential cells in the fanin are
+                cone inputs and their own fanin is not considered.
+
+        Returns:
+            Cut point cells ordered from the sink outward. Empty list if the
+            cell doesn't exist, has no fanin, or its paths don't converge.
+
+        Example:
+            >>> cut_points = traverser.get_fanin_cut_points(CellId("XFF2"))
+            >>> [cell.name for cell in cut_points]
+            ['XMUX1', 'XAND3']
+        """
+        ...
@@ -1,13 +1,14 @@
-"""Net classification configuration for power/ground net names.
+"""Net classification configuration for power/ground/clock net names.
 
 This module provides the NetClassificationConfig dataclass for managing
-per-project power and ground net classification settings. Configuration
+per-project power, ground and clock net classification settings. Configuration
 is stored in YAML format at {project_root}/.ink/net_classification.yaml.
 
 The configuration allows users to:
     1. Define exact net names for power/ground classification
     2. Add custom regex patterns for matching power/ground nets
-    3. Optionally override default patterns (VDD*, VSS*, etc.)
+    3. Name the clock root nets that clock tracing starts from
+    4. Optionally override default patterns (VDD*, VSS*, CLK*, etc.)
 
 Configuration File Format:
     The YAML file follows this structure:
@@ -28,6 +29,12 @@ Configuration File Format:
       patterns:
         - "^GND_.*$"
 
+    clock_nets:
+      names:
+        - PLL_OUT
+      patterns:
+        - "^SCLK[0-9]*$"
+
     override_defaults: false
     ```
 
@@ -40,6 +47,7 @@ Design Decisions:
 See Also:
     - Spec E01-F01-T06 for requirements
     - NetNormalizer for using this configuration
+    - ClockDomainIndex for clock root tracing
 """
 
 from __future__ import annotations
@@ -84,7 +92,11 @@ class NetClassificationConfig:
             Example: ["AVSS", "DVSS", "VSS_CORE"]
         ground_patterns: Regex patterns for ground nets.
             Example: ["^VSSQ[0-9]*$", "^GND_.*$"]
-        override_defaults: If True, ignore default VDD/VSS patterns from
+        clock_names: Exact clock root net names (case-insensitive matching).
+            Example: ["PLL_OUT", "REFCLK"]
+        clock_patterns: Regex patterns for clock root nets.
+            Example: ["^SCLK[0-9]*$"]
+        override_defaults: If True, ignore default VDD/VSS/CLK patterns from
             NetNormalizer and only use custom names/patterns.
 
     Example:
@@ -106,6 +118,8 @@ class NetClassificationConfig:
     power_patterns: list[str] = field(default_factory=list)
     ground_names: list[str] = field(default_factory=list)
     ground_patterns: list[str] = field(default_factory=list)
+    clock_names: list[str] = field(default_factory=list)
+    clock_patterns: list[str] = field(default_factory=list)
     override_defaults: bool = False
 
     @classmethod
@@ -159,11 +173,19 @@ class NetClassificationConfig:
         if not isinstance(ground_nets, dict):
             ground_nets = {}
 
+        # clock_nets was added after version 1 files were written; older
+        # files simply have no clock section
+        clock_nets = data.get("clock_nets", {})
+        if not isinstance(clock_nets, dict):
+            clock_nets = {}
+
         return cls(
             power_names=power_nets.get("names", []) or [],
             power_patterns=power_nets.get("patterns", []) or [],
             ground_names=ground_nets.get("names", []) or [],
             ground_patterns=ground_nets.get("patterns", []) or [],
+            clock_names=clock_nets.get("names", []) or [],
+            clock_patterns=clock_nets.get("patterns", []) or [],
             override_defaults=bool(data.get("override_defaults", False)),
         )
 
@@ -177,6 +199,7 @@ class NetClassificationConfig:
         - A version field for future migration support
         - Power nets (names and patterns)
         - Ground nets (names and patterns)
+        - Clock nets (names and patterns)
         - Override defaults flag
 
         Args:
@@ -207,6 +230,10 @@ class NetClassificationConfig:
                 "names": self.ground_names,
                 "patterns": self.ground_patterns,
             },
+            "clock_nets": {
+                "names": self.clock_names,
+                "patterns": self.clock_patterns,
+            },
             "override_defaults": self.override_defaults,
         }
 
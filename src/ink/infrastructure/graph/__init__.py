@@ -6,6 +6,13 @@ and manipulating NetworkX graphs from the domain model entities.
 Classes:
     NetworkXGraphBuilder: Builds NetworkX MultiDiGraph from Design aggregate
     NetworkXGraphTraverser: Implements GraphTraverser protocol for queries
+    CellAdjacency: Compact CSR cell-to-cell signal flow graph
+    CellProjection: Cell-to-cell edges labeled with driving pin and net
+    SequentialReachabilityIndex: Precomputed register-to-register reachability
+    CombinationalLoopIndex: Combinational loops (SCCs excluding sequential cells)
+    ClockDomainIndex: Clock root per sequential cell, grouped by domain
+    IndexBundle: Memory-mapped file of persisted indexes for instant reopen
+    GraphStatistics: Counts, fanout distributions and hot spots of a built graph
 
 Example:
     >>> from ink.infrastructure.graph import NetworkXGraphBuilder, NetworkXGraphTraverser
@@ -21,10 +28,64 @@ Example:
     >>> fanout = traverser.get_fanout_cells(CellId("XI1"), hops=2)
 """
 
+from ink.infrastructure.graph.caching_traverser import CacheStats, CachingGraphTraverser
+from ink.infrastructure.graph.cell_adjacency import CellAdjacency
+from ink.infrastructure.graph.cell_projection import CellEdge, CellProjection
+from ink.infrastructure.graph.clock_domains import ClockDomainIndex
+from ink.infrastructure.graph.combinational_loops import CombinationalLoopIndex
+from ink.infrastructure.graph.cone import CellCone, ConeSizeEstimator
+from ink.infrastructure.graph.dominators import DominatorTree
+from ink.infrastructure.graph.graph_delta import GraphDelta
+from ink.infrastructure.graph.graph_statistics import GraphStatistics
+from ink.infrastructure.graph.index_bundle import (
+    IndexBundle,
+    default_bundle_path,
+    netlist_digest,
+    register_section,
+)
+from ink.infrastructure.graph.levelization import LevelIndex
 from ink.infrastructure.graph.networkx_adapter import NetworkXGraphBuilder
 from ink.infrastructure.graph.networkx_traverser import NetworkXGraphTraverser
+from ink.infrastructure.graph.parallel_analytics import (
+    CsrView,
+    ParallelAnalyticsRunner,
+    SharedCsr,
+    fanin_cone_sizes,
+    fanout_cone_sizes,
+)
+from ink.infrastructure.graph.path_search import PathLimits, PathSearch
+from ink.infrastructure.graph.pin_table import PinTable
+from ink.infrastructure.graph.sequential_reachability import (
+    SequentialReachabilityIndex,
+)
 
 __all__ = [
+    "CacheStats",
+    "CachingGraphTraverser",
+    "CellAdjacency",
+    "CellCone",
+    "CellEdge",
+    "CellProjection",
+    "ClockDomainIndex",
+    "CombinationalLoopIndex",
+    "ConeSizeEstimator",
+    "CsrView",
+    "DominatorTree",
+    "GraphDelta",
+    "GraphStatistics",
+    "IndexBundle",
+    "LevelIndex",
     "NetworkXGraphBuilder",
     "NetworkXGraphTraverser",
+    "ParallelAnalyticsRunner",
+    "PathLimits",
+    "PathSearch",
+    "PinTable",
+    "SequentialReachabilityIndex",
+    "SharedCsr",
+    "default_bundle_path",
+    "fanin_cone_sizes",
+    "fanout_cone_sizes",
+    "netlist_digest",
+    "register_section",
 ]
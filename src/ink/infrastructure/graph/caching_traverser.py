@@ -0,0 +1,301 @@
+"""LRU result cache layered over any GraphTraverser.
+
+This module provides CachingGraphTraverser, a GraphTraverser that forwards
+queries to another traverser and memoizes the results. Interactive
+exploration repeats the same queries constantly (expand, collapse,
+re-expand), so most of them can be answered without touching the graph.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Decorator (implements GraphTraverser, wraps a GraphTraverser)
+    Bounded Context: Netlist Context
+
+Cache Semantics:
+    - Key: (query name, arguments); every method of the protocol is cached
+    - Bound: total cached result size, counted as the number of entities in
+      each result (at least 1 per entry), evicted least recently used first
+    - Invalidation: a version callable is checked on every query; when its
+      value changes the whole cache is dropped. NetworkXGraphBuilder bumps
+      graph.graph["version"] on every build and apply_delta(), which
+      over_networkx() uses as the version source.
+    - Results are stored as tuples and returned as fresh lists, so callers
+      may mutate what they get back without corrupting the cache.
+
+Example:
+    >>> traverser = CachingGraphTraverser.over_networkx(
+    ...     NetworkXGraphTraverser(graph, design)
+    ... )
+    >>> traverser.get_fanout_cells(CellId("XI1"), hops=2)
+    >>> traverser.get_fanout_cells(CellId("XI1"), hops=2)  # served from cache
+    >>> traverser.stats().hits
+    1
+
+See Also:
+    - GraphTraverser: The protocol implemented and wrapped
+    - NetworkXGraphBuilder.apply_delta: Bumps the graph version
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from ink.domain.model import Cell, Net, Pin
+    from ink.domain.services.graph_traverser import GraphTraverser
+    from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+    from ink.infrastructure.graph.networkx_traverser import NetworkXGraphTraverser
+
+_T = TypeVar("_T")
+
+# (query name, arguments)
+_Key = tuple[str, tuple[object, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Snapshot of cache counters.
+
+    Attributes:
+        hits: Queries answered from the cache
+        misses: Queries forwarded to the wrapped traverser
+        evictions: Entries dropped to respect the size bound
+        invalidations: Times the cache was cleared by a version change
+        entries: Entries currently cached
+        cached_size: Total size of the cached results
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    cached_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of queries served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachingGraphTraverser:
+    """GraphTraverser decorator with a size-bounded, version-checked LRU cache.
+
+    Attributes:
+        traverser: The wrapped traverser answering cache misses
+        max_cached_size: Upper bound on the total size of cached results
+
+    Example:
+        >>> cached = CachingGraphTraverser(inner, version=lambda: graph.graph["version"])
+        >>> cells = cached.get_connected_cells(NetId("net_1"))
+    """
+
+    def __init__(
+        self,
+        traverser: GraphTraverser,
+        version: Callable[[], Hashable],
+        max_cached_size: int = 200_000,
+    ) -> None:
+        """Initialize the cache around a traverser.
+
+        Args:
+            traverser: Traverser to forward cache misses to.
+            version: Returns the current graph version; a change in its
+                value invalidates every cached result.
+            max_cached_size: Total result size (entities) to keep cached.
+                Results larger than this are returned but not cached.
+        """
+        self.traverser = traverser
+        self.max_cached_size = max_cached_size
+        self._version = version
+        self._seen_version = version()
+
+        # key -> (result, size); OrderedDict order is recency of use
+        self._entries: OrderedDict[_Key, tuple[object, int]] = OrderedDict()
+        self._cached_size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @classmethod
+    def over_networkx(
+        cls,
+        traverser: NetworkXGraphTraverser,
+        max_cached_size: int = 200_000,
+    ) -> CachingGraphTraverser:
+        """Wrap a NetworkX traverser, versioned by graph.graph["version"].
+
+        Args:
+            traverser: The NetworkX traverser to wrap.
+            max_cached_size: Total result size (entities) to keep cached.
+
+        Returns:
+            A caching traverser invalidated by every build or delta of the graph.
+        """
+        graph = traverser.graph
+        return cls(traverser, lambda: graph.graph.get("version"), max_cached_size)
+
+    # =========================================================================
+    # Cache Management
+    # =========================================================================
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+            cached_size=self._cached_size,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached result (counters are kept)."""
+        self._entries.clear()
+        self._cached_size = 0
+
+    def _lookup(self, key: _Key, compute: Callable[[], _T]) -> _T:
+        """Return a cached result or compute, store and return it.
+
+        Tuple results are sized by their length, anything else counts as 1.
+
+        Args:
+            key: Cache key.
+            compute: Produces the result on a miss.
+        """
+        current = self._version()
+        if current != self._seen_version:
+            self._seen_version = current
+            self._invalidations += 1
+            self.clear()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cast("_T", entry[0])
+
+        self._misses += 1
+        result = compute()
+        size = max(len(result), 1) if isinstance(result, tuple) else 1
+        if size > self.max_cached_size:
+            return result
+
+        self._entries[key] = (result, size)
+        self._cached_size += size
+        while self._cached_size > self.max_cached_size:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._cached_size -= evicted
+            self._evictions += 1
+        return result
+
+    def _cached_list(
+        self, query: str, args: tuple[object, ...], compute: Callable[[], list[_T]]
+    ) -> list[_T]:
+        """Cache a list-valued query as a tuple and return a fresh list."""
+        return list(self._lookup((query, args), lambda: tuple(compute())))
+
+    # =========================================================================
+    # GraphTraverser Protocol
+    # =========================================================================
+
+    def get_connected_cells(self, net_id: NetId) -> list[Cell]:
+        """Get all cells connected to a net (cached)."""
+        return self._cached_list(
+            "connected_cells", (net_id,), lambda: self.traverser.get_connected_cells(net_id)
+        )
+
+    def get_cell_pins(self, cell_id: CellId) -> list[Pin]:
+        """Get all pins of a cell (cached)."""
+        return self._cached_list(
+            "cell_pins", (cell_id,), lambda: self.traverser.get_cell_pins(cell_id)
+        )
+
+    def get_pin_net(self, pin_id: PinId) -> Net | None:
+        """Get the net connected to a pin (cached)."""
+        return self._lookup(("pin_net", (pin_id,)), lambda: self.traverser.get_pin_net(pin_id))
+
+    def get_fanout_cells(
+        self,
+        cell_id: CellId,
+        hops: int = 1,
+        stop_at_sequential: bool = False,
+    ) -> list[Cell]:
+        """Get fanout cells from a cell (cached)."""
+        return self._cached_list(
+            "fanout_cells",
+            (cell_id, hops, stop_at_sequential),
+            lambda: self.traverser.get_fanout_cells(cell_id, hops, stop_at_sequential),
+        )
+
+    def get_fanin_cells(
+        self,
+        cell_id: CellId,
+        hops: int = 1,
+        stop_at_sequential: bool = False,
+    ) -> list[Cell]:
+        """Get fanin cells to a cell (cached)."""
+        return self._cached_list(
+            "fanin_cells",
+            (cell_id, hops, stop_at_sequential),
+            lambda: self.traverser.get_fanin_cells(cell_id, hops, stop_at_sequential),
+        )
+
+    def get_fanout_from_pin(
+        self,
+        pin_id: PinId,
+        hops: int = 1,
+        stop_at_sequential: bool = False,
+    ) -> list[Cell]:
+        """Get fanout cells from a pin (cached)."""
+        return self._cached_list(
+            "fanout_from_pin",
+            (pin_id, hops, stop_at_sequential),
+            lambda: self.traverser.get_fanout_from_pin(pin_id, hops, stop_at_sequential),
+        )
+
+    def get_fanin_to_pin(
+        self,
+        pin_id: PinId,
+        hops: int = 1,
+        stop_at_sequential: bool = False,
+    ) -> list[Cell]:
+        """Get fanin cells to a pin (cached)."""
+        return self._cached_list(
+            "fanin_to_pin",
+            (pin_id, hops, stop_at_sequential),
+            lambda: self.traverser.get_fanin_to_pin(pin_id, hops, stop_at_sequential),
+        )
+
+    def find_path(
+        self,
+        from_cell_id: CellId,
+        to_cell_id: CellId,
+        max_hops: int = 10,
+    ) -> list[Cell] | None:
+        """Find the shortest path between two cells (cached)."""
+
+        def compute() -> tuple[Cell, ...] | None:
+            path = self.traverser.find_path(from_cell_id, to_cell_id, max_hops)
+            return None if path is None else tuple(path)
+
+        path = self._lookup(("find_path", (from_cell_id, to_cell_id, max_hops)), compute)
+        return None if path is None else list(path)
+
+    def get_fanin_cut_points(
+        self,
+        cell_id: CellId,
+        stop_at_sequential: bool = True,
+    ) -> list[Cell]:
+        """Get the convergence points of a cell's fanin (cached)."""
+        return self._cached_list(
+            "fanin_cut_points",
+            (cell_id, stop_at_sequential),
+            lambda: self.traverser.get_fanin_cut_points(cell_id, stop_at_sequential),
+        )
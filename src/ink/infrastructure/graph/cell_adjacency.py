@@ -0,0 +1,283 @@
+"""Compact cell-to-cell adjacency derived from the Design aggregate.
+
+This module provides the CellAdjacency class, a read-only, integer-indexed
+view of cell-level signal flow. Where the NetworkX graph models every pin and
+net as its own node, CellAdjacency collapses each "cell → pin → net → pin →
+cell" hop into a single edge stored in CSR (compressed sparse row) form.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Derived index (built once, queried many times)
+    Bounded Context: Netlist Context
+
+Data Layout:
+    - Cells are numbered 0..N-1 in Design insertion order
+    - ``fanout_offsets[i]:fanout_offsets[i + 1]`` slices ``fanout_targets``
+      to give the cells driven by cell i (driver → sink)
+    - ``fanin_offsets``/``fanin_targets`` hold the transposed edges
+    - ``sequential[i]`` is 1 for flip-flops/latches, 0 otherwise
+
+    All arrays are ``array.array`` buffers, so they are compact (4-8 bytes
+    per entry instead of a Python object per entry), picklable for worker
+    processes, and can be written to disk with to_bytes().
+
+Edge Semantics:
+    An edge i → j exists when an output (or inout) pin of cell i and an
+    input (or inout) pin of cell j share a net. Parallel edges (several nets
+    between the same pair of cells) are merged. Self-edges are kept: a cell
+    whose output feeds its own input is a genuine one-cell loop. Ports and
+    floating pins do not contribute edges.
+
+Example:
+    >>> adjacency = CellAdjacency.from_design(design)
+    >>> i = adjacency.index_of(CellId("XI1"))
+    >>> [adjacency.cell_ids[j] for j in adjacency.fanout(i)]
+    ['XI2']
+
+See Also:
+    - SequentialReachabilityIndex: Register-to-register reachability
+    - NetworkXGraphTraverser: Entity-level traversal queries
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph.csr import (
+    OFFSET_TYPECODE,
+    TARGET_TYPECODE,
+    IntArray,
+    NameTable,
+    pack_csr,
+    row,
+    to_le_bytes,
+    transpose_csr,
+    view_le,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ink.domain.model import Design
+    from ink.domain.value_objects.identifiers import NetId
+
+# Binary format header: magic, version, cell count, edge count
+_MAGIC = b"INKADJ"
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<6sHqq")
+
+
+class CellAdjacency:
+    """Integer-indexed, CSR-encoded cell-to-cell signal flow graph.
+
+    Instances are immutable after construction. Use from_design() to build
+    one from a Design aggregate; the constructor accepts pre-built arrays so
+    that indexes can be restored from disk without re-walking the design.
+
+    Attributes:
+        cell_ids: Cell IDs in index order (index → CellId)
+        sequential: One byte per cell, 1 if the cell is sequential
+        fanout_offsets: CSR row offsets for driver → sink edges (len N + 1)
+        fanout_targets: CSR column indices for driver → sink edges
+        fanin_offsets: CSR row offsets for sink → driver edges (len N + 1)
+        fanin_targets: CSR column indices for sink → driver edges
+
+    Example:
+        >>> adjacency = CellAdjacency.from_design(design)
+        >>> adjacency.cell_count()
+        3
+        >>> adjacency.edge_count()
+        2
+    """
+
+    def __init__(
+        self,
+        cell_ids: Sequence[CellId],
+        sequential: bytes | IntArray,
+        fanout: tuple[IntArray, IntArray],
+        fanin: tuple[IntArray, IntArray] | None = None,
+    ) -> None:
+        """Initialize from pre-built CSR arrays.
+
+        Args:
+            cell_ids: Cell IDs in index order.
+            sequential: One byte per cell (1 = sequential).
+            fanout: (offsets, targets) CSR pair for driver → sink edges.
+            fanin: (offsets, targets) CSR pair for sink → driver edges.
+                Derived by transposing fanout when omitted.
+        """
+        self.cell_ids = cell_ids
+        self.sequential = sequential
+        self.fanout_offsets, self.fanout_targets = fanout
+        if fanin is None:
+            fanin = transpose_csr(len(cell_ids), *fanout)
+        self.fanin_offsets, self.fanin_targets = fanin
+
+        # Reverse lookup CellId → index, built on first index_of()
+        self._index: dict[CellId, int] | None = None
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def from_design(cls, design: Design) -> CellAdjacency:
+        """Build the adjacency from a Design aggregate in one pass.
+
+        Algorithm:
+            1. Number cells and record which cell owns each pin
+            2. Group pin owners by net into drivers and sinks
+            3. Emit driver → sink edges per net, deduplicated per driver
+            4. Pack successor lists into CSR and transpose for fanin
+
+        Args:
+            design: The Design aggregate to index.
+
+        Returns:
+            A new CellAdjacency covering every cell in the design.
+
+        Time Complexity:
+            O(P + E) where P = pins, E = emitted cell-to-cell edges
+        """
+        cells = design.get_all_cells()
+        cell_ids = tuple(cell.id for cell in cells)
+        sequential = bytes(1 if cell.is_sequential else 0 for cell in cells)
+
+        # Net → owning cell indices, split by pin direction
+        drivers: dict[NetId, list[int]] = {}
+        sinks: dict[NetId, list[int]] = {}
+
+        for index, cell in enumerate(cells):
+            for pin_id in cell.pin_ids:
+                pin = design.get_pin(pin_id)
+                if pin is None or pin.net_id is None:
+                    continue
+                if pin.direction.is_output():
+                    drivers.setdefault(pin.net_id, []).append(index)
+                if pin.direction.is_input():
+                    sinks.setdefault(pin.net_id, []).append(index)
+
+        # Successor sets per driver cell; sets merge parallel edges
+        successors: list[set[int]] = [set() for _ in cells]
+        for net_id, net_drivers in drivers.items():
+            net_sinks = sinks.get(net_id)
+            if not net_sinks:
+                continue
+            for driver in net_drivers:
+                successors[driver].update(net_sinks)
+
+        return cls(
+            cell_ids=cell_ids,
+            sequential=sequential,
+            fanout=pack_csr(successors),
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def cell_count(self) -> int:
+        """Get the number of indexed cells."""
+        return len(self.cell_ids)
+
+    def edge_count(self) -> int:
+        """Get the number of (deduplicated) driver → sink edges."""
+        return len(self.fanout_targets)
+
+    def index_of(self, cell_id: CellId) -> int | None:
+        """Get the integer index of a cell.
+
+        Args:
+            cell_id: The cell to look up.
+
+        Returns:
+            The cell's index, or None if the cell is not indexed.
+        """
+        if self._index is None:
+            self._index = {cell_id: i for i, cell_id in enumerate(self.cell_ids)}
+        return self._index.get(cell_id)
+
+    def is_sequential(self, index: int) -> bool:
+        """Check whether the cell at an index is sequential."""
+        return self.sequential[index] == 1
+
+    def fanout(self, index: int) -> IntArray:
+        """Get the indices of cells driven by a cell.
+
+        Args:
+            index: Index of the driving cell.
+
+        Returns:
+            Array slice of sink cell indices (sorted ascending).
+        """
+        return row(self.fanout_offsets, self.fanout_targets, index)
+
+    def fanin(self, index: int) -> IntArray:
+        """Get the indices of cells driving a cell.
+
+        Args:
+            index: Index of the sink cell.
+
+        Returns:
+            Array slice of driver cell indices (sorted ascending).
+        """
+        return row(self.fanin_offsets, self.fanin_targets, index)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the adjacency to a compact binary form.
+
+        Layout: header, sequential flags (one byte per cell), fanout offsets
+        (int64) and targets (int32), fanin offsets and targets, then
+        newline-separated UTF-8 CellIds.
+
+        Returns:
+            Bytes suitable for from_bytes().
+        """
+        return b"".join(
+            (
+                _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.cell_count(), self.edge_count()),
+                bytes(self.sequential),
+                to_le_bytes(self.fanout_offsets),
+                to_le_bytes(self.fanout_targets),
+                to_le_bytes(self.fanin_offsets),
+                to_le_bytes(self.fanin_targets),
+                "\n".join(self.cell_ids).encode("utf-8"),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> CellAdjacency:
+        """Restore an adjacency serialized by to_bytes().
+
+        The arrays of the result are views of data (on little-endian hosts)
+        and its CellIds are split on first use, so data must stay valid
+        while the adjacency is in use.
+
+        Args:
+            data: Bytes produced by to_bytes(), or a view of them.
+
+        Returns:
+            The restored CellAdjacency.
+
+        Raises:
+            ValueError: If the data has the wrong magic or version.
+        """
+        magic, version, count, edge_count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a cell adjacency (bad header)")
+
+        sequential, position = view_le(data, _HEADER.size, "B", count)
+        offsets, position = view_le(data, position, OFFSET_TYPECODE, count + 1)
+        targets, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+        fanin_offsets, position = view_le(data, position, OFFSET_TYPECODE, count + 1)
+        fanin_targets, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+
+        with memoryview(data) as whole:
+            cell_ids = NameTable(whole[position:], count, CellId)
+        return cls(cell_ids, sequential, (offsets, targets), (fanin_offsets, fanin_targets))
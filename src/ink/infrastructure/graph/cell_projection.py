@@ -0,0 +1,755 @@
+"""Cell-only projected graph for fast fanin/fanout traversal.
+
+This module provides the CellProjection class, a compact cell-to-cell view of
+signal flow in which every edge remembers *how* the two cells are connected:
+the driving pin and the net it drives. A fanout hop that would otherwise walk
+cell → pin → net → pin → cell over four node types becomes a single CSR slice.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Derived index (built once from the graph or Design)
+    Bounded Context: Netlist Context
+
+Data Layout:
+    - Cells are numbered 0..N-1 (graph or Design order)
+    - Driver pins are numbered 0..D-1; ``driver_pins[d]`` is the PinId and
+      ``driver_nets[d]`` the NetId it drives
+    - ``fanout_offsets``/``fanout_targets`` give sink cells per driver cell;
+      ``edge_driver[e]`` is the driver pin ordinal of edge e
+    - ``fanin_offsets``/``fanin_sources``/``fanin_edges`` hold the reverse
+      view; ``fanin_edges`` points back at forward edge numbers so both
+      directions share one set of annotations
+
+Incremental Updates:
+    apply_delta() patches the projection after NetworkXGraphBuilder.apply_delta()
+    in time proportional to the change. Rows of touched cells are recomputed
+    from the graph and stored in small per-row overlays; new edges are
+    appended to the edge arrays and removed cells become tombstones (their
+    index is retired, never reused). When a row is patched again, the edge
+    records of its previous overlay are recycled for the new one, so the
+    edge arrays grow with the size of the live overlays, not with the number
+    of deltas. The CSR base is left untouched, so a projection that has
+    absorbed many deltas can be compacted by rebuilding it with from_graph().
+    A projection restored by from_bytes() reads its arrays and names straight
+    from the serialized buffer; the first delta copies the parts it writes.
+
+Edge Semantics:
+    One edge per (driving pin, sink cell) pair: an output (or inout) pin of
+    cell i on net n, and an input (or inout) pin of cell j on the same net.
+    Unlike CellAdjacency, edges through different nets or pins are kept
+    separate so each can be labeled. Sibling loads on a net are *not*
+    connected to each other: fanin follows sinks back to drivers only.
+
+Example:
+    >>> projection = CellProjection.from_design(design)
+    >>> projection.get_fanout_edges(CellId("XI1"))
+    [CellEdge(source='XI1', target='XI2', pin_id='XI1.Y', net_id='net_1')]
+
+See Also:
+    - NetworkXGraphTraverser: Uses the projection for get_fanout_cells/get_fanin_cells
+    - CellAdjacency: Deduplicated, unlabeled cell graph for analytics
+"""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
+
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.infrastructure.graph.csr import (
+    OFFSET_TYPECODE,
+    TARGET_TYPECODE,
+    IntArray,
+    NameTable,
+    row,
+    to_le_bytes,
+    view_le,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import networkx as nx
+
+    from ink.domain.model import Design
+    from ink.infrastructure.graph.graph_delta import GraphDelta
+
+# (other cell, driving pin, net) as read from the graph for one row
+_RowRecord = tuple[str, str, str]
+
+# Binary format header: magic, version, cell count, driver pin count, edge count,
+# byte sizes of the CellId and driver PinId name blocks
+_MAGIC = b"INKPRJ"
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<6sHqqqqq")
+
+
+@dataclass(frozen=True, slots=True)
+class CellEdge:
+    """One annotated cell-to-cell signal flow edge.
+
+    Attributes:
+        source: Driving cell
+        target: Receiving (sink) cell
+        pin_id: Output pin of the source cell that drives the net
+        net_id: Net connecting the two cells
+    """
+
+    source: CellId
+    target: CellId
+    pin_id: PinId
+    net_id: NetId
+
+
+@dataclass(frozen=True, slots=True)
+class _PinRecord:
+    """A cell pin as seen by the projection builder."""
+
+    cell: int
+    pin_id: PinId
+    net_id: NetId
+    drives: bool
+    receives: bool
+
+
+class _Owned(NamedTuple):
+    """The parts of a projection apply_delta() writes, as mutable containers."""
+
+    cell_ids: list[CellId]
+    sequential: bytearray
+    driver_pins: list[PinId]
+    driver_nets: list[NetId]
+    fanout_targets: array[int]
+    edge_driver: array[int]
+
+
+class CellProjection:
+    """CSR cell-to-cell graph with driving pin and net on every edge.
+
+    Attributes:
+        cell_ids: Cell IDs in index order
+        sequential: One byte per cell, 1 if sequential
+        driver_pins: PinId per driver pin ordinal
+        driver_nets: NetId per driver pin ordinal
+        fanout_offsets: CSR offsets, driver cell → edges
+        fanout_targets: Sink cell index per edge
+        edge_driver: Driver pin ordinal per edge
+        fanin_offsets: CSR offsets, sink cell → incoming edges
+        fanin_sources: Driver cell index per incoming edge slot
+        fanin_edges: Forward edge number per incoming edge slot
+        graph_version: Graph version this projection reflects, or None if
+            it was built from a Design rather than a graph
+
+    Example:
+        >>> projection = CellProjection.from_graph(graph, design)
+        >>> i = projection.index_of(CellId("XI1"))
+        >>> [projection.cell_ids[j] for j in projection.fanout(i)]
+        ['XI2']
+    """
+
+    def __init__(
+        self,
+        cell_ids: Sequence[CellId],
+        sequential: bytes | bytearray | IntArray,
+        drivers: tuple[Sequence[PinId], Sequence[NetId]],
+        fanout: tuple[IntArray, IntArray, IntArray],
+        fanin: tuple[IntArray, IntArray, IntArray] | None = None,
+    ) -> None:
+        """Initialize from pre-built arrays, deriving the fanin view if not given.
+
+        The arguments are kept as given (not copied), so they may be
+        read-only views; apply_delta() copies what it writes on first use.
+
+        Args:
+            cell_ids: Cell IDs in index order.
+            sequential: One byte per cell (1 = sequential).
+            drivers: (driver_pins, driver_nets) parallel sequences.
+            fanout: (offsets, targets, edge_driver) CSR triple.
+            fanin: (offsets, sources, edges) CSR triple matching fanout,
+                or None to derive it.
+        """
+        self.cell_ids: Sequence[CellId] = cell_ids
+        self.sequential = sequential
+        self.driver_pins: Sequence[PinId] = drivers[0]
+        self.driver_nets: Sequence[NetId] = drivers[1]
+        self.fanout_offsets, self.fanout_targets, self.edge_driver = fanout
+        self.graph_version: int | None = None
+
+        # Built on first lookup; restoring a projection never needs it
+        self._lookup: dict[CellId, int] | None = None
+        self._owned: _Owned | None = None
+        self._edge_count = len(self.fanout_targets)
+        if fanin is None:
+            fanin = self._build_fanin()
+        self.fanin_offsets, self.fanin_sources, self.fanin_edges = fanin
+
+        # Per-row overlays written by apply_delta():
+        # index -> (neighbor cells, forward edge numbers)
+        self._out_patch: dict[int, tuple[array[int], array[int]]] = {}
+        self._in_patch: dict[int, tuple[array[int], array[int]]] = {}
+        # Edge records from this number on belong to overlays; those of
+        # replaced overlay rows are recycled through the free list
+        self._base_edges = len(self.fanout_targets)
+        self._free_edges: list[int] = []
+
+    def _build_fanin(self) -> tuple[IntArray, IntArray, IntArray]:
+        """Derive the reverse (sink → driver) view by a counting pass."""
+        count = len(self.cell_ids)
+        offsets = self.fanout_offsets
+        targets = self.fanout_targets
+
+        counts = [0] * (count + 1)
+        for target in targets:
+            counts[target + 1] += 1
+        for i in range(count):
+            counts[i + 1] += counts[i]
+
+        sources: array[int] = array(TARGET_TYPECODE, [0]) * len(targets)
+        edges: array[int] = array(TARGET_TYPECODE, [0]) * len(targets)
+        cursor = counts[:count]
+        for source in range(count):
+            for edge in range(offsets[source], offsets[source + 1]):
+                slot = cursor[targets[edge]]
+                sources[slot] = source
+                edges[slot] = edge
+                cursor[targets[edge]] += 1
+
+        return array(OFFSET_TYPECODE, counts), sources, edges
+
+    @property
+    def _index(self) -> dict[CellId, int]:
+        """CellId → index map (live cells only), built on first use."""
+        if self._lookup is None:
+            self._lookup = {cell_id: i for i, cell_id in enumerate(self.cell_ids)}
+        return self._lookup
+
+    def _own(self) -> _Owned:
+        """Get the parts apply_delta() writes, copying read-only views once."""
+        if self._owned is None:
+            self._owned = _Owned(
+                self.cell_ids if isinstance(self.cell_ids, list) else list(self.cell_ids),
+                self.sequential
+                if isinstance(self.sequential, bytearray)
+                else bytearray(self.sequential),
+                self.driver_pins if isinstance(self.driver_pins, list) else list(self.driver_pins),
+                self.driver_nets if isinstance(self.driver_nets, list) else list(self.driver_nets),
+                _owned_array(self.fanout_targets),
+                _owned_array(self.edge_driver),
+            )
+            (
+                self.cell_ids,
+                self.sequential,
+                self.driver_pins,
+                self.driver_nets,
+                self.fanout_targets,
+                self.edge_driver,
+            ) = self._owned
+        return self._owned
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def from_design(cls, design: Design) -> CellProjection:
+        """Build the projection directly from a Design aggregate.
+
+        Args:
+            design: The Design aggregate to project.
+
+        Returns:
+            A new CellProjection over every cell in the design.
+
+        Time Complexity:
+            O(P + E) where P = pins, E = projected edges
+        """
+        cells = design.get_all_cells()
+
+        def records() -> Iterable[_PinRecord]:
+            for index, cell in enumerate(cells):
+                for pin_id in cell.pin_ids:
+                    pin = design.get_pin(pin_id)
+                    if pin is None or pin.net_id is None:
+                        continue
+                    yield _PinRecord(
+                        index,
+                        pin_id,
+                        pin.net_id,
+                        pin.direction.is_output(),
+                        pin.direction.is_input(),
+                    )
+
+        return cls._assemble(
+            tuple(cell.id for cell in cells),
+            bytes(1 if cell.is_sequential else 0 for cell in cells),
+            records(),
+        )
+
+    @classmethod
+    def from_graph(  # type: ignore[no-any-unimported]
+        cls,
+        graph: nx.MultiDiGraph,
+        design: Design,
+    ) -> CellProjection:
+        """Build the projection from a NetworkXGraphBuilder graph.
+
+        Pin direction is read from 'drives' edge direction (pin → net for
+        drivers, net → pin for sinks), so lean graphs without per-node
+        attributes work too. The Design supplies is_sequential flags.
+
+        Args:
+            graph: MultiDiGraph built by NetworkXGraphBuilder.
+            design: Design the graph was built from.
+
+        Returns:
+            A new CellProjection over every cell node in the graph.
+        """
+        cell_ids = tuple(
+            CellId(str(node))
+            for node, node_type in graph.nodes(data="node_type")
+            if node_type == "cell"
+        )
+
+        def is_sequential(cell_id: CellId) -> bool:
+            cell = design.get_cell(cell_id)
+            return cell is not None and cell.is_sequential
+
+        def records() -> Iterable[_PinRecord]:
+            for index, cell_id in enumerate(cell_ids):
+                for _, pin_id, edge_type in graph.out_edges(cell_id, data="edge_type"):
+                    if edge_type != "contains_pin":
+                        continue
+                    for _, net_id, pin_edge in graph.out_edges(pin_id, data="edge_type"):
+                        if pin_edge == "drives":
+                            yield _PinRecord(index, PinId(pin_id), NetId(net_id), True, False)
+                    for net_id, _, pin_edge in graph.in_edges(pin_id, data="edge_type"):
+                        if pin_edge == "drives":
+                            yield _PinRecord(index, PinId(pin_id), NetId(net_id), False, True)
+
+        projection = cls._assemble(
+            cell_ids,
+            bytes(1 if is_sequential(cell_id) else 0 for cell_id in cell_ids),
+            records(),
+        )
+        projection.graph_version = graph.graph.get("version", 0)
+        return projection
+
+    @classmethod
+    def _assemble(
+        cls,
+        cell_ids: tuple[CellId, ...],
+        sequential: bytes,
+        records: Iterable[_PinRecord],
+    ) -> CellProjection:
+        """Group pin records by net and emit driver pin → sink cell edges.
+
+        Args:
+            cell_ids: Cell IDs in index order.
+            sequential: One byte per cell.
+            records: Connected pins of every cell.
+
+        Returns:
+            A new CellProjection.
+        """
+        driver_pins: list[PinId] = []
+        driver_nets: list[NetId] = []
+        drivers_on: dict[NetId, list[tuple[int, int]]] = {}
+        sinks_on: dict[NetId, dict[int, None]] = {}
+
+        for record in records:
+            if record.drives:
+                drivers_on.setdefault(record.net_id, []).append((record.cell, len(driver_pins)))
+                driver_pins.append(record.pin_id)
+                driver_nets.append(record.net_id)
+            if record.receives:
+                # dict as ordered set: one edge per sink cell per net
+                sinks_on.setdefault(record.net_id, {})[record.cell] = None
+
+        # (sink cell, driver ordinal) per driver cell
+        out_rows: list[list[tuple[int, int]]] = [[] for _ in cell_ids]
+        for net_id, net_drivers in drivers_on.items():
+            net_sinks = sinks_on.get(net_id)
+            if not net_sinks:
+                continue
+            for cell, driver in net_drivers:
+                out_rows[cell].extend((sink, driver) for sink in net_sinks)
+
+        offsets: array[int] = array(OFFSET_TYPECODE, [0])
+        targets: array[int] = array(TARGET_TYPECODE)
+        edge_driver: array[int] = array(TARGET_TYPECODE)
+        for out_row in out_rows:
+            out_row.sort()
+            for sink, driver in out_row:
+                targets.append(sink)
+                edge_driver.append(driver)
+            offsets.append(len(targets))
+
+        return cls(
+            cell_ids=list(cell_ids),
+            sequential=bytearray(sequential),
+            drivers=(driver_pins, driver_nets),
+            fanout=(offsets, targets, edge_driver),
+        )
+
+    # =========================================================================
+    # Index-Level Queries
+    # =========================================================================
+
+    def cell_count(self) -> int:
+        """Get the number of projected (live) cells."""
+        # Cells are only retired by apply_delta(), which builds the index
+        return len(self.cell_ids) if self._lookup is None else len(self._lookup)
+
+    def edge_count(self) -> int:
+        """Get the number of projected (driver pin, sink cell) edges."""
+        return self._edge_count
+
+    def index_of(self, cell_id: CellId) -> int | None:
+        """Get the integer index of a cell, or None if not projected."""
+        return self._index.get(cell_id)
+
+    def is_sequential(self, index: int) -> bool:
+        """Check whether the cell at an index is sequential."""
+        return self.sequential[index] == 1
+
+    def fanout(self, index: int) -> IntArray:
+        """Get sink cell indices of a cell's outgoing edges (may repeat)."""
+        patch = self._out_patch.get(index)
+        if patch is not None:
+            return patch[0]
+        return row(self.fanout_offsets, self.fanout_targets, index)
+
+    def fanin(self, index: int) -> IntArray:
+        """Get driver cell indices of a cell's incoming edges (may repeat)."""
+        patch = self._in_patch.get(index)
+        if patch is not None:
+            return patch[0]
+        return row(self.fanin_offsets, self.fanin_sources, index)
+
+    def _out_edges(self, index: int) -> Iterable[int]:
+        """Get the forward edge numbers leaving a cell."""
+        patch = self._out_patch.get(index)
+        if patch is not None:
+            return patch[1]
+        return range(self.fanout_offsets[index], self.fanout_offsets[index + 1])
+
+    def _in_edges(self, index: int) -> Iterable[tuple[int, int]]:
+        """Get (source cell, forward edge number) pairs entering a cell."""
+        patch = self._in_patch.get(index)
+        if patch is not None:
+            return zip(patch[0], patch[1], strict=True)
+        start, end = self.fanin_offsets[index], self.fanin_offsets[index + 1]
+        return zip(self.fanin_sources[start:end], self.fanin_edges[start:end], strict=True)
+
+    # =========================================================================
+    # Annotated Queries
+    # =========================================================================
+
+    def get_fanout_edges(self, cell_id: CellId) -> list[CellEdge]:
+        """Get the labeled edges leaving a cell.
+
+        Args:
+            cell_id: Driving cell.
+
+        Returns:
+            One CellEdge per (driving pin, sink cell); empty if unknown.
+        """
+        index = self._index.get(cell_id)
+        if index is None:
+            return []
+        return [self._edge(index, edge) for edge in self._out_edges(index)]
+
+    def get_fanin_edges(self, cell_id: CellId) -> list[CellEdge]:
+        """Get the labeled edges entering a cell.
+
+        Args:
+            cell_id: Receiving cell.
+
+        Returns:
+            One CellEdge per (driving pin, this cell); empty if unknown.
+        """
+        index = self._index.get(cell_id)
+        if index is None:
+            return []
+        return [self._edge(source, edge) for source, edge in self._in_edges(index)]
+
+    def _edge(self, source: int, edge: int) -> CellEdge:
+        """Materialize forward edge number `edge` leaving cell `source`."""
+        driver = self.edge_driver[edge]
+        return CellEdge(
+            source=self.cell_ids[source],
+            target=self.cell_ids[self.fanout_targets[edge]],
+            pin_id=self.driver_pins[driver],
+            net_id=self.driver_nets[driver],
+        )
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the projection to a compact binary form.
+
+        Layout: header, sequential flags (one byte per cell), fanout
+        offsets (int64), targets and edge drivers (int32), fanin offsets
+        (int64), sources and edges (int32), then three blocks of
+        newline-separated UTF-8 names: CellIds, driver PinIds and driver
+        NetIds. Everything from_bytes() needs is stored, so it derives
+        nothing on load.
+
+        Returns:
+            Bytes suitable for from_bytes().
+
+        Raises:
+            ValueError: If deltas have been applied; persist a projection
+                rebuilt with from_graph() instead.
+        """
+        if self._out_patch or self._in_patch:
+            raise ValueError("Cannot serialize a patched projection; rebuild it first")
+        cell_names = "\n".join(self.cell_ids).encode("utf-8")
+        pin_names = "\n".join(self.driver_pins).encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            len(self.cell_ids),
+            len(self.driver_pins),
+            len(self.fanout_targets),
+            len(cell_names),
+            len(pin_names),
+        )
+        return b"".join(
+            (
+                header,
+                bytes(self.sequential),
+                to_le_bytes(self.fanout_offsets),
+                to_le_bytes(self.fanout_targets),
+                to_le_bytes(self.edge_driver),
+                to_le_bytes(self.fanin_offsets),
+                to_le_bytes(self.fanin_sources),
+                to_le_bytes(self.fanin_edges),
+                cell_names,
+                pin_names,
+                "\n".join(self.driver_nets).encode("utf-8"),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> CellProjection:
+        """Restore a projection serialized by to_bytes().
+
+        The restored projection has no graph_version; callers that pair it
+        with a graph set graph_version to that graph's version. Its arrays
+        are views of data (on little-endian hosts) and its names are split
+        on first use, so restoring costs time independent of design size;
+        data must stay valid while the projection is in use.
+
+        Args:
+            data: Bytes produced by to_bytes(), or a view of them.
+
+        Returns:
+            The restored CellProjection.
+
+        Raises:
+            ValueError: If the data has the wrong magic or version.
+        """
+        header = _HEADER.unpack_from(data, 0)
+        magic, version, count, driver_count, edge_count, cell_size, pin_size = header
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a cell projection (bad header)")
+
+        sequential, position = view_le(data, _HEADER.size, "B", count)
+        offsets, position = view_le(data, position, OFFSET_TYPECODE, count + 1)
+        targets, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+        edge_driver, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+        fanin_offsets, position = view_le(data, position, OFFSET_TYPECODE, count + 1)
+        sources, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+        edges, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+
+        with memoryview(data) as whole:
+            pin_start = position + cell_size
+            net_start = pin_start + pin_size
+            return cls(
+                cell_ids=NameTable(whole[position:pin_start], count, CellId),
+                sequential=sequential,
+                drivers=(
+                    NameTable(whole[pin_start:net_start], driver_count, PinId),
+                    NameTable(whole[net_start:], driver_count, NetId),
+                ),
+                fanout=(offsets, targets, edge_driver),
+                fanin=(fanin_offsets, sources, edges),
+            )
+
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    def apply_delta(  # type: ignore[no-any-unimported]
+        self,
+        graph: nx.MultiDiGraph,
+        design: Design,
+        delta: GraphDelta,
+    ) -> None:
+        """Patch the projection after the graph was mutated in place.
+
+        Removed cells are retired, added cells are appended, and the fanout
+        and fanin rows of every touched cell are recomputed from the graph.
+
+        Args:
+            graph: The already-mutated graph.
+            design: Design supplying is_sequential for added cells.
+            delta: Summary returned by NetworkXGraphBuilder.apply_delta().
+
+        Time Complexity:
+            O(sum of degrees of touched cells), independent of design size
+            (plus a one-off O(N + E) copy on a projection from from_bytes()).
+        """
+        owned = self._own()
+        for cell_id in delta.removed_cells:
+            index = self._index.pop(cell_id, None)
+            if index is not None:
+                self._release(index)
+                self._patch_out(index, [])
+                self._in_patch[index] = _empty_row()
+
+        for cell_id in delta.added_cells:
+            if cell_id in self._index:
+                continue
+            self._index[cell_id] = len(owned.cell_ids)
+            owned.cell_ids.append(cell_id)
+            cell = design.get_cell(cell_id)
+            owned.sequential.append(1 if cell is not None and cell.is_sequential else 0)
+            # Beyond the CSR base, so rows live only in the overlays
+            self._out_patch[self._index[cell_id]] = _empty_row()
+            self._in_patch[self._index[cell_id]] = _empty_row()
+
+        touched = sorted(
+            (index, cell_id)
+            for cell_id in delta.touched_cells
+            if (index := self._index.get(cell_id)) is not None
+        )
+        # Free every replaced row before storing any new one, so the new
+        # rows can reuse all of their records whatever the patch order
+        for index, _ in touched:
+            self._release(index)
+        for index, cell_id in touched:
+            self._patch_out(index, _graph_fanout(graph, cell_id))
+            self._patch_in(index, _graph_fanin(graph, cell_id))
+
+        self.graph_version = delta.version
+
+    def _store_edge(self, target: int, pin_id: str, net_id: str) -> int:
+        """Store one overlay edge record (and its driver pin) and return its number.
+
+        Reuses a record released by a replaced overlay row when there is
+        one; overlay records each own their driver pin ordinal, so it is
+        overwritten along with the target.
+        """
+        owned = self._own()
+        if self._free_edges:
+            edge = self._free_edges.pop()
+            driver = owned.edge_driver[edge]
+            owned.driver_pins[driver] = PinId(pin_id)
+            owned.driver_nets[driver] = NetId(net_id)
+            owned.fanout_targets[edge] = target
+            return edge
+        owned.driver_pins.append(PinId(pin_id))
+        owned.driver_nets.append(NetId(net_id))
+        owned.fanout_targets.append(target)
+        owned.edge_driver.append(len(owned.driver_pins) - 1)
+        return len(owned.fanout_targets) - 1
+
+    def _release(self, index: int) -> None:
+        """Return the overlay edge records of a cell's rows to the free list.
+
+        Called before the rows are replaced; the overlays stay in place
+        until then, so fanout() still reports the old row.
+        """
+        for patch in (self._out_patch.get(index), self._in_patch.get(index)):
+            if patch is not None:
+                self._free_edges.extend(edge for edge in patch[1] if edge >= self._base_edges)
+
+    def _patch_out(self, index: int, records: list[_RowRecord]) -> None:
+        """Replace a cell's fanout row with edges to the given sinks."""
+        resolved = sorted(
+            (sink, pin_id, net_id)
+            for sink_id, pin_id, net_id in records
+            if (sink := self._index.get(CellId(sink_id))) is not None
+        )
+        self._edge_count += len(resolved) - len(self.fanout(index))
+        targets: array[int] = array(TARGET_TYPECODE)
+        edges: array[int] = array(TARGET_TYPECODE)
+        for sink, pin_id, net_id in resolved:
+            targets.append(sink)
+            edges.append(self._store_edge(sink, pin_id, net_id))
+        self._out_patch[index] = (targets, edges)
+
+    def _patch_in(self, index: int, records: list[_RowRecord]) -> None:
+        """Replace a cell's fanin row with edges from the given drivers."""
+        resolved = sorted(
+            (source, pin_id, net_id)
+            for source_id, pin_id, net_id in records
+            if (source := self._index.get(CellId(source_id))) is not None
+        )
+        sources: array[int] = array(TARGET_TYPECODE)
+        edges: array[int] = array(TARGET_TYPECODE)
+        for source, pin_id, net_id in resolved:
+            sources.append(source)
+            edges.append(self._store_edge(index, pin_id, net_id))
+        self._in_patch[index] = (sources, edges)
+
+
+# =============================================================================
+# Graph Row Readers (used by apply_delta)
+# =============================================================================
+
+
+def _empty_row() -> tuple[array[int], array[int]]:
+    """Get an empty (neighbors, edges) overlay row."""
+    return array(TARGET_TYPECODE), array(TARGET_TYPECODE)
+
+
+def _owned_array(values: IntArray) -> array[int]:
+    """Get values as a growable array, copying a read-only view."""
+    return values if isinstance(values, array) else array(TARGET_TYPECODE, values)
+
+
+def _pin_owner(graph: nx.MultiDiGraph, pin_id: str) -> str | None:  # type: ignore[no-any-unimported]
+    """Get the cell containing a pin node, or None for ports."""
+    for owner, _, edge_type in graph.in_edges(pin_id, data="edge_type"):
+        if edge_type == "contains_pin":
+            return str(owner)
+    return None
+
+
+def _graph_fanout(graph: nx.MultiDiGraph, cell_id: CellId) -> list[_RowRecord]:  # type: ignore[no-any-unimported]
+    """Read (sink cell, driving pin, net) records for a cell from the graph."""
+    found: dict[tuple[str, str], str] = {}
+    for _, pin_id, edge_type in graph.out_edges(cell_id, data="edge_type"):
+        if edge_type != "contains_pin":
+            continue
+        for _, net_id, pin_edge in graph.out_edges(pin_id, data="edge_type"):
+            if pin_edge != "drives":
+                continue
+            for _, sink_pin, net_edge in graph.out_edges(net_id, data="edge_type"):
+                owner = _pin_owner(graph, sink_pin) if net_edge == "drives" else None
+                if owner is not None:
+                    found[(owner, pin_id)] = net_id
+    return [(owner, pin_id, net_id) for (owner, pin_id), net_id in found.items()]
+
+
+def _graph_fanin(graph: nx.MultiDiGraph, cell_id: CellId) -> list[_RowRecord]:  # type: ignore[no-any-unimported]
+    """Read (driver cell, driving pin, net) records for a cell from the graph."""
+    found: dict[tuple[str, str], str] = {}
+    for _, pin_id, edge_type in graph.out_edges(cell_id, data="edge_type"):
+        if edge_type != "contains_pin":
+            continue
+        for net_id, _, pin_edge in graph.in_edges(pin_id, data="edge_type"):
+            if pin_edge != "drives":
+                continue
+            for driver_pin, _, net_edge in graph.in_edges(net_id, data="edge_type"):
+                owner = _pin_owner(graph, driver_pin) if net_edge == "drives" else None
+                if owner is not None:
+                    found[(owner, driver_pin)] = net_id
+    return [(owner, pin_id, net_id) for (owner, pin_id), net_id in found.items()]
@@ -0,0 +1,370 @@
+"""Clock-domain tracing: which clock root drives each sequential cell.
+
+This module provides the ClockDomainIndex class. Starting from clock root
+nets, clock tracing follows the clock network forward through buffers,
+inverters, gating cells and muxes (any combinational cell) until it reaches
+the clock pins of sequential cells, and labels every flop and latch with
+its clock root. Once built, "which clock drives this register" and "all
+registers of this domain" are array lookups, so traversal results can be
+filtered by clock domain without touching the netlist again.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Derived index (built once after load, numbered like the design)
+    Bounded Context: Netlist Context
+
+Clock Roots:
+    Candidate nets come from NetNormalizer.is_clock(): the default CLK/CK
+    patterns plus the clock names and patterns in NetClassificationConfig.
+    Input ports whose name is a clock name seed their net as well. A
+    candidate that is itself reached from another candidate through the
+    clock network (e.g. "clk_buf" behind "clk") is an internal clock net,
+    not a root; only unreached candidates become roots.
+
+Algorithm:
+    Two breadth-first sweeps over nets, each touching every pin at most
+    once, so the build is O(P) in the number of pins:
+
+    1. Sweep from every candidate, marking candidates reached through a
+       combinational cell (they are internal, not roots).
+    2. Sweep from the roots, labeling each net with the first root that
+       reaches it. A sequential sink is labeled when the net lands on one of
+       its clock pins (CK, CLK, CP, G, ...); the sweep does not continue
+       through sequential cells, so divided clocks start no new domain.
+
+    Sequential cells without any recognizable clock pin are labeled by the
+    first root reaching any of their inputs. When two clocks merge in a
+    mux, cells behind the mux keep the root that reached them first (the
+    one fewest nets away).
+
+Example:
+    >>> clocks = ClockDomainIndex.from_design(design)
+    >>> clocks.clock_of(CellId("XFF1"))
+    'clk_core'
+    >>> clocks.get_cells_in_domain(NetId("clk_core"))
+    ['XFF1', 'XFF7']
+    >>> mask = clocks.domain_mask(NetId("clk_core"), projection.cell_ids)
+    >>> [cell for cell in fanout_indices if mask[cell]]
+
+See Also:
+    - NetNormalizer.is_clock: Clock root name classification
+    - NetClassificationConfig: Per-project clock names and patterns
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Final
+
+from ink.domain.value_objects.identifiers import CellId, NetId
+from ink.infrastructure.graph.csr import TARGET_TYPECODE, IntArray, to_le_bytes, view_le
+from ink.infrastructure.parsing.net_normalizer import NetNormalizer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from ink.domain.model import Design
+    from ink.domain.value_objects.identifiers import PinId
+
+    # on_net(net, source ordinal) / on_clock_pin(cell, source ordinal)
+    _NetVisitor = Callable[[NetId, int], object]
+    _CellVisitor = Callable[[int, int], object]
+
+# Domain value of cells no clock root reaches (and of combinational cells)
+NO_CLOCK: Final = -1
+
+# Clock/enable pin names of common flop and latch cells (case-insensitive)
+DEFAULT_CLOCK_PIN_PATTERNS: Final = (
+    r"^(CLK|CK|CP|C|CLOCK)N?$",  # Edge-triggered flops: CK, CLK, CPN, ...
+    r"^(G|GN|GATE)$",  # Level-sensitive latches
+)
+
+# Binary format header: magic, version, cell count, root count
+_MAGIC = b"INKCLK"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sHqq")
+
+
+class ClockDomainIndex:
+    """Clock root per cell, grouped by domain.
+
+    Attributes:
+        cell_ids: Cell IDs in index order (index → CellId)
+        roots: Clock root nets in root order (root ordinal → NetId)
+        domain: Root ordinal per cell, NO_CLOCK for cells no clock reaches
+    """
+
+    def __init__(
+        self,
+        cell_ids: tuple[CellId, ...],
+        roots: tuple[NetId, ...],
+        domain: IntArray,
+    ) -> None:
+        """Initialize from pre-built arrays.
+
+        Args:
+            cell_ids: CellIds in index order.
+            roots: Clock root NetIds in root order.
+            domain: Root ordinal per cell.
+        """
+        self.cell_ids = cell_ids
+        self.roots = roots
+        self.domain = domain
+
+        self._index: dict[CellId, int] = {cell_id: i for i, cell_id in enumerate(cell_ids)}
+        self._root_ordinal: dict[NetId, int] = {root: r for r, root in enumerate(roots)}
+        self._members: list[list[int]] = [[] for _ in roots]
+        for cell, root in enumerate(domain):
+            if root != NO_CLOCK:
+                self._members[root].append(cell)
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def from_design(
+        cls,
+        design: Design,
+        normalizer: NetNormalizer | None = None,
+        clock_pin_patterns: Iterable[str] = DEFAULT_CLOCK_PIN_PATTERNS,
+    ) -> ClockDomainIndex:
+        """Trace every clock root of a design to its sequential cells.
+
+        Args:
+            design: The Design aggregate to trace.
+            normalizer: Clock root classification; pass
+                NetNormalizer.from_config(config) for project settings.
+                Defaults to the built-in CLK/CK patterns.
+            clock_pin_patterns: Regex patterns of sequential clock pin names.
+
+        Returns:
+            A new ClockDomainIndex.
+
+        Time Complexity:
+            O(P) where P = pins in the design.
+        """
+        return _ClockTracer(design, normalizer or NetNormalizer(), clock_pin_patterns).trace()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def cell_count(self) -> int:
+        """Get the number of indexed cells."""
+        return len(self.cell_ids)
+
+    def clock_of(self, cell_id: CellId) -> NetId | None:
+        """Get the clock root driving a cell, or None if unclocked or unknown."""
+        index = self._index.get(cell_id)
+        if index is None or self.domain[index] == NO_CLOCK:
+            return None
+        return self.roots[self.domain[index]]
+
+    def get_cells_in_domain(self, root: NetId) -> list[CellId]:
+        """Get the cells clocked by one root, in index order."""
+        ordinal = self._root_ordinal.get(root)
+        if ordinal is None:
+            return []
+        return [self.cell_ids[cell] for cell in self._members[ordinal]]
+
+    def domain_mask(self, root: NetId, cell_ids: Sequence[CellId] | None = None) -> bytes:
+        """Get a per-cell membership mask for one clock domain.
+
+        Args:
+            root: Clock root of the domain.
+            cell_ids: Numbering of the mask, e.g. a CellProjection's
+                cell_ids; defaults to this index's own numbering.
+
+        Returns:
+            One byte per cell, 1 for cells clocked by root.
+        """
+        ordinal = self._root_ordinal.get(root, NO_CLOCK)
+        if cell_ids is None:
+            return bytes(
+                1 if ordinal != NO_CLOCK and value == ordinal else 0 for value in self.domain
+            )
+        mask = bytearray(len(cell_ids))
+        if ordinal != NO_CLOCK:
+            members = {self.cell_ids[cell] for cell in self._members[ordinal]}
+            for i, cell_id in enumerate(cell_ids):
+                if cell_id in members:
+                    mask[i] = 1
+        return bytes(mask)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index to a compact binary form.
+
+        Layout: header, domains (int32), then newline-separated UTF-8
+        CellIds followed by root NetIds.
+
+        Returns:
+            Bytes suitable for from_bytes().
+        """
+        return b"".join(
+            (
+                _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.cell_count(), len(self.roots)),
+                to_le_bytes(self.domain),
+                "\n".join((*self.cell_ids, *self.roots)).encode("utf-8"),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> ClockDomainIndex:
+        """Restore an index serialized by to_bytes().
+
+        Args:
+            data: Bytes produced by to_bytes(), or a view of them.
+
+        Returns:
+            The restored ClockDomainIndex.
+
+        Raises:
+            ValueError: If the data has the wrong magic or version.
+        """
+        magic, version, count, root_count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a clock domain index (bad header)")
+
+        domain, position = view_le(data, _HEADER.size, TARGET_TYPECODE, count)
+
+        text = str(data[position:], "utf-8")
+        names = text.split("\n") if count + root_count else []
+        cell_ids = tuple(CellId(name) for name in names[:count])
+        roots = tuple(NetId(name) for name in names[count:])
+
+        return cls(cell_ids, roots, domain)
+
+
+class _ClockTracer:
+    """One-shot clock network sweep over a Design (see module docstring)."""
+
+    def __init__(
+        self,
+        design: Design,
+        normalizer: NetNormalizer,
+        clock_pin_patterns: Iterable[str],
+    ) -> None:
+        self.design = design
+        self.normalizer = normalizer
+        self.clock_pin = re.compile("|".join(clock_pin_patterns), re.IGNORECASE)
+
+        cells = design.get_all_cells()
+        self.cell_ids = tuple(cell.id for cell in cells)
+        self.sequential = bytes(1 if cell.is_sequential else 0 for cell in cells)
+
+        # Pin → owning cell; per cell, the nets it drives
+        self.pin_owner: dict[PinId, int] = {}
+        self.output_nets: list[list[NetId]] = [[] for _ in cells]
+        # Sequential cells with at least one recognizable clock pin
+        self.has_clock_pin = bytearray(len(cells))
+        self._pin_name_is_clock: dict[str, bool] = {}
+
+        for index, cell in enumerate(cells):
+            for pin_id in cell.pin_ids:
+                self.pin_owner[pin_id] = index
+                pin = design.get_pin(pin_id)
+                if pin is None:
+                    continue
+                if pin.net_id is not None and pin.direction.is_output():
+                    self.output_nets[index].append(pin.net_id)
+                if cell.is_sequential and self._is_clock_pin(pin.name):
+                    self.has_clock_pin[index] = 1
+
+    def trace(self) -> ClockDomainIndex:
+        """Find the clock roots and label every sequential cell."""
+        candidates = self._candidates()
+
+        # Pass 1: candidates reached from another candidate are internal
+        internal: set[NetId] = set()
+
+        def reached(net: NetId, source: int) -> None:
+            if net != candidates[source]:
+                internal.add(net)
+
+        self._sweep(candidates, reached, lambda *_: None)
+        roots = tuple(net for net in candidates if net not in internal)
+
+        # Pass 2: label sequential cells with the first root reaching them
+        domain: array[int] = array(TARGET_TYPECODE, [NO_CLOCK]) * len(self.cell_ids)
+
+        def label(cell: int, root: int) -> None:
+            if domain[cell] == NO_CLOCK:
+                domain[cell] = root
+
+        self._sweep(roots, lambda *_: None, label)
+        return ClockDomainIndex(self.cell_ids, roots, domain)
+
+    def _candidates(self) -> list[NetId]:
+        """Clock-named input port nets, then clock-named nets, deduplicated."""
+        normalizer = self.normalizer
+        seeds: dict[NetId, None] = {}
+        for port in self.design.get_all_ports():
+            if (
+                port.net_id is not None
+                and port.direction.is_input()
+                and normalizer.is_clock(port.name)
+            ):
+                seeds[port.net_id] = None
+        for net in self.design.get_all_nets():
+            if normalizer.is_clock(net.name):
+                seeds[net.id] = None
+        return list(seeds)
+
+    def _sweep(
+        self,
+        sources: Sequence[NetId],
+        on_net: _NetVisitor,
+        on_clock_pin: _CellVisitor,
+    ) -> None:
+        """Breadth-first over the clock network from sources.
+
+        Each net carries the ordinal of the source that reached it first.
+        on_net(net, source) is called for every net reached through a
+        combinational cell; on_clock_pin(cell, source) for every sequential
+        cell reached on a clock pin.
+        """
+        design = self.design
+        sequential = self.sequential
+        expanded = bytearray(len(self.cell_ids))
+        source_of: dict[NetId, int] = {net: s for s, net in enumerate(sources)}
+        queue = deque(sources)
+
+        while queue:
+            net_id = queue.popleft()
+            source = source_of[net_id]
+            net = design.get_net(net_id)
+            if net is None:
+                continue
+            for pin_id in net.connected_pin_ids:
+                cell = self.pin_owner.get(pin_id)
+                pin = design.get_pin(pin_id)
+                if cell is None or pin is None or not pin.direction.is_input():
+                    continue
+                if sequential[cell]:
+                    if not self.has_clock_pin[cell] or self._is_clock_pin(pin.name):
+                        on_clock_pin(cell, source)
+                    continue
+                if expanded[cell]:
+                    continue
+                expanded[cell] = 1
+                for out_net in self.output_nets[cell]:
+                    on_net(out_net, source)
+                    if out_net not in source_of:
+                        source_of[out_net] = source
+                        queue.append(out_net)
+
+    def _is_clock_pin(self, name: str) -> bool:
+        """Check a pin name against the clock pin patterns (cached by name)."""
+        result = self._pin_name_is_clock.get(name)
+        if result is None:
+            result = self.clock_pin.match(name) is not None
+            self._pin_name_is_clock[name] = result
+        return result
@@ -0,0 +1,432 @@
+"""Combinational loop detection via strongly connected components.
+
+This module provides the CombinationalLoopIndex class, which finds every
+combinational loop in a gate-level netlist: a set of non-sequential cells
+that can reach each other through signal flow without crossing a register.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Derived index (built once after load, persisted with the design)
+    Bounded Context: Netlist Context
+
+Algorithm:
+    Tarjan's SCC algorithm over CellAdjacency, restricted to combinational
+    cells (sequential cells and every edge touching them are ignored). The
+    DFS is iterative, with an explicit (cell, next-edge cursor) stack, so
+    deep logic cones never hit Python's recursion limit. All per-cell state
+    lives in flat lists indexed by cell number.
+
+    A component is reported as a loop if it has more than one cell, or if
+    its single cell drives its own input (a self-edge).
+
+    Time Complexity: O(N + E), one visit per cell and per edge.
+
+Storage:
+    Loops are stored CSR-style: ``members`` holds the CellIds of every loop
+    back to back and ``loop_offsets`` delimits each loop. Edges inside each
+    loop are stored as pairs of positions into ``members``, again delimited
+    per loop by ``edge_offsets``. Only edges inside a loop can lie on a
+    combinational cycle, so they are the complete candidate set for
+    feedback-edge selection in layout.
+
+Example:
+    >>> loops = CombinationalLoopIndex.from_design(design)
+    >>> loops.loop_count()
+    1
+    >>> loops.get_loop_cells(CellId("XNAND1"))
+    ['XNAND1', 'XNAND2']
+    >>> loops.is_loop_edge(CellId("XNAND2"), CellId("XNAND1"))
+    True
+
+See Also:
+    - CellAdjacency: The cell-level CSR graph this index is built from
+    - LayerAssignmentAlgorithm: Feedback-edge reversal during layout
+"""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from typing import TYPE_CHECKING
+
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph.cell_adjacency import CellAdjacency
+from ink.infrastructure.graph.csr import (
+    OFFSET_TYPECODE,
+    TARGET_TYPECODE,
+    IntArray,
+    to_le_bytes,
+    view_le,
+)
+
+if TYPE_CHECKING:
+    from ink.domain.model import Design
+
+# Binary format header: magic, version, member count, loop count, edge count
+_MAGIC = b"INKSCC"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sHqqq")
+
+
+class CombinationalLoopIndex:
+    """Queryable set of combinational loops (non-trivial SCCs).
+
+    Attributes:
+        members: CellIds of all loops, back to back
+        loop_offsets: Loop k spans members[loop_offsets[k]:loop_offsets[k + 1]]
+        edge_offsets: Loop k's edges span edge_sources/targets[edge_offsets[k]:...]
+        edge_sources: Member positions of loop-edge drivers
+        edge_targets: Member positions of loop-edge sinks
+
+    Example:
+        >>> loops = CombinationalLoopIndex.build(adjacency)
+        >>> for cells in loops.get_loops():
+        ...     print(len(cells))
+    """
+
+    def __init__(
+        self,
+        members: tuple[CellId, ...],
+        loop_offsets: IntArray,
+        edges: tuple[IntArray, IntArray, IntArray],
+    ) -> None:
+        """Initialize from pre-built loop arrays.
+
+        Args:
+            members: CellIds of all loops, back to back.
+            loop_offsets: Per-loop offsets into members (loop count + 1).
+            edges: (edge_offsets, edge_sources, edge_targets) where sources
+                and targets are positions into members.
+        """
+        self.members = members
+        self.loop_offsets = loop_offsets
+        self.edge_offsets, self.edge_sources, self.edge_targets = edges
+
+        # CellId → loop number, for O(1) membership queries
+        self._loop_of: dict[CellId, int] = {}
+        for loop in range(len(loop_offsets) - 1):
+            for position in range(loop_offsets[loop], loop_offsets[loop + 1]):
+                self._loop_of[members[position]] = loop
+
+        # (source, target) member positions for O(1) is_loop_edge()
+        self._edge_set: set[tuple[int, int]] = set(
+            zip(self.edge_sources, self.edge_targets, strict=True)
+        )
+        self._position: dict[CellId, int] = {
+            cell_id: position for position, cell_id in enumerate(members)
+        }
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def from_design(cls, design: Design) -> CombinationalLoopIndex:
+        """Build the index directly from a Design aggregate.
+
+        Args:
+            design: The Design aggregate to analyze.
+
+        Returns:
+            A new CombinationalLoopIndex.
+        """
+        return cls.build(CellAdjacency.from_design(design))
+
+    @classmethod
+    def build(cls, adjacency: CellAdjacency) -> CombinationalLoopIndex:
+        """Find all combinational loops in a cell adjacency.
+
+        Args:
+            adjacency: Cell-level graph to analyze.
+
+        Returns:
+            A new CombinationalLoopIndex.
+        """
+        component_of, components = strongly_connected_components(adjacency)
+
+        offsets = adjacency.fanout_offsets
+        targets = adjacency.fanout_targets
+
+        members: list[CellId] = []
+        loop_offsets: array[int] = array(OFFSET_TYPECODE, [0])
+        edge_offsets: array[int] = array(OFFSET_TYPECODE, [0])
+        edge_sources: array[int] = array(TARGET_TYPECODE)
+        edge_targets: array[int] = array(TARGET_TYPECODE)
+
+        for component, cells in enumerate(components):
+            if len(cells) == 1:
+                cell = cells[0]
+                if cell not in targets[offsets[cell] : offsets[cell + 1]]:
+                    continue  # Trivial SCC: not a loop
+
+            ordered = sorted(cells)
+            base = len(members)
+            position = {cell: base + k for k, cell in enumerate(ordered)}
+            members.extend(adjacency.cell_ids[cell] for cell in ordered)
+            loop_offsets.append(len(members))
+
+            for cell in ordered:
+                for k in range(offsets[cell], offsets[cell + 1]):
+                    sink = targets[k]
+                    if component_of[sink] == component:
+                        edge_sources.append(position[cell])
+                        edge_targets.append(position[sink])
+            edge_offsets.append(len(edge_sources))
+
+        return cls(
+            members=tuple(members),
+            loop_offsets=loop_offsets,
+            edges=(edge_offsets, edge_sources, edge_targets),
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def loop_count(self) -> int:
+        """Get the number of combinational loops."""
+        return len(self.loop_offsets) - 1
+
+    def has_loops(self) -> bool:
+        """Check whether the design contains any combinational loop."""
+        return len(self.members) > 0
+
+    def get_loop(self, loop: int) -> list[CellId]:
+        """Get the cells of one loop.
+
+        Args:
+            loop: Loop number (0..loop_count() - 1).
+
+        Returns:
+            CellIds of the loop's cells.
+        """
+        return list(self.members[self.loop_offsets[loop] : self.loop_offsets[loop + 1]])
+
+    def get_loops(self) -> list[list[CellId]]:
+        """Get all loops as lists of CellIds."""
+        return [self.get_loop(loop) for loop in range(self.loop_count())]
+
+    def get_loop_of(self, cell_id: CellId) -> int | None:
+        """Get the loop number a cell belongs to.
+
+        Args:
+            cell_id: Cell to look up.
+
+        Returns:
+            Loop number, or None if the cell is not on a combinational loop.
+        """
+        return self._loop_of.get(cell_id)
+
+    def is_in_loop(self, cell_id: CellId) -> bool:
+        """Check whether a cell lies on a combinational loop."""
+        return cell_id in self._loop_of
+
+    def get_loop_cells(self, cell_id: CellId) -> list[CellId]:
+        """Get all cells on the same loop as a cell.
+
+        Args:
+            cell_id: Cell to look up.
+
+        Returns:
+            CellIds of the loop containing cell_id (including cell_id), or
+            an empty list if the cell is not on a loop.
+        """
+        loop = self._loop_of.get(cell_id)
+        return [] if loop is None else self.get_loop(loop)
+
+    def get_loop_edges(self, loop: int) -> list[tuple[CellId, CellId]]:
+        """Get the driver → sink edges inside one loop.
+
+        These are the only edges that can close a combinational cycle, so
+        a feedback-edge selection only needs to consider them.
+
+        Args:
+            loop: Loop number (0..loop_count() - 1).
+
+        Returns:
+            List of (driver, sink) CellId pairs.
+        """
+        start, end = self.edge_offsets[loop], self.edge_offsets[loop + 1]
+        return [
+            (self.members[self.edge_sources[k]], self.members[self.edge_targets[k]])
+            for k in range(start, end)
+        ]
+
+    def is_loop_edge(self, source: CellId, target: CellId) -> bool:
+        """Check whether a driver → sink edge lies inside a loop.
+
+        Args:
+            source: Driving cell.
+            target: Sink cell.
+
+        Returns:
+            True if both cells are on the same loop and source drives target.
+        """
+        source_position = self._position.get(source)
+        target_position = self._position.get(target)
+        if source_position is None or target_position is None:
+            return False
+        return (source_position, target_position) in self._edge_set
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index to a compact binary form.
+
+        Layout: header, loop offsets (int64), edge offsets (int64), edge
+        sources and targets (int32), then newline-separated UTF-8 CellIds.
+
+        Returns:
+            Bytes suitable for from_bytes().
+        """
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            len(self.members),
+            self.loop_count(),
+            len(self.edge_sources),
+        )
+        return b"".join(
+            (
+                header,
+                to_le_bytes(self.loop_offsets),
+                to_le_bytes(self.edge_offsets),
+                to_le_bytes(self.edge_sources),
+                to_le_bytes(self.edge_targets),
+                "\n".join(self.members).encode("utf-8"),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> CombinationalLoopIndex:
+        """Restore an index serialized by to_bytes().
+
+        Args:
+            data: Bytes produced by to_bytes(), or a view of them.
+
+        Returns:
+            The restored CombinationalLoopIndex.
+
+        Raises:
+            ValueError: If the data has the wrong magic or version.
+        """
+        magic, version, member_count, loop_count, edge_count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a combinational loop index (bad header)")
+
+        position = _HEADER.size
+        loop_offsets, position = view_le(data, position, OFFSET_TYPECODE, loop_count + 1)
+        edge_offsets, position = view_le(data, position, OFFSET_TYPECODE, loop_count + 1)
+        edge_sources, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+        edge_targets, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+
+        names = str(data[position:], "utf-8")
+        members = tuple(CellId(name) for name in names.split("\n")) if member_count else ()
+
+        return cls(members, loop_offsets, (edge_offsets, edge_sources, edge_targets))
+
+
+def strongly_connected_components(
+    adjacency: CellAdjacency,
+) -> tuple[array[int], list[list[int]]]:
+    """Compute SCCs of the combinational part of a cell adjacency.
+
+    Iterative Tarjan: each DFS frame is a (cell, edge cursor) pair kept in
+    two parallel lists, so the search resumes exactly where it left off
+    after returning from a child.
+
+    Args:
+        adjacency: Cell-level graph. Sequential cells are skipped.
+
+    Returns:
+        Tuple of (component_of, components). component_of[i] is the
+        component number of cell i, or -1 for sequential cells.
+        components[c] lists the cell indices of component c. Components
+        are produced in reverse topological order.
+
+    Time Complexity:
+        O(N + E)
+    """
+    count = adjacency.cell_count()
+    offsets = adjacency.fanout_offsets
+    targets = adjacency.fanout_targets
+    sequential = adjacency.sequential
+
+    order = [-1] * count  # DFS discovery number, -1 = unvisited
+    low = [0] * count
+    on_stack = bytearray(count)
+    component_of: array[int] = array(TARGET_TYPECODE, [-1]) * count
+    components: list[list[int]] = []
+    scc_stack: list[int] = []
+    counter = 0
+
+    for root in range(count):
+        if sequential[root] or order[root] != -1:
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        frames = [root]
+        cursors = [offsets[root]]
+
+        while frames:
+            cell = frames[-1]
+            cursor = cursors[-1]
+            descended = False
+
+            while cursor < offsets[cell + 1]:
+                neighbor = targets[cursor]
+                cursor += 1
+                if sequential[neighbor]:
+                    continue
+                if order[neighbor] == -1:
+                    # Descend: save our cursor, push the child frame
+                    cursors[-1] = cursor
+                    order[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    scc_stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    frames.append(neighbor)
+                    cursors.append(offsets[neighbor])
+                    descended = True
+                    break
+                if on_stack[neighbor] and order[neighbor] < low[cell]:
+                    low[cell] = order[neighbor]
+
+            if descended:
+                continue
+
+            # All edges of cell explored: pop frame, maybe emit a component
+            frames.pop()
+            cursors.pop()
+            if low[cell] == order[cell]:
+                components.append(
+                    _pop_component(scc_stack, on_stack, component_of, cell, len(components))
+                )
+            if frames:
+                parent = frames[-1]
+                low[parent] = min(low[parent], low[cell])
+
+    return component_of, components
+
+
+def _pop_component(
+    scc_stack: list[int],
+    on_stack: bytearray,
+    component_of: array[int],
+    root: int,
+    component: int,
+) -> list[int]:
+    """Pop one finished SCC (everything above and including root)."""
+    cells: list[int] = []
+    while True:
+        member = scc_stack.pop()
+        on_stack[member] = 0
+        component_of[member] = component
+        cells.append(member)
+        if member == root:
+            return cells
@@ -0,0 +1,273 @@
+"""CSR (compressed sparse row) helpers for compact graph indexes.
+
+Graph-layer indexes (cell adjacency, register reachability, ...) store
+neighbor lists as two flat integer arrays:
+
+    offsets: int64, one entry per row plus a trailing total
+    targets: int32, neighbors of row i at targets[offsets[i]:offsets[i + 1]]
+
+This module holds the shared packing, transposition and (de)serialization
+helpers so every index uses the same layout and byte order.
+
+Zero-Copy Loading:
+    view_le() returns a read-only memoryview cast straight over the stored
+    bytes (on little-endian hosts), so an index restored from a mapped
+    IndexBundle shares the file's pages instead of copying them. Such
+    indexes hold IntArray values: either an owned array.array or one of
+    these views, both indexable, sliceable and iterable the same way.
+    NameTable does the same for the newline-joined names an index stores:
+    they are split only when a name is first asked for.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Utility functions (no state)
+    Bounded Context: Netlist Context
+
+Example:
+    >>> offsets, targets = pack_csr([[1, 2], [2], []])
+    >>> list(offsets), list(targets)
+    ([0, 2, 3, 3], [1, 2, 2])
+    >>> t_offsets, t_targets = transpose_csr(3, offsets, targets)
+    >>> list(t_offsets), list(t_targets)
+    ([0, 0, 1, 3], [0, 0, 1])
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Final, Literal, TypeAlias, TypeVar, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Typecodes for CSR arrays: 'q' = int64 offsets, 'i' = int32 targets
+# (Final so they type as literals, e.g. for memoryview.cast)
+OFFSET_TYPECODE: Final = "q"
+TARGET_TYPECODE: Final = "i"
+
+# An index array: owned, or a read-only view over serialized bytes
+IntArray: TypeAlias = "array[int] | memoryview[int]"
+
+# Integer typecodes view_le() can cast to
+IntTypecode: TypeAlias = Literal["B", "i", "q"]
+
+_Name = TypeVar("_Name", bound=str)
+
+
+def pack_csr(rows: Iterable[Iterable[int]]) -> tuple[array[int], array[int]]:
+    """Pack per-row neighbor collections into CSR offset/target arrays.
+
+    Targets within each row are sorted so that slices are deterministic
+    and can be merged or searched without extra work.
+
+    Args:
+        rows: One iterable of neighbor indices per row.
+
+    Returns:
+        Tuple of (offsets, targets). offsets has one more entry than rows.
+    """
+    offsets: array[int] = array(OFFSET_TYPECODE, [0])
+    targets: array[int] = array(TARGET_TYPECODE)
+    for row in rows:
+        targets.extend(sorted(row))
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def transpose_csr(
+    row_count: int,
+    offsets: IntArray,
+    targets: IntArray,
+) -> tuple[array[int], array[int]]:
+    """Transpose a square CSR matrix using a counting pass.
+
+    Args:
+        row_count: Number of rows (equal to number of columns).
+        offsets: CSR offsets of the matrix to transpose.
+        targets: CSR targets of the matrix to transpose.
+
+    Returns:
+        Tuple of (offsets, targets) for the transposed matrix. Because
+        source rows are visited in ascending order, each transposed row
+        is sorted ascending as well.
+
+    Time Complexity:
+        O(N + E)
+    """
+    # Count in-degree per column, then prefix-sum into offsets
+    counts = [0] * (row_count + 1)
+    for target in targets:
+        counts[target + 1] += 1
+    for i in range(row_count):
+        counts[i + 1] += counts[i]
+
+    transposed_offsets: array[int] = array(OFFSET_TYPECODE, counts)
+    transposed_targets: array[int] = array(TARGET_TYPECODE, [0]) * len(targets)
+
+    # Scatter each edge into its column's next free slot
+    cursor = counts[:row_count]
+    for source in range(row_count):
+        for k in range(offsets[source], offsets[source + 1]):
+            target = targets[k]
+            transposed_targets[cursor[target]] = source
+            cursor[target] += 1
+
+    return transposed_offsets, transposed_targets
+
+
+@overload
+def row(offsets: IntArray, targets: array[int], index: int) -> array[int]: ...
+
+
+@overload
+def row(offsets: IntArray, targets: memoryview[int], index: int) -> memoryview[int]: ...
+
+
+def row(offsets: IntArray, targets: IntArray, index: int) -> IntArray:
+    """Get the neighbor slice of one CSR row.
+
+    Args:
+        offsets: CSR offsets.
+        targets: CSR targets.
+        index: Row index.
+
+    Returns:
+        Slice with the row's neighbors, of the same kind as targets.
+    """
+    return targets[offsets[index] : offsets[index + 1]]
+
+
+def to_le_bytes(values: IntArray | array[float]) -> bytes:
+    """Get the little-endian bytes of an integer or float array.
+
+    Indexes are always written little-endian so that files are portable
+    between hosts.
+
+    Args:
+        values: Array to serialize.
+
+    Returns:
+        Raw little-endian bytes.
+    """
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array(values.format if isinstance(values, memoryview) else values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def read_le(
+    data: bytes | memoryview,
+    position: int,
+    typecode: str,
+    count: int,
+) -> tuple[array[int], int]:
+    """Read little-endian integers written by to_le_bytes().
+
+    Args:
+        data: Buffer to read from.
+        position: Byte offset to start reading at.
+        typecode: array typecode of the stored values.
+        count: Number of values to read.
+
+    Returns:
+        Tuple of (values, position after the last byte read).
+    """
+    values: array[int] = array(typecode)
+    end = position + count * values.itemsize
+    values.frombytes(data[position:end])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values, end
+
+
+def view_le(
+    data: bytes | memoryview,
+    position: int,
+    typecode: IntTypecode,
+    count: int,
+) -> tuple[IntArray, int]:
+    """Get little-endian integers written by to_le_bytes() without copying.
+
+    On little-endian hosts the result is a read-only memoryview of data
+    cast to typecode; it keeps data (e.g. a bundle's mapping) alive while
+    it exists. Big-endian hosts get a byte-swapped copy from read_le().
+
+    Args:
+        data: Buffer to read from.
+        position: Byte offset to start reading at.
+        typecode: array typecode of the stored values.
+        count: Number of values to read.
+
+    Returns:
+        Tuple of (values, position after the last byte read).
+    """
+    if sys.byteorder != "little":
+        return read_le(data, position, typecode, count)
+    end = position + count * array(typecode).itemsize
+    with memoryview(data) as whole:
+        return whole[position:end].cast(typecode), end
+
+
+class NameTable(Sequence[_Name]):
+    r"""Newline-joined UTF-8 names, split on first access.
+
+    Restoring an index keeps its names as the raw bytes; the cost of
+    decoding and splitting them is paid only by the first lookup.
+
+    Example:
+        >>> names = NameTable(b"XI1\nXI2", 2, CellId)
+        >>> names[1]
+        'XI2'
+    """
+
+    def __init__(self, data: bytes | memoryview, count: int, kind: Callable[[str], _Name]) -> None:
+        """Wrap serialized names.
+
+        Args:
+            data: count names joined by newlines, UTF-8 encoded.
+            count: Number of names.
+            kind: Identifier type applied to each name, e.g. CellId.
+        """
+        self._data: bytes | memoryview | None = data
+        self._count = count
+        self._kind = kind
+        self._names: list[_Name] | None = None
+
+    @property
+    def names(self) -> list[_Name]:
+        """The decoded names (decoded on first access)."""
+        if self._names is None:
+            assert self._data is not None
+            text = str(self._data, "utf-8")
+            self._names = list(map(self._kind, text.split("\n"))) if self._count else []
+            self._data = None
+        return self._names
+
+    @overload
+    def __getitem__(self, index: int) -> _Name: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_Name]: ...
+
+    def __getitem__(self, index: int | slice) -> _Name | list[_Name]:
+        """Get one name, or a list of names for a slice."""
+        return self.names[index]
+
+    def __len__(self) -> int:
+        """Get the number of names without decoding them."""
+        return self._count
+
+    def __iter__(self) -> Iterator[_Name]:
+        """Iterate over the decoded names."""
+        return iter(self.names)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by content with any sequence of names."""
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(other) == self._count and list(other) == self.names
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
@@ -0,0 +1,46 @@
+"""Description of an incremental graph change.
+
+This module provides the GraphDelta value object returned by
+NetworkXGraphBuilder.apply_delta() and consumed by derived indexes (such as
+CellProjection) that patch themselves instead of being rebuilt.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Value Object
+    Bounded Context: Netlist Context
+
+See Also:
+    - NetworkXGraphBuilder.apply_delta: Produces deltas
+    - CellProjection.apply_delta: Consumes deltas
+    - PinTable.apply_delta: Consumes deltas
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+
+
+@dataclass(frozen=True, slots=True)
+class GraphDelta:
+    """One applied graph mutation, summarized for index maintenance.
+
+    Attributes:
+        added_cells: Cells that were added to the graph
+        removed_cells: Cells that were removed from the graph
+        touched_cells: Surviving cells whose fanin or fanout may have
+            changed (every cell on a net the delta touched, plus added cells)
+        version: Graph version after the change
+        removed_pins: Pins that were removed along with removed cells
+        touched_nets: Nets whose driver or sink pins may have changed
+    """
+
+    added_cells: tuple[CellId, ...]
+    removed_cells: tuple[CellId, ...]
+    touched_cells: frozenset[CellId]
+    version: int
+    removed_pins: tuple[PinId, ...] = ()
+    touched_nets: frozenset[NetId] = frozenset()
@@ -0,0 +1,499 @@
+"""Design statistics report: counts, fanout distributions and hot spots.
+
+This module provides the GraphStatistics class, a snapshot of a built
+design graph taken in one sweep at load time: node and edge counts by
+type, fanout/fanin histograms, the highest-fanout nets, cell-type
+frequency and rough memory estimates. It answers the questions that used
+to require scanning every node (NetworkXGraphBuilder.cell_node_count())
+and points at traversal hot spots, such as a reset net with 200k sinks,
+before a user expands into them.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Derived index (built once per graph version)
+    Bounded Context: Netlist Context
+
+Definitions:
+    - Net fanout: sink connections on the net, i.e. input (or inout) pins
+      plus output ports it drives
+    - Cell fanin: connected input (or inout) pins of the cell
+    - Cell fanout: sink connections of every net the cell's output pins
+      drive, summed
+    - Histograms bucket values by powers of two: 0, 1, 2, 3-4, 5-8, ...
+      (see bucket_label())
+
+Memory Estimates:
+    Graph bytes are node and edge counts times per-element costs measured
+    for NetworkX MultiDiGraph on CPython 3.11 (full or lean builder mode).
+    Projection bytes follow the CellProjection CSR layout, with one edge
+    per (driver pin, sink pin) pair on a net. Both are order-of-magnitude
+    guides for sizing, not allocator measurements.
+
+Persistence:
+    to_bytes()/from_bytes() let the report travel in an IndexBundle, so
+    the command line tool can print it for a netlist without loading the
+    design:
+
+        python -m ink.infrastructure.graph.graph_statistics top.cdl [--json]
+
+    Writing the bundle is up to the code that loads the design; the file
+    open path of the GUI does not parse netlists yet, so nothing writes one
+    automatically:
+
+        >>> IndexBundle.update(default_bundle_path(cdl_path), netlist_digest(cdl_path),
+        ...                    [builder.statistics()])
+
+Example:
+    >>> stats = builder.statistics()
+    >>> stats.format_summary()
+    '1,204 cells · 1,530 nets · max fanout 412 (rst_n)'
+    >>> stats.top_fanout_nets[0]
+    ('rst_n', 412)
+
+See Also:
+    - NetworkXGraphBuilder.statistics: Cached report for the current graph
+    - IndexBundle: Persists the report alongside the graph indexes
+    - MainWindow.update_graph_statistics: Status bar display
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import struct
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from ink.domain.value_objects.identifiers import NetId
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import networkx as nx
+
+    from ink.domain.model import Design
+
+# Number of highest-fanout nets kept in the report by default
+DEFAULT_TOP_N: Final = 10
+
+# Approximate bytes per NetworkX MultiDiGraph element (node attribute dict,
+# successor and predecessor adjacency dicts; edge key dict and attribute
+# dict, referenced from both sides). Lean graphs carry only node_type.
+_NODE_BYTES: Final = 900
+_LEAN_NODE_BYTES: Final = 550
+_EDGE_BYTES: Final = 700
+
+# CellProjection: 8-byte offsets per cell (both directions) and 8-byte
+# target, driver and fanin-edge entries per edge
+_PROJECTION_CELL_BYTES: Final = 2 * 8
+_PROJECTION_EDGE_BYTES: Final = 4 * 8
+
+# Binary format header: magic, version; followed by the report as UTF-8 JSON
+_MAGIC = b"INKSTA"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sH")
+
+# Buckets 0, 1 and 2 each hold a single value
+_SINGLE_VALUE_BUCKETS: Final = 2
+
+# (bucket label, count) pairs in ascending bucket order
+Histogram = tuple[tuple[str, int], ...]
+
+
+def bucket_of(value: int) -> int:
+    """Get the power-of-two histogram bucket of a non-negative value.
+
+    Bucket 0 holds 0, bucket 1 holds 1, bucket 2 holds 2, and bucket k > 2
+    holds 2**(k-2)+1 .. 2**(k-1).
+
+    Args:
+        value: Fanout or fanin count.
+
+    Returns:
+        Bucket number.
+    """
+    return 0 if value == 0 else (value - 1).bit_length() + 1
+
+
+def bucket_label(bucket: int) -> str:
+    """Get the display label of a histogram bucket ("0", "1", "3-4", ...).
+
+    Args:
+        bucket: Bucket number from bucket_of().
+
+    Returns:
+        The value range the bucket covers.
+    """
+    if bucket <= _SINGLE_VALUE_BUCKETS:
+        return str(bucket)
+    return f"{(1 << (bucket - 2)) + 1}-{1 << (bucket - 1)}"
+
+
+@dataclass(frozen=True)
+class GraphStatistics:
+    """Statistics report for one built design graph.
+
+    Build with from_graph(); the report is immutable and describes the
+    graph as of graph_version.
+
+    Attributes:
+        design_name: Name of the Design the graph was built from
+        graph_version: Builder version the report describes (None when
+            restored from bytes)
+        node_counts: Node count per node_type ('cell', 'pin', 'net', 'port')
+        edge_counts: Edge count per edge_type ('contains_pin', 'drives')
+        sequential_cell_count: Cells flagged is_sequential
+        floating_pin_count: Pins with no net
+        undriven_net_count: Nets with sinks but no driver
+        multi_driven_net_count: Nets with more than one driver
+        net_fanout_histogram: Nets per fanout bucket
+        cell_fanin_histogram: Cells per fanin bucket
+        cell_fanout_histogram: Cells per fanout bucket
+        top_fanout_nets: (net, fanout) for the highest-fanout nets,
+            highest first, ties in design order
+        cell_type_counts: (cell type, count), most frequent first
+        estimated_graph_bytes: Rough NetworkX graph footprint
+        estimated_projection_bytes: Rough CellProjection footprint
+    """
+
+    design_name: str
+    graph_version: int | None
+    node_counts: dict[str, int]
+    edge_counts: dict[str, int]
+    sequential_cell_count: int
+    floating_pin_count: int
+    undriven_net_count: int
+    multi_driven_net_count: int
+    net_fanout_histogram: Histogram
+    cell_fanin_histogram: Histogram
+    cell_fanout_histogram: Histogram
+    top_fanout_nets: tuple[tuple[NetId, int], ...]
+    cell_type_counts: tuple[tuple[str, int], ...]
+    estimated_graph_bytes: int
+    estimated_projection_bytes: int
+
+    @classmethod
+    def from_graph(  # type: ignore[no-any-unimported]
+        cls,
+        graph: nx.MultiDiGraph,
+        design: Design,
+        top_n: int = DEFAULT_TOP_N,
+        lean: bool = False,
+    ) -> GraphStatistics:
+        """Collect statistics for a graph built from design.
+
+        Node and edge counts come from one sweep over the graph; the
+        connectivity figures from one pass over the design's pins, nets,
+        ports and cells.
+
+        Args:
+            graph: Graph from NetworkXGraphBuilder.build_from_design().
+            design: The Design the graph was built from.
+            top_n: Number of highest-fanout nets to keep.
+            lean: True if the graph was built in lean mode (affects only
+                the memory estimate).
+
+        Returns:
+            The statistics report.
+        """
+        node_counts = Counter(kind for _, kind in graph.nodes(data="node_type"))
+        edge_counts = Counter(kind for _, _, kind in graph.edges(data="edge_type"))
+
+        drivers, sinks, floating = _net_connections(design)
+
+        nets = design.get_all_nets()
+        net_fanout = Counter(bucket_of(sinks[net.id]) for net in nets)
+        undriven = sum(1 for net in nets if sinks[net.id] and not drivers[net.id])
+        multi_driven = sum(1 for net in nets if drivers[net.id] > 1)
+        top = heapq.nlargest(top_n, ((sinks[net.id], net.id) for net in nets), key=_first)
+        projection_edges = sum(drivers[net.id] * sinks[net.id] for net in nets)
+
+        cell_fanin: Counter[int] = Counter()
+        cell_fanout: Counter[int] = Counter()
+        cell_types: Counter[str] = Counter()
+        sequential = 0
+        for cell in design.get_all_cells():
+            fanin = fanout = 0
+            for pin_id in cell.pin_ids:
+                cell_pin = design.get_pin(pin_id)
+                if cell_pin is None or cell_pin.net_id is None:
+                    continue
+                if cell_pin.direction.is_input():
+                    fanin += 1
+                if cell_pin.direction.is_output():
+                    # An inout pin is one of its own net's sinks
+                    fanout += sinks[cell_pin.net_id] - cell_pin.direction.is_input()
+            cell_fanin[bucket_of(fanin)] += 1
+            cell_fanout[bucket_of(fanout)] += 1
+            cell_types[cell.cell_type] += 1
+            sequential += cell.is_sequential
+
+        node_bytes = _LEAN_NODE_BYTES if lean else _NODE_BYTES
+        return cls(
+            design_name=design.name,
+            graph_version=graph.graph.get("version"),
+            node_counts=dict(node_counts),
+            edge_counts=dict(edge_counts),
+            sequential_cell_count=sequential,
+            floating_pin_count=floating,
+            undriven_net_count=undriven,
+            multi_driven_net_count=multi_driven,
+            net_fanout_histogram=_histogram(net_fanout),
+            cell_fanin_histogram=_histogram(cell_fanin),
+            cell_fanout_histogram=_histogram(cell_fanout),
+            top_fanout_nets=tuple((net_id, count) for count, net_id in top),
+            cell_type_counts=tuple(
+                sorted(cell_types.items(), key=lambda item: (-item[1], item[0]))
+            ),
+            estimated_graph_bytes=(
+                graph.number_of_nodes() * node_bytes + graph.number_of_edges() * _EDGE_BYTES
+            ),
+            estimated_projection_bytes=(
+                node_counts["cell"] * _PROJECTION_CELL_BYTES
+                + projection_edges * _PROJECTION_EDGE_BYTES
+            ),
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    @property
+    def cell_count(self) -> int:
+        """Number of cell nodes."""
+        return self.node_counts.get("cell", 0)
+
+    @property
+    def net_count(self) -> int:
+        """Number of net nodes."""
+        return self.node_counts.get("net", 0)
+
+    @property
+    def max_net_fanout(self) -> int:
+        """Fanout of the highest-fanout net, 0 if there are no nets."""
+        return self.top_fanout_nets[0][1] if self.top_fanout_nets else 0
+
+    def format_summary(self) -> str:
+        """Format a one-line summary for the status bar.
+
+        Returns:
+            e.g. "1,204 cells · 1,530 nets · max fanout 412 (rst_n)"
+        """
+        parts = [f"{self.cell_count:,} cells", f"{self.net_count:,} nets"]
+        if self.top_fanout_nets:
+            net_id, fanout = self.top_fanout_nets[0]
+            parts.append(f"max fanout {fanout:,} ({net_id})")
+        return " · ".join(parts)
+
+    def format_report(self) -> str:
+        """Format the full multi-line report.
+
+        Returns:
+            Plain text with one section per statistic group.
+        """
+        lines = [f"Design: {self.design_name}", "", "Nodes:"]
+        lines.extend(
+            f"  {kind:<14}{count:>12,}" for kind, count in sorted(self.node_counts.items())
+        )
+        lines.append("Edges:")
+        lines.extend(
+            f"  {kind:<14}{count:>12,}" for kind, count in sorted(self.edge_counts.items())
+        )
+        lines += [
+            "",
+            f"Sequential cells:  {self.sequential_cell_count:,}",
+            f"Floating pins:     {self.floating_pin_count:,}",
+            f"Undriven nets:     {self.undriven_net_count:,}",
+            f"Multi-driven nets: {self.multi_driven_net_count:,}",
+        ]
+        for title, histogram in (
+            ("Net fanout", self.net_fanout_histogram),
+            ("Cell fanin", self.cell_fanin_histogram),
+            ("Cell fanout", self.cell_fanout_histogram),
+        ):
+            lines += ["", f"{title}:"]
+            lines.extend(f"  {label:>13}{count:>12,}" for label, count in histogram)
+        lines += ["", "Highest-fanout nets:"]
+        lines.extend(f"  {count:>12,}  {net_id}" for net_id, count in self.top_fanout_nets)
+        lines += ["", "Cell types:"]
+        lines.extend(f"  {count:>12,}  {cell_type}" for cell_type, count in self.cell_type_counts)
+        lines += [
+            "",
+            f"Estimated graph memory:      {_megabytes(self.estimated_graph_bytes)}",
+            f"Estimated projection memory: {_megabytes(self.estimated_projection_bytes)}",
+        ]
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-compatible builtins.
+
+        Returns:
+            Dictionary of the fields; tuples become lists.
+        """
+        return asdict(self)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the report for an IndexBundle.
+
+        Returns:
+            Header followed by the report as UTF-8 JSON.
+        """
+        payload = json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+        return _HEADER.pack(_MAGIC, _FORMAT_VERSION) + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> GraphStatistics:
+        """Restore a report written by to_bytes().
+
+        Args:
+            data: Serialized report.
+
+        Returns:
+            The report, with graph_version None.
+
+        Raises:
+            ValueError: If data is not a serialized GraphStatistics.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a GraphStatistics (bad header)")
+        magic, version = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a GraphStatistics (bad header)")
+
+        fields = json.loads(str(data[_HEADER.size :], "utf-8"))
+        return cls(
+            design_name=fields["design_name"],
+            graph_version=None,
+            node_counts=fields["node_counts"],
+            edge_counts=fields["edge_counts"],
+            sequential_cell_count=fields["sequential_cell_count"],
+            floating_pin_count=fields["floating_pin_count"],
+            undriven_net_count=fields["undriven_net_count"],
+            multi_driven_net_count=fields["multi_driven_net_count"],
+            net_fanout_histogram=_pairs(fields["net_fanout_histogram"]),
+            cell_fanin_histogram=_pairs(fields["cell_fanin_histogram"]),
+            cell_fanout_histogram=_pairs(fields["cell_fanout_histogram"]),
+            top_fanout_nets=tuple(
+                (NetId(net_id), count) for net_id, count in fields["top_fanout_nets"]
+            ),
+            cell_type_counts=_pairs(fields["cell_type_counts"]),
+            estimated_graph_bytes=fields["estimated_graph_bytes"],
+            estimated_projection_bytes=fields["estimated_projection_bytes"],
+        )
+
+
+def _net_connections(design: Design) -> tuple[Counter[str], Counter[str], int]:
+    """Count driver and sink connections per net, and floating pins.
+
+    Returns:
+        (drivers per net, sinks per net, pins with no net)
+    """
+    drivers: Counter[str] = Counter()
+    sinks: Counter[str] = Counter()
+    floating = 0
+    for pin in design.get_all_pins():
+        if pin.net_id is None:
+            floating += 1
+            continue
+        if pin.direction.is_output():
+            drivers[pin.net_id] += 1
+        if pin.direction.is_input():
+            sinks[pin.net_id] += 1
+    for port in design.get_all_ports():
+        if port.net_id is None:
+            continue
+        # Input ports drive the design; output ports are driven by it
+        if port.direction.is_input():
+            drivers[port.net_id] += 1
+        if port.direction.is_output():
+            sinks[port.net_id] += 1
+    return drivers, sinks, floating
+
+
+def _first(item: tuple[int, NetId]) -> int:
+    """Sort key for (fanout, net) pairs: fanout only, so ties keep design order."""
+    return item[0]
+
+
+def _histogram(buckets: Counter[int]) -> Histogram:
+    """Convert bucket counts to labeled pairs, filling empty buckets up to the max."""
+    if not buckets:
+        return ()
+    return tuple((bucket_label(b), buckets[b]) for b in range(max(buckets) + 1))
+
+
+def _pairs(items: list[list[Any]]) -> tuple[tuple[str, int], ...]:
+    """Convert JSON [label, count] lists back to tuples."""
+    return tuple((str(label), int(count)) for label, count in items)
+
+
+def _megabytes(size: int) -> str:
+    """Format a byte count in MiB."""
+    return f"{size / (1 << 20):,.1f} MiB"
+
+
+# =============================================================================
+# Command Line
+# =============================================================================
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Print the statistics report saved for a netlist.
+
+    Reads the report from the netlist's index bundle, so no parsing or
+    graph build is needed. The bundle must have been written with a
+    GraphStatistics section (see "Persistence" in the module docstring).
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code: 0 on success, 1 if no current report exists.
+    """
+    # Imported here: index_bundle imports this module for its section table
+    from ink.infrastructure.graph.index_bundle import (  # noqa: PLC0415
+        IndexBundle,
+        default_bundle_path,
+        netlist_digest,
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="python -m ink.infrastructure.graph.graph_statistics",
+        description="Print the design statistics report saved for a netlist.",
+    )
+    parser.add_argument("netlist", type=Path, help="netlist file (e.g. design.cdl)")
+    parser.add_argument("--bundle", type=Path, help="index bundle (default: next to netlist)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if not args.netlist.is_file():
+        print(f"error: {args.netlist}: no such file", file=sys.stderr)
+        return 1
+    bundle_path = args.bundle or default_bundle_path(args.netlist)
+    bundle = IndexBundle.open(bundle_path, netlist_digest(args.netlist))
+    if bundle is None:
+        print(
+            f"error: no current index bundle at {bundle_path}; write one with IndexBundle.update()",
+            file=sys.stderr,
+        )
+        return 1
+    with bundle:
+        stats = bundle.get(GraphStatistics)
+    if stats is None:
+        print(f"error: {bundle_path} has no statistics section", file=sys.stderr)
+        return 1
+
+    print(json.dumps(stats.to_dict(), indent=2) if args.json else stats.format_report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
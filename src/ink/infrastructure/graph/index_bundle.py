@@ -0,0 +1,422 @@
+"""Memory-mapped bundle of graph indexes for instant reopen.
+
+This module provides the IndexBundle class: one binary file holding the
+serialized graph-layer indexes of a design (cell projection and adjacency
+CSR arrays, levelization, combinational loops, sequential reachability,
+clock domains, the statistics report), plus any section other layers
+register, keyed by a digest of the netlist they were built from. On reopen
+the file is mapped read-only and each index is decoded only when it is
+first asked for, so a previously opened design skips every index build and
+pays only for the indexes a query actually touches. Decoding copies little:
+the integer arrays of every index are read in place from the mapped pages,
+and CellProjection and CellAdjacency also split their names only on first
+use.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Persistence of derived indexes (write once, mmap on reopen)
+    Bounded Context: Netlist Context
+
+File Layout:
+    - Header: magic, format version, section count, 32-byte key digest
+    - Table of contents: (section name, offset, length) per section
+    - Sections: each index's own to_bytes() form, 8-byte aligned
+
+    Every index keeps its own magic and version inside its section, so a
+    format change in one index invalidates only that section.
+
+Sections:
+    The graph indexes are registered here. Other layers add their own
+    section types with register_section() instead of this module importing
+    them; the layout package registers LayoutCache as "layouts" when
+    ink.infrastructure.layout.layout_cache is imported. Sections whose type
+    is not registered in the current process are still kept by update().
+
+Keying:
+    The key is the SHA-256 of the netlist file (netlist_digest()), which
+    is cheap to compute compared to rebuilding any index. A bundle whose
+    key does not match, or that cannot be read, is treated as absent and
+    open() returns None; callers then rebuild and write a fresh bundle.
+
+Updating:
+    update() replaces some sections of an existing bundle and copies the
+    others byte for byte, without decoding them. It is how state that grows
+    during a session (e.g. the layout package's LayoutCache) is saved
+    without rebuilding the graph indexes.
+
+Example:
+    >>> key = netlist_digest(cdl_path)
+    >>> path = default_bundle_path(cdl_path)
+    >>> bundle = IndexBundle.open(path, key)
+    >>> if bundle is None:
+    ...     IndexBundle.write(path, key, [projection, LevelIndex.from_design(design)])
+    ... else:
+    ...     traverser = NetworkXGraphTraverser(graph, design, indexes=bundle)
+
+See Also:
+    - NetworkXGraphTraverser: Takes its projection and cone adjacency from a bundle
+    - NetClassificationConfig: Source of the .ink project directory convention
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Protocol, TypeVar
+
+from ink.infrastructure.graph.cell_adjacency import CellAdjacency
+from ink.infrastructure.graph.cell_projection import CellProjection
+from ink.infrastructure.graph.clock_domains import ClockDomainIndex
+from ink.infrastructure.graph.combinational_loops import CombinationalLoopIndex
+from ink.infrastructure.graph.graph_statistics import GraphStatistics
+from ink.infrastructure.graph.levelization import LevelIndex
+from ink.infrastructure.graph.sequential_reachability import SequentialReachabilityIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from types import TracebackType
+
+_T = TypeVar("_T", bound="BundledIndex")
+
+
+class BundledIndex(Protocol):
+    """Any index the bundle can hold: serializable to and from bytes."""
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index."""
+        ...
+
+    @classmethod
+    def from_bytes(cls: type[_T], data: bytes | memoryview) -> _T:
+        """Restore an index from to_bytes() output (or a view of it)."""
+        ...
+
+
+# Section name per index type (8 bytes, NUL-padded in the table of contents);
+# extended by register_section()
+SECTION_NAMES: Final[dict[type[BundledIndex], bytes]] = {
+    CellProjection: b"project",
+    CellAdjacency: b"adjacent",
+    LevelIndex: b"levels",
+    CombinationalLoopIndex: b"loops",
+    SequentialReachabilityIndex: b"seqreach",
+    ClockDomainIndex: b"clocks",
+    GraphStatistics: b"stats",
+}
+
+# Bundle files live next to the netlist, under the project's .ink folder
+BUNDLE_DIR = Path(".ink") / "indexes"
+BUNDLE_SUFFIX = ".inkidx"
+
+# Binary format: header, then one table-of-contents entry per section
+_MAGIC = b"INKBDL"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sHq32s")
+_ENTRY = struct.Struct("<8sqq")
+_ENTRY_NAME_SIZE = 8
+_ALIGNMENT = 8
+
+# Read netlists in 1 MiB chunks when hashing
+_DIGEST_CHUNK = 1 << 20
+
+
+def netlist_digest(path: Path) -> str:
+    """Get the SHA-256 hex digest of a netlist file, the bundle key.
+
+    Args:
+        path: Netlist file (e.g. a .cdl file).
+
+    Returns:
+        64-character lowercase hex digest.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_DIGEST_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def register_section(kind: type[BundledIndex], name: bytes) -> None:
+    """Let bundles store an index type defined outside the graph layer.
+
+    Registering the same type under the same name again is a no-op, so
+    modules can register at import time.
+
+    Args:
+        kind: Index class with to_bytes() and a from_bytes() classmethod.
+        name: Section name, at most 8 bytes.
+
+    Raises:
+        ValueError: If the name is empty or too long, or the name or the
+            type is already registered with a different counterpart.
+    """
+    if not 0 < len(name) <= _ENTRY_NAME_SIZE:
+        raise ValueError(f"Section name must be 1 to {_ENTRY_NAME_SIZE} bytes: {name!r}")
+    existing = SECTION_NAMES.get(kind)
+    if existing == name:
+        return
+    if existing is not None:
+        raise ValueError(f"{kind.__name__} is already registered as {existing!r}")
+    if name in SECTION_NAMES.values():
+        raise ValueError(f"Section name {name!r} is already registered")
+    SECTION_NAMES[kind] = name
+
+
+def default_bundle_path(netlist_path: Path) -> Path:
+    """Get the conventional bundle location for a netlist.
+
+    Args:
+        netlist_path: Netlist file the bundle's indexes describe.
+
+    Returns:
+        ``<netlist dir>/.ink/indexes/<netlist name>.inkidx``
+    """
+    return netlist_path.parent / BUNDLE_DIR / (netlist_path.name + BUNDLE_SUFFIX)
+
+
+class IndexBundle:
+    """Read-only, memory-mapped view of a bundle file.
+
+    Use open() to map a bundle and write() to create one. Decoded indexes
+    are cached, so repeated get() calls return the same object. The
+    mapping is released by close() (or by using the bundle as a context
+    manager); indexes already decoded stay valid after closing.
+
+    Attributes:
+        path: The mapped bundle file
+        key: The hex digest the bundle was written for
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        key: str,
+        mapping: mmap.mmap,
+        sections: dict[bytes, tuple[int, int]],
+    ) -> None:
+        """Initialize over an open mapping; use open() instead.
+
+        Args:
+            path: Bundle file path.
+            key: Hex digest the bundle was written for.
+            mapping: Read-only mapping of the whole file.
+            sections: Section name → (offset, length) in the mapping.
+        """
+        self.path = path
+        self.key = key
+        self._mapping: mmap.mmap | None = mapping
+        self._sections = sections
+        self._decoded: dict[bytes, BundledIndex] = {}
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    @staticmethod
+    def write(path: Path, key: str, indexes: Iterable[BundledIndex]) -> None:
+        """Write indexes to a bundle file, replacing any existing one.
+
+        The file is written next to its final path and renamed into place,
+        so a concurrent or interrupted writer never leaves a torn bundle.
+
+        Args:
+            path: Destination file; parent directories are created.
+            key: Hex digest identifying the netlist (see netlist_digest()).
+            indexes: Indexes to store, at most one per type.
+
+        Raises:
+            ValueError: If the key is not a SHA-256 hex digest, or an index
+                type appears twice or is not registered.
+        """
+        _write_sections(path, key, _serialize(indexes))
+
+    @classmethod
+    def update(cls, path: Path, key: str, indexes: Iterable[BundledIndex]) -> None:
+        """Replace some sections of a bundle, keeping the others.
+
+        Sections of the existing bundle are copied without being decoded.
+        If there is no valid bundle for key at path, only the given indexes
+        are written, as by write().
+
+        Args:
+            path: Bundle file; parent directories are created.
+            key: Hex digest identifying the netlist (see netlist_digest()).
+            indexes: Indexes to store, at most one per type.
+
+        Raises:
+            ValueError: If the key is not a SHA-256 hex digest, or an index
+                type appears twice or is not registered.
+        """
+        payloads = _serialize(indexes)
+        existing = cls.open(path, key)
+        if existing is not None and existing._mapping is not None:
+            with existing, memoryview(existing._mapping) as whole:
+                kept = {
+                    name: bytes(whole[offset : offset + length])
+                    for name, (offset, length) in existing._sections.items()
+                    if name not in payloads
+                }
+            payloads = {**kept, **payloads}
+        _write_sections(path, key, payloads)
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    @classmethod
+    def open(cls, path: Path, key: str) -> IndexBundle | None:
+        """Map a bundle read-only if it exists and was written for key.
+
+        Only the header and table of contents are read here; sections are
+        decoded on first get().
+
+        Args:
+            path: Bundle file.
+            key: Expected hex digest (see netlist_digest()).
+
+        Returns:
+            The mapped bundle, or None if the file is missing, foreign,
+            truncated or was written for a different netlist.
+        """
+        try:
+            with path.open("rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Missing, unreadable, or empty (zero-length files cannot be mapped)
+            return None
+
+        sections = _read_table(mapping, key)
+        if sections is None:
+            mapping.close()
+            return None
+        return cls(path, key, mapping, sections)
+
+    def __contains__(self, kind: object) -> bool:
+        """Check whether the bundle holds a section for an index type."""
+        return any(k is kind and name in self._sections for k, name in SECTION_NAMES.items())
+
+    def get(self, kind: type[_T]) -> _T | None:
+        """Get an index from the bundle, decoding it on first access.
+
+        Args:
+            kind: Index class, e.g. LevelIndex.
+
+        Returns:
+            The index, or None if the bundle has no such section.
+
+        Raises:
+            ValueError: If the bundle is closed and the index was not
+                decoded before closing, the section is corrupt, or kind is
+                not registered.
+        """
+        name = _section_name(kind)
+        cached = self._decoded.get(name)
+        if isinstance(cached, kind):
+            return cached
+        span = self._sections.get(name)
+        if span is None:
+            return None
+        if self._mapping is None:
+            raise ValueError("Bundle is closed")
+
+        offset, length = span
+        with memoryview(self._mapping) as whole, whole[offset : offset + length] as section:
+            index = kind.from_bytes(section)
+        self._decoded[name] = index
+        return index
+
+    def close(self) -> None:
+        """Release the mapping; decoded indexes remain usable.
+
+        Decoded indexes may hold views of the mapped pages. While any do,
+        the mapping cannot be closed explicitly; the bundle then drops its
+        reference and the pages are unmapped once those indexes are gone.
+        """
+        if self._mapping is not None:
+            # Views held by decoded indexes keep the mapping alive
+            with contextlib.suppress(BufferError):
+                self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self) -> IndexBundle:
+        """Use the bundle as a context manager that closes the mapping."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the mapping."""
+        self.close()
+
+
+def _serialize(indexes: Iterable[BundledIndex]) -> dict[bytes, bytes]:
+    """Serialize indexes by section name, rejecting duplicate types."""
+    payloads: dict[bytes, bytes] = {}
+    for index in indexes:
+        name = _section_name(type(index))
+        if name in payloads:
+            raise ValueError(f"Duplicate {type(index).__name__} in bundle")
+        payloads[name] = index.to_bytes()
+    return payloads
+
+
+def _section_name(kind: type[BundledIndex]) -> bytes:
+    """Get the registered section name of an index type."""
+    name = SECTION_NAMES.get(kind)
+    if name is None:
+        raise ValueError(f"{kind.__name__} is not a registered bundle section")
+    return name
+
+
+def _write_sections(path: Path, key: str, payloads: Mapping[bytes, bytes]) -> None:
+    """Write serialized sections to a temporary file and rename it into place."""
+    digest = bytes.fromhex(key)
+    if len(digest) != hashlib.sha256().digest_size:
+        raise ValueError("Bundle key must be a SHA-256 hex digest")
+
+    table: list[bytes] = []
+    position = _HEADER.size + _ENTRY.size * len(payloads)
+    for name, payload in payloads.items():
+        position = _aligned(position)
+        table.append(_ENTRY.pack(name, position, len(payload)))
+        position += len(payload)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with temporary.open("wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(payloads), digest))
+        f.writelines(table)
+        for payload in payloads.values():
+            f.write(bytes(_aligned(f.tell()) - f.tell()))
+            f.write(payload)
+    temporary.replace(path)
+
+
+def _aligned(position: int) -> int:
+    """Round a file position up to the section alignment."""
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+
+def _read_table(mapping: mmap.mmap, key: str) -> dict[bytes, tuple[int, int]] | None:
+    """Validate the header and read the table of contents, or None."""
+    if len(mapping) < _HEADER.size:
+        return None
+    magic, version, count, digest = _HEADER.unpack_from(mapping, 0)
+    if magic != _MAGIC or version != _FORMAT_VERSION or digest.hex() != key.lower():
+        return None
+    if len(mapping) < _HEADER.size + count * _ENTRY.size:
+        return None
+
+    sections: dict[bytes, tuple[int, int]] = {}
+    for k in range(count):
+        name, offset, length = _ENTRY.unpack_from(mapping, _HEADER.size + k * _ENTRY.size)
+        if offset + length > len(mapping):
+            return None
+        sections[name.rstrip(b"\0")] = (offset, length)
+    return sections
@@ -39,6 +39,19 @@ Design Decisions:
     3. Typed Nodes/Edges: All nodes and edges have type attributes for filtering
     4. Builder Pattern: Allows reuse for multiple designs
     5. Future Migration: Structure designed for easy migration to rustworkx
+    6. Lean Mode: For very large designs, NetworkXGraphBuilder(lean=True)
+       stores only node_type on nodes and edge_type on edges, bulk-loads
+       them with add_nodes_from/add_edges_from, and resolves entities from
+       the Design on demand. On 100k-cell designs this builds in roughly
+       half the time of the default mode; entity lookups then go through
+       the Design's dictionaries instead of node attributes.
+    7. Incremental Updates: apply_delta() adds/removes cells and rewires pins
+       in place for ECO reloads and hierarchical expansion, touching only
+       the affected nodes. Every build or delta bumps graph.graph["version"]
+       so caches keyed on the graph can tell when they are stale.
+    8. Statistics: statistics() collects a GraphStatistics report in one
+       sweep and caches it per graph version; the per-type count methods
+       read from it instead of scanning every node on each call.
 
 Example:
     >>> from ink.infrastructure.graph import NetworkXGraphBuilder
@@ -64,11 +77,21 @@ Example:
 
 from __future__ import annotations
 
+import gc
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 import networkx as nx
 
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId, PortId
+from ink.infrastructure.graph.cell_projection import CellProjection
+from ink.infrastructure.graph.graph_delta import GraphDelta
+from ink.infrastructure.graph.graph_statistics import DEFAULT_TOP_N, GraphStatistics
+from ink.infrastructure.graph.pin_table import PinTable
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from ink.domain.model import Cell, Design, Net, Pin, Port
 
 
@@ -85,6 +108,8 @@ class NetworkXGraphBuilder:
 
     Attributes:
         graph: The NetworkX MultiDiGraph being constructed
+        version: Monotonic graph version, bumped by every build and delta
+            and mirrored in graph.graph["version"]
 
     Node Attributes:
         - node_type: 'cell' | 'pin' | 'net' | 'port'
@@ -101,6 +126,11 @@ class NetworkXGraphBuilder:
     Edge Attributes:
         - edge_type: 'contains_pin' | 'drives'
 
+    Lean Mode:
+        With lean=True only node_type is stored on nodes; all other node
+        attributes above are omitted. get_node_entity() still works by
+        resolving the node ID against the Design.
+
     Example:
         >>> builder = NetworkXGraphBuilder()
         >>> graph = builder.build_from_design(design)
@@ -117,13 +147,20 @@ class NetworkXGraphBuilder:
         True
     """
 
-    def __init__(self) -> None:
+    def __init__(self, lean: bool = False) -> None:
         """Initialize the builder with an empty MultiDiGraph.
 
         Creates an empty NetworkX MultiDiGraph ready for building.
         MultiDiGraph is used to support multiple edges between the same
         nodes (e.g., multiple connections in bus signals).
+
+        Args:
+            lean: If True, build with minimal node attributes (node_type
+                only) using bulk inserts. Entities are looked up from the
+                Design instead of being stored on nodes.
         """
+        self.lean = lean
+
         # MultiDiGraph: directed graph with parallel edges support
         # This is essential for representing multiple connections between
         # the same pair of nodes (common in bus architectures)
@@ -133,6 +170,17 @@ class NetworkXGraphBuilder:
         # Store reference to current design for entity lookups
         self._design: Design | None = None
 
+        # Never reset, so (graph, version) identifies one graph state even
+        # when the builder is reused for another design
+        self.version = 0
+
+        # Builder-owned projection and pin table, kept current by apply_delta()
+        self._projection: CellProjection | None = None
+        self._pin_table: PinTable | None = None
+
+        # (version, top_n, report) for the last statistics() call
+        self._statistics: tuple[int, int, GraphStatistics] | None = None
+
     def build_from_design(  # type: ignore[no-any-unimported]
         self, design: Design
     ) -> nx.MultiDiGraph:
@@ -168,6 +216,13 @@ class NetworkXGraphBuilder:
 
         # Clear any previous graph data for reuse
         self.graph.clear()
+        self._projection = None
+        self._pin_table = None
+        self._bump_version()
+
+        if self.lean:
+            self._build_lean(design)
+            return self.graph
 
         # Phase 1: Add all entity nodes
         # Order matters: nodes must exist before creating edges
@@ -186,6 +241,67 @@ class NetworkXGraphBuilder:
 
         return self.graph
 
+    def _build_lean(self, design: Design) -> None:
+        """Build the graph with bulk inserts and minimal attributes.
+
+        Produces the same nodes and edges as the full build, but:
+        - Nodes carry only node_type (no entity or copied attributes)
+        - Nodes and edges are fed to add_nodes_from/add_edges_from from
+          generators, one call per node/edge kind, so NetworkX's per-call
+          overhead is paid a handful of times instead of once per element
+        - The cyclic garbage collector is paused for the bulk load. The
+          build allocates millions of long-lived dicts, and every gen-2
+          collection triggered along the way rescans all of them, which
+          otherwise costs more than the inserts themselves.
+
+        Args:
+            design: The Design aggregate to build the graph from.
+        """
+        with _gc_paused():
+            self._bulk_load(design)
+
+    def _bulk_load(self, design: Design) -> None:
+        """Insert all nodes and edges for a lean build (see _build_lean)."""
+        cells = design.get_all_cells()
+        pins = design.get_all_pins()
+        ports = design.get_all_ports()
+
+        graph = self.graph
+        graph.add_nodes_from((cell.id for cell in cells), node_type="cell")
+        graph.add_nodes_from((pin.id for pin in pins), node_type="pin")
+        graph.add_nodes_from((net.id for net in design.get_all_nets()), node_type="net")
+        graph.add_nodes_from((port.id for port in ports), node_type="port")
+
+        graph.add_edges_from(
+            ((cell.id, pin_id) for cell in cells for pin_id in cell.pin_ids),
+            edge_type="contains_pin",
+        )
+
+        # Same direction rules as _add_pin_net_edges/_add_port_net_edges;
+        # INOUT pins and ports get both edges
+        graph.add_edges_from(
+            (
+                edge
+                for pin in pins
+                if pin.net_id is not None
+                for edge in _signal_edges(
+                    pin.id, pin.net_id, pin.direction.is_output(), pin.direction.is_input()
+                )
+            ),
+            edge_type="drives",
+        )
+        graph.add_edges_from(
+            (
+                edge
+                for port in ports
+                if port.net_id is not None
+                for edge in _signal_edges(
+                    port.id, port.net_id, port.direction.is_input(), port.direction.is_output()
+                )
+            ),
+            edge_type="drives",
+        )
+
     # =========================================================================
     # Node Creation Methods
     # =========================================================================
@@ -394,6 +510,259 @@ class NetworkXGraphBuilder:
                     edge_type="drives",
                 )
 
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    def apply_delta(
+        self,
+        added_cells: Iterable[Cell] = (),
+        removed_cells: Iterable[CellId] = (),
+        changed_pins: Iterable[Pin] = (),
+    ) -> GraphDelta:
+        """Mutate the built graph in place instead of rebuilding it.
+
+        The Design must already reflect the change (Design.add_cell/add_pin/
+        add_net, remove_cell, replace_pin, replace_net); this method brings
+        the graph, and the indexes returned by get_cell_projection() and
+        get_pin_table(), in line with it. Work is proportional to the size of the change:
+        the pins of the affected cells and the nets they touch.
+
+        Args:
+            added_cells: New cells. Their pins (and any new nets) must be in
+                the Design.
+            removed_cells: Cells to drop along with their pins. Nets are
+                kept, even if they become empty, since the Design owns them.
+            changed_pins: Updated Pin entities, typically reconnected to a
+                different net or with a new direction. Each must already be
+                in the graph or belong to one of added_cells.
+
+        Returns:
+            A GraphDelta describing the affected cells, for patching other
+            derived indexes.
+
+        Raises:
+            ValueError: If no graph has been built yet, or a changed pin is
+                neither in the graph nor a pin of an added cell (the graph
+                is left unchanged).
+
+        Note:
+            Whole-design indexes (CellAdjacency, CombinationalLoopIndex,
+            SequentialReachabilityIndex) are not patched; rebuild them when
+            their results are needed after a delta.
+
+        Example:
+            >>> design.remove_cell(CellId("XI2"))
+            >>> delta = builder.apply_delta(removed_cells=[CellId("XI2")])
+            >>> CellId("XI2") in builder.graph
+            False
+        """
+        design = self._design
+        if design is None:
+            raise ValueError("apply_delta() requires a graph from build_from_design()")
+
+        graph = self.graph
+        added_cells = list(added_cells)
+        changed_pins = list(changed_pins)
+        added_pins = {pin_id for cell in added_cells for pin_id in cell.pin_ids}
+        unknown = [
+            pin.id for pin in changed_pins if pin.id not in graph and pin.id not in added_pins
+        ]
+        if unknown:
+            # Pins carry no owner, so there is no cell to attach them to
+            raise ValueError(f"Changed pins not in the graph: {', '.join(unknown)}")
+        touched_nets: set[str] = set()
+
+        removed = tuple(cell_id for cell_id in removed_cells if cell_id in graph)
+        removed_pins: list[PinId] = []
+        for cell_id in removed:
+            for pin_id in self._cell_pins(cell_id):
+                touched_nets.update(self._pin_nets(pin_id))
+                graph.remove_node(pin_id)
+                removed_pins.append(PinId(pin_id))
+            graph.remove_node(cell_id)
+
+        added: list[CellId] = []
+        for cell in added_cells:
+            self._insert_cell(design, cell)
+            for pin_id in cell.pin_ids:
+                pin = design.get_pin(pin_id)
+                if pin is not None:
+                    self._insert_pin(design, pin)
+                    touched_nets.update(self._pin_nets(pin_id))
+            added.append(cell.id)
+
+        # Owners of changed pins: a pin disconnected from every net no
+        # longer reaches its cell through touched_nets
+        touched: set[CellId] = set()
+        for pin in changed_pins:
+            if pin.id not in graph:
+                continue  # removed along with its cell above
+            touched.update(self._pin_owners(pin.id))
+            touched_nets.update(self._pin_nets(pin.id))
+            self._detach_pin(pin.id)
+            self._insert_pin(design, pin)
+            touched_nets.update(self._pin_nets(pin.id))
+
+        touched.update(owner for net_id in touched_nets for owner in self._net_cells(net_id))
+        touched.update(added)
+
+        self._bump_version()
+        delta = GraphDelta(
+            added_cells=tuple(added),
+            removed_cells=removed,
+            touched_cells=frozenset(touched),
+            version=self.version,
+            removed_pins=tuple(removed_pins),
+            touched_nets=frozenset(NetId(net_id) for net_id in touched_nets),
+        )
+        if self._projection is not None:
+            self._projection.apply_delta(graph, design, delta)
+            if self._pin_table is not None:
+                self._pin_table.apply_delta(graph, self._projection, delta)
+        return delta
+
+    def get_cell_projection(self) -> CellProjection:
+        """Get the cell projection of the current graph, kept current by deltas.
+
+        Built lazily on first use and discarded by build_from_design();
+        apply_delta() patches it in place rather than rebuilding it.
+
+        Returns:
+            The builder-owned CellProjection.
+
+        Raises:
+            ValueError: If no graph has been built yet.
+        """
+        if self._design is None:
+            raise ValueError("get_cell_projection() requires a graph from build_from_design()")
+        if self._projection is None:
+            self._projection = CellProjection.from_graph(self.graph, self._design)
+        return self._projection
+
+    def get_pin_table(self) -> PinTable:
+        """Get the pin table of the current graph, kept current by deltas.
+
+        Numbered like get_cell_projection(). Built lazily on first use and
+        discarded by build_from_design(); apply_delta() patches it in place
+        rather than rebuilding it.
+
+        Returns:
+            The builder-owned PinTable.
+
+        Raises:
+            ValueError: If no graph has been built yet.
+        """
+        if self._pin_table is None:
+            self._pin_table = PinTable.from_graph(self.graph, self.get_cell_projection())
+        return self._pin_table
+
+    def _bump_version(self) -> None:
+        """Advance the graph version after a structural change."""
+        self.version += 1
+        self.graph.graph["version"] = self.version
+
+    def _insert_cell(self, design: Design, cell: Cell) -> None:
+        """Add one cell node (attributes per build mode) and its pin edges."""
+        if self.lean:
+            self.graph.add_node(cell.id, node_type="cell")
+        else:
+            self.graph.add_node(
+                cell.id,
+                node_type="cell",
+                name=cell.name,
+                cell_type=cell.cell_type,
+                is_sequential=cell.is_sequential,
+                entity=cell,
+            )
+        for pin_id in cell.pin_ids:
+            if design.get_pin(pin_id) is not None:
+                self.graph.add_edge(cell.id, pin_id, edge_type="contains_pin")
+
+    def _insert_pin(self, design: Design, pin: Pin) -> None:
+        """Add or refresh one pin node and connect it to its net."""
+        if self.lean:
+            self.graph.add_node(pin.id, node_type="pin")
+        else:
+            self.graph.add_node(
+                pin.id,
+                node_type="pin",
+                name=pin.name,
+                direction=pin.direction,
+                net_id=pin.net_id,
+                entity=pin,
+            )
+        if pin.net_id is None:
+            return
+
+        net = design.get_net(pin.net_id)
+        if self.lean or net is None:
+            self.graph.add_node(pin.net_id, node_type="net")
+        else:
+            self.graph.add_node(
+                net.id, node_type="net", name=net.name, pin_count=net.pin_count(), entity=net
+            )
+        for source, target in _signal_edges(
+            pin.id, pin.net_id, pin.direction.is_output(), pin.direction.is_input()
+        ):
+            self.graph.add_edge(source, target, edge_type="drives")
+
+    def _detach_pin(self, pin_id: str) -> None:
+        """Remove every 'drives' edge between a pin and its net."""
+        graph = self.graph
+        stale = [
+            (source, target, key)
+            for source, target, key, edge_type in (
+                *graph.out_edges(pin_id, keys=True, data="edge_type"),
+                *graph.in_edges(pin_id, keys=True, data="edge_type"),
+            )
+            if edge_type == "drives"
+        ]
+        graph.remove_edges_from(stale)
+
+    def _cell_pins(self, cell_id: str) -> list[str]:
+        """Get the pin nodes contained by a cell node."""
+        return [
+            pin_id
+            for _, pin_id, edge_type in self.graph.out_edges(cell_id, data="edge_type")
+            if edge_type == "contains_pin"
+        ]
+
+    def _pin_nets(self, pin_id: str) -> set[str]:
+        """Get the nets a pin node drives or is driven by."""
+        graph = self.graph
+        edges = (
+            *graph.out_edges(pin_id, data="edge_type"),
+            *graph.in_edges(pin_id, data="edge_type"),
+        )
+        return {
+            target if source == pin_id else source
+            for source, target, kind in edges
+            if kind == "drives"
+        }
+
+    def _pin_owners(self, pin_id: str) -> set[CellId]:
+        """Get the cell containing a pin node (empty for ports)."""
+        return {
+            CellId(owner)
+            for owner, _, kind in self.graph.in_edges(pin_id, data="edge_type")
+            if kind == "contains_pin"
+        }
+
+    def _net_cells(self, net_id: str) -> set[CellId]:
+        """Get the cells owning any pin on a net (ports are skipped)."""
+        graph = self.graph
+        if net_id not in graph:
+            return set()
+        pins = [pin for _, pin in graph.out_edges(net_id)]
+        pins.extend(pin for pin, _ in graph.in_edges(net_id))
+        return {
+            CellId(owner)
+            for pin in pins
+            for owner, _, kind in graph.in_edges(pin, data="edge_type")
+            if kind == "contains_pin"
+        }
+
     # =========================================================================
     # Graph Access Methods
     # =========================================================================
@@ -413,11 +782,26 @@ class NetworkXGraphBuilder:
         """
         return self.graph
 
+    def get_design(self) -> Design:
+        """Get the Design the current graph was built from.
+
+        Returns:
+            The Design passed to build_from_design().
+
+        Raises:
+            ValueError: If no graph has been built yet.
+        """
+        if self._design is None:
+            raise ValueError("get_design() requires a graph from build_from_design()")
+        return self._design
+
     def get_node_entity(self, node_id: str) -> Cell | Pin | Net | Port | None:
         """Get the domain entity associated with a graph node.
 
         Retrieves the original domain entity (Cell, Pin, Net, or Port)
-        stored in the node's 'entity' attribute.
+        stored in the node's 'entity' attribute. Lean-mode graphs have no
+        entity attribute, so the entity is resolved from the Design by
+        node type instead.
 
         Args:
             node_id: The node identifier (CellId, PinId, NetId, or PortId)
@@ -433,7 +817,35 @@ class NetworkXGraphBuilder:
             >>> entity.cell_type
             'INV_X1'
         """
-        return self.graph.nodes[node_id].get("entity")  # type: ignore[no-any-return]
+        data = self.graph.nodes[node_id]
+        entity = data.get("entity")
+        if entity is not None or self._design is None:
+            return entity  # type: ignore[no-any-return]
+        return self._lookup_entity(node_id, data.get("node_type"))
+
+    def _lookup_entity(
+        self, node_id: str, node_type: str | None
+    ) -> Cell | Pin | Net | Port | None:
+        """Resolve a node ID to its domain entity through the Design.
+
+        Args:
+            node_id: The node identifier.
+            node_type: The node's node_type attribute.
+
+        Returns:
+            The entity, or None if the type is unknown or the ID is missing.
+        """
+        if self._design is None:
+            return None
+        if node_type == "cell":
+            return self._design.get_cell(CellId(node_id))
+        if node_type == "pin":
+            return self._design.get_pin(PinId(node_id))
+        if node_type == "net":
+            return self._design.get_net(NetId(node_id))
+        if node_type == "port":
+            return self._design.get_port(PortId(node_id))
+        return None
 
     def get_node_type(self, node_id: str) -> str | None:
         """Get the type of a graph node.
@@ -486,10 +898,39 @@ class NetworkXGraphBuilder:
         """
         return int(self.graph.number_of_edges())
 
+    def statistics(self, top_n: int = DEFAULT_TOP_N) -> GraphStatistics:
+        """Get the statistics report of the current graph.
+
+        Collected in one sweep on first use after each build or delta and
+        cached until the graph version changes.
+
+        Args:
+            top_n: Number of highest-fanout nets to report.
+
+        Returns:
+            The GraphStatistics report.
+
+        Raises:
+            ValueError: If no graph has been built yet.
+
+        Example:
+            >>> builder.build_from_design(design)
+            >>> builder.statistics().format_summary()
+            '1 cells · 2 nets · max fanout 1 (net_in)'
+        """
+        if self._design is None:
+            raise ValueError("statistics() requires a graph from build_from_design()")
+        cached = self._statistics
+        if cached is not None and cached[:2] == (self.version, top_n):
+            return cached[2]
+        stats = GraphStatistics.from_graph(self.graph, self._design, top_n, self.lean)
+        self._statistics = (self.version, top_n, stats)
+        return stats
+
     def cell_node_count(self) -> int:
         """Get number of cell nodes in the graph.
 
-        Counts nodes where node_type='cell'.
+        Counts nodes where node_type='cell', from the cached statistics().
 
         Returns:
             Number of cell nodes (0 or more)
@@ -499,16 +940,12 @@ class NetworkXGraphBuilder:
             >>> builder.cell_node_count()
             1
         """
-        return sum(
-            1
-            for _, data in self.graph.nodes(data=True)
-            if data.get("node_type") == "cell"
-        )
+        return self.statistics().cell_count if self._design is not None else 0
 
     def net_node_count(self) -> int:
         """Get number of net nodes in the graph.
 
-        Counts nodes where node_type='net'.
+        Counts nodes where node_type='net', from the cached statistics().
 
         Returns:
             Number of net nodes (0 or more)
@@ -518,8 +955,40 @@ class NetworkXGraphBuilder:
             >>> builder.net_node_count()
             2
         """
-        return sum(
-            1
-            for _, data in self.graph.nodes(data=True)
-            if data.get("node_type") == "net"
-        )
+        return self.statistics().net_count if self._design is not None else 0
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Disable the cyclic garbage collector for the duration of a block.
+
+    Restores the previous state on exit, so nesting and callers that have
+    already disabled GC are unaffected.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _signal_edges(
+    node_id: str, net_id: str, drives_net: bool, driven_by_net: bool
+) -> Iterator[tuple[str, str]]:
+    """Yield the 'drives' edges between a pin/port node and its net.
+
+    Args:
+        node_id: Pin or port node ID.
+        net_id: Connected net ID.
+        drives_net: True to emit node → net.
+        driven_by_net: True to emit net → node.
+
+    Yields:
+        (source, target) edge tuples.
+    """
+    if drives_net:
+        yield node_id, net_id
+    if driven_by_net:
+        yield net_id, node_id
@@ -13,23 +13,40 @@ and uses the Design aggregate to resolve graph node IDs to domain entities.
 
 Key Design Decisions:
     1. BFS Traversal: Uses breadth-first search for hop-counted queries
+       over a CellProjection (cell → cell CSR), so each hop is one slice
     2. Visited Tracking: Prevents infinite loops in cyclic graphs
     3. Entity Resolution: Converts graph node IDs to domain entities
     4. Sequential Boundaries: Respects is_sequential flag for expansion limits
-    5. Edge Direction: Follows pin direction semantics (OUTPUT→Net, Net→INPUT)
+    5. Edge Direction: Follows pin direction semantics (OUTPUT→Net, Net→INPUT);
+       fanin walks sinks back to drivers only, so other loads on the same
+       input net are not reported as fanin
 
 Performance Characteristics:
     - get_connected_cells: O(k) where k = pins on net
     - get_cell_pins: O(k) where k = pins on cell
-    - get_fanout/fanin: O(n) where n = cells visited
+    - get_fanout/fanin: O(n + e) over visited cells and their projected
+      edges; the projection is built once, O(P), on first use and again
+      only if the graph version changes behind its back
+    - get_fanout_from_pin/get_fanin_to_pin: first hop from PinTable arrays,
+      then as get_fanout/fanin; no Design lookups until results are built
     - find_path: O(V + E) using NetworkX shortest_path
+    - iter_k_shortest_paths/iter_simple_paths: bounded by PathLimits
+      (paths, hops and visited cells); results are streamed
+    - get_fanin_cut_points: O(E log V) over the fanin cone on first query
+      per sink (Lengauer-Tarjan), then O(depth) from the cached tree
+    - With an IndexBundle, the projection and the cone estimator's
+      adjacency are decoded from the memory-mapped bundle instead of
+      being rebuilt from the graph
+    - from_builder() shares the builder's projection and pin table, which
+      NetworkXGraphBuilder.apply_delta() patches in place, so edits never
+      trigger an O(P) rebuild
 
 Example:
     >>> from ink.infrastructure.graph import NetworkXGraphBuilder, NetworkXGraphTraverser
     >>>
     >>> builder = NetworkXGraphBuilder()
-    >>> graph = builder.build_from_design(design)
-    >>> traverser = NetworkXGraphTraverser(graph, design)
+    >>> builder.build_from_design(design)
+    >>> traverser = NetworkXGraphTraverser.from_builder(builder)
     >>>
     >>> # Get 2-hop fanout from a cell
     >>> fanout = traverser.get_fanout_cells(
@@ -45,14 +62,31 @@ See Also:
 
 from __future__ import annotations
 
+from array import array
+from collections import OrderedDict
+from itertools import chain
 from typing import TYPE_CHECKING
 
 import networkx as nx
 
 from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.infrastructure.graph.cell_adjacency import CellAdjacency
+from ink.infrastructure.graph.cell_projection import CellProjection
+from ink.infrastructure.graph.cone import CellCone, ConeSizeEstimator
+from ink.infrastructure.graph.csr import TARGET_TYPECODE
+from ink.infrastructure.graph.dominators import DominatorTree
+from ink.infrastructure.graph.path_search import PathLimits, PathSearch
+from ink.infrastructure.graph.pin_table import PinTable
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
     from ink.domain.model import Cell, Design, Net, Pin
+    from ink.infrastructure.graph.index_bundle import IndexBundle
+    from ink.infrastructure.graph.networkx_adapter import NetworkXGraphBuilder
+
+# Dominator trees kept per traverser (most recently used sinks)
+_DOMINATOR_CACHE_SIZE = 64
 
 
 class NetworkXGraphTraverser:
@@ -91,6 +125,9 @@ class NetworkXGraphTraverser:
         self,
         graph: nx.MultiDiGraph,
         design: Design,
+        projection: CellProjection | None = None,
+        indexes: IndexBundle | None = None,
+        pin_table: PinTable | None = None,
     ) -> None:
         """Initialize the traverser with graph and design.
 
@@ -99,9 +136,84 @@ class NetworkXGraphTraverser:
                    Must have node_type and entity attributes on nodes.
             design: Design aggregate for resolving entity IDs to entities.
                    Used for lookups when entity attribute is missing.
+            projection: Pre-built cell projection of the same graph. When
+                   omitted it is derived from the graph on first use.
+            indexes: Bundle of persisted indexes for this graph's netlist.
+                   When given (and projection is not), the projection and
+                   the cone estimator are restored from it on first use.
+            pin_table: Pre-built pin table numbered like projection; used
+                   while it is at the projection's graph version. Ignored
+                   without projection.
         """
         self.graph = graph
         self.design = design
+        self._projection = projection
+        self._indexes = indexes
+
+        # Derived indexes, tagged with the projection they were built from
+        self._pin_table: tuple[CellProjection, PinTable] | None = None
+        if projection is not None and pin_table is not None:
+            self._pin_table = (projection, pin_table)
+        # (projection, graph_version, estimator) the estimator was built for
+        self._estimator: tuple[CellProjection, int | None, ConeSizeEstimator] | None = None
+        # (projection, graph_version, LRU of (sink, stop_at_sequential) → tree)
+        self._dominators: (
+            tuple[CellProjection, int | None, OrderedDict[tuple[int, bool], DominatorTree]] | None
+        ) = None
+
+    @classmethod
+    def from_builder(
+        cls,
+        builder: NetworkXGraphBuilder,
+        indexes: IndexBundle | None = None,
+    ) -> NetworkXGraphTraverser:
+        """Create a traverser over a builder's graph and live indexes.
+
+        The builder's projection and pin table are patched in place by its
+        apply_delta(), so they stay current without being rebuilt.
+
+        Args:
+            builder: Builder that has run build_from_design().
+            indexes: Bundle for the cone estimator's adjacency.
+
+        Returns:
+            A traverser sharing the builder's projection and pin table.
+
+        Raises:
+            ValueError: If the builder has not built a graph yet.
+        """
+        return cls(
+            builder.graph,
+            builder.get_design(),
+            builder.get_cell_projection(),
+            indexes,
+            builder.get_pin_table(),
+        )
+
+    @property
+    def projection(self) -> CellProjection:
+        """Get the cell-to-cell projection used for fanin/fanout hops.
+
+        Built lazily from the graph the first time a traversal needs it, and
+        rebuilt if the graph version (graph.graph["version"]) has moved past
+        the one the projection was derived from. Projections built from a
+        Design carry no version and are used as given.
+        """
+        projection = self._projection
+        if projection is None and self._indexes is not None:
+            projection = self._indexes.get(CellProjection)
+            if projection is not None:
+                # Bundles are written from freshly built graphs; tie the
+                # restored projection to this graph so deltas invalidate it
+                projection.graph_version = self.graph.graph.get("version", 0)
+                self._projection = projection
+        if projection is None or (
+            projection.graph_version is not None
+            and projection.graph_version != self.graph.graph.get("version", 0)
+        ):
+            projection = CellProjection.from_graph(self.graph, self.design)
+            self._projection = projection
+        return projection
 
     # =========================================================================
     # Basic Connectivity Queries
@@ -285,115 +397,84 @@ class NetworkXGraphTraverser:
     ) -> list[Cell]:
         """Common BFS traversal logic for fanin/fanout.
 
+        Walks the cell projection level by level; each hop from a cell is
+        one CSR slice (sink cells for fanout, driver cells for fanin).
+        Sequential cells reached during the walk are reported but not
+        expanded when stop_at_sequential is set; the starting cell is
+        always expanded.
+
         Args:
             cell_id: Starting cell for traversal.
             hops: Number of hops to traverse.
             stop_at_sequential: If True, don't expand past sequential cells.
-            is_fanout: True for fanout (follow output pins), False for fanin.
+            is_fanout: True for fanout (driver → sink), False for fanin.
 
         Returns:
             List of cells reachable within specified hops.
         """
         # Handle edge cases
-        if hops <= 0 or cell_id not in self.graph:
+        if hops <= 0:
+            return []
+        projection = self.projection
+        start = projection.index_of(cell_id)
+        if start is None:
             return []
 
-        visited_cells: set[CellId] = set()
-        current_level: set[CellId] = {cell_id}
-
-        for _ in range(hops):
-            if not current_level:
-                break
-
-            next_level: set[CellId] = set()
-
-            for current_cell_id in current_level:
-                visited_cells.add(current_cell_id)
-                self._expand_cell(
-                    current_cell_id,
-                    visited_cells,
-                    next_level,
-                    stop_at_sequential,
-                    is_fanout,
-                )
-
-            current_level = next_level
-
-        # Add any remaining cells in current_level to visited
-        visited_cells.update(current_level)
-
-        # Convert to list, excluding starting cell
-        return self._visited_to_cells(visited_cells, cell_id)
+        reached = self._reach(start, hops, stop_at_sequential, is_fanout)
+        cell_ids = projection.cell_ids
+        return self._visited_to_cells({cell_ids[i] for i in reached}, cell_id)
 
-    def _expand_cell(
+    def _reach(
         self,
-        current_cell_id: CellId,
-        visited_cells: set[CellId],
-        next_level: set[CellId],
+        start: int,
+        hops: int | None,
         stop_at_sequential: bool,
         is_fanout: bool,
-    ) -> None:
-        """Expand a single cell during BFS traversal.
+        first_hop: Iterable[int] | None = None,
+    ) -> list[int]:
+        """BFS over projection indices shared by hop, cone and pin queries.
 
         Args:
-            current_cell_id: Cell to expand.
-            visited_cells: Set of already visited cells.
-            next_level: Set to add discovered cells to.
-            stop_at_sequential: If True, don't expand past sequential cells.
-            is_fanout: True for fanout, False for fanin.
-        """
-        pins = self.get_cell_pins(current_cell_id)
-        for pin in pins:
-            # Filter by direction: fanout uses output, fanin uses input
-            if is_fanout and not pin.direction.is_output():
-                continue
-            if not is_fanout and not pin.direction.is_input():
-                continue
-
-            # Skip floating pins
-            if not pin.net_id:
-                continue
-
-            # Get cells connected to this net
-            connected_cells = self.get_connected_cells(pin.net_id)
-            self._add_connected_cells(
-                connected_cells,
-                current_cell_id,
-                visited_cells,
-                next_level,
-                stop_at_sequential,
-            )
-
-    def _add_connected_cells(
-        self,
-        connected_cells: list[Cell],
-        current_cell_id: CellId,
-        visited_cells: set[CellId],
-        next_level: set[CellId],
-        stop_at_sequential: bool,
-    ) -> None:
-        """Add connected cells to traversal sets.
+            start: Projection index of the starting cell (never reported).
+            hops: Levels to expand, or None for the full transitive cone.
+            stop_at_sequential: Report but don't expand sequential cells.
+            is_fanout: True for fanout (driver → sink), False for fanin.
+            first_hop: Cells reached by the first hop. Defaults to the
+                start cell's whole row; pin-level queries narrow it to the
+                cells on one pin's net.
 
-        Args:
-            connected_cells: Cells connected via net.
-            current_cell_id: Current cell being expanded.
-            visited_cells: Set of already visited cells.
-            next_level: Set to add discovered cells to.
-            stop_at_sequential: If True, don't expand past sequential cells.
+        Returns:
+            Reached projection indices in BFS order, excluding start.
         """
-        for connected_cell in connected_cells:
-            # Skip self and already visited
-            if connected_cell.id == current_cell_id:
-                continue
-            if connected_cell.id in visited_cells:
-                continue
-
-            # Sequential boundary: add to visited but not next_level
-            if stop_at_sequential and connected_cell.is_sequential:
-                visited_cells.add(connected_cell.id)
-                continue
+        projection = self.projection
+        # Row accessors rather than raw CSR arrays so rows patched by
+        # CellProjection.apply_delta() are honored
+        step = projection.fanout if is_fanout else projection.fanin
+        sequential = projection.sequential
+
+        # Byte mask instead of a set: whole-cone walks touch many cells
+        seen = bytearray(len(projection.cell_ids))
+        seen[start] = 1
+        reached: list[int] = []
+        candidates: Iterable[int] = step(start) if first_hop is None else first_hop
+        level = 0
+
+        while hops is None or level < hops:
+            next_level: list[int] = []
+            for neighbor in candidates:
+                if seen[neighbor]:
+                    continue
+                seen[neighbor] = 1
+                reached.append(neighbor)
+                # Sequential boundary: report but don't expand
+                if not (stop_at_sequential and sequential[neighbor]):
+                    next_level.append(neighbor)
+            if not next_level:
+                break
+            candidates = chain.from_iterable(map(step, next_level))
+            level += 1
 
-            next_level.add(connected_cell.id)
+        return reached
 
     def _visited_to_cells(
         self,
@@ -419,6 +500,74 @@ class NetworkXGraphTraverser:
 
         return result
 
+    # =========================================================================
+    # Cone Extraction
+    # =========================================================================
+
+    def get_fanout_cone(self, cell_id: CellId, stop_at_sequential: bool = True) -> CellCone:
+        """Get the full transitive fanout of a cell as sorted indices.
+
+        Same BFS semantics as get_fanout_cells() with unlimited hops, but
+        no Cell entities are created; see CellCone.get_cell_ids().
+
+        Args:
+            cell_id: Root cell (not included in the cone).
+            stop_at_sequential: Include but don't expand sequential cells.
+
+        Returns:
+            The cone; empty if the cell is unknown.
+        """
+        return self._cone(cell_id, stop_at_sequential, is_fanout=True)
+
+    def get_fanin_cone(self, cell_id: CellId, stop_at_sequential: bool = True) -> CellCone:
+        """Get the full transitive fanin of a cell as sorted indices.
+
+        Args:
+            cell_id: Root cell (not included in the cone).
+            stop_at_sequential: Include but don't expand sequential cells.
+
+        Returns:
+            The cone; empty if the cell is unknown.
+        """
+        return self._cone(cell_id, stop_at_sequential, is_fanout=False)
+
+    def estimate_fanout_cone_size(self, cell_id: CellId, stop_at_sequential: bool = True) -> int:
+        """Estimate len(get_fanout_cone(...)) without extracting the cone.
+
+        Exact for small cones; see ConeSizeEstimator for the large-cone
+        sketch estimate and its error.
+        """
+        return self.cone_estimator.estimate_fanout_cone(cell_id, stop_at_sequential)
+
+    def estimate_fanin_cone_size(self, cell_id: CellId, stop_at_sequential: bool = True) -> int:
+        """Estimate len(get_fanin_cone(...)) without extracting the cone."""
+        return self.cone_estimator.estimate_fanin_cone(cell_id, stop_at_sequential)
+
+    @property
+    def cone_estimator(self) -> ConeSizeEstimator:
+        """Get the cone size estimator, rebuilt when the projection changes."""
+        projection = self.projection
+        cached = self._estimator
+        if cached is None or cached[0] is not projection or cached[1] != projection.graph_version:
+            cached = (projection, projection.graph_version, self._build_estimator(projection))
+            self._estimator = cached
+        return cached[2]
+
+    def _build_estimator(self, projection: CellProjection) -> ConeSizeEstimator:
+        """Build an estimator, over the bundled adjacency if it matches."""
+        adjacency = self._indexes.get(CellAdjacency) if self._indexes is not None else None
+        if adjacency is not None and list(adjacency.cell_ids) == projection.cell_ids:
+            return ConeSizeEstimator(adjacency)
+        return ConeSizeEstimator.from_projection(projection)
+
+    def _cone(self, cell_id: CellId, stop_at_sequential: bool, is_fanout: bool) -> CellCone:
+        """Run an unbounded _reach() and pack the result as a CellCone."""
+        projection = self.projection
+        start = projection.index_of(cell_id)
+        reached = [] if start is None else self._reach(start, None, stop_at_sequential, is_fanout)
+        reached.sort()
+        return CellCone(cell_id, array(TARGET_TYPECODE, reached), projection.cell_ids)
+
     # =========================================================================
     # Pin-Level Traversal
     # =========================================================================
@@ -431,8 +580,11 @@ class NetworkXGraphTraverser:
     ) -> list[Cell]:
         """Get fanout cells from a specific pin.
 
-        For MVP, delegates to cell-based fanout from the pin's parent cell.
-        A more precise implementation could start traversal from just this pin.
+        For a driving pin the first hop is only the cells receiving that
+        pin's net, not the whole fanout of its cell; later hops continue
+        cell by cell. For an input (or floating) pin the signal continues
+        through the owning cell, so this equals that cell's fanout. The
+        owning cell is never reported.
 
         Args:
             pin_id: Starting pin for fanout traversal.
@@ -442,13 +594,7 @@ class NetworkXGraphTraverser:
         Returns:
             List of cells reachable from this pin.
         """
-        # Get the cell containing this pin
-        cell_ids = self._get_cells_for_pin(pin_id)
-        if not cell_ids:
-            return []
-
-        # For MVP, delegate to cell-based fanout
-        return self.get_fanout_cells(cell_ids[0], hops, stop_at_sequential)
+        return self._traverse_from_pin(pin_id, hops, stop_at_sequential, is_fanout=True)
 
     def get_fanin_to_pin(
         self,
@@ -458,8 +604,9 @@ class NetworkXGraphTraverser:
     ) -> list[Cell]:
         """Get fanin cells to a specific pin.
 
-        For MVP, delegates to cell-based fanin to the pin's parent cell.
-        A more precise implementation could target just this pin.
+        For a receiving pin the first hop is only the cells driving that
+        pin's net; for an output (or floating) pin this equals the owning
+        cell's fanin. The owning cell is never reported.
 
         Args:
             pin_id: Target pin for fanin traversal.
@@ -469,36 +616,48 @@ class NetworkXGraphTraverser:
         Returns:
             List of cells reachable to this pin.
         """
-        # Get the cell containing this pin
-        cell_ids = self._get_cells_for_pin(pin_id)
-        if not cell_ids:
+        return self._traverse_from_pin(pin_id, hops, stop_at_sequential, is_fanout=False)
+
+    @property
+    def pin_table(self) -> PinTable:
+        """Get the packed pin arrays, rebuilt when the projection changes."""
+        projection = self.projection
+        cached = self._pin_table
+        if (
+            cached is None
+            or cached[0] is not projection
+            or cached[1].graph_version != projection.graph_version
+        ):
+            table = PinTable.from_graph(self.graph, projection)
+            table.graph_version = projection.graph_version
+            cached = (projection, table)
+            self._pin_table = cached
+        return cached[1]
+
+    def _traverse_from_pin(
+        self,
+        pin_id: PinId,
+        hops: int,
+        stop_at_sequential: bool,
+        is_fanout: bool,
+    ) -> list[Cell]:
+        """Common pin-level traversal on PinTable and projection indices."""
+        if hops <= 0:
             return []
-
-        # For MVP, delegate to cell-based fanin
-        return self.get_fanin_cells(cell_ids[0], hops, stop_at_sequential)
-
-    def _get_cells_for_pin(self, pin_id: PinId) -> list[CellId]:
-        """Get cells that contain a pin.
-
-        Helper method to find the parent cell of a pin by following
-        Cell → Pin containment edges backwards.
-
-        Args:
-            pin_id: The pin to find parent cells for.
-
-        Returns:
-            List of CellIds containing this pin (usually just one).
-        """
-        # Check if pin exists in graph
-        if pin_id not in self.graph:
+        table = self.pin_table
+        pin = table.index_of(pin_id)
+        if pin is None:
             return []
 
-        cell_ids: list[CellId] = []
-        # Find cells that contain this pin (Cell → Pin edges)
-        for cell_id, _, edge_data in self.graph.in_edges(pin_id, data=True):
-            if edge_data.get("edge_type") == "contains_pin":
-                cell_ids.append(CellId(str(cell_id)))
-        return cell_ids
+        owner = table.pin_owner[pin]
+        net = table.pin_net[pin]
+        first_hop: array[int] | None = None
+        if net >= 0 and (table.drives(pin) if is_fanout else table.receives(pin)):
+            first_hop = table.sink_cells(net) if is_fanout else table.driver_cells(net)
+
+        reached = self._reach(owner, hops, stop_at_sequential, is_fanout, first_hop)
+        cell_ids = self.projection.cell_ids
+        return self._visited_to_cells({cell_ids[i] for i in reached}, cell_ids[owner])
 
     # =========================================================================
     # Path Finding
@@ -564,3 +723,140 @@ class NetworkXGraphTraverser:
             return None
         except nx.NodeNotFound:
             return None
+
+    # =========================================================================
+    # Multi-Path Queries
+    # =========================================================================
+
+    def iter_k_shortest_paths(
+        self,
+        from_cell_id: CellId,
+        to_cell_id: CellId,
+        limits: PathLimits | None = None,
+        stop_at_sequential: bool = False,
+    ) -> Iterator[list[Cell]]:
+        """Stream up to limits.max_paths distinct paths, shortest first.
+
+        Unlike find_path(), paths follow signal flow (driver → sink) on the
+        cell projection and never revisit a cell. See PathSearch for the
+        algorithm (Yen's k-shortest paths) and the limits.
+
+        Args:
+            from_cell_id: First cell of every path.
+            to_cell_id: Last cell of every path.
+            limits: Path count, hop and visited-cell bounds.
+            stop_at_sequential: Don't pass through sequential cells.
+
+        Returns:
+            Lazy iterator of paths as lists of cells, including both
+            endpoints; empty if either cell is unknown.
+        """
+        return self._iter_paths(
+            from_cell_id, to_cell_id, PathSearch.k_shortest_paths, (limits, stop_at_sequential)
+        )
+
+    def iter_simple_paths(
+        self,
+        from_cell_id: CellId,
+        to_cell_id: CellId,
+        limits: PathLimits | None = None,
+        stop_at_sequential: bool = False,
+    ) -> Iterator[list[Cell]]:
+        """Stream loop-free paths of at most limits.max_hops edges.
+
+        Args:
+            from_cell_id: First cell of every path.
+            to_cell_id: Last cell of every path.
+            limits: Path count, hop and visited-cell bounds.
+            stop_at_sequential: Don't pass through sequential cells.
+
+        Returns:
+            Lazy iterator of paths as lists of cells, in depth-first order.
+        """
+        return self._iter_paths(
+            from_cell_id, to_cell_id, PathSearch.simple_paths, (limits, stop_at_sequential)
+        )
+
+    def _iter_paths(
+        self,
+        from_cell_id: CellId,
+        to_cell_id: CellId,
+        query: Callable[[PathSearch, int, int], Iterator[list[int]]],
+        options: tuple[PathLimits | None, bool],
+    ) -> Iterator[list[Cell]]:
+        """Run a PathSearch query and resolve index paths to cells."""
+        projection = self.projection
+        source = projection.index_of(from_cell_id)
+        target = projection.index_of(to_cell_id)
+        if source is None or target is None:
+            return
+
+        search = PathSearch(projection, *options)
+        cell_ids = projection.cell_ids
+        for path in query(search, source, target):
+            cells = [self.design.get_cell(cell_ids[i]) for i in path]
+            yield [cell for cell in cells if cell is not None]
+
+    # =========================================================================
+    # Dominator Analysis
+    # =========================================================================
+
+    def get_fanin_cut_points(
+        self,
+        cell_id: CellId,
+        stop_at_sequential: bool = True,
+    ) -> list[Cell]:
+        """Get the cells that every fanin path into a cell passes through.
+
+        Args:
+            cell_id: Sink cell whose fanin cone is analyzed.
+            stop_at_sequential: Treat sequential fanin cells as cone inputs.
+
+        Returns:
+            Cut point cells ordered from the sink outward; see
+            DominatorTree.get_cut_points().
+        """
+        tree = self.get_fanin_dominator_tree(cell_id, stop_at_sequential)
+        if tree is None:
+            return []
+        cells = [self.design.get_cell(cut_point) for cut_point in tree.get_cut_points()]
+        return [cell for cell in cells if cell is not None]
+
+    def get_fanin_dominator_tree(
+        self,
+        cell_id: CellId,
+        stop_at_sequential: bool = True,
+    ) -> DominatorTree | None:
+        """Get the dominator tree of a cell's fanin cone.
+
+        Trees are computed on first request per sink and kept in a small
+        LRU cache that is dropped when the projection changes.
+
+        Args:
+            cell_id: Sink cell (root of the tree).
+            stop_at_sequential: Treat sequential fanin cells as cone inputs.
+
+        Returns:
+            The tree, or None if the cell is unknown.
+        """
+        projection = self.projection
+        sink = projection.index_of(cell_id)
+        if sink is None:
+            return None
+
+        cached = self._dominators
+        if cached is None or cached[0] is not projection or cached[1] != projection.graph_version:
+            cached = (projection, projection.graph_version, OrderedDict())
+            self._dominators = cached
+        trees = cached[2]
+
+        key = (sink, stop_at_sequential)
+        tree = trees.get(key)
+        if tree is None:
+            tree = DominatorTree.build(projection, sink, stop_at_sequential)
+            trees[key] = tree
+            if len(trees) > _DOMINATOR_CACHE_SIZE:
+                trees.popitem(last=False)
+        else:
+            trees.move_to_end(key)
+        return tree
@@ -0,0 +1,314 @@
+"""Bounded multi-path queries on the cell projection.
+
+This module provides PathSearch, which answers "show me up to K distinct
+signal paths from A to B within N hops" for timing and X-propagation
+debugging, where a single shortest path (find_path) is not enough.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Query object (one search per instance, results streamed)
+    Bounded Context: Netlist Context
+
+Queries:
+    - k_shortest_paths(): Yen's algorithm over unit-weight edges. Paths are
+      yielded shortest first as soon as each is known; every spur search is
+      a hop-bounded BFS that avoids the shared root prefix and the edges
+      already used by earlier paths with that prefix.
+    - simple_paths(): depth-first enumeration of every loop-free path. A
+      reverse BFS from the target first records each cell's hop distance
+      to it, and the DFS only enters cells that can still reach the target
+      within the remaining hop budget, so dead branches of reconvergent
+      logic are never walked.
+
+Limits:
+    PathLimits bounds both queries: ``max_paths`` paths are yielded at
+    most, no path is longer than ``max_hops`` edges, and the search stops
+    after ``max_visited`` cell expansions in total. Hitting the visit
+    budget ends the stream early and sets ``PathSearch.truncated``, so a
+    query on a huge reconvergent cone returns what it has instead of
+    hanging.
+
+Paths follow signal flow (driver → sink) and are lists of projection
+indices including both endpoints. With stop_at_sequential, sequential
+cells may end a path but are not passed through (the start cell is always
+expanded, as in fanout queries).
+
+Example:
+    >>> search = PathSearch(projection, PathLimits(max_paths=3, max_hops=8))
+    >>> for path in search.k_shortest_paths(source, target):
+    ...     print([projection.cell_ids[i] for i in path])
+    >>> search.truncated
+    False
+
+See Also:
+    - NetworkXGraphTraverser.iter_k_shortest_paths: Cell-level wrapper
+    - NetworkXGraphTraverser.find_path: Single shortest path
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ink.infrastructure.graph.cell_projection import CellProjection
+
+
+@dataclass(frozen=True, slots=True)
+class PathLimits:
+    """Hard bounds on a multi-path query.
+
+    Attributes:
+        max_paths: Maximum number of paths yielded (K for k-shortest)
+        max_hops: Maximum path length in cell-to-cell edges
+        max_visited: Maximum cell expansions before the search gives up
+    """
+
+    max_paths: int = 10
+    max_hops: int = 10
+    max_visited: int = 100_000
+
+
+class _VisitBudgetExceeded(Exception):
+    """Raised internally when a search exhausts max_visited."""
+
+
+class PathSearch:
+    """K-shortest and all-simple-path enumeration with hard limits.
+
+    Attributes:
+        projection: Cell graph searched (fanout rows give signal flow)
+        limits: Bounds on paths, hops and visited cells
+        stop_at_sequential: Do not pass through sequential cells
+        visited: Cell expansions used so far by this search
+        truncated: True once a query stopped on the visit budget
+
+    Example:
+        >>> search = PathSearch(projection, PathLimits(max_paths=100))
+        >>> paths = list(search.simple_paths(source, target))
+    """
+
+    def __init__(
+        self,
+        projection: CellProjection,
+        limits: PathLimits | None = None,
+        stop_at_sequential: bool = False,
+    ) -> None:
+        """Initialize the search.
+
+        Args:
+            projection: Cell projection to search.
+            limits: Query bounds; defaults to PathLimits().
+            stop_at_sequential: Let sequential cells end paths but not
+                appear inside them.
+        """
+        self.projection = projection
+        self.limits = limits if limits is not None else PathLimits()
+        self.stop_at_sequential = stop_at_sequential
+        self.visited = 0
+        self.truncated = False
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def k_shortest_paths(self, source: int, target: int) -> Iterator[list[int]]:
+        """Yield up to max_paths loop-free paths, shortest first (Yen).
+
+        Args:
+            source: Projection index of the first cell.
+            target: Projection index of the last cell.
+
+        Yields:
+            Paths as lists of projection indices, in nondecreasing length;
+            equal-length paths in index order.
+        """
+        if self.limits.max_paths <= 0:
+            return
+        if source == target:
+            yield [source]
+            return
+
+        try:
+            first = self._shortest(source, target, (set(), set()), self.limits.max_hops)
+            if first is None:
+                return
+            found = [first]
+            yield first
+
+            candidates: list[tuple[int, list[int]]] = []
+            queued: set[tuple[int, ...]] = {tuple(first)}
+            while len(found) < self.limits.max_paths:
+                previous = found[-1]
+                for i in range(len(previous) - 1):
+                    spur = previous[i]
+                    root = previous[: i + 1]
+                    # Edges leaving the spur along known paths with this root
+                    banned_edges = {
+                        (path[i], path[i + 1]) for path in found if path[: i + 1] == root
+                    }
+                    banned_cells = set(root[:-1])
+                    spur_path = self._shortest(
+                        spur, target, (banned_cells, banned_edges), self.limits.max_hops - i
+                    )
+                    if spur_path is None:
+                        continue
+                    candidate = root[:-1] + spur_path
+                    key = tuple(candidate)
+                    if key not in queued:
+                        queued.add(key)
+                        heapq.heappush(candidates, (len(candidate), candidate))
+                if not candidates:
+                    return
+                _, best = heapq.heappop(candidates)
+                found.append(best)
+                yield best
+        except _VisitBudgetExceeded:
+            self.truncated = True
+
+    def simple_paths(self, source: int, target: int) -> Iterator[list[int]]:
+        """Yield up to max_paths loop-free paths of at most max_hops edges.
+
+        Args:
+            source: Projection index of the first cell.
+            target: Projection index of the last cell.
+
+        Yields:
+            Paths as lists of projection indices, in depth-first order.
+        """
+        if self.limits.max_paths <= 0:
+            return
+        if source == target:
+            yield [source]
+            return
+
+        try:
+            distance = self._distances_to(target, source)
+            if source not in distance:
+                return
+
+            max_hops = self.limits.max_hops
+            emitted = 0
+            path = [source]
+            on_path = {source}
+            # One neighbor iterator per path cell: an explicit DFS stack
+            stack = [iter(self._successors(source))]
+            while stack:
+                neighbor = next(stack[-1], None)
+                if neighbor is None:
+                    stack.pop()
+                    on_path.discard(path.pop())
+                    continue
+                remaining = max_hops - len(path)
+                if neighbor in on_path or distance.get(neighbor, max_hops + 1) > remaining:
+                    continue
+                if neighbor == target:
+                    yield [*path, target]
+                    emitted += 1
+                    if emitted >= self.limits.max_paths:
+                        return
+                    continue
+                if not self._passable(neighbor):
+                    continue
+                self._visit()
+                path.append(neighbor)
+                on_path.add(neighbor)
+                stack.append(iter(self._successors(neighbor)))
+        except _VisitBudgetExceeded:
+            self.truncated = True
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _visit(self) -> None:
+        """Charge one cell expansion against the visit budget."""
+        self.visited += 1
+        if self.visited > self.limits.max_visited:
+            raise _VisitBudgetExceeded
+
+    def _passable(self, cell: int) -> bool:
+        """Check whether a path may continue through a cell."""
+        return not (self.stop_at_sequential and self.projection.sequential[cell])
+
+    def _successors(self, cell: int) -> list[int]:
+        """Get distinct sink cells of a cell in first-seen order."""
+        return list(dict.fromkeys(self.projection.fanout(cell)))
+
+    def _shortest(
+        self,
+        source: int,
+        target: int,
+        banned: tuple[set[int], set[tuple[int, int]]],
+        max_hops: int,
+    ) -> list[int] | None:
+        """Hop-bounded BFS shortest path avoiding banned cells and edges.
+
+        Args:
+            source: Start cell (always expanded).
+            target: Goal cell.
+            banned: (cells that may not be entered, edges that may not be used).
+            max_hops: Maximum path length in edges.
+
+        Returns:
+            The path including both ends, or None if none fits.
+        """
+        banned_cells, banned_edges = banned
+        parent = {source: source}
+        frontier = [source]
+        for _ in range(max_hops):
+            next_frontier: list[int] = []
+            for cell in frontier:
+                if cell != source and not self._passable(cell):
+                    continue
+                self._visit()
+                for neighbor in self._successors(cell):
+                    if (
+                        neighbor in parent
+                        or neighbor in banned_cells
+                        or (cell, neighbor) in banned_edges
+                    ):
+                        continue
+                    parent[neighbor] = cell
+                    if neighbor == target:
+                        return _unwind(parent, target)
+                    next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return None
+
+    def _distances_to(self, target: int, source: int) -> dict[int, int]:
+        """Hop distance to the target of every cell within max_hops of it.
+
+        Reverse BFS over fanin rows; cells a path may not pass through
+        (other than the source) are given a distance but not expanded.
+        """
+        distance = {target: 0}
+        queue = deque([target])
+        while queue:
+            cell = queue.popleft()
+            hops = distance[cell]
+            if hops >= self.limits.max_hops:
+                continue
+            if cell not in (target, source) and not self._passable(cell):
+                continue
+            self._visit()
+            for driver in self.projection.fanin(cell):
+                if driver not in distance:
+                    distance[driver] = hops + 1
+                    queue.append(driver)
+        return distance
+
+
+def _unwind(parent: dict[int, int], target: int) -> list[int]:
+    """Rebuild a BFS path from its parent links."""
+    path = [target]
+    while parent[path[-1]] != path[-1]:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
@@ -0,0 +1,318 @@
+"""Packed pin attributes for pin-level traversal.
+
+This module provides the PinTable class: per-pin direction flags, net and
+owning cell stored in flat arrays, plus per-net rows of driver and sink
+cells. Pin-level queries (get_fanout_from_pin/get_fanin_to_pin) resolve
+their first hop from these arrays and then continue on the CellProjection,
+so no Pin, Net or Cell entity is touched until results are materialized.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Derived index (built from the graph, numbered like a projection)
+    Bounded Context: Netlist Context
+
+Data Layout:
+    - Pins are numbered 0..P-1; ``pin_ids[p]`` is the PinId
+    - ``flags[p]``: PIN_DRIVES | PIN_RECEIVES bits, read from 'drives' edge
+      direction (so lean graphs work); 0 for floating pins
+    - ``pin_owner[p]``: CellProjection index of the owning cell
+    - ``pin_net[p]``: net ordinal, or -1 for floating pins
+    - ``net_driver_offsets``/``net_driver_cells`` and
+      ``net_sink_offsets``/``net_sink_cells``: CSR rows of distinct driver
+      and sink cells per net ordinal
+
+Incremental Updates:
+    apply_delta() patches the table from a GraphDelta like
+    CellProjection.apply_delta(): pins of removed cells are retired (their
+    slots go to a free list), the pins of touched cells are read again and
+    the driver/sink rows of touched nets are recomputed into overlays that
+    take precedence over the packed rows. Indices of surviving pins and net
+    ordinals never change.
+
+Example:
+    >>> table = PinTable.from_graph(graph, projection)
+    >>> p = table.index_of(PinId("XI1.Y"))
+    >>> table.drives(p), table.net_ids[table.pin_net[p]]
+    (True, 'net_1')
+
+See Also:
+    - CellProjection: Cell numbering shared with this table
+    - NetworkXGraphTraverser.get_fanout_from_pin: Main consumer
+    - NetworkXGraphBuilder.get_pin_table: Builder-owned table kept current
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from ink.domain.value_objects.identifiers import NetId, PinId
+from ink.infrastructure.graph.csr import TARGET_TYPECODE, pack_csr, row
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import networkx as nx
+
+    from ink.infrastructure.graph.cell_projection import CellProjection
+    from ink.infrastructure.graph.graph_delta import GraphDelta
+
+PIN_DRIVES = 1
+PIN_RECEIVES = 2
+
+
+class PinTable:
+    """Flat per-pin arrays and per-net cell rows.
+
+    Attributes:
+        pin_ids: PinId per pin index
+        flags: PIN_DRIVES/PIN_RECEIVES bits per pin
+        pin_owner: Owning cell (projection index) per pin
+        pin_net: Net ordinal per pin, -1 if floating
+        net_ids: NetId per net ordinal
+        net_driver_offsets: CSR offsets, net → driver cells
+        net_driver_cells: Distinct driver cells per net
+        net_sink_offsets: CSR offsets, net → sink cells
+        net_sink_cells: Distinct sink cells per net
+        graph_version: Graph version the table was read from
+    """
+
+    def __init__(
+        self,
+        pin_ids: Sequence[PinId],
+        pins: tuple[bytearray, array[int], array[int]],
+        net_ids: Sequence[NetId],
+        net_rows: tuple[tuple[array[int], array[int]], tuple[array[int], array[int]]],
+    ) -> None:
+        """Initialize from pre-built arrays.
+
+        Args:
+            pin_ids: PinIds in index order.
+            pins: (flags, pin_owner, pin_net) parallel arrays.
+            net_ids: NetIds in ordinal order.
+            net_rows: ((driver offsets, driver cells), (sink offsets, sink cells)).
+        """
+        self.pin_ids = list(pin_ids)
+        self.flags, self.pin_owner, self.pin_net = pins
+        self.net_ids = list(net_ids)
+        (
+            (self.net_driver_offsets, self.net_driver_cells),
+            (
+                self.net_sink_offsets,
+                self.net_sink_cells,
+            ),
+        ) = net_rows
+        self.graph_version: int | None = None
+
+        self._index: dict[PinId, int] = {pin_id: i for i, pin_id in enumerate(pin_ids)}
+        self._net_index: dict[NetId, int] = {net_id: i for i, net_id in enumerate(net_ids)}
+        # Pin slots retired by deltas, reused by pins added later
+        self._free_pins: list[int] = []
+        # net ordinal → (driver cells, sink cells), replacing the packed rows
+        self._net_patch: dict[int, tuple[array[int], array[int]]] = {}
+
+    @classmethod
+    def from_graph(  # type: ignore[no-any-unimported]
+        cls,
+        graph: nx.MultiDiGraph,
+        projection: CellProjection,
+    ) -> PinTable:
+        """Read every pin of every projected cell from the graph.
+
+        Args:
+            graph: MultiDiGraph built by NetworkXGraphBuilder.
+            projection: Projection of the same graph; supplies cell numbering.
+
+        Returns:
+            A new PinTable.
+
+        Time Complexity:
+            O(P) over the pins of projected cells.
+        """
+        pin_ids: list[PinId] = []
+        flags = bytearray()
+        pin_owner: array[int] = array(TARGET_TYPECODE)
+        pin_net: array[int] = array(TARGET_TYPECODE)
+        net_ordinal: dict[str, int] = {}
+        # Per net ordinal: dicts as ordered sets of cell indices
+        drivers: list[dict[int, None]] = []
+        sinks: list[dict[int, None]] = []
+
+        for cell_id in projection.cell_ids:
+            owner = projection.index_of(cell_id)
+            if owner is None:
+                continue  # retired by a delta
+            for _, pin_id, edge_type in graph.out_edges(cell_id, data="edge_type"):
+                if edge_type != "contains_pin":
+                    continue
+                flag, net_id = _read_pin(graph, pin_id)
+                net = -1
+                if net_id is not None:
+                    net = net_ordinal.setdefault(net_id, len(net_ordinal))
+                    if net == len(drivers):
+                        drivers.append({})
+                        sinks.append({})
+                    if flag & PIN_DRIVES:
+                        drivers[net][owner] = None
+                    if flag & PIN_RECEIVES:
+                        sinks[net][owner] = None
+
+                pin_ids.append(PinId(pin_id))
+                flags.append(flag)
+                pin_owner.append(owner)
+                pin_net.append(net)
+
+        table = cls(
+            pin_ids,
+            (flags, pin_owner, pin_net),
+            [NetId(net_id) for net_id in net_ordinal],
+            (pack_csr(drivers), pack_csr(sinks)),
+        )
+        table.graph_version = graph.graph.get("version", 0)
+        return table
+
+    def apply_delta(  # type: ignore[no-any-unimported]
+        self,
+        graph: nx.MultiDiGraph,
+        projection: CellProjection,
+        delta: GraphDelta,
+    ) -> None:
+        """Patch the table after the graph was mutated in place.
+
+        Call it after projection.apply_delta(), so added cells have their
+        indices.
+
+        Args:
+            graph: The already-mutated graph.
+            projection: The patched projection; supplies cell numbering.
+            delta: Summary returned by NetworkXGraphBuilder.apply_delta().
+
+        Time Complexity:
+            O(pins of touched cells + pins on touched nets), independent
+            of design size.
+        """
+        for pin_id in delta.removed_pins:
+            pin = self._index.pop(pin_id, None)
+            if pin is not None:
+                self.flags[pin] = 0
+                self.pin_net[pin] = -1
+                self._free_pins.append(pin)
+
+        touched = sorted(
+            (owner, cell_id)
+            for cell_id in delta.touched_cells
+            if (owner := projection.index_of(cell_id)) is not None
+        )
+        for owner, cell_id in touched:
+            for _, pin_id, edge_type in graph.out_edges(cell_id, data="edge_type"):
+                if edge_type != "contains_pin":
+                    continue
+                flag, net_id = _read_pin(graph, pin_id)
+                net = -1 if net_id is None else self._net_ordinal(NetId(net_id))
+                self._store_pin(PinId(pin_id), flag, owner, net)
+
+        for net_id in delta.touched_nets:
+            if net_id in self._net_index or net_id in graph:
+                self._patch_net(graph, self._net_ordinal(net_id), net_id)
+
+        self.graph_version = delta.version
+
+    def _store_pin(self, pin_id: PinId, flag: int, owner: int, net: int) -> None:
+        """Write one pin's attributes, taking a slot if the pin is new."""
+        pin = self._index.get(pin_id)
+        if pin is None:
+            if self._free_pins:
+                pin = self._free_pins.pop()
+                self.pin_ids[pin] = pin_id
+            else:
+                pin = len(self.pin_ids)
+                self.pin_ids.append(pin_id)
+                self.flags.append(0)
+                self.pin_owner.append(owner)
+                self.pin_net.append(net)
+            self._index[pin_id] = pin
+        self.flags[pin] = flag
+        self.pin_owner[pin] = owner
+        self.pin_net[pin] = net
+
+    def _net_ordinal(self, net_id: NetId) -> int:
+        """Get the ordinal of a net, giving a new net an empty overlay row."""
+        net = self._net_index.get(net_id)
+        if net is None:
+            net = len(self.net_ids)
+            self.net_ids.append(net_id)
+            self._net_index[net_id] = net
+            self._net_patch[net] = (array(TARGET_TYPECODE), array(TARGET_TYPECODE))
+        return net
+
+    def _patch_net(  # type: ignore[no-any-unimported]
+        self,
+        graph: nx.MultiDiGraph,
+        net: int,
+        net_id: NetId,
+    ) -> None:
+        """Recompute the driver and sink cells of one net from the graph."""
+        drivers: dict[int, None] = {}
+        sinks: dict[int, None] = {}
+        if net_id in graph:
+            for cells, edges in (
+                (drivers, graph.in_edges(net_id, data="edge_type")),
+                (sinks, graph.out_edges(net_id, data="edge_type")),
+            ):
+                for source, target, kind in edges:
+                    pin = self._index.get(target if source == net_id else source)
+                    if kind == "drives" and pin is not None:
+                        cells[self.pin_owner[pin]] = None
+        self._net_patch[net] = (array(TARGET_TYPECODE, drivers), array(TARGET_TYPECODE, sinks))
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def pin_count(self) -> int:
+        """Get the number of pins in the table."""
+        return len(self._index)
+
+    def index_of(self, pin_id: PinId) -> int | None:
+        """Get the index of a pin, or None if unknown."""
+        return self._index.get(pin_id)
+
+    def drives(self, pin: int) -> bool:
+        """Check whether a pin drives its net (OUTPUT or INOUT)."""
+        return bool(self.flags[pin] & PIN_DRIVES)
+
+    def receives(self, pin: int) -> bool:
+        """Check whether a pin is driven by its net (INPUT or INOUT)."""
+        return bool(self.flags[pin] & PIN_RECEIVES)
+
+    def driver_cells(self, net: int) -> array[int]:
+        """Get the distinct cells driving a net ordinal."""
+        patch = self._net_patch.get(net)
+        if patch is not None:
+            return patch[0]
+        return row(self.net_driver_offsets, self.net_driver_cells, net)
+
+    def sink_cells(self, net: int) -> array[int]:
+        """Get the distinct cells receiving a net ordinal."""
+        patch = self._net_patch.get(net)
+        if patch is not None:
+            return patch[1]
+        return row(self.net_sink_offsets, self.net_sink_cells, net)
+
+
+def _read_pin(  # type: ignore[no-any-unimported]
+    graph: nx.MultiDiGraph,
+    pin_id: str,
+) -> tuple[int, str | None]:
+    """Read a pin's direction flags and net from its 'drives' edges."""
+    flag = 0
+    net_id: str | None = None
+    for _, target, kind in graph.out_edges(pin_id, data="edge_type"):
+        if kind == "drives":
+            flag |= PIN_DRIVES
+            net_id = target
+    for source, _, kind in graph.in_edges(pin_id, data="edge_type"):
+        if kind == "drives":
+            flag |= PIN_RECEIVES
+            net_id = source
+    return flag, net_id
@@ -0,0 +1,334 @@
+"""Register-to-register reachability index over the cell adjacency.
+
+This module provides the SequentialReachabilityIndex class, which precomputes,
+for every sequential cell (flip-flop/latch), the set of sequential cells that
+can be reached through purely combinational logic. Questions like "which
+flops feed this flop?" become a single CSR slice lookup instead of a fresh
+stop_at_sequential traversal.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Derived index (built once after load, persisted with the design)
+    Bounded Context: Netlist Context
+
+Algorithm:
+    For each sequential seed cell, run a BFS over CellAdjacency fanout edges.
+    Combinational cells are expanded; sequential cells are recorded and not
+    expanded (they are the register boundary). A seed reaches itself only if
+    a combinational path loops back to it.
+
+    Visited tracking uses a per-seed stamp array instead of a fresh set per
+    BFS, so the whole build allocates O(N) once rather than O(N) per seed.
+
+Parallel Build:
+    Seeds are independent, so the build runs them as a kernel on
+    ParallelAnalyticsRunner, which partitions seeds into chunks and shares
+    the CSR arrays with worker processes through shared memory.
+
+Storage:
+    Results are stored as two CSR matrices over sequential ordinals
+    (0..S-1): forward (seed → reached) and reverse (reached → seeds).
+    to_bytes()/from_bytes() give a compact binary form for persistence.
+
+Example:
+    >>> index = SequentialReachabilityIndex.from_design(design)
+    >>> index.get_fanin_sequential_cells(CellId("XFF2"))
+    ['XFF1']
+    >>> index.get_fanout_sequential_cells(CellId("XFF1"))
+    ['XFF2']
+
+See Also:
+    - CellAdjacency: The cell-level CSR graph this index is built from
+    - NetworkXGraphTraverser: stop_at_sequential traversal
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from typing import TYPE_CHECKING
+
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph.cell_adjacency import CellAdjacency
+from ink.infrastructure.graph.csr import (
+    OFFSET_TYPECODE,
+    TARGET_TYPECODE,
+    IntArray,
+    pack_csr,
+    row,
+    to_le_bytes,
+    transpose_csr,
+    view_le,
+)
+from ink.infrastructure.graph.parallel_analytics import ParallelAnalyticsRunner
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ink.domain.model import Design
+    from ink.infrastructure.graph.parallel_analytics import CsrView
+
+# Below this many sequential seeds, process start-up costs more than it saves
+_PARALLEL_SEED_THRESHOLD = 2048
+
+# Binary format header: magic, version, sequential count, forward edge count
+_MAGIC = b"INKSRI"
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<6sHqq")
+
+
+class SequentialReachabilityIndex:
+    """Precomputed sequential → sequential reachability through logic.
+
+    Attributes:
+        sequential_ids: Sequential cell IDs in ordinal order
+        forward_offsets: CSR offsets, seed ordinal → reached ordinals
+        forward_targets: CSR targets for forward edges
+        reverse_offsets: CSR offsets, reached ordinal → seed ordinals
+        reverse_targets: CSR targets for reverse edges
+
+    Example:
+        >>> index = SequentialReachabilityIndex.build(adjacency)
+        >>> index.pair_count()
+        42
+    """
+
+    def __init__(
+        self,
+        sequential_ids: tuple[CellId, ...],
+        forward_offsets: IntArray,
+        forward_targets: IntArray,
+        reverse: tuple[IntArray, IntArray] | None = None,
+    ) -> None:
+        """Initialize from the forward CSR matrix.
+
+        Args:
+            sequential_ids: Sequential cell IDs in ordinal order.
+            forward_offsets: CSR offsets (len(sequential_ids) + 1).
+            forward_targets: CSR targets (sequential ordinals).
+            reverse: (offsets, targets) of the transposed matrix.
+                Derived by transposition when omitted.
+        """
+        self.sequential_ids = sequential_ids
+        self.forward_offsets = forward_offsets
+        self.forward_targets = forward_targets
+        if reverse is None:
+            reverse = transpose_csr(len(sequential_ids), forward_offsets, forward_targets)
+        self.reverse_offsets, self.reverse_targets = reverse
+
+        # CellId → sequential ordinal for O(1) query entry
+        self._ordinal: dict[CellId, int] = {cell_id: i for i, cell_id in enumerate(sequential_ids)}
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def from_design(
+        cls,
+        design: Design,
+        max_workers: int | None = None,
+    ) -> SequentialReachabilityIndex:
+        """Build the index directly from a Design aggregate.
+
+        Args:
+            design: The Design aggregate to index.
+            max_workers: Worker process count (see build()).
+
+        Returns:
+            A new SequentialReachabilityIndex.
+        """
+        return cls.build(CellAdjacency.from_design(design), max_workers)
+
+    @classmethod
+    def build(
+        cls,
+        adjacency: CellAdjacency,
+        max_workers: int | None = None,
+    ) -> SequentialReachabilityIndex:
+        """Build the index from a CellAdjacency.
+
+        Args:
+            adjacency: Cell-level graph to search.
+            max_workers: Number of worker processes. None picks the CPU
+                count for large designs and runs in-process for small ones.
+                1 always runs in-process.
+
+        Returns:
+            A new SequentialReachabilityIndex.
+        """
+        seeds = [i for i in range(adjacency.cell_count()) if adjacency.is_sequential(i)]
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1 if len(seeds) >= _PARALLEL_SEED_THRESHOLD else 1
+
+        rows = ParallelAnalyticsRunner(adjacency, max_workers).run(_reach_chunk, seeds)
+
+        # Map reached cell indices to sequential ordinals
+        ordinal_of = {cell_index: k for k, cell_index in enumerate(seeds)}
+        forward_offsets, forward_targets = pack_csr(
+            (ordinal_of[cell_index] for cell_index in reached) for reached in rows
+        )
+
+        return cls(
+            sequential_ids=tuple(adjacency.cell_ids[i] for i in seeds),
+            forward_offsets=forward_offsets,
+            forward_targets=forward_targets,
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def sequential_count(self) -> int:
+        """Get the number of indexed sequential cells."""
+        return len(self.sequential_ids)
+
+    def pair_count(self) -> int:
+        """Get the number of (source, destination) register pairs."""
+        return len(self.forward_targets)
+
+    def get_fanout_sequential_cells(self, cell_id: CellId) -> list[CellId]:
+        """Get sequential cells fed by a sequential cell.
+
+        Args:
+            cell_id: A sequential cell.
+
+        Returns:
+            Sequential cells reachable from cell_id through combinational
+            logic only. Empty list if cell_id is not a sequential cell.
+        """
+        ordinal = self._ordinal.get(cell_id)
+        if ordinal is None:
+            return []
+        reached = row(self.forward_offsets, self.forward_targets, ordinal)
+        return [self.sequential_ids[k] for k in reached]
+
+    def get_fanin_sequential_cells(self, cell_id: CellId) -> list[CellId]:
+        """Get sequential cells that feed a sequential cell.
+
+        Args:
+            cell_id: A sequential cell.
+
+        Returns:
+            Sequential cells from which cell_id is reachable through
+            combinational logic only. Empty list if cell_id is not a
+            sequential cell.
+        """
+        ordinal = self._ordinal.get(cell_id)
+        if ordinal is None:
+            return []
+        feeding = row(self.reverse_offsets, self.reverse_targets, ordinal)
+        return [self.sequential_ids[k] for k in feeding]
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index to a compact binary form.
+
+        Layout: header, forward offsets (int64), forward targets (int32),
+        reverse offsets and targets, then newline-separated UTF-8
+        sequential cell IDs.
+
+        Returns:
+            Bytes suitable for from_bytes().
+        """
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            len(self.sequential_ids),
+            len(self.forward_targets),
+        )
+        names = "\n".join(self.sequential_ids).encode("utf-8")
+        return b"".join(
+            (
+                header,
+                to_le_bytes(self.forward_offsets),
+                to_le_bytes(self.forward_targets),
+                to_le_bytes(self.reverse_offsets),
+                to_le_bytes(self.reverse_targets),
+                names,
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> SequentialReachabilityIndex:
+        """Restore an index serialized by to_bytes().
+
+        The matrices of the result are views of data (on little-endian
+        hosts), so data must stay valid while the index is in use.
+
+        Args:
+            data: Bytes produced by to_bytes(), or a view of them.
+
+        Returns:
+            The restored SequentialReachabilityIndex.
+
+        Raises:
+            ValueError: If the data has the wrong magic or version.
+        """
+        magic, version, seq_count, edge_count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a sequential reachability index (bad header)")
+
+        forward_offsets, position = view_le(data, _HEADER.size, OFFSET_TYPECODE, seq_count + 1)
+        forward_targets, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+        reverse_offsets, position = view_le(data, position, OFFSET_TYPECODE, seq_count + 1)
+        reverse_targets, position = view_le(data, position, TARGET_TYPECODE, edge_count)
+
+        names = str(data[position:], "utf-8")
+        sequential_ids = tuple(CellId(name) for name in names.split("\n")) if seq_count else ()
+
+        return cls(
+            sequential_ids,
+            forward_offsets,
+            forward_targets,
+            (reverse_offsets, reverse_targets),
+        )
+
+
+# =============================================================================
+# BFS Kernels
+# =============================================================================
+
+
+def _reach_chunk(view: CsrView, seeds: Sequence[int]) -> list[list[int]]:
+    """Kernel: compute reached sequential cells for a chunk of seeds.
+
+    Args:
+        view: Cell graph (local arrays or shared memory).
+        seeds: Cell indices of sequential seeds to process.
+
+    Returns:
+        One list of reached sequential cell indices per seed.
+    """
+    offsets = view.fanout_offsets
+    targets = view.fanout_targets
+    sequential = view.sequential
+
+    # stamp[i] == seed_number (1-based) marks cell i visited for the current seed
+    stamp = [0] * (len(offsets) - 1)
+    results: list[list[int]] = []
+
+    for seed_number, seed in enumerate(seeds, start=1):
+        reached: list[int] = []
+        frontier = [seed]
+        while frontier:
+            next_frontier: list[int] = []
+            for cell in frontier:
+                for k in range(offsets[cell], offsets[cell + 1]):
+                    neighbor = targets[k]
+                    if stamp[neighbor] == seed_number:
+                        continue
+                    stamp[neighbor] = seed_number
+                    if sequential[neighbor]:
+                        # Register boundary: record, don't expand
+                        reached.append(neighbor)
+                    else:
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        results.append(reached)
+
+    return results
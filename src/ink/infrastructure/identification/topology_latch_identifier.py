@@ -31,7 +31,7 @@ from ink.domain.services.latch_identifier import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Set
+    from collections.abc import Iterator, Set
 
 # Pin signature patterns for sequential detection (used as heuristic fallback)
 CLOCK_PIN_PATTERNS = {"CLK", "CK", "CP", "CLOCK", "GCLK", "CLKB", "CKB", "PHI", "PHI1", "PHI2"}
@@ -240,25 +240,34 @@ class TopologyBasedLatchIdentifier:
                 graph[src] = []
             graph[src].append(dst)
 
-        # DFS cycle detection (standard algorithm)
+        # Iterative DFS cycle detection. Subcircuit graphs can be deep
+        # (long transistor chains), so an explicit stack of (node, neighbor
+        # iterator) frames replaces recursion to avoid RecursionError.
         visited: set[str] = set()
         rec_stack: set[str] = set()
 
-        def has_cycle(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True  # Back edge found = cycle
-
-            rec_stack.remove(node)
-            return False
-
-        return any(node not in visited and has_cycle(node) for node in graph)
+        for start, successors in graph.items():
+            if start in visited:
+                continue
+            visited.add(start)
+            rec_stack.add(start)
+            frames: list[tuple[str, Iterator[str]]] = [(start, iter(successors))]
+
+            while frames:
+                node, neighbors = frames[-1]
+                for neighbor in neighbors:
+                    if neighbor in rec_stack:
+                        return True  # Back edge found = cycle
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        rec_stack.add(neighbor)
+                        frames.append((neighbor, iter(graph.get(neighbor, []))))
+                        break
+                else:
+                    rec_stack.remove(node)
+                    frames.pop()
+
+        return False
 
     def clear_cache(self) -> None:
         """Clear all caches."""
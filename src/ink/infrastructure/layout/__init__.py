@@ -2,22 +2,74 @@
 
 This module implements the layout phases of the Sugiyama algorithm for schematic
 visualization:
-1. Layer Assignment - Assign cells to horizontal layers (this task)
+1. Layer Assignment - Assign cells to horizontal layers
 2. Crossing Minimization - Reduce edge crossings within layers
 3. Coordinate Assignment - Compute final X/Y positions
 
+LayoutPipeline runs the three phases with cooperative cancellation, and
+quick_placement() gives new cells provisional positions in linear time.
+LayoutCache keeps finished layouts by the signature of the visible graph.
+ClusteredLayout handles mega-expansions: clusters are placed as super-nodes
+and their interiors are laid out on demand.
+
 Architecture:
     Layer: Infrastructure Layer
     Pattern: Algorithm implementations
     Bounded Context: Schematic Context
 """
 
+from ink.infrastructure.layout.cluster_layout import (
+    ClusterBox,
+    ClusteredLayout,
+    cluster_by_component,
+    cluster_by_hierarchy,
+)
+from ink.infrastructure.layout.coordinate_assignment import (
+    CoordinateAssigner,
+    CoordinateAssignment,
+)
+from ink.infrastructure.layout.crossing_minimization import (
+    CrossingMinimizer,
+    DummyNode,
+    LayerOrdering,
+)
 from ink.infrastructure.layout.layer_assignment import (
     LayerAssignment,
     LayerAssignmentAlgorithm,
 )
+from ink.infrastructure.layout.layout_cache import (
+    CachedLayout,
+    LayoutCache,
+    LayoutCacheStats,
+    layout_signature,
+)
+from ink.infrastructure.layout.layout_pipeline import (
+    CancellationToken,
+    LayoutCancelledError,
+    LayoutPipeline,
+    LayoutResult,
+    quick_placement,
+)
 
 __all__ = [
+    "CachedLayout",
+    "CancellationToken",
+    "ClusterBox",
+    "ClusteredLayout",
+    "CoordinateAssigner",
+    "CoordinateAssignment",
+    "CrossingMinimizer",
+    "DummyNode",
     "LayerAssignment",
     "LayerAssignmentAlgorithm",
+    "LayerOrdering",
+    "LayoutCache",
+    "LayoutCacheStats",
+    "LayoutCancelledError",
+    "LayoutPipeline",
+    "LayoutResult",
+    "cluster_by_component",
+    "cluster_by_hierarchy",
+    "layout_signature",
+    "quick_placement",
 ]
@@ -0,0 +1,369 @@
+"""Clustered layout for very large visible graphs.
+
+This module provides ClusteredLayout, the layout mode for expansions that
+bring in tens of thousands of cells at once. A flat Sugiyama run over such a
+graph takes minutes and produces a drawing nobody can read at any zoom.
+Instead, cells are grouped into clusters, the clusters are laid out as
+super-nodes, and the interior of a cluster is laid out only when it is
+needed, i.e. when the user zooms in far enough to see its cells.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Two-level layout with lazy evaluation
+    Bounded Context: Schematic Context
+
+Clustering:
+    - cluster_by_hierarchy(): by instance path prefix. Cell "XCORE/XALU/XI1"
+      belongs to "XCORE" while that cluster is small enough, otherwise to
+      "XCORE/XALU", and so on down the hierarchy. Cells with no deeper
+      path stay in their parent's cluster even if it is oversized. This
+      keeps cones of a hierarchical design readable, since the clusters
+      match the design's own blocks.
+    - cluster_by_component(): one cluster per weakly connected component,
+      for flat netlists where the names carry no structure.
+
+Super-Node Layout:
+    The quotient graph (one node per cluster, one edge per pair of
+    clusters joined by a net) is laid out with the pipeline's own layer
+    assignment and crossing minimization. Columns are as wide as their
+    widest cluster; rows come from CoordinateAssigner with the cluster
+    heights. Until a cluster's interior has been laid out, its size is
+    estimated from its cell count as a near-square grid of cells.
+
+Lazy Interiors:
+    interior() runs the full pipeline on one cluster's subgraph and caches
+    the result. When the real size differs from the estimate, the box takes
+    the real size and the super-nodes are placed again (cheap, the quotient
+    graph is small); boxes may move, so callers re-read boxes afterwards.
+    Interiors are returned in scene coordinates, already offset into their
+    box.
+
+Complexity:
+    Construction: O(V + E) plus the pipeline on the quotient graph
+    interior(): the pipeline on one cluster, once per cluster
+
+Example:
+    >>> clusters = cluster_by_hierarchy(graph.nodes(), max_cells=1000)
+    >>> layout = ClusteredLayout(graph, clusters, heights)
+    >>> layout.boxes["XCORE/XALU"]
+    ClusterBox(name='XCORE/XALU', position=Point(x=0.0, y=0.0), ...)
+    >>> cells = layout.interior("XCORE/XALU").positions
+
+See Also:
+    - LayoutPipeline: Lays out the quotient graph and each interior
+    - ClusterDetailController: Expands interiors as the user zooms in
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+import networkx as nx
+
+from ink.domain.value_objects.geometry import Point
+from ink.infrastructure.layout.coordinate_assignment import (
+    DEFAULT_CELL_HEIGHT,
+    CoordinateAssigner,
+    CoordinateAssignment,
+)
+from ink.infrastructure.layout.layout_pipeline import LayoutPipeline
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping
+
+    from ink.infrastructure.layout.crossing_minimization import LayerOrdering
+    from ink.infrastructure.layout.layout_pipeline import CancellationToken
+
+# Separator of hierarchical instance names ("XCORE/XALU/XI1")
+HIERARCHY_SEPARATOR: Final = "/"
+
+# Cluster name of cells without a hierarchy prefix
+TOP_LEVEL_CLUSTER: Final = ""
+
+# Largest cluster whose interior still lays out at interactive speed
+DEFAULT_MAX_CLUSTER_CELLS: Final = 1000
+
+# Margin between a cluster's frame and its cells, and gap between clusters
+DEFAULT_CLUSTER_PADDING: Final = 40.0
+DEFAULT_CLUSTER_SPACING: Final = 160.0
+
+
+def cluster_by_hierarchy(
+    nodes: Iterable[Hashable],
+    separator: str = HIERARCHY_SEPARATOR,
+    max_cells: int = DEFAULT_MAX_CLUSTER_CELLS,
+) -> dict[str, list[Hashable]]:
+    """Group cells by the shortest instance path prefix that is small enough.
+
+    Starting from one cluster holding everything, a cluster with more than
+    max_cells cells is split by the next level of the hierarchy. Cells that
+    sit directly in a split instance stay in a cluster named after it.
+
+    Args:
+        nodes: Cells; their str() is the hierarchical instance name.
+        separator: Separator between hierarchy levels.
+        max_cells: Size above which a cluster is split further.
+
+    Returns:
+        Cluster name (the instance path, TOP_LEVEL_CLUSTER for the top
+        level) → member cells in input order, sorted by name.
+    """
+    paths = {node: str(node).split(separator)[:-1] for node in nodes}
+    clusters: dict[str, list[Hashable]] = {}
+    pending: list[tuple[tuple[str, ...], list[Hashable]]] = [((), list(paths))]
+    while pending:
+        prefix, members = pending.pop()
+        depth = len(prefix)
+        if len(members) <= max_cells:
+            clusters[separator.join(prefix)] = members
+            continue
+        groups: dict[tuple[str, ...], list[Hashable]] = {}
+        for node in members:
+            groups.setdefault(tuple(paths[node][: depth + 1]), []).append(node)
+        for key, group in groups.items():
+            if len(key) == depth:
+                # Cells directly in this instance cannot be split further
+                clusters[separator.join(key)] = group
+            else:
+                pending.append((key, group))
+    return dict(sorted(clusters.items()))
+
+
+def cluster_by_component(  # type: ignore[no-any-unimported]
+    graph: nx.DiGraph | nx.MultiDiGraph,
+) -> dict[str, list[Hashable]]:
+    """Group cells by weakly connected component.
+
+    Args:
+        graph: The visible graph.
+
+    Returns:
+        "component-<i>" → member cells, largest component first (ties
+        broken by the smallest member name).
+    """
+    components = sorted(
+        (list(component) for component in nx.weakly_connected_components(graph)),
+        key=lambda members: (-len(members), min(str(node) for node in members)),
+    )
+    return {f"component-{i}": members for i, members in enumerate(components)}
+
+
+@dataclass(frozen=True, slots=True)
+class ClusterBox:
+    """Placement of one cluster drawn as a super-node.
+
+    Attributes:
+        name: Cluster name.
+        position: Top-left corner of the cluster frame.
+        width: Frame width (estimated until the interior is laid out).
+        height: Frame height (estimated until the interior is laid out).
+        cell_count: Number of member cells.
+    """
+
+    name: str
+    position: Point
+    width: float
+    height: float
+    cell_count: int
+
+
+class ClusteredLayout:
+    """Super-node layout of clusters with lazily laid out interiors.
+
+    Attributes:
+        graph: The full visible graph.
+        pipeline: Lays out the quotient graph and the interiors.
+        padding: Margin between a cluster frame and its cells.
+        cluster_spacing: Gap between cluster frames.
+
+    Example:
+        >>> layout = ClusteredLayout(graph, cluster_by_component(graph))
+        >>> layout.is_laid_out("component-0")
+        False
+        >>> assignment = layout.interior("component-0")
+    """
+
+    def __init__(  # type: ignore[no-any-unimported]  # noqa: PLR0913
+        self,
+        graph: nx.DiGraph | nx.MultiDiGraph,
+        clusters: Mapping[str, Iterable[Hashable]],
+        heights: Mapping[Hashable, float] | None = None,
+        pipeline: LayoutPipeline | None = None,
+        *,
+        padding: float = DEFAULT_CLUSTER_PADDING,
+        cluster_spacing: float = DEFAULT_CLUSTER_SPACING,
+    ) -> None:
+        """Group the graph and place the clusters as super-nodes.
+
+        Args:
+            graph: The full visible graph.
+            clusters: Cluster name → members, e.g. from cluster_by_hierarchy();
+                every node of the graph must be in exactly one cluster.
+            heights: Height per cell, used for interiors and estimates.
+            pipeline: Layout phases; defaults to LayoutPipeline().
+            padding: Margin between a cluster frame and its cells.
+            cluster_spacing: Gap between cluster frames.
+
+        Raises:
+            ValueError: If a node is in no cluster or in more than one.
+        """
+        self.graph = graph
+        self.pipeline = pipeline or LayoutPipeline()
+        self.padding = padding
+        self.cluster_spacing = cluster_spacing
+        self._heights = heights or {}
+
+        self._members: dict[str, list[Hashable]] = {}
+        self._cluster_of: dict[Hashable, str] = {}
+        for name, members in clusters.items():
+            self._members[name] = list(members)
+            for node in self._members[name]:
+                if self._cluster_of.setdefault(node, name) != name:
+                    raise ValueError(f"Node {node} is in more than one cluster")
+        for node in graph.nodes():
+            if node not in self._cluster_of:
+                raise ValueError(f"Node {node} is not in any cluster")
+
+        self._super_graph = nx.DiGraph()
+        self._super_graph.add_nodes_from(self._members)
+        cluster_of = self._cluster_of
+        self._super_graph.add_edges_from(
+            {
+                (cluster_of[u], cluster_of[v])
+                for u, v in graph.edges()
+                if cluster_of[u] != cluster_of[v]
+            }
+        )
+
+        self._sizes = {
+            name: self._estimate_size(members) for name, members in self._members.items()
+        }
+        self._interiors: dict[str, CoordinateAssignment] = {}
+        layering = self.pipeline.layer_algorithm.assign_layers(self._super_graph)
+        self._ordering: LayerOrdering = self.pipeline.minimizer.minimize(
+            self._super_graph, layering
+        )
+        self._boxes: dict[str, ClusterBox] = {}
+        self._place()
+
+    # =========================================================================
+    # Clusters
+    # =========================================================================
+
+    @property
+    def super_graph(self) -> nx.DiGraph:  # type: ignore[no-any-unimported]
+        """Quotient graph: one node per cluster, edges between connected clusters."""
+        return self._super_graph
+
+    @property
+    def boxes(self) -> dict[str, ClusterBox]:
+        """Current placement of every cluster (a copy)."""
+        return dict(self._boxes)
+
+    def members(self, name: str) -> list[Hashable]:
+        """Get the cells of a cluster.
+
+        Raises:
+            KeyError: If there is no such cluster.
+        """
+        return list(self._members[name])
+
+    def cluster_of(self, node: Hashable) -> str:
+        """Get the name of the cluster holding a cell.
+
+        Raises:
+            KeyError: If the cell is not in the graph.
+        """
+        return self._cluster_of[node]
+
+    # =========================================================================
+    # Interiors
+    # =========================================================================
+
+    def is_laid_out(self, name: str) -> bool:
+        """Check whether a cluster's interior has been computed."""
+        return name in self._interiors
+
+    def interior(self, name: str, token: CancellationToken | None = None) -> CoordinateAssignment:
+        """Get the cell positions inside a cluster, laying them out if needed.
+
+        The first call for a cluster runs the pipeline on its subgraph. If
+        the result does not fit the estimated box, every box is placed
+        again, so re-read boxes after calling this.
+
+        Args:
+            name: Cluster name.
+            token: Passed to LayoutPipeline.run() on the first call.
+
+        Returns:
+            Positions and bend points in scene coordinates, inside the
+            cluster's current box.
+
+        Raises:
+            KeyError: If there is no such cluster.
+            LayoutCancelledError: If the token was cancelled.
+        """
+        local = self._interiors.get(name)
+        if local is None:
+            subgraph = self.graph.subgraph(self._members[name])
+            local = self.pipeline.run(subgraph, self._heights, token).assignment
+            self._interiors[name] = local
+            size = (local.width + 2 * self.padding, local.height + 2 * self.padding)
+            if size != self._sizes[name]:
+                self._sizes[name] = size
+                self._place()
+
+        box = self._boxes[name]
+        dx = box.position.x + self.padding
+        dy = box.position.y + self.padding
+        return CoordinateAssignment(
+            positions={node: Point(p.x + dx, p.y + dy) for node, p in local.positions.items()},
+            bend_points={
+                edge: [Point(p.x + dx, p.y + dy) for p in points]
+                for edge, points in local.bend_points.items()
+            },
+            width=local.width,
+            height=local.height,
+        )
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _estimate_size(self, members: list[Hashable]) -> tuple[float, float]:
+        """Frame size of a cluster laid out as a near-square grid of cells."""
+        assigner = self.pipeline.assigner
+        count = max(len(members), 1)
+        columns = math.ceil(math.sqrt(count))
+        rows = math.ceil(count / columns)
+        mean_height = (
+            sum(self._heights.get(node, DEFAULT_CELL_HEIGHT) for node in members) / len(members)
+            if members
+            else DEFAULT_CELL_HEIGHT
+        )
+        width = columns * assigner.cell_width + (columns - 1) * assigner.layer_spacing
+        height = rows * mean_height + (rows - 1) * assigner.node_spacing
+        return (width + 2 * self.padding, height + 2 * self.padding)
+
+    def _place(self) -> None:
+        """Place the boxes from the cached ordering and the current sizes."""
+        rows = CoordinateAssigner(node_spacing=self.cluster_spacing).assign(
+            self._ordering, {name: height for name, (_, height) in self._sizes.items()}
+        )
+        x = 0.0
+        for layer in self._ordering.layers:
+            # Real super-nodes are cluster names; the rest are DummyNodes
+            names = [node for node in layer if isinstance(node, str)]
+            for name in names:
+                width, height = self._sizes[name]
+                self._boxes[name] = ClusterBox(
+                    name=name,
+                    position=Point(x, rows.positions[name].y),
+                    width=width,
+                    height=height,
+                    cell_count=len(self._members[name]),
+                )
+            x += max((self._sizes[name][0] for name in names), default=0.0)
+            x += self.cluster_spacing
@@ -0,0 +1,366 @@
+"""Coordinate assignment phase of the Sugiyama hierarchical layout.
+
+This module implements phase 3 of the Sugiyama pipeline with the method of
+Brandes and Köpf ("Fast and Simple Horizontal Coordinate Assignment"). Given
+a LayerOrdering from CrossingMinimizer, it computes a Point for every cell:
+layers become columns (signal flows left to right) and the order within a
+layer becomes the vertical position.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Algorithm implementation
+    Bounded Context: Schematic Context
+
+Algorithm Overview:
+    1. Mark type-1 conflicts: non-inner segments crossing an inner segment
+       (an edge between two dummy nodes), so long edges stay straight
+    2. For each of the four sweep directions (left-to-right or right-to-left
+       across layers, top-down or bottom-up within them):
+       a. Vertical alignment: align each node with a median neighbor in the
+          previous column, forming blocks that share one coordinate
+       b. Compaction: place blocks as close as the separation between
+          neighboring nodes allows, via a longest-path pass over the block
+          graph (and a second pass pulling blocks toward their neighbors)
+    3. Balance: align the four results to the narrowest one and give each
+       node the average of its two median candidates
+
+Cell Sizes:
+    Separation between neighbors in a column is half of each node's height
+    plus node_spacing (half that next to a dummy), so tall multi-pin cells
+    from SymbolLayoutCalculator.adjust_cell_height_for_pins() are packed
+    without overlap by construction; no overlap-resolution pass is needed.
+
+Complexity:
+    Time: O(V + E) per direction, plus sorting each node's neighbors
+    Space: O(V + E)
+
+Example:
+    >>> calc = SymbolLayoutCalculator()
+    >>> heights = {cell_id: calc.adjust_cell_height_for_pins(n_in, n_out), ...}
+    >>> result = CoordinateAssigner().assign(ordering, heights)
+    >>> point = result.positions["XI1"]
+    >>> cell_item.set_position(point.x, point.y)
+
+See Also:
+    - CrossingMinimizer: Phase 2, produces the LayerOrdering input
+    - CellItem.set_position: Consumes the top-left positions
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, TypeVar
+
+from ink.domain.value_objects.geometry import Point
+from ink.infrastructure.layout.crossing_minimization import DummyNode
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+    from ink.infrastructure.layout.crossing_minimization import LayerOrdering
+
+# Graph node type of the caller (e.g. str); keeps dict[str, float] heights valid
+_Node = TypeVar("_Node", bound="Hashable")
+
+# Defaults matching CellItem.DEFAULT_WIDTH / DEFAULT_HEIGHT
+DEFAULT_CELL_WIDTH: Final = 120.0
+DEFAULT_CELL_HEIGHT: Final = 80.0
+
+# Gaps between columns and between vertically adjacent cells
+DEFAULT_LAYER_SPACING: Final = 80.0
+DEFAULT_NODE_SPACING: Final = 40.0
+
+
+@dataclass(frozen=True)
+class CoordinateAssignment:
+    """Result of coordinate assignment.
+
+    Attributes:
+        positions: Top-left corner of every real node, ready for
+                   CellItem.set_position().
+        bend_points: For each long edge (keyed as in
+                     LayerOrdering.dummy_chains), the centers of its dummy
+                     nodes in chain order, where the edge crosses the
+                     intermediate columns.
+        width: Width of the bounding box of all nodes.
+        height: Height of the bounding box of all nodes.
+    """
+
+    positions: dict[Hashable, Point]
+    bend_points: dict[tuple[Hashable, Hashable], list[Point]]
+    width: float
+    height: float
+
+
+class CoordinateAssigner:
+    """Assigns x/y coordinates to an ordered layering (Brandes-Köpf).
+
+    Attributes:
+        layer_spacing: Horizontal gap between columns.
+        node_spacing: Vertical gap between adjacent cells in a column.
+        cell_width: Width of every cell (the column width).
+
+    Example:
+        >>> assigner = CoordinateAssigner(layer_spacing=100.0)
+        >>> result = assigner.assign(ordering, {"A": 170.0})
+        >>> result.positions["A"]
+        Point(x=0.0, y=0.0)
+    """
+
+    def __init__(
+        self,
+        layer_spacing: float = DEFAULT_LAYER_SPACING,
+        node_spacing: float = DEFAULT_NODE_SPACING,
+        cell_width: float = DEFAULT_CELL_WIDTH,
+    ) -> None:
+        """Initialize the assigner.
+
+        Args:
+            layer_spacing: Horizontal gap between columns.
+            node_spacing: Vertical gap between adjacent cells in a column.
+            cell_width: Width of every cell.
+        """
+        self.layer_spacing = layer_spacing
+        self.node_spacing = node_spacing
+        self.cell_width = cell_width
+
+    def assign(
+        self,
+        ordering: LayerOrdering,
+        heights: Mapping[_Node, float] | None = None,
+    ) -> CoordinateAssignment:
+        """Compute positions for an ordered layering.
+
+        Args:
+            ordering: Result of CrossingMinimizer.minimize().
+            heights: Height per real node (e.g. from
+                SymbolLayoutCalculator.adjust_cell_height_for_pins());
+                nodes not listed use DEFAULT_CELL_HEIGHT.
+
+        Returns:
+            CoordinateAssignment with top-left positions of real nodes.
+        """
+        graph = _NumberedLayering(ordering, heights or {}, self.node_spacing)
+        if not graph.nodes:
+            return CoordinateAssignment(positions={}, bend_points={}, width=0.0, height=0.0)
+
+        centers = graph.balanced_centers()
+        size = graph.size
+        top = min(c - s / 2 for c, s in zip(centers, size, strict=True))
+
+        column = self.cell_width + self.layer_spacing
+        positions: dict[Hashable, Point] = {}
+        dummies: dict[Hashable, Point] = {}
+        for index, layer in enumerate(graph.layers):
+            x = index * column
+            for v in layer:
+                node = graph.nodes[v]
+                if isinstance(node, DummyNode):
+                    dummies[node] = Point(x + self.cell_width / 2, centers[v] - top)
+                else:
+                    positions[node] = Point(x, centers[v] - size[v] / 2 - top)
+
+        bottom = max(c + s / 2 for c, s in zip(centers, size, strict=True))
+        return CoordinateAssignment(
+            positions=positions,
+            bend_points={
+                edge: [dummies[dummy] for dummy in chain]
+                for edge, chain in ordering.dummy_chains.items()
+            },
+            width=len(graph.layers) * column - self.layer_spacing,
+            height=bottom - top,
+        )
+
+
+class _NumberedLayering:
+    """Layering with nodes numbered 0..N-1 and per-node sizes."""
+
+    def __init__(
+        self,
+        ordering: LayerOrdering,
+        heights: Mapping[Any, float],
+        node_spacing: float,
+    ) -> None:
+        """Number the nodes of an ordering and index its edges."""
+        number: dict[Hashable, int] = {}
+        self.nodes: list[Hashable] = []
+        self.layers: list[list[int]] = []
+        for layer in ordering.layers:
+            self.layers.append(list(range(len(self.nodes), len(self.nodes) + len(layer))))
+            for node in layer:
+                number[node] = len(self.nodes)
+                self.nodes.append(node)
+
+        self.dummy = [isinstance(node, DummyNode) for node in self.nodes]
+        self.size = [
+            0.0 if dummy else heights.get(node, DEFAULT_CELL_HEIGHT)
+            for node, dummy in zip(self.nodes, self.dummy, strict=True)
+        ]
+        self.node_spacing = node_spacing
+
+        self.up: list[list[int]] = [[] for _ in self.nodes]
+        self.down: list[list[int]] = [[] for _ in self.nodes]
+        for upper, lower in ordering.edges:
+            self.up[number[lower]].append(number[upper])
+            self.down[number[upper]].append(number[lower])
+
+        self.conflicts = self._type1_conflicts()
+
+    def separation(self, a: int, b: int) -> float:
+        """Minimum center distance between vertically adjacent nodes."""
+        gap = self.node_spacing if not (self.dummy[a] or self.dummy[b]) else self.node_spacing / 2
+        return (self.size[a] + self.size[b]) / 2 + gap
+
+    def _type1_conflicts(self) -> set[tuple[int, int]]:
+        """Mark non-inner segments that cross an inner segment.
+
+        Returns:
+            Conflicting segments, in both orientations.
+        """
+        position = [0] * len(self.nodes)
+        for layer in self.layers:
+            for k, v in enumerate(layer):
+                position[v] = k
+
+        marked: set[tuple[int, int]] = set()
+        for upper, lower in itertools.pairwise(self.layers):
+            k0 = 0
+            scanned = 0
+            for l1, v in enumerate(lower):
+                inner = next((u for u in self.up[v] if self.dummy[u] and self.dummy[v]), None)
+                if l1 != len(lower) - 1 and inner is None:
+                    continue
+                k1 = position[inner] if inner is not None else len(upper) - 1
+                while scanned <= l1:
+                    w = lower[scanned]
+                    for u in self.up[w]:
+                        if position[u] < k0 or position[u] > k1:
+                            marked.update(((u, w), (w, u)))
+                    scanned += 1
+                k0 = k1
+        return marked
+
+    def balanced_centers(self) -> list[float]:
+        """Run the four alignments and balance them.
+
+        Returns:
+            Center coordinate of every node within its column.
+        """
+        candidates: list[tuple[bool, list[float]]] = []
+        for top_down in (True, False):
+            for left_to_right in (True, False):
+                centers = self._align_and_compact(left_to_right, top_down)
+                if not top_down:
+                    centers = [-c for c in centers]
+                candidates.append((top_down, centers))
+
+        # Align every candidate to the narrowest one: top-down variants by
+        # their top edge, bottom-up variants by their bottom edge
+        extents = [self._extent(centers) for _, centers in candidates]
+        low, high = min(extents, key=lambda extent: extent[1] - extent[0])
+        shifted = [
+            [c + (low - extent[0] if top_down else high - extent[1]) for c in centers]
+            for (top_down, centers), extent in zip(candidates, extents, strict=True)
+        ]
+
+        balanced: list[float] = []
+        for values in zip(*shifted, strict=True):
+            ordered = sorted(values)
+            balanced.append((ordered[1] + ordered[2]) / 2)
+        return balanced
+
+    def _extent(self, centers: list[float]) -> tuple[float, float]:
+        """Lowest and highest edge of any node."""
+        size = self.size
+        return (
+            min(c - s / 2 for c, s in zip(centers, size, strict=True)),
+            max(c + s / 2 for c, s in zip(centers, size, strict=True)),
+        )
+
+    def _align_and_compact(self, left_to_right: bool, top_down: bool) -> list[float]:
+        """Compute one of the four candidate layouts.
+
+        The sweep is normalized to left-to-right and top-down by reversing
+        the column order and the order within columns; bottom-up results
+        are therefore mirrored and must be negated by the caller.
+
+        Args:
+            left_to_right: Align with the previous column (else the next).
+            top_down: Prefer upper medians and compact upward (else down).
+
+        Returns:
+            Center coordinate of every node.
+        """
+        layers = self.layers if left_to_right else self.layers[::-1]
+        if not top_down:
+            layers = [layer[::-1] for layer in layers]
+        previous = self.up if left_to_right else self.down
+
+        position = [0] * len(self.nodes)
+        for layer in layers:
+            for k, v in enumerate(layer):
+                position[v] = k
+
+        root = list(range(len(self.nodes)))
+        align = list(range(len(self.nodes)))
+        for layer in layers[1:]:
+            reached = -1
+            for v in layer:
+                neighbors = sorted(previous[v], key=position.__getitem__)
+                if not neighbors:
+                    continue
+                d = len(neighbors)
+                for m in sorted({(d - 1) // 2, d // 2}):
+                    if align[v] != v:
+                        break
+                    u = neighbors[m]
+                    if (u, v) not in self.conflicts and reached < position[u]:
+                        align[u] = v
+                        root[v] = root[u]
+                        align[v] = root[v]
+                        reached = position[u]
+
+        return self._compact(layers, root)
+
+    def _compact(self, layers: list[list[int]], root: list[int]) -> list[float]:
+        """Place blocks by longest path over the block graph.
+
+        Args:
+            layers: Columns in normalized sweep order.
+            root: Block root of every node.
+
+        Returns:
+            Center coordinate of every node.
+        """
+        # Block graph: root of the upper neighbor -> root of the lower one
+        successors: dict[int, dict[int, float]] = {}
+        indegree = dict.fromkeys(set(root), 0)
+        for layer in layers:
+            for above, below in itertools.pairwise(layer):
+                edges = successors.setdefault(root[above], {})
+                target = root[below]
+                if target not in edges:
+                    indegree[target] += 1
+                    edges[target] = 0.0
+                edges[target] = max(edges[target], self.separation(above, below))
+
+        order = [block for block, degree in indegree.items() if degree == 0]
+        for block in order:
+            for target in successors.get(block, ()):
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    order.append(target)
+
+        coordinate = dict.fromkeys(indegree, 0.0)
+        for block in order:
+            for target, gap in successors.get(block, {}).items():
+                coordinate[target] = max(coordinate[target], coordinate[block] + gap)
+        # Pull blocks toward their lower neighbors where there is slack
+        for block in reversed(order):
+            gaps = successors.get(block)
+            if gaps:
+                limit = min(coordinate[target] - gap for target, gap in gaps.items())
+                coordinate[block] = max(coordinate[block], limit)
+
+        return [coordinate[root[v]] for v in range(len(self.nodes))]
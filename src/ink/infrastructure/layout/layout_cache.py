@@ -0,0 +1,349 @@
+"""Layout result cache keyed by the visible subgraph.
+
+This module provides LayoutCache, which remembers finished layouts (layer
+assignment, cell positions and routed NetGeometry) by a canonical signature of the visible
+graph. Users collapse and re-expand the same regions all the time; with the
+cache, returning to a view seen before is a dictionary lookup instead of a
+full Sugiyama run plus routing.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Memoization with a memory-bounded LRU
+    Bounded Context: Schematic Context
+
+Signature:
+    layout_signature() hashes the sorted node ids, the sorted set of edges
+    and (optionally) the cell heights with SHA-256. It depends only on what
+    is visible, not on the order cells were expanded in, so the same view
+    reached by different paths hits the same entry. Node ids are hashed by
+    their str(), which is what CellIds are.
+
+Cache Semantics:
+    - Bound: estimated memory of the cached layouts (layers, positions,
+      bend points and segments times per-object costs), evicted least recently used
+      first. A layout larger than the whole bound is not cached.
+    - No invalidation by graph version: a signature already names the
+      exact graph a layout belongs to. Entries from another design can
+      only appear through persistence, which is keyed per netlist.
+
+Persistence:
+    to_bytes()/from_bytes() let the cache travel in the design's
+    IndexBundle (see IndexBundle.update()), so layouts survive across
+    sessions. Importing this module registers the cache as the bundle's
+    "layouts" section. Entries are stored least recently used first and keep that
+    order when restored. Node ids come back as str, which equals the
+    original CellIds.
+
+Example:
+    >>> cache = LayoutCache(max_bytes=32 << 20)
+    >>> signature = layout_signature(visible_graph, heights)
+    >>> cached = cache.get(signature)
+    >>> if cached is None:
+    ...     result = LayoutPipeline().run(visible_graph, heights)
+    ...     cached = CachedLayout(result.assignment, result.layers)
+    ...     cache.put(signature, cached)
+
+See Also:
+    - LayoutService: Consults the cache before starting a job
+    - IndexBundle: Persists the cache with the design's indexes
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final, TypeVar
+
+from ink.domain.value_objects.geometry import NetGeometry, Point
+from ink.infrastructure.graph.index_bundle import register_section
+from ink.infrastructure.layout.coordinate_assignment import CoordinateAssignment
+from ink.infrastructure.layout.layer_assignment import LayerAssignment
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+    import networkx as nx
+
+    from ink.domain.value_objects.identifiers import NetId
+
+# Graph node type of the caller (e.g. str); keeps dict[str, float] heights valid
+_Node = TypeVar("_Node", bound="Hashable")
+
+# Default bound on the estimated memory of cached layouts
+DEFAULT_MAX_BYTES: Final = 64 << 20
+
+# Approximate bytes per cached object (dict slot, frozen dataclass, floats)
+_POSITION_BYTES: Final = 220
+_LAYER_BYTES: Final = 100
+_POINT_BYTES: Final = 120
+_SEGMENT_BYTES: Final = 330
+_GEOMETRY_BYTES: Final = 400
+
+# Binary format: magic, version, then the entries as UTF-8 JSON
+_MAGIC = b"INKLAY"
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<6sH")
+
+# Separators that cannot occur inside the hashed records
+_FIELD = b"\x1f"
+_RECORD = b"\x1e"
+
+
+def layout_signature(  # type: ignore[no-any-unimported]
+    graph: nx.DiGraph | nx.MultiDiGraph,
+    heights: Mapping[_Node, float] | None = None,
+) -> str:
+    """Compute the canonical signature of a visible graph.
+
+    Args:
+        graph: The visible graph.
+        heights: Cell heights the layout was computed with; cells not
+            listed are hashed without a height.
+
+    Returns:
+        64-character lowercase hex SHA-256 digest.
+    """
+    heights = heights or {}
+    digest = hashlib.sha256()
+    for node in sorted(graph.nodes(), key=str):
+        height = heights.get(node)
+        text = b"" if height is None else repr(float(height)).encode()
+        digest.update(str(node).encode() + _FIELD + text + _RECORD)
+    digest.update(_RECORD)
+    for u, v in sorted({(str(u), str(v)) for u, v in graph.edges()}):
+        digest.update(u.encode() + _FIELD + v.encode() + _RECORD)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedLayout:
+    """A finished layout of one visible graph.
+
+    Attributes:
+        assignment: Cell positions, bend points and bounding size.
+        layers: Layer assignment the positions were computed from; the
+            previous assignment for the next expansion of this view.
+        geometries: Routed geometry per net (empty if not routed yet).
+    """
+
+    assignment: CoordinateAssignment
+    layers: LayerAssignment
+    geometries: dict[NetId, NetGeometry] = field(default_factory=dict)
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Rough memory footprint, used for the cache bound."""
+        bends = sum(len(points) for points in self.assignment.bend_points.values())
+        segments = sum(len(g.segments) + len(g.junctions) for g in self.geometries.values())
+        return (
+            len(self.assignment.positions) * _POSITION_BYTES
+            + (len(self.layers.layer_map) + len(self.layers.reverse_edges)) * _LAYER_BYTES
+            + bends * _POINT_BYTES
+            + len(self.geometries) * _GEOMETRY_BYTES
+            + segments * _SEGMENT_BYTES
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-compatible builtins (node ids become strings)."""
+        assignment = self.assignment
+        layers = self.layers
+        return {
+            "positions": {str(n): [p.x, p.y] for n, p in assignment.positions.items()},
+            "bend_points": [
+                [str(u), str(v), [[p.x, p.y] for p in points]]
+                for (u, v), points in assignment.bend_points.items()
+            ],
+            "width": assignment.width,
+            "height": assignment.height,
+            "layers": {str(n): layer for n, layer in layers.layer_map.items()},
+            "reverse_edges": [[str(u), str(v)] for u, v in layers.reverse_edges],
+            "layer_count": layers.layer_count,
+            "geometries": [geometry.to_dict() for geometry in self.geometries.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedLayout:
+        """Restore a layout written by to_dict()."""
+        assignment = CoordinateAssignment(
+            positions={node: Point(x, y) for node, (x, y) in data["positions"].items()},
+            bend_points={
+                (u, v): [Point(x, y) for x, y in points] for u, v, points in data["bend_points"]
+            },
+            width=data["width"],
+            height=data["height"],
+        )
+        layers = LayerAssignment(
+            layer_map=data["layers"],
+            reverse_edges={(u, v) for u, v in data["reverse_edges"]},
+            layer_count=data["layer_count"],
+        )
+        geometries = [NetGeometry.from_dict(item) for item in data["geometries"]]
+        return cls(assignment, layers, {geometry.net_id: geometry for geometry in geometries})
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutCacheStats:
+    """Snapshot of cache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that found nothing
+        evictions: Entries dropped to respect the memory bound
+        entries: Entries currently cached
+        cached_bytes: Estimated memory of the cached layouts
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    cached_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LayoutCache:
+    """Memory-bounded LRU cache of layouts by subgraph signature.
+
+    Attributes:
+        max_bytes: Upper bound on the estimated memory of cached layouts
+
+    Example:
+        >>> cache = LayoutCache()
+        >>> cache.put(signature, CachedLayout(assignment, layers))
+        >>> cache.get(signature).assignment is assignment
+        True
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Estimated memory to keep cached. Layouts larger than
+                this are not cached.
+        """
+        self.max_bytes = max_bytes
+        # signature -> (layout, estimated bytes); order is recency of use
+        self._entries: OrderedDict[str, tuple[CachedLayout, int]] = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached layouts."""
+        return len(self._entries)
+
+    def __contains__(self, signature: object) -> bool:
+        """Check for a signature without touching its recency."""
+        return signature in self._entries
+
+    def stats(self) -> LayoutCacheStats:
+        """Get a snapshot of the cache counters."""
+        return LayoutCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            cached_bytes=self._cached_bytes,
+        )
+
+    def get(self, signature: str) -> CachedLayout | None:
+        """Look up a layout and mark it most recently used.
+
+        Args:
+            signature: From layout_signature().
+
+        Returns:
+            The cached layout, or None.
+        """
+        entry = self._entries.get(signature)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(signature)
+        self._hits += 1
+        return entry[0]
+
+    def put(self, signature: str, layout: CachedLayout) -> None:
+        """Store a layout, replacing any previous one for the signature.
+
+        Least recently used layouts are evicted until the bound holds.
+
+        Args:
+            signature: From layout_signature().
+            layout: The finished layout.
+        """
+        previous = self._entries.pop(signature, None)
+        if previous is not None:
+            self._cached_bytes -= previous[1]
+        size = layout.estimated_bytes
+        if size > self.max_bytes:
+            return
+
+        self._entries[signature] = (layout, size)
+        self._cached_bytes += size
+        while self._cached_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._cached_bytes -= evicted
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached layout (counters are kept)."""
+        self._entries.clear()
+        self._cached_bytes = 0
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the cached layouts for an IndexBundle.
+
+        Returns:
+            Header followed by the entries, least recently used first, as
+            UTF-8 JSON.
+        """
+        entries = [
+            [signature, layout.to_dict()] for signature, (layout, _) in self._entries.items()
+        ]
+        payload = json.dumps(
+            {"max_bytes": self.max_bytes, "entries": entries}, separators=(",", ":")
+        ).encode("utf-8")
+        return _HEADER.pack(_MAGIC, _FORMAT_VERSION) + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> LayoutCache:
+        """Restore a cache written by to_bytes().
+
+        Args:
+            data: Serialized cache.
+
+        Returns:
+            The cache with its entries in their saved recency order and
+            fresh counters.
+
+        Raises:
+            ValueError: If data is not a serialized LayoutCache.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a LayoutCache (bad header)")
+        magic, version = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a LayoutCache (bad header)")
+
+        fields = json.loads(str(data[_HEADER.size :], "utf-8"))
+        cache = cls(max_bytes=fields["max_bytes"])
+        for signature, layout in fields["entries"]:
+            cache.put(signature, CachedLayout.from_dict(layout))
+        return cache
+
+
+register_section(LayoutCache, b"layouts")
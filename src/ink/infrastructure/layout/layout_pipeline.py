@@ -0,0 +1,308 @@
+"""Full Sugiyama layout pipeline with cancellation and a quick first placement.
+
+This module ties the three Sugiyama phases together for callers that lay out
+a whole visible graph in one go, typically on a worker thread:
+
+1. LayerAssignmentAlgorithm (update_layers() for an expansion)
+2. CrossingMinimizer
+3. CoordinateAssigner
+
+It also provides quick_placement(), a linear-time heuristic that puts new
+cells next to cells that are already on screen, so an expansion can be shown
+immediately while the full pipeline is still running.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Pipeline (phase composition) with cooperative cancellation
+    Bounded Context: Schematic Context
+
+Cancellation:
+    A CancellationToken is checked between phases (the phases themselves
+    are not interruptible). When it has been cancelled, run() raises
+    LayoutCancelledError instead of starting the next phase, so a stale job
+    gives up its thread after at most one phase. The token is a
+    threading.Event, safe to cancel from the GUI thread while a worker runs.
+
+Quick Placement:
+    New nodes are reached breadth-first from the anchored (already placed)
+    nodes. A node reached from its driver goes one column to the right of
+    it, one reached from a load one column to the left; within the column
+    it takes the first free slot at or below the neighbor's row. Nodes not
+    connected to any anchor start a new region below everything placed.
+    The result has no overlaps but no crossing optimization; it is meant to
+    be animated to the refined positions once run() finishes.
+
+Complexity:
+    run(): as the three phases
+    quick_placement(): O(V + E) plus the slot search in crowded columns
+
+Result:
+    run() returns a LayoutResult holding the phase 1 LayerAssignment next
+    to the final CoordinateAssignment. The layers are what the next
+    expansion passes back as previous, so callers keep them with the
+    positions instead of layering the graph a second time.
+
+Example:
+    >>> token = CancellationToken()
+    >>> quick = quick_placement(graph, anchors=current_positions)
+    >>> result = LayoutPipeline().run(graph, heights, token)
+    >>> result.assignment.positions["XI1"]
+    Point(x=200.0, y=0.0)
+    >>> expanded = LayoutPipeline().run(bigger_graph, heights, previous=result.layers)
+
+See Also:
+    - LayoutService: Runs this pipeline on a worker thread with Qt signals
+    - CoordinateAssignment: The positions in the result
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+from ink.domain.value_objects.geometry import Point
+from ink.infrastructure.layout.coordinate_assignment import (
+    DEFAULT_CELL_HEIGHT,
+    DEFAULT_CELL_WIDTH,
+    DEFAULT_LAYER_SPACING,
+    DEFAULT_NODE_SPACING,
+    CoordinateAssigner,
+)
+from ink.infrastructure.layout.crossing_minimization import CrossingMinimizer
+from ink.infrastructure.layout.layer_assignment import LayerAssignmentAlgorithm
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+    import networkx as nx
+
+    from ink.infrastructure.layout.coordinate_assignment import CoordinateAssignment
+    from ink.infrastructure.layout.layer_assignment import LayerAssignment
+
+# Graph node type of the caller (e.g. str); keeps dict[str, ...] arguments valid
+_Node = TypeVar("_Node", bound="Hashable")
+
+
+@dataclass(frozen=True)
+class LayoutResult:
+    """Output of LayoutPipeline.run().
+
+    Attributes:
+        layers: Phase 1 layer assignment; pass it as previous to the run
+            after an expansion.
+        assignment: Top-left positions, bend points and bounding size.
+    """
+
+    layers: LayerAssignment
+    assignment: CoordinateAssignment
+
+
+class LayoutCancelledError(Exception):
+    """Raised by LayoutPipeline.run() when its token has been cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe flag telling a running layout job to stop.
+
+    Example:
+        >>> token = CancellationToken()
+        >>> token.cancel()
+        >>> token.cancelled
+        True
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uncancelled token."""
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation; the job stops at its next check."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise LayoutCancelledError if cancel() has been called.
+
+        Raises:
+            LayoutCancelledError: If the token is cancelled.
+        """
+        if self._event.is_set():
+            raise LayoutCancelledError("Layout job was cancelled")
+
+
+class LayoutPipeline:
+    """Runs layer assignment, crossing minimization and coordinate assignment.
+
+    Attributes:
+        layer_algorithm: Phase 1 implementation.
+        minimizer: Phase 2 implementation.
+        assigner: Phase 3 implementation.
+
+    Example:
+        >>> pipeline = LayoutPipeline(minimizer=CrossingMinimizer(method="median"))
+        >>> result = pipeline.run(graph)
+        >>> result.layers.layer_count
+        3
+    """
+
+    def __init__(
+        self,
+        layer_algorithm: LayerAssignmentAlgorithm | None = None,
+        minimizer: CrossingMinimizer | None = None,
+        assigner: CoordinateAssigner | None = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            layer_algorithm: Phase 1; defaults to LayerAssignmentAlgorithm().
+            minimizer: Phase 2; defaults to CrossingMinimizer().
+            assigner: Phase 3; defaults to CoordinateAssigner().
+        """
+        self.layer_algorithm = layer_algorithm or LayerAssignmentAlgorithm()
+        self.minimizer = minimizer or CrossingMinimizer()
+        self.assigner = assigner or CoordinateAssigner()
+
+    def run(  # type: ignore[no-any-unimported]
+        self,
+        graph: nx.DiGraph | nx.MultiDiGraph,
+        heights: Mapping[_Node, float] | None = None,
+        token: CancellationToken | None = None,
+        previous: LayerAssignment | None = None,
+    ) -> LayoutResult:
+        """Lay out a graph.
+
+        Args:
+            graph: The visible graph.
+            heights: Height per node for coordinate assignment.
+            token: Checked between phases; None never cancels.
+            previous: Layer assignment of the graph before an expansion.
+                When given, phase 1 extends it with update_layers() so
+                existing cells keep their columns.
+
+        Returns:
+            LayoutResult with the layer assignment and the top-left
+            positions of all nodes.
+
+        Raises:
+            LayoutCancelledError: If the token was cancelled.
+        """
+        check = token.raise_if_cancelled if token is not None else _never_cancelled
+        check()
+        if previous is None:
+            assignment = self.layer_algorithm.assign_layers(graph)
+        else:
+            layer_map = previous.layer_map
+            added_nodes = [node for node in graph.nodes() if node not in layer_map]
+            # Edges between existing cells that the old layering doesn't satisfy
+            added_edges = [
+                (u, v)
+                for u, v in graph.edges()
+                if u in layer_map
+                and v in layer_map
+                and layer_map[u] >= layer_map[v]
+                and (u, v) not in previous.reverse_edges
+            ]
+            assignment = self.layer_algorithm.update_layers(
+                previous, graph, added_nodes, added_edges
+            )
+        check()
+        ordering = self.minimizer.minimize(graph, assignment)
+        check()
+        return LayoutResult(assignment, self.assigner.assign(ordering, heights))
+
+
+def _never_cancelled() -> None:
+    """Cancellation check for jobs without a token."""
+
+
+def quick_placement(  # type: ignore[no-any-unimported]  # noqa: PLR0913
+    graph: nx.DiGraph | nx.MultiDiGraph,
+    anchors: Mapping[_Node, Point] | None = None,
+    heights: Mapping[_Node, float] | None = None,
+    *,
+    layer_spacing: float = DEFAULT_LAYER_SPACING,
+    node_spacing: float = DEFAULT_NODE_SPACING,
+    cell_width: float = DEFAULT_CELL_WIDTH,
+) -> dict[_Node, Point]:
+    """Place every graph node not in anchors next to its placed neighbors.
+
+    Anchors are treated as fixed obstacles; see the module docstring for
+    the heuristic.
+
+    Args:
+        graph: The visible graph, including the new nodes.
+        anchors: Top-left positions of nodes already on screen.
+        heights: Height per node; others use DEFAULT_CELL_HEIGHT.
+        layer_spacing: Horizontal gap between columns.
+        node_spacing: Vertical gap between cells.
+        cell_width: Width of every cell.
+
+    Returns:
+        Top-left positions of the new nodes only.
+    """
+    anchors = anchors or {}
+    heights = heights or {}
+    grid = _SlotGrid(layer_spacing + cell_width, DEFAULT_CELL_HEIGHT + node_spacing)
+    for node, point in anchors.items():
+        grid.occupy(point, heights.get(node, DEFAULT_CELL_HEIGHT))
+
+    placed: dict[_Node, Point] = {}
+    queue = deque((node, point) for node, point in anchors.items() if node in graph)
+    unplaced = (node for node in graph.nodes() if node not in placed and node not in anchors)
+    while True:
+        while queue:
+            node, origin = queue.popleft()
+            for neighbors, step in ((graph.successors(node), 1), (graph.predecessors(node), -1)):
+                for neighbor in neighbors:
+                    if neighbor in placed or neighbor in anchors:
+                        continue
+                    x = origin.x + step * grid.column_pitch
+                    height = heights.get(neighbor, DEFAULT_CELL_HEIGHT)
+                    placed[neighbor] = grid.place(x, origin.y, height)
+                    queue.append((neighbor, placed[neighbor]))
+        # Start a new region for nodes no anchor reaches (networkx nodes are never None)
+        seed = next(unplaced, None)
+        if seed is None:
+            return placed
+        placed[seed] = grid.place(0.0, grid.bottom, heights.get(seed, DEFAULT_CELL_HEIGHT))
+        queue.append((seed, placed[seed]))
+
+
+class _SlotGrid:
+    """Occupied row slots per column, for quick_placement()."""
+
+    def __init__(self, column_pitch: float, row_pitch: float) -> None:
+        """Create an empty grid."""
+        self.column_pitch = column_pitch
+        self.row_pitch = row_pitch
+        self.bottom = 0.0
+        self._taken: dict[float, set[int]] = {}
+
+    def _rows(self, height: float) -> int:
+        """Slots a cell of this height covers."""
+        return max(1, math.ceil(height / self.row_pitch))
+
+    def occupy(self, point: Point, height: float) -> None:
+        """Mark the slots under a placed cell as taken."""
+        first = math.floor(point.y / self.row_pitch)
+        taken = self._taken.setdefault(point.x, set())
+        taken.update(range(first, first + self._rows(height)))
+        self.bottom = max(self.bottom, (first + self._rows(height)) * self.row_pitch)
+
+    def place(self, x: float, y: float, height: float) -> Point:
+        """Take the first free run of slots at or below y in column x."""
+        rows = self._rows(height)
+        taken = self._taken.setdefault(x, set())
+        first = math.floor(y / self.row_pitch)
+        while any(first + i in taken for i in range(rows)):
+            first += 1
+        point = Point(x, first * self.row_pitch)
+        self.occupy(point, height)
+        return point
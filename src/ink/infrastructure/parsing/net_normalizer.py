@@ -9,13 +9,18 @@ netlists into a normalized, consistent format. This normalization is critical fo
 2. **Power/Ground Identification**: Automatically classifies power and ground nets
    to enable filtering, highlighting, or special handling in the UI.
 
-3. **Performance**: Caches normalized results to avoid repeated regex processing
+3. **Clock Root Identification**: Recognizes clock nets (CLK, CK, *_CLK and
+   user-configured names) that clock-domain tracing starts from. Clock nets
+   remain SIGNAL nets; being a clock root is a separate, orthogonal flag.
+
+4. **Performance**: Caches normalized results to avoid repeated regex processing
    for the same net names (common in large netlists with many instances).
 
 CDL Netlist Net Name Patterns:
 - Bus notation: signal<N> where N is a bit index (e.g., data<7>, addr<0>)
 - Power nets: VDD, VDDA, VCC, VPWR and variants
 - Ground nets: VSS, VSSA, GND, VGND and variants
+- Clock nets: CLK, CK, CLOCK, *_CLK, *_CK and variants
 - Trailing markers: ! or ? suffixes (e.g., VDD!, clk?)
 - Escaped names: Names with special characters (handled by preserving)
 
@@ -30,6 +35,8 @@ Example Usage:
     >>> print(info.net_type)  # NetType.POWER
     >>> print(info.normalized_name)  # "VDD"
 
+    >>> normalizer.is_clock("core_clk")  # True
+
     >>> # Create from per-project configuration
     >>> from ink.infrastructure.config.net_classification_config import (
     ...     NetClassificationConfig,
@@ -70,6 +77,7 @@ class NetNormalizer:
     Attributes:
         POWER_PATTERNS: Regex patterns matching power supply net names.
         GROUND_PATTERNS: Regex patterns matching ground reference net names.
+        CLOCK_PATTERNS: Regex patterns matching clock root net names.
         BUS_PATTERN: Compiled regex for detecting bus notation.
 
     Example:
@@ -110,6 +118,21 @@ class NetNormalizer:
         r"^VGND$",  # VGND (common in some PDKs)
     }
 
+    # Known clock net patterns - case insensitive matching
+    # These identify clock roots for clock-domain tracing; they do not
+    # change net_type (a clock is still a SIGNAL net). Names with an enable
+    # or gate token (clk_en, CLKGATE_EN, core_clk_gate) are ICG controls or
+    # data, not clocks, and are excluded by a lookahead.
+    CLOCK_PATTERNS: ClassVar[set[str]] = {
+        r"^CLK[0-9]*$",  # CLK, CLK2
+        r"^(?!.*(?:_EN|EN$|GATE))CLK_[A-Z0-9_]+$",  # CLK_CORE, CLK_A2 (not clk_en)
+        r"^CK$",  # CK (short form used by many cell libraries)
+        r"^CLOCK[0-9]*$",  # CLOCK, CLOCK2
+        r"^(?!.*(?:_EN|EN$|GATE))CLOCK_[A-Z0-9_]+$",  # CLOCK_IN (not clock_en)
+        r"^(?!.*(?:_EN|GATE))[A-Z0-9_]*_CLK[0-9]*$",  # core_clk, SYS_CLK2
+        r"^(?!.*(?:_EN|GATE))[A-Z0-9_]*_CK$",  # sys_ck
+    }
+
     # Bus notation pattern: matches net<N> or net<M:N> formats
     # Group 1: Base net name (e.g., "data" in "data<7>")
     # Group 2: Bit index or start of range (e.g., "7" in "data<7>")
@@ -121,6 +144,7 @@ class NetNormalizer:
         self,
         power_nets: Iterable[str] | None = None,
         ground_nets: Iterable[str] | None = None,
+        clock_nets: Iterable[str] | None = None,
     ) -> None:
         """Initialize the NetNormalizer with optional custom net names.
 
@@ -131,6 +155,8 @@ class NetNormalizer:
             ground_nets: Individual ground net names to recognize (case-insensitive).
                 These are checked before pattern matching.
                 Example: ["AVSS", "DVSS", "VSS_CORE"]
+            clock_nets: Individual clock root net names to recognize
+                (case-insensitive). Example: ["PLL_OUT", "REFCLK"]
 
         The cache stores NetInfo objects keyed by original net name to avoid
         repeated processing of the same net names.
@@ -153,11 +179,15 @@ class NetNormalizer:
         self._ground_nets: set[str] = (
             {name.upper() for name in ground_nets} if ground_nets else set()
         )
+        self._clock_nets: set[str] = (
+            {name.upper() for name in clock_nets} if clock_nets else set()
+        )
 
         # Custom regex patterns for power/ground nets (user-defined via configuration)
         # These are checked in addition to the class-level default patterns
         self._custom_power_patterns: set[str] = set()
         self._custom_ground_patterns: set[str] = set()
+        self._custom_clock_patterns: set[str] = set()
 
         # Flag to control whether default patterns (POWER_PATTERNS, GROUND_PATTERNS)
         # are used during classification. When True, only custom names and patterns
@@ -169,6 +199,9 @@ class NetNormalizer:
         # the same net names appear many times (e.g., VDD, VSS on every cell)
         self._net_cache: dict[str, NetInfo] = {}
 
+        # Cache for clock root checks, keyed and invalidated like _net_cache
+        self._clock_cache: dict[str, bool] = {}
+
     def normalize(self, net_name: str) -> NetInfo:
         """Normalize a net name and return classification information.
 
@@ -344,6 +377,45 @@ class NetNormalizer:
         info = self.normalize(net_name)
         return info.net_type in (NetType.POWER, NetType.GROUND)
 
+    def is_clock(self, net_name: str) -> bool:
+        """Check if a net is a clock root.
+
+        The check runs on the normalized name with any bus index removed,
+        so "clk<0>" is a clock root if "clk" is. Priority mirrors
+        _classify_type: custom names, custom patterns, then default
+        patterns (unless clear_default_patterns() has been called).
+
+        Args:
+            net_name: Raw net name to check.
+
+        Returns:
+            True if the net is a clock root, False otherwise.
+
+        Example:
+            >>> normalizer = NetNormalizer(clock_nets=["PLL_OUT"])
+            >>> normalizer.is_clock("sys_clk"), normalizer.is_clock("PLL_OUT")
+            (True, True)
+            >>> normalizer.is_clock("data")
+            False
+        """
+        if net_name in self._clock_cache:
+            return self._clock_cache[net_name]
+
+        info = self.normalize(net_name)
+        base_name = info.normalized_name
+        if info.is_bus:
+            base_name = base_name.rsplit("[", 1)[0]
+
+        patterns = list(self._custom_clock_patterns)
+        if self._use_default_patterns:
+            patterns.extend(self.CLOCK_PATTERNS)
+
+        result = base_name.upper() in self._clock_nets or any(
+            re.match(p, base_name, re.IGNORECASE) for p in patterns
+        )
+        self._clock_cache[net_name] = result
+        return result
+
     def add_power_patterns(self, patterns: Iterable[str]) -> None:
         """Add custom regex patterns for power net classification.
 
@@ -386,13 +458,32 @@ class NetNormalizer:
         # Invalidate cache since classification results may have changed
         self._net_cache.clear()
 
+    def add_clock_patterns(self, patterns: Iterable[str]) -> None:
+        """Add custom regex patterns for clock root identification.
+
+        These patterns are checked in addition to the default patterns
+        (unless clear_default_patterns() has been called).
+
+        Args:
+            patterns: Regex patterns to match clock root nets.
+                Example: ["^SCLK[0-9]*$"]
+
+        Example:
+            >>> normalizer = NetNormalizer()
+            >>> normalizer.add_clock_patterns(["^SCLK[0-9]*$"])
+            >>> normalizer.is_clock("SCLK2")
+            True
+        """
+        self._custom_clock_patterns.update(patterns)
+        self._clock_cache.clear()
+
     def clear_default_patterns(self) -> None:
-        """Disable default power/ground patterns.
+        """Disable default power/ground/clock patterns.
 
         After calling this method, only custom names (from constructor) and
-        custom patterns (from add_power_patterns/add_ground_patterns) will
-        be used for classification. The default VDD/VSS/GND patterns will
-        be ignored.
+        custom patterns (from add_power_patterns/add_ground_patterns/
+        add_clock_patterns) will be used for classification. The default
+        VDD/VSS/GND and CLK patterns will be ignored.
 
         This is useful when the default patterns conflict with a project's
         naming conventions, or when you want complete control over classification.
@@ -410,6 +501,7 @@ class NetNormalizer:
         self._use_default_patterns = False
         # Invalidate cache since classification results may have changed
         self._net_cache.clear()
+        self._clock_cache.clear()
 
     @classmethod
     def from_config(cls, config: NetClassificationConfig) -> NetNormalizer:
@@ -419,6 +511,7 @@ class NetNormalizer:
         the settings in a NetClassificationConfig object. It handles:
         - Custom power/ground net names
         - Custom regex patterns for power/ground
+        - Custom clock root names and patterns
         - The override_defaults flag
 
         This is the preferred way to create a NetNormalizer when using
@@ -442,6 +535,7 @@ class NetNormalizer:
         normalizer = cls(
             power_nets=config.power_names,
             ground_nets=config.ground_names,
+            clock_nets=config.clock_names,
         )
 
         # Add custom patterns if provided
@@ -449,6 +543,8 @@ class NetNormalizer:
             normalizer.add_power_patterns(config.power_patterns)
         if config.ground_patterns:
             normalizer.add_ground_patterns(config.ground_patterns)
+        if config.clock_patterns:
+            normalizer.add_clock_patterns(config.clock_patterns)
 
         # Handle override_defaults flag
         if config.override_defaults:
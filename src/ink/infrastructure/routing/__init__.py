@@ -0,0 +1,28 @@
+"""Routing infrastructure module for orthogonal net routing.
+
+This module turns placed cells into wire geometry:
+- SpatialGrid - Uniform-grid index of cell rectangles for obstacle queries
+- ChannelRouter - Orthogonal channel router producing NetGeometry per net
+- GeometryStore - Flat float32 arrays of routed geometry, NetGeometry on demand
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Algorithm implementations
+    Bounded Context: Schematic Context
+"""
+
+from ink.infrastructure.routing.channel_router import (
+    ChannelRouter,
+    NetPins,
+    RoutingResult,
+)
+from ink.infrastructure.routing.geometry_store import GeometryStore
+from ink.infrastructure.routing.spatial_grid import SpatialGrid
+
+__all__ = [
+    "ChannelRouter",
+    "GeometryStore",
+    "NetPins",
+    "RoutingResult",
+    "SpatialGrid",
+]
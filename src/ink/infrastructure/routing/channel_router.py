@@ -0,0 +1,424 @@
+"""Orthogonal channel router for layered schematics.
+
+This module turns the cell placement of the Sugiyama layout into wires: it
+routes every visible net as horizontal and vertical segments plus junction
+dots, collected in a GeometryStore (NetGeometry views on demand).
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Two-phase router (global plan, then per-channel tracks)
+    Bounded Context: Schematic Context
+
+Channels:
+    Cells sit in columns (the layers). The vertical gap between column c
+    and column c+1 is channel c. Every net gets a vertical trunk in the
+    channel right of its driver's column; wires between pins and trunks
+    run horizontally. Beyond the outermost columns, virtual columns
+    continue at the same pitch, so feedback nets into column 0 get a
+    channel -1 left of it.
+
+Algorithm Overview:
+    1. Index cell rectangles in a SpatialGrid
+    2. Plan each net. Output pin -> trunk; sinks in the next column branch
+       straight off the trunk. Sinks further right (or at or left of the
+       driver's column, i.e. feedback) are grouped by column. Each group
+       gets one horizontal run from the trunk to a jog in the channel left
+       of the group's column, at the free row nearest the group's mean
+       pin height. Free rows are found with grid queries that jump past
+       the obstacles they hit, and each run is added to the grid so later
+       runs keep clear of it. A search that is still blocked after
+       _MAX_ROW_PROBES queries routes the run below everything placed.
+    3. Assign tracks channel by channel with the left-edge algorithm: each
+       net's wire in a channel is one interval [top, bottom], and
+       intervals that don't overlap (with clearance) share a track.
+       Channels are independent, so with workers > 1 they are processed
+       in a process pool.
+    4. Resolve track x positions (spread evenly across the channel) and
+       append the segments to the store as flat coordinates, with a
+       junction wherever three or more wire ends meet on a trunk or jog.
+
+Limits:
+    Crossings between nets are not computed (NetGeometry.crossings is
+    empty). Channels are not widened: a channel with many tracks packs
+    them more tightly, and RoutingResult.channel_tracks reports the
+    density so callers can increase layer spacing.
+
+Complexity:
+    Time: O(P log P) for P pins, plus at most _MAX_ROW_PROBES grid
+          queries per run (each proportional to the columns it crosses)
+    Space: O(P + cells)
+
+Example:
+    >>> result = CoordinateAssigner().assign(ordering, heights)
+    >>> nets = [NetPins(NetId("n1"), driver=Point(120.0, 40.0), sinks=(Point(200.0, 40.0),))]
+    >>> routing = ChannelRouter().route(result.positions, nets, heights)
+    >>> routing.geometries[NetId("n1")].segments
+    (LineSegment(start=Point(x=120.0, y=40.0), end=Point(x=160.0, y=40.0)), ...)
+
+See Also:
+    - CoordinateAssigner: Produces the cell positions
+    - SpatialGrid: Obstacle index
+    - GeometryStore: The routed result, one NetGeometry view per net
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import math
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final, TypeVar
+
+from ink.infrastructure.layout.coordinate_assignment import (
+    DEFAULT_CELL_HEIGHT,
+    DEFAULT_CELL_WIDTH,
+    DEFAULT_LAYER_SPACING,
+)
+from ink.infrastructure.routing.geometry_store import GeometryStore
+from ink.infrastructure.routing.spatial_grid import SpatialGrid
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping
+
+    from ink.domain.value_objects.geometry import Point
+    from ink.domain.value_objects.identifiers import NetId
+
+# Graph node type of the caller (e.g. str); keeps dict[str, Point] positions valid
+_Node = TypeVar("_Node", bound="Hashable")
+
+# Minimum distance between parallel wires, and between wires and cells
+DEFAULT_CLEARANCE: Final = 5.0
+
+# Tolerance when matching pin x coordinates to cell edges
+_EDGE_TOLERANCE: Final = 1e-6
+
+# Grid queries per free-row search before falling back below all obstacles
+_MAX_ROW_PROBES: Final = 16
+
+
+@dataclass(frozen=True)
+class NetPins:
+    """Pin locations of one net to route.
+
+    Attributes:
+        net_id: The net.
+        driver: Output pin, on the right edge of the driving cell.
+        sinks: Input pins, on the left edges of the loads.
+    """
+
+    net_id: NetId
+    driver: Point
+    sinks: tuple[Point, ...]
+
+
+@dataclass(frozen=True)
+class RoutingResult:
+    """Result of routing.
+
+    Attributes:
+        geometries: Routed geometry per net, array-backed.
+        channel_tracks: Number of tracks used in each channel that has
+            wires (channel c lies right of column c).
+    """
+
+    geometries: GeometryStore
+    channel_tracks: dict[int, int]
+
+
+@dataclass
+class _NetPlan:
+    """Channel-relative wiring of one net before tracks are known.
+
+    Horizontal wires are (y, pin_x, channel, None) from a pin to a
+    channel's wire, or (y, None, channel, other_channel) between two
+    channels' wires. attach[c] lists the heights at which horizontal wires
+    end on the net's vertical wire in channel c.
+    """
+
+    net_id: NetId
+    horizontals: list[tuple[float, float | None, int, int | None]] = field(default_factory=list)
+    attach: dict[int, list[float]] = field(default_factory=lambda: defaultdict(list))
+
+
+class ChannelRouter:
+    """Routes nets orthogonally through the channels between columns.
+
+    Attributes:
+        cell_width: Width of every cell (the column width).
+        layer_spacing: Channel width used for virtual columns beyond the
+            placed ones.
+        clearance: Minimum gap between wires and obstacles.
+        workers: Processes for per-channel track assignment (1 = serial).
+
+    Example:
+        >>> router = ChannelRouter(workers=4)
+        >>> routing = router.route(positions, nets, heights)
+    """
+
+    def __init__(
+        self,
+        cell_width: float = DEFAULT_CELL_WIDTH,
+        layer_spacing: float = DEFAULT_LAYER_SPACING,
+        clearance: float = DEFAULT_CLEARANCE,
+        workers: int = 1,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            cell_width: Width of every cell; must match the layout.
+            layer_spacing: Gap between columns; must match the layout.
+            clearance: Minimum gap between wires and obstacles.
+            workers: Processes for track assignment; 1 runs in-process.
+
+        Raises:
+            ValueError: If clearance is not positive or workers < 1.
+        """
+        if clearance <= 0:
+            raise ValueError("clearance must be positive")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.cell_width = cell_width
+        self.layer_spacing = layer_spacing
+        self.clearance = clearance
+        self.workers = workers
+
+    def route(
+        self,
+        positions: Mapping[_Node, Point],
+        nets: Iterable[NetPins],
+        heights: Mapping[_Node, float] | None = None,
+    ) -> RoutingResult:
+        """Route nets around placed cells.
+
+        Args:
+            positions: Top-left corner of every cell, e.g.
+                CoordinateAssignment.positions.
+            nets: Nets to route. Nets without sinks get only the stub to
+                their trunk.
+            heights: Height per cell; others use DEFAULT_CELL_HEIGHT.
+
+        Returns:
+            RoutingResult with the geometry of every net, in input order.
+        """
+        heights = heights or {}
+        columns = _Columns(
+            sorted({point.x for point in positions.values()}),
+            self.cell_width,
+            self.cell_width + self.layer_spacing,
+        )
+        grid = SpatialGrid(bucket_size=DEFAULT_CELL_HEIGHT)
+        for node, point in positions.items():
+            height = heights.get(node, DEFAULT_CELL_HEIGHT)
+            grid.insert(point.x, point.y, point.x + self.cell_width, point.y + height)
+
+        plans = [self._plan(net, columns, grid) for net in nets]
+        tracks = self._assign_tracks(plans)
+        geometries = GeometryStore()
+        for index, plan in enumerate(plans):
+            self._build(plan, columns, tracks[index], geometries)
+        counts = {
+            channel: total for net_tracks in tracks for channel, (_, total) in net_tracks.items()
+        }
+        return RoutingResult(geometries=geometries, channel_tracks=counts)
+
+    def _plan(self, net: NetPins, columns: _Columns, grid: SpatialGrid) -> _NetPlan:
+        """Decide which channels a net uses and where its runs go."""
+        plan = _NetPlan(net.net_id)
+        driver_column = columns.column_of(net.driver.x - self.cell_width)
+        trunk = driver_column
+        plan.horizontals.append((net.driver.y, net.driver.x, trunk, None))
+        plan.attach[trunk].append(net.driver.y)
+
+        groups: dict[int, list[Point]] = defaultdict(list)
+        for sink in net.sinks:
+            groups[columns.column_of(sink.x)].append(sink)
+        for column, sinks in sorted(groups.items()):
+            jog = column - 1
+            if jog != trunk:
+                # Run from the trunk across the columns between to a jog
+                lo, hi = min(trunk + 1, column), max(column - 1, trunk)
+                preferred = sum(sink.y for sink in sinks) / len(sinks)
+                y = self._free_row(grid, columns.left(lo), columns.right(hi), preferred)
+                plan.horizontals.append((y, None, trunk, jog))
+                plan.attach[trunk].append(y)
+                plan.attach[jog].append(y)
+            for sink in sinks:
+                plan.horizontals.append((sink.y, sink.x, jog, None))
+                plan.attach[jog].append(sink.y)
+        return plan
+
+    def _free_row(self, grid: SpatialGrid, x0: float, x1: float, preferred: float) -> float:
+        """Find the free row nearest a height across [x0, x1] and reserve it.
+
+        Rows lie at multiples of twice the clearance below (k > 0) and
+        above (k < 0) the preferred height, nearest first and below before
+        above on ties. A blocked probe jumps its direction to the first
+        row past the obstacles it hit, which skips only blocked rows. In
+        crowded regions the search gives up after _MAX_ROW_PROBES queries
+        and takes the first row below every obstacle, which is always free.
+        """
+        step = 2 * self.clearance
+        margin = self.clearance
+        below, above = 0, 1  # next row number to probe in each direction
+        for _ in range(_MAX_ROW_PROBES):
+            down = below <= above
+            y = preferred + below * step if down else preferred - above * step
+            hits = grid.query(x0, y - margin, x1, y + margin)
+            if not hits:
+                break
+            if down:
+                edge = max(grid.rect(number)[3] for number in hits)
+                below = max(below + 1, math.floor((edge + margin - preferred) / step) + 1)
+            else:
+                edge = min(grid.rect(number)[1] for number in hits)
+                above = max(above + 1, math.floor((preferred + margin - edge) / step) + 1)
+        else:
+            k = max(0, math.floor((grid.bottom + margin - preferred) / step) + 1)
+            y = preferred + k * step
+        grid.insert(x0, y - margin, x1, y + margin)
+        return y
+
+    def _assign_tracks(self, plans: list[_NetPlan]) -> list[dict[int, tuple[int, int]]]:
+        """Give every (net, channel) wire a track.
+
+        Returns:
+            Per plan, channel → (track, tracks in that channel).
+        """
+        intervals: dict[int, list[tuple[float, float]]] = defaultdict(list)
+        owners: dict[int, list[int]] = defaultdict(list)
+        for index, plan in enumerate(plans):
+            for channel, ys in plan.attach.items():
+                intervals[channel].append((min(ys), max(ys)))
+                owners[channel].append(index)
+
+        channels = list(intervals)
+        gap = 2 * self.clearance
+        batches = [intervals[channel] for channel in channels]
+        if self.workers > 1 and len(channels) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_left_edge, batches, itertools.repeat(gap)))
+        else:
+            results = [_left_edge(batch, gap) for batch in batches]
+
+        tracks: list[dict[int, tuple[int, int]]] = [{} for _ in plans]
+        for channel, (assigned, total) in zip(channels, results, strict=True):
+            for index, track in zip(owners[channel], assigned, strict=True):
+                tracks[index][channel] = (track, total)
+        return tracks
+
+    def _build(
+        self,
+        plan: _NetPlan,
+        columns: _Columns,
+        tracks: dict[int, tuple[int, int]],
+        store: GeometryStore,
+    ) -> None:
+        """Append the segments and junctions of a planned net to the store."""
+
+        def track_x(channel: int) -> float:
+            track, total = tracks[channel]
+            left, right = columns.right(channel), columns.left(channel + 1)
+            return left + (right - left) * (track + 1) / (total + 1)
+
+        # Walk from the driver: each channel's vertical follows the first
+        # horizontal reaching it, oriented away from that point, so simple
+        # nets come out as a connected path and bend_count is meaningful
+        segments: list[float] = []
+        emitted: set[int] = set()
+        for index, (y, pin_x, channel, other) in enumerate(plan.horizontals):
+            if other is not None:
+                start, end, reached = track_x(channel), track_x(other), other
+            elif pin_x is None:
+                continue  # every wire has a pin or a second channel
+            elif index == 0:
+                start, end, reached = pin_x, track_x(channel), channel
+            else:
+                start, end, reached = track_x(channel), pin_x, None
+            if start != end:
+                segments += (start, y, end, y)
+            if reached is not None and reached not in emitted:
+                emitted.add(reached)
+                ys = plan.attach[reached]
+                top, bottom = min(ys), max(ys)
+                if top < bottom:
+                    far = top if y == bottom else bottom
+                    near = y if y in (top, bottom) else top
+                    x = track_x(reached)
+                    segments += (x, near, x, far)
+
+        junctions: list[float] = []
+        for channel, ys in plan.attach.items():
+            top, bottom = min(ys), max(ys)
+            for y, ends in sorted(_count(ys).items()):
+                # Wire ends meeting here: horizontals plus the vertical's own
+                vertical = 0 if top == bottom else (1 if y in (top, bottom) else 2)
+                if ends + vertical >= 3:  # noqa: PLR2004 - a branch point
+                    junctions += (track_x(channel), y)
+
+        store.append(plan.net_id, segments, junctions)
+
+
+class _Columns:
+    """Column left edges, extended by virtual columns on both sides."""
+
+    def __init__(self, lefts: list[float], width: float, pitch: float) -> None:
+        """Store the sorted left edges of the placed columns."""
+        self.lefts = lefts or [0.0]
+        self.width = width
+        self.pitch = pitch
+
+    def column_of(self, x: float) -> int:
+        """Column whose left edge is at or just left of x."""
+        return bisect.bisect_right(self.lefts, x + _EDGE_TOLERANCE) - 1
+
+    def left(self, column: int) -> float:
+        """Left edge of a (possibly virtual) column."""
+        last = len(self.lefts) - 1
+        if column < 0:
+            return self.lefts[0] + column * self.pitch
+        if column > last:
+            return self.lefts[last] + (column - last) * self.pitch
+        return self.lefts[column]
+
+    def right(self, column: int) -> float:
+        """Right edge of a (possibly virtual) column."""
+        return self.left(column) + self.width
+
+
+def _count(values: list[float]) -> dict[float, int]:
+    """Occurrences of each value."""
+    counts: dict[float, int] = defaultdict(int)
+    for value in values:
+        counts[value] += 1
+    return counts
+
+
+def _left_edge(intervals: list[tuple[float, float]], gap: float) -> tuple[list[int], int]:
+    """Assign tracks to intervals so that no track holds two within gap.
+
+    Module-level so it can be sent to worker processes.
+
+    Args:
+        intervals: (top, bottom) per wire in one channel.
+        gap: Minimum vertical distance between wires on one track.
+
+    Returns:
+        (track per interval, number of tracks).
+    """
+    order = sorted(range(len(intervals)), key=lambda i: intervals[i])
+    assigned = [0] * len(intervals)
+    busy: list[tuple[float, int]] = []  # (bottom, track), lowest bottom first
+    total = 0
+    for i in order:
+        top, bottom = intervals[i]
+        if busy and busy[0][0] + gap <= top:
+            _, track = heapq.heappop(busy)
+        else:
+            track = total
+            total += 1
+        assigned[i] = track
+        heapq.heappush(busy, (bottom, track))
+    return assigned, total
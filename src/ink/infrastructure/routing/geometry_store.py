@@ -0,0 +1,357 @@
+"""Array-backed storage of routed net geometry.
+
+This module provides GeometryStore, the compact form in which the channel
+router returns its wires. A NetGeometry holds a tuple of LineSegments of
+Points, i.e. five Python objects per segment; tens of thousands of routed
+nets turn into millions of small objects that are slow to create, to
+pickle and to collect. The store keeps the same information in a handful
+of flat arrays and creates NetGeometry objects only when one is asked for.
+
+Architecture:
+    Layer: Infrastructure Layer
+    Pattern: Structure of arrays with lazy object views
+    Bounded Context: Schematic Context
+
+Data Layout:
+    Net i owns segments segment_offsets[i] to segment_offsets[i + 1] - 1,
+    and segment k is segment_coords[4k : 4k + 4] = (x0, y0, x1, y1).
+    Junctions and crossings are stored the same way with two floats per
+    point. Coordinates are float32: at schematic scale (logical pixels up
+    to a few hundred thousand) the rounding error stays below 0.02 pixels,
+    and the coordinate buffer is half the size of a float64 one.
+
+Access:
+    - Mapping interface: store[net_id] builds a NetGeometry view of one
+      net on demand (not cached; callers that keep it hold the objects)
+    - segment_view(): zero-copy memoryview of one net's coordinates, for
+      renderers that walk the floats directly (see build_net_path())
+
+Serialization:
+    to_bytes()/from_bytes() write the arrays little-endian after a small
+    header, followed by the net ids as UTF-8 JSON. No per-segment objects
+    are created on either side.
+
+Example:
+    >>> store = GeometryStore()
+    >>> store.append(NetId("n1"), [0.0, 0.0, 10.0, 0.0, 10.0, 0.0, 10.0, 5.0])
+    >>> store[NetId("n1")].bend_count
+    1
+    >>> with store.segment_view(NetId("n1")) as coords:
+    ...     list(coords)
+    [0.0, 0.0, 10.0, 0.0, 10.0, 0.0, 10.0, 5.0]
+
+See Also:
+    - ChannelRouter: Fills a store per routing run
+    - NetGeometry: The object view of one net
+    - build_net_path: Batches a store into one QPainterPath
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Final
+
+from ink.domain.value_objects.geometry import LineSegment, NetGeometry, Point
+from ink.domain.value_objects.identifiers import NetId
+from ink.infrastructure.graph.csr import to_le_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Typecodes: 'f' = float32 coordinates, 'q' = int64 offsets
+COORD_TYPECODE: Final = "f"
+OFFSET_TYPECODE: Final = "q"
+
+# Floats per stored segment (x0, y0, x1, y1) and per point (x, y)
+_SEGMENT_FLOATS: Final = 4
+_POINT_FLOATS: Final = 2
+
+# Binary format: magic, version, net count, then segment, junction and
+# crossing totals
+_MAGIC = b"INKGEO"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sHqqqq")
+
+
+class GeometryStore(Mapping[NetId, NetGeometry]):
+    """Routed geometry of many nets in flat float32 arrays.
+
+    Behaves as a read-only mapping of net id to NetGeometry; append() and
+    add() are the only ways to grow it. Nets keep their insertion order.
+
+    Attributes:
+        segment_coords: x0, y0, x1, y1 of every segment, net by net.
+        segment_offsets: Segment range per net (one more entry than nets).
+        junction_coords: x, y of every junction point, net by net.
+        junction_offsets: Junction range per net.
+        crossing_coords: x, y of every crossing point, net by net.
+        crossing_offsets: Crossing range per net.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty store."""
+        self._net_ids: list[NetId] = []
+        self._positions: dict[NetId, int] = {}
+        self.segment_coords: array[float] = array(COORD_TYPECODE)
+        self.segment_offsets: array[int] = array(OFFSET_TYPECODE, [0])
+        self.junction_coords: array[float] = array(COORD_TYPECODE)
+        self.junction_offsets: array[int] = array(OFFSET_TYPECODE, [0])
+        self.crossing_coords: array[float] = array(COORD_TYPECODE)
+        self.crossing_offsets: array[int] = array(OFFSET_TYPECODE, [0])
+
+    @classmethod
+    def from_geometries(cls, geometries: Iterable[NetGeometry]) -> GeometryStore:
+        """Pack existing NetGeometry objects into a store.
+
+        Args:
+            geometries: Geometries with distinct net ids.
+
+        Returns:
+            A store holding the geometries in iteration order.
+        """
+        store = cls()
+        for geometry in geometries:
+            store.add(geometry)
+        return store
+
+    # =========================================================================
+    # Building
+    # =========================================================================
+
+    def append(
+        self,
+        net_id: NetId,
+        segments: Iterable[float],
+        junctions: Iterable[float] = (),
+        crossings: Iterable[float] = (),
+    ) -> None:
+        """Add one net from flat coordinates.
+
+        Args:
+            net_id: The net; must not be in the store yet.
+            segments: x0, y0, x1, y1 per segment, in path order.
+            junctions: x, y per junction point.
+            crossings: x, y per crossing point.
+
+        Raises:
+            ValueError: If the net is already stored or a coordinate count
+                does not fit its record size. The store is unchanged then.
+            BufferError: If a segment_view() is still held.
+        """
+        if net_id in self._positions:
+            raise ValueError(f"Net {net_id} is already in the store")
+        parts = (
+            (array(COORD_TYPECODE, segments), _SEGMENT_FLOATS),
+            (array(COORD_TYPECODE, junctions), _POINT_FLOATS),
+            (array(COORD_TYPECODE, crossings), _POINT_FLOATS),
+        )
+        for values, size in parts:
+            if len(values) % size:
+                raise ValueError(f"Coordinate count {len(values)} is not a multiple of {size}")
+
+        targets = (
+            (self.segment_coords, self.segment_offsets),
+            (self.junction_coords, self.junction_offsets),
+            (self.crossing_coords, self.crossing_offsets),
+        )
+        for (values, size), (coords, offsets) in zip(parts, targets, strict=True):
+            coords.extend(values)
+            offsets.append(offsets[-1] + len(values) // size)
+        self._positions[net_id] = len(self._net_ids)
+        self._net_ids.append(net_id)
+
+    def add(self, geometry: NetGeometry) -> None:
+        """Add one net from its NetGeometry.
+
+        Args:
+            geometry: Geometry of a net not in the store yet.
+
+        Raises:
+            ValueError: If the net is already stored.
+        """
+        self.append(
+            geometry.net_id,
+            [
+                value
+                for segment in geometry.segments
+                for value in (segment.start.x, segment.start.y, segment.end.x, segment.end.y)
+            ],
+            [value for point in geometry.junctions for value in (point.x, point.y)],
+            [value for point in geometry.crossings for value in (point.x, point.y)],
+        )
+
+    # =========================================================================
+    # Mapping interface
+    # =========================================================================
+
+    def __getitem__(self, net_id: NetId) -> NetGeometry:
+        """Build the NetGeometry view of one net.
+
+        Raises:
+            KeyError: If the net is not stored.
+        """
+        index = self._positions[net_id]
+        coords = self._slice(self.segment_coords, self.segment_offsets, index, _SEGMENT_FLOATS)
+        segments = tuple(
+            LineSegment(Point(coords[k], coords[k + 1]), Point(coords[k + 2], coords[k + 3]))
+            for k in range(0, len(coords), _SEGMENT_FLOATS)
+        )
+        return NetGeometry(
+            net_id=net_id,
+            segments=segments,
+            junctions=self._points(self.junction_coords, self.junction_offsets, index),
+            crossings=self._points(self.crossing_coords, self.crossing_offsets, index),
+        )
+
+    def __iter__(self) -> Iterator[NetId]:
+        """Iterate over net ids in insertion order."""
+        return iter(self._net_ids)
+
+    def __len__(self) -> int:
+        """Get the number of stored nets."""
+        return len(self._net_ids)
+
+    def __contains__(self, net_id: object) -> bool:
+        """Check whether a net is stored, without building its view."""
+        return net_id in self._positions
+
+    def __eq__(self, other: object) -> bool:
+        """Compare stores by arrays, other mappings by their items."""
+        if isinstance(other, GeometryStore):
+            return self._net_ids == other._net_ids and self._arrays() == other._arrays()
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # =========================================================================
+    # Raw access
+    # =========================================================================
+
+    def segment_view(self, net_id: NetId) -> memoryview:
+        """Get one net's segment coordinates without copying.
+
+        The view shares memory with segment_coords and blocks append()
+        while it exists, so use it as a context manager (or release() it).
+
+        Args:
+            net_id: A stored net.
+
+        Returns:
+            Memoryview of float32 values, four per segment.
+
+        Raises:
+            KeyError: If the net is not stored.
+        """
+        index = self._positions[net_id]
+        start = self.segment_offsets[index] * _SEGMENT_FLOATS
+        end = self.segment_offsets[index + 1] * _SEGMENT_FLOATS
+        with memoryview(self.segment_coords) as whole:
+            return whole[start:end]
+
+    @property
+    def segment_count(self) -> int:
+        """Total number of segments over all nets."""
+        return self.segment_offsets[-1]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the coordinate and offset arrays."""
+        return sum(len(values) * values.itemsize for values in self._arrays())
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_bytes(self) -> bytes:
+        """Serialize the store.
+
+        Returns:
+            Header, the offset and coordinate arrays little-endian, then
+            the net ids as UTF-8 JSON.
+        """
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            len(self._net_ids),
+            self.segment_offsets[-1],
+            self.junction_offsets[-1],
+            self.crossing_offsets[-1],
+        )
+        chunks = [header] + [to_le_bytes(values) for values in self._arrays()]
+        chunks.append(json.dumps(self._net_ids, separators=(",", ":")).encode("utf-8"))
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> GeometryStore:
+        """Restore a store written by to_bytes().
+
+        Args:
+            data: Serialized store.
+
+        Returns:
+            The restored store.
+
+        Raises:
+            ValueError: If data is not a serialized GeometryStore or is
+                truncated.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a GeometryStore (bad header)")
+        magic, version, nets, segments, junctions, crossings = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a GeometryStore (bad header)")
+
+        store = cls()
+        position = _HEADER.size
+        counts = (
+            nets + 1,
+            nets + 1,
+            nets + 1,
+            segments * _SEGMENT_FLOATS,
+            junctions * _POINT_FLOATS,
+            crossings * _POINT_FLOATS,
+        )
+        if len(data) < position + sum(
+            count * target.itemsize for target, count in zip(store._arrays(), counts, strict=True)
+        ):
+            raise ValueError("Truncated GeometryStore")
+        for target, count in zip(store._arrays(), counts, strict=True):
+            end = position + count * target.itemsize
+            del target[:]
+            target.frombytes(data[position:end])
+            if sys.byteorder != "little":
+                target.byteswap()
+            position = end
+        store._net_ids = [NetId(net_id) for net_id in json.loads(str(data[position:], "utf-8"))]
+        store._positions = {net_id: index for index, net_id in enumerate(store._net_ids)}
+        return store
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _arrays(self) -> tuple[array[Any], ...]:
+        """All arrays in serialization order: offsets first, then coordinates."""
+        return (
+            self.segment_offsets,
+            self.junction_offsets,
+            self.crossing_offsets,
+            self.segment_coords,
+            self.junction_coords,
+            self.crossing_coords,
+        )
+
+    @staticmethod
+    def _slice(coords: array[float], offsets: array[int], index: int, size: int) -> array[float]:
+        """Copy the coordinates of one net's records."""
+        return coords[offsets[index] * size : offsets[index + 1] * size]
+
+    @classmethod
+    def _points(cls, coords: array[float], offsets: array[int], index: int) -> tuple[Point, ...]:
+        """Build the Points of one net's point records."""
+        values = cls._slice(coords, offsets, index, _POINT_FLOATS)
+        return tuple(Point(values[k], values[k + 1]) for k in range(0, len(values), 2))
@@ -11,6 +11,9 @@ E02 - Rendering Epic Components:
     - CellItem (E02-F01-T01): QGraphicsItem for cell symbol rendering
     - SymbolLayoutCalculator (E02-F01-T03): Pin position calculation
     - DetailLevel (E02-F01-T05): Level of Detail enum for rendering optimization
+    - LayoutService: Background layout with quick placement and animation
+    - build_net_path: One QPainterPath for many routed nets
+    - ClusterDetailController: Zoom-driven expansion of clustered layouts
 
 Future implementation (E02 - Rendering):
     - Full QGraphicsView-based rendering with QGraphicsScene
@@ -25,7 +28,10 @@ Example:
 """
 
 from ink.presentation.canvas.cell_item import CellItem
+from ink.presentation.canvas.cluster_detail import ClusterDetailController
 from ink.presentation.canvas.detail_level import DetailLevel
+from ink.presentation.canvas.layout_service import LayoutService
+from ink.presentation.canvas.net_paths import build_net_path
 from ink.presentation.canvas.schematic_canvas import SchematicCanvas
 from ink.presentation.canvas.symbol_layout_calculator import (
     PinLayout,
@@ -34,8 +40,11 @@ from ink.presentation.canvas.symbol_layout_calculator import (
 
 __all__ = [
     "CellItem",
+    "ClusterDetailController",
     "DetailLevel",
+    "LayoutService",
     "PinLayout",
     "SchematicCanvas",
     "SymbolLayoutCalculator",
+    "build_net_path",
 ]
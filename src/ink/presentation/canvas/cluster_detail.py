@@ -0,0 +1,171 @@
+"""Zoom-driven expansion of clustered layouts.
+
+This module provides ClusterDetailController, which decides which clusters
+of a ClusteredLayout show their cells. Zoomed out, every cluster is a
+single super-node frame; once the view reaches the controller's detail
+level, the clusters inside the visible area are expanded and their interiors
+laid out on first use. Clusters that scroll out of view, or all of them
+when the user zooms back out, are collapsed again, so the scene only ever
+holds the cells that are on screen.
+
+Architecture:
+    Layer: Presentation Layer
+    Pattern: Controller emitting Qt signals
+    Bounded Context: Schematic Context
+
+Expansion Policy:
+    - Below min_level (DetailLevel.BASIC by default): no cluster is
+      expanded; the canvas draws only the boxes.
+    - At or above it: clusters whose box intersects the visible scene
+      rectangle are expanded, nearest to the view center first.
+    - A first-time interior layout runs on the GUI thread, so one
+      update_view() call lays out at most max_cells_per_update cells (but
+      always at least one cluster). update_view() returns False while
+      visible clusters remain collapsed; call it again, e.g. from a
+      zero-delay timer, to continue. Interiors already laid out are cached
+      by the ClusteredLayout and cost nothing to show again.
+
+Signals:
+    interior_shown(str, object): Cluster name and its CoordinateAssignment
+        in scene coordinates. Emitted again for every shown cluster when
+        boxes move.
+    interior_hidden(str): Cluster name whose cells should be removed.
+    boxes_changed(object): dict name → ClusterBox after an interior turned
+        out larger or smaller than its estimated box.
+
+Example:
+    >>> layout = ClusteredLayout(graph, cluster_by_hierarchy(graph.nodes()))
+    >>> controller = ClusterDetailController(layout)
+    >>> controller.interior_shown.connect(add_cells)
+    >>> controller.interior_hidden.connect(remove_cells)
+    >>> canvas.zoom_changed.connect(
+    ...     lambda zoom: controller.update_view(DetailLevel.from_zoom(zoom), visible_rect())
+    ... )
+
+See Also:
+    - ClusteredLayout: Super-node placement and lazy interiors
+    - DetailLevel: The zoom thresholds
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+from PySide6.QtCore import QObject, QPointF, QRectF, Signal
+
+from ink.presentation.canvas.detail_level import DetailLevel
+
+if TYPE_CHECKING:
+    from ink.infrastructure.layout.cluster_layout import ClusterBox, ClusteredLayout
+
+# Cells laid out per update_view() call before yielding to the event loop
+DEFAULT_MAX_CELLS_PER_UPDATE: Final = 2000
+
+
+class ClusterDetailController(QObject):
+    """Expands and collapses clusters as the view zooms and scrolls.
+
+    See the module docstring for the expansion policy.
+
+    Signals:
+        interior_shown(str, object): Cluster name, CoordinateAssignment.
+        interior_hidden(str): Cluster name.
+        boxes_changed(object): dict name → ClusterBox.
+
+    Example:
+        >>> controller = ClusterDetailController(layout)
+        >>> done = controller.update_view(DetailLevel.FULL, QRectF(0, 0, 800, 600))
+    """
+
+    interior_shown = Signal(str, object)
+    interior_hidden = Signal(str)
+    boxes_changed = Signal(object)
+
+    def __init__(
+        self,
+        layout: ClusteredLayout,
+        parent: QObject | None = None,
+        *,
+        min_level: DetailLevel = DetailLevel.BASIC,
+        max_cells_per_update: int = DEFAULT_MAX_CELLS_PER_UPDATE,
+    ) -> None:
+        """Initialize the controller with every cluster collapsed.
+
+        Args:
+            layout: The clustered layout to expand.
+            parent: Optional parent QObject for Qt ownership.
+            min_level: Lowest detail level at which interiors are shown.
+            max_cells_per_update: Cells laid out per update_view() call.
+        """
+        super().__init__(parent)
+        self._layout = layout
+        self.min_level = min_level
+        self.max_cells_per_update = max_cells_per_update
+        self._shown: set[str] = set()
+
+    @property
+    def layout(self) -> ClusteredLayout:
+        """The clustered layout being expanded."""
+        return self._layout
+
+    @property
+    def shown(self) -> frozenset[str]:
+        """Names of the clusters currently expanded."""
+        return frozenset(self._shown)
+
+    def update_view(self, level: DetailLevel, visible: QRectF) -> bool:
+        """Bring the expanded clusters in line with the current view.
+
+        Args:
+            level: Detail level of the current zoom.
+            visible: Visible area in scene coordinates.
+
+        Returns:
+            True if every cluster that should be expanded is; False if the
+            per-call budget ran out first.
+        """
+        boxes = self._layout.boxes
+        wanted = (
+            {name for name, box in boxes.items() if _rect(box).intersects(visible)}
+            if level >= self.min_level
+            else set()
+        )
+        for name in sorted(self._shown - wanted):
+            self._shown.discard(name)
+            self.interior_hidden.emit(name)
+
+        center = visible.center()
+        pending = sorted(
+            wanted - self._shown,
+            key=lambda name: (_distance(_rect(boxes[name]).center(), center), name),
+        )
+        budget = self.max_cells_per_update
+        added: list[str] = []
+        for name in pending:
+            laid_out = self._layout.is_laid_out(name)
+            if not laid_out and added and boxes[name].cell_count > budget:
+                continue
+            if not laid_out:
+                budget -= boxes[name].cell_count
+            self._layout.interior(name)
+            added.append(name)
+
+        if self._layout.boxes != boxes:
+            # A new interior resized its box; everything shown has moved
+            self.boxes_changed.emit(self._layout.boxes)
+            for name in sorted(self._shown):
+                self.interior_shown.emit(name, self._layout.interior(name))
+        for name in added:
+            self._shown.add(name)
+            self.interior_shown.emit(name, self._layout.interior(name))
+        return len(added) == len(pending)
+
+
+def _rect(box: ClusterBox) -> QRectF:
+    """Scene rectangle of a cluster box."""
+    return QRectF(box.position.x, box.position.y, box.width, box.height)
+
+
+def _distance(a: QPointF, b: QPointF) -> float:
+    """Squared distance between two points (for ordering only)."""
+    return (a.x() - b.x()) ** 2 + (a.y() - b.y()) ** 2
@@ -0,0 +1,335 @@
+"""Background layout service with progressive placement.
+
+This module provides LayoutService, which keeps the Qt event loop
+responsive while a large expansion is laid out. Each request is answered
+twice:
+
+1. Immediately, on the GUI thread, with quick_placement() positions for
+   the new cells (linear time, no crossing optimization)
+2. Later, from a worker thread, with the full Sugiyama layout from
+   LayoutPipeline; animate_to() then moves the cells from their quick
+   positions to the refined ones
+
+Architecture:
+    Layer: Presentation Layer
+    Pattern: Worker thread + queued Qt signals
+    Bounded Context: Schematic Context
+
+Threading:
+    Jobs run as QRunnables on a private single-thread QThreadPool. A
+    worker never touches Qt objects; it reports through _JobSignals, a
+    QObject living on the GUI thread, so its emits arrive as queued
+    connections and the service's slots (and every public signal) run on
+    the GUI thread. The layout is pure Python and holds the GIL while it
+    computes, but the interpreter switches threads every few milliseconds,
+    which is enough for painting and input to stay fluid. A worker process
+    would avoid the GIL but would have to pickle the visible graph both ways
+    for every expansion.
+
+Layout Cache:
+    With a LayoutCache, each request first looks up the signature of the
+    visible graph. A hit emits layout_ready with the cached layout before
+    request_layout() returns and starts no job (and no quick placement);
+    a miss runs as usual and the finished layout is stored under the
+    request's signature. Collapsing back to a view seen before is thus
+    instant.
+
+Cancellation:
+    Every request gets a new job id and CancellationToken and cancels the
+    token of the previous job, which then stops at its next phase boundary
+    without emitting anything. Results that still arrive for an older job
+    id are dropped, so only the newest request ever reaches layout_ready.
+
+Signals:
+    quick_layout_ready(int, object): Job id and dict node → Point of the
+        quick placement of the new cells. Emitted before request_layout()
+        returns.
+    layout_ready(int, object): Job id and the LayoutResult of the full
+        layout (synchronously on a cache hit). Its layers are the previous
+        assignment to pass with the next expansion.
+    layout_failed(int, str): Job id and error message if the pipeline
+        raised anything other than a cancellation.
+
+Example:
+    >>> service = LayoutService()
+    >>> service.quick_layout_ready.connect(lambda _, pos: place(items, pos))
+    >>> service.layout_ready.connect(
+    ...     lambda _, result: service.animate_to(items, result.assignment.positions)
+    ... )
+    >>> service.request_layout(graph, anchors=current_positions, heights=heights)
+
+See Also:
+    - LayoutPipeline: The phases run on the worker
+    - LayoutCache: Finished layouts by visible-graph signature
+    - quick_placement: The immediate heuristic placement
+    - CellItem.set_position: Used by animate_to()
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Final, TypeVar, cast
+
+from PySide6.QtCore import QEasingCurve, QObject, QRunnable, QThreadPool, QVariantAnimation, Signal
+
+from ink.infrastructure.layout.layout_cache import CachedLayout, LayoutCache, layout_signature
+from ink.infrastructure.layout.layout_pipeline import (
+    CancellationToken,
+    LayoutCancelledError,
+    LayoutPipeline,
+    LayoutResult,
+    quick_placement,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+    import networkx as nx
+
+    from ink.domain.value_objects.geometry import Point
+    from ink.infrastructure.layout.layer_assignment import LayerAssignment
+    from ink.presentation.canvas.cell_item import CellItem
+
+# Graph node type of the caller (e.g. str); keeps dict[str, ...] arguments valid
+_Node = TypeVar("_Node", bound="Hashable")
+
+logger = logging.getLogger(__name__)
+
+# Duration of the move from quick to refined positions
+DEFAULT_ANIMATION_MS: Final = 300
+
+
+class _JobSignals(QObject):
+    """GUI-thread endpoint for results emitted by worker threads."""
+
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class _LayoutJob(QRunnable):
+    """One pipeline run on the worker thread."""
+
+    def __init__(
+        self,
+        job_id: int,
+        compute: Callable[[], LayoutResult],
+        token: CancellationToken,
+        signals: _JobSignals,
+    ) -> None:
+        """Capture the job's inputs."""
+        super().__init__()
+        self.job_id = job_id
+        self.compute = compute
+        self.token = token
+        self.signals = signals
+
+    def run(self) -> None:
+        """Run the pipeline and report the result unless cancelled."""
+        try:
+            result = self.compute()
+        except LayoutCancelledError:
+            return
+        except Exception as e:
+            logger.exception("Layout job %d failed", self.job_id)
+            self.signals.failed.emit(self.job_id, str(e))
+            return
+        if not self.token.cancelled:
+            self.signals.finished.emit(self.job_id, result)
+
+
+class LayoutService(QObject):
+    """Runs layouts off the GUI thread and reports them progressively.
+
+    See the module docstring for the threading and cancellation model.
+
+    Signals:
+        quick_layout_ready(int, object): Job id, quick positions of new cells.
+        layout_ready(int, object): Job id, full LayoutResult.
+        layout_failed(int, str): Job id, error message.
+
+    Example:
+        >>> service = LayoutService(LayoutPipeline())
+        >>> job_id = service.request_layout(graph)
+    """
+
+    quick_layout_ready = Signal(int, object)
+    layout_ready = Signal(int, object)
+    layout_failed = Signal(int, str)
+
+    def __init__(
+        self,
+        pipeline: LayoutPipeline | None = None,
+        parent: QObject | None = None,
+        cache: LayoutCache | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            pipeline: Layout phases to run; defaults to LayoutPipeline().
+            parent: Optional parent QObject for Qt ownership.
+            cache: Layout cache to consult and fill; None disables caching.
+        """
+        super().__init__(parent)
+        self._pipeline = pipeline or LayoutPipeline()
+        self._cache = cache
+        self._signature: str | None = None
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _JobSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._job_id = 0
+        self._token: CancellationToken | None = None
+        self._animation: QVariantAnimation | None = None
+
+    @property
+    def current_job(self) -> int:
+        """Id of the newest request (0 before the first)."""
+        return self._job_id
+
+    @property
+    def cache(self) -> LayoutCache | None:
+        """The layout cache, e.g. for saving it with IndexBundle.update()."""
+        return self._cache
+
+    @property
+    def is_busy(self) -> bool:
+        """Whether the newest request's full layout is still pending."""
+        return self._token is not None
+
+    def request_layout(  # type: ignore[no-any-unimported]
+        self,
+        graph: nx.DiGraph | nx.MultiDiGraph,
+        anchors: Mapping[_Node, Point] | None = None,
+        heights: Mapping[_Node, float] | None = None,
+        previous: LayerAssignment | None = None,
+    ) -> int:
+        """Start laying out the visible graph, cancelling any older job.
+
+        Emits quick_layout_ready before returning and layout_ready (or
+        layout_failed) later; on a cache hit, emits only layout_ready,
+        before returning. The graph and heights are read on the worker
+        thread, so they must not be modified until the job reports; pass
+        copies if the caller keeps editing them.
+
+        Args:
+            graph: The visible graph after the expansion.
+            anchors: Current top-left positions of cells already on screen.
+            heights: Height per cell.
+            previous: Layer assignment before the expansion, passed to
+                LayoutPipeline.run() so existing cells keep their columns.
+
+        Returns:
+            The id of the new job, as carried by its signals.
+        """
+        self.cancel()
+        self._job_id += 1
+        if self._cache is not None:
+            self._signature = layout_signature(graph, heights)
+            cached = self._cache.get(self._signature)
+            if cached is not None:
+                result = LayoutResult(cached.layers, cached.assignment)
+                self.layout_ready.emit(self._job_id, result)
+                return self._job_id
+        self._token = CancellationToken()
+
+        assigner = self._pipeline.assigner
+        positions = quick_placement(
+            graph,
+            anchors,
+            heights,
+            layer_spacing=assigner.layer_spacing,
+            node_spacing=assigner.node_spacing,
+            cell_width=assigner.cell_width,
+        )
+        self.quick_layout_ready.emit(self._job_id, positions)
+
+        compute = partial(self._pipeline.run, graph, heights, self._token, previous)
+        job = _LayoutJob(self._job_id, compute, self._token, self._signals)
+        self._pool.start(job)
+        return self._job_id
+
+    def cancel(self) -> None:
+        """Cancel the pending job (if any) and stop a running animation."""
+        if self._token is not None:
+            self._token.cancel()
+            self._token = None
+        if self._animation is not None:
+            self._animation.stop()
+            self._animation = None
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the worker is idle (for shutdown and tests).
+
+        Queued results are still delivered through the event loop
+        afterwards.
+
+        Args:
+            msecs: Timeout in milliseconds; -1 waits indefinitely.
+
+        Returns:
+            True if the worker became idle before the timeout.
+        """
+        return self._pool.waitForDone(msecs)
+
+    def animate_to(
+        self,
+        items: Mapping[_Node, CellItem],
+        positions: Mapping[_Node, Point],
+        duration_ms: int = DEFAULT_ANIMATION_MS,
+    ) -> QVariantAnimation:
+        """Move cell items from where they are to new positions.
+
+        Items without a target position stay put. A running animation is
+        stopped first (cells keep their intermediate positions and move on
+        from there).
+
+        Args:
+            items: Cell item per node.
+            positions: Target top-left position per node, e.g.
+                CoordinateAssignment.positions.
+            duration_ms: Length of the animation.
+
+        Returns:
+            The started animation (owned by the service).
+        """
+        if self._animation is not None:
+            self._animation.stop()
+        moves = [
+            (item, item.pos().x(), item.pos().y(), positions[node])
+            for node, item in items.items()
+            if node in positions
+        ]
+
+        def step(value: object) -> None:
+            t = float(value)  # type: ignore[arg-type]
+            for item, x0, y0, target in moves:
+                item.set_position(x0 + (target.x - x0) * t, y0 + (target.y - y0) * t)
+
+        animation = QVariantAnimation(self)
+        animation.setStartValue(0.0)
+        animation.setEndValue(1.0)
+        animation.setDuration(duration_ms)
+        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        animation.valueChanged.connect(step)
+        animation.start()
+        self._animation = animation
+        return animation
+
+    def _on_finished(self, job_id: int, result: object) -> None:
+        """Forward the newest job's result; drop stale ones."""
+        if job_id != self._job_id:
+            return
+        self._token = None
+        if self._cache is not None and self._signature is not None:
+            layout = cast("LayoutResult", result)
+            self._cache.put(self._signature, CachedLayout(layout.assignment, layout.layers))
+        self.layout_ready.emit(job_id, result)
+
+    def _on_failed(self, job_id: int, message: str) -> None:
+        """Forward the newest job's failure; drop stale ones."""
+        if job_id != self._job_id:
+            return
+        self._token = None
+        self.layout_failed.emit(job_id, message)
@@ -308,5 +308,8 @@ class NetClassificationDialog(QDialog):
             power_patterns=self.get_power_patterns(),
             ground_names=self.get_ground_names(),
             ground_patterns=self.get_ground_patterns(),
+            # Clock roots are not edited here; carry them over unchanged
+            clock_names=list(self._config.clock_names),
+            clock_patterns=list(self._config.clock_patterns),
             override_defaults=self._override_checkbox.isChecked(),
         )
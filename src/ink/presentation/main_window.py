@@ -56,6 +56,7 @@ from ink.presentation.utils.icon_provider import IconProvider
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from ink.infrastructure.graph.graph_statistics import GraphStatistics
     from ink.infrastructure.persistence.app_settings import AppSettings
 
 
@@ -1832,6 +1833,32 @@ class InkMainWindow(QMainWindow):
         """
         self.object_count_label.setText(f"Cells: {cell_count} / Nets: {net_count}")
 
+    def update_graph_statistics(self, stats: GraphStatistics | None) -> None:
+        """Show the design statistics report of a loaded design.
+
+        The one-line summary (cell/net counts and the highest-fanout net)
+        is flashed in the status bar, and the full report becomes the
+        tooltip of the object count label, so hot spots such as a reset
+        net with huge fanout are visible before the user expands into them.
+
+        Not called by the window itself: _open_file() does not parse
+        netlists yet, so the code that loads a design calls this after
+        building its graph.
+
+        Args:
+            stats: Report from NetworkXGraphBuilder.statistics(), or None
+                when the design is closed (clears the tooltip).
+
+        Example:
+            >>> window.update_graph_statistics(builder.statistics())
+            # Shows "1,204 cells · 1,530 nets · max fanout 412 (rst_n)" for 5 s
+        """
+        if stats is None:
+            self.object_count_label.setToolTip("")
+            return
+        self.object_count_label.setToolTip(stats.format_report())
+        self.statusBar().showMessage(stats.format_summary(), 5000)
+
     def _update_view_counts(self) -> None:
         """Query and update visible object counts from expansion state.
 
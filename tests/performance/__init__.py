@@ -6,6 +6,7 @@ application meets speed and memory requirements. Tests focus on:
 - Window creation time (< 500ms target)
 - Memory usage and leak detection
 - Component creation benchmarks
+- Layout and routing stages on synthetic designs (layout_benchmark.py)
 
 Note: pytest-benchmark is optional. If not installed, benchmark tests
 will use basic time measurements instead.
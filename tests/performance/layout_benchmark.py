@@ -0,0 +1,528 @@
+"""Reproducible benchmark of the schematic layout and routing stages.
+
+This module times the four stages that turn a visible cell graph into a
+drawn schematic, on generated designs of different shapes and sizes, and
+appends the results to a JSON history file so regressions show up as a
+jump against earlier runs:
+
+1. layers: LayerAssignmentAlgorithm.assign_layers()
+2. ordering: CrossingMinimizer.minimize()
+3. coordinates: CoordinateAssigner.assign()
+4. routing: ChannelRouter.route() with one net per driving cell
+
+Shapes:
+    pipeline: Parallel lanes of stages with occasional hops between
+        neighboring lanes and a few register feedback edges.
+    bus: 32-bit wide buses through banks of cells, every bit feeding the
+        same and the next bit of the following bank (shift/mux style).
+    reconvergent: Blocks of fanout trees whose leaves are reduced pairwise
+        in shuffled order, so paths split and meet again at every level.
+    fanout: Chains of cells plus a few control nets (clock, reset and
+        enable style) that each drive a large share of all cells.
+
+    Every generator is seeded, so a (shape, cells, seed) triple always
+    produces the same graph.
+
+Measurement:
+    Each stage is timed with time.perf_counter() in a plain run. Peak
+    memory is measured in a second run with tracemalloc, whose bookkeeping
+    would otherwise inflate the times: the peak of memory allocated during
+    the stage, above what was allocated before it started. Results of
+    earlier stages are kept alive, as in the application.
+
+History:
+    The history file is a JSON object {"version": 1, "runs": [...]}. Each
+    run records a UTC timestamp, the git commit (if available), the Python
+    version and platform, and one result per (shape, cells, stage).
+    compare() checks a run against the newest earlier run with the same
+    measurements and reports stages that got slower by more than a factor.
+
+Usage:
+    python -m tests.performance.layout_benchmark                    # 1k-100k
+    python -m tests.performance.layout_benchmark --sizes 1000000 --shapes bus
+    python -m tests.performance.layout_benchmark --history out.json --no-memory
+
+    Sizes of a million cells take minutes per stage and several GB of RAM.
+
+See Also:
+    - test_layout_benchmark.py: Runs the suite at 1k cells under pytest
+    - LayoutPipeline: The same three layout stages with cancellation
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import networkx as nx
+
+from ink.domain.value_objects.geometry import Point
+from ink.domain.value_objects.identifiers import NetId
+from ink.infrastructure.layout import (
+    CoordinateAssigner,
+    CrossingMinimizer,
+    LayerAssignmentAlgorithm,
+)
+from ink.infrastructure.layout.coordinate_assignment import DEFAULT_CELL_HEIGHT
+from ink.infrastructure.routing import ChannelRouter, NetPins
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+# Default history location (pytest-benchmark's directory convention)
+DEFAULT_HISTORY = Path(".benchmarks") / "layout_history.json"
+HISTORY_VERSION: Final = 1
+
+DEFAULT_SIZES: Final = (1_000, 10_000, 100_000)
+DEFAULT_SEED: Final = 1
+STAGES: Final = ("layers", "ordering", "coordinates", "routing")
+
+# A stage counts as regressed when it is this many times slower; stages
+# faster than the floor are too noisy to compare
+DEFAULT_REGRESSION_FACTOR: Final = 1.25
+REGRESSION_FLOOR_SECONDS: Final = 0.05
+
+# Shape parameters
+_LANE_LENGTH: Final = 50
+_BUS_WIDTH: Final = 32
+_TREE_LEAVES: Final = 256
+_CHAINED_BLOCKS: Final = 4
+_CONTROL_NETS: Final = 4
+_CONTROL_SHARE: Final = 0.25
+
+
+# =============================================================================
+# Design Generators
+# =============================================================================
+
+
+def pipeline_graph(cells: int, seed: int = DEFAULT_SEED) -> nx.DiGraph:  # type: ignore[no-any-unimported]
+    """Parallel pipeline lanes with cross-lane hops and feedback.
+
+    Args:
+        cells: Number of cells.
+        seed: Random seed.
+
+    Returns:
+        Graph with integer nodes 0..cells-1.
+    """
+    rng = random.Random(seed)
+    lanes = max(1, cells // _LANE_LENGTH)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(cells))
+    for node in range(cells - lanes):
+        graph.add_edge(node, node + lanes)
+        if rng.random() < 0.2:
+            graph.add_edge(node, min(cells - 1, node + lanes + rng.choice((-1, 1))))
+    for _ in range(max(1, cells // 100)):
+        # Register feedback from late to early stages of a lane
+        late = rng.randrange(cells // 2, cells)
+        graph.add_edge(late, late % lanes)
+    return graph
+
+
+def bus_graph(cells: int, seed: int = DEFAULT_SEED) -> nx.DiGraph:  # type: ignore[no-any-unimported]
+    """Wide buses through banks of cells.
+
+    Args:
+        cells: Number of cells.
+        seed: Random seed.
+
+    Returns:
+        Graph with integer nodes 0..cells-1.
+    """
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(cells))
+    for node in range(cells - _BUS_WIDTH):
+        bit = node % _BUS_WIDTH
+        graph.add_edge(node, node + _BUS_WIDTH)
+        if bit + 1 < _BUS_WIDTH and node + _BUS_WIDTH + 1 < cells:
+            graph.add_edge(node, node + _BUS_WIDTH + 1)
+        if rng.random() < 0.05:
+            graph.add_edge(node, min(cells - 1, node + 2 * _BUS_WIDTH))
+    return graph
+
+
+def reconvergent_graph(cells: int, seed: int = DEFAULT_SEED) -> nx.DiGraph:  # type: ignore[no-any-unimported]
+    """Blocks of a fanout tree whose leaves are reduced pairwise.
+
+    Each block fans a root out to 256 leaves and reduces them pairwise in
+    shuffled order back to one output, so paths split and meet again at
+    every level (adder and comparator trees look like this). Groups of
+    four blocks are chained output to root.
+
+    Args:
+        cells: Number of cells.
+        seed: Random seed.
+
+    Returns:
+        Graph with integer nodes 0..cells-1.
+    """
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(cells))
+    next_node = 0
+    output: int | None = None
+    for block in itertools.count():
+        if next_node >= cells:
+            break
+        root = next_node
+        next_node += 1
+        if output is not None and block % _CHAINED_BLOCKS:
+            graph.add_edge(output, root)
+        level = [root]
+        while len(level) < _TREE_LEAVES and next_node < cells:
+            children = list(range(next_node, min(cells, next_node + 2 * len(level))))
+            for k, child in enumerate(children):
+                graph.add_edge(level[k // 2], child)
+            next_node += len(children)
+            level = children
+        while len(level) > 1 and next_node < cells:
+            rng.shuffle(level)
+            reduced = list(range(next_node, min(cells, next_node + (len(level) + 1) // 2)))
+            for k, node in enumerate(reduced):
+                graph.add_edges_from((source, node) for source in level[2 * k : 2 * k + 2])
+            next_node += len(reduced)
+            level = reduced
+        output = level[0]
+    return graph
+
+
+def fanout_graph(cells: int, seed: int = DEFAULT_SEED) -> nx.DiGraph:  # type: ignore[no-any-unimported]
+    """Chains of cells plus a few control nets with very high fanout.
+
+    Args:
+        cells: Number of cells.
+        seed: Random seed.
+
+    Returns:
+        Graph with integer nodes 0..cells-1; nodes 0..3 drive the control
+        nets.
+    """
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(cells))
+    for node in range(_CONTROL_NETS, cells - 1):
+        if rng.random() < 0.9:
+            graph.add_edge(node, node + 1)
+    loads = list(range(_CONTROL_NETS, cells))
+    share = int(len(loads) * _CONTROL_SHARE)
+    for driver in range(_CONTROL_NETS):
+        graph.add_edges_from((driver, load) for load in rng.sample(loads, share))
+    return graph
+
+
+SHAPES: Final[dict[str, Callable[[int, int], nx.DiGraph]]] = {  # type: ignore[no-any-unimported]
+    "pipeline": pipeline_graph,
+    "bus": bus_graph,
+    "reconvergent": reconvergent_graph,
+    "fanout": fanout_graph,
+}
+
+
+def nets_of(graph: nx.DiGraph, positions: dict[Any, Point], cell_width: float) -> list[NetPins]:  # type: ignore[no-any-unimported]
+    """One net per driving cell: output pin mid-right, inputs mid-left.
+
+    Args:
+        graph: Cell graph.
+        positions: Top-left corner per cell.
+        cell_width: Width of every cell.
+
+    Returns:
+        Pins of every net with at least one sink.
+    """
+    half = DEFAULT_CELL_HEIGHT / 2
+    return [
+        NetPins(
+            NetId(f"n{u}"),
+            driver=Point(positions[u].x + cell_width, positions[u].y + half),
+            sinks=tuple(Point(positions[v].x, positions[v].y + half) for v in graph.successors(u)),
+        )
+        for u in graph
+        if graph.out_degree(u)
+    ]
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class StageResult:
+    """Measurement of one stage on one design.
+
+    Attributes:
+        shape: Design shape (a key of SHAPES).
+        cells: Number of cells.
+        edges: Number of cell-to-cell edges.
+        stage: Stage name (one of STAGES).
+        seconds: Wall-clock time of the stage.
+        peak_bytes: Peak memory allocated during the stage, or None if
+            memory was not measured.
+    """
+
+    shape: str
+    cells: int
+    edges: int
+    stage: str
+    seconds: float
+    peak_bytes: int | None
+
+
+def _stages(graph: nx.DiGraph) -> list[tuple[str, Callable[[dict[str, Any]], Any]]]:  # type: ignore[no-any-unimported]
+    """The benchmarked stages; each reads earlier outputs from a dict."""
+    assigner = CoordinateAssigner()
+    router = ChannelRouter(cell_width=assigner.cell_width, layer_spacing=assigner.layer_spacing)
+    return [
+        ("layers", lambda _: LayerAssignmentAlgorithm().assign_layers(graph)),
+        ("ordering", lambda out: CrossingMinimizer().minimize(graph, out["layers"])),
+        ("coordinates", lambda out: assigner.assign(out["ordering"])),
+        (
+            "routing",
+            lambda out: router.route(
+                out["coordinates"].positions,
+                nets_of(graph, out["coordinates"].positions, assigner.cell_width),
+            ),
+        ),
+    ]
+
+
+def _run_stages(graph: nx.DiGraph, *, trace_memory: bool) -> dict[str, tuple[float, int | None]]:  # type: ignore[no-any-unimported]
+    """Run all stages once; return (seconds, peak bytes) per stage."""
+    outputs: dict[str, Any] = {}
+    measured: dict[str, tuple[float, int | None]] = {}
+    for name, stage in _stages(graph):
+        peak: int | None = None
+        if trace_memory:
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        outputs[name] = stage(outputs)
+        seconds = time.perf_counter() - start
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            tracemalloc.stop()
+        measured[name] = (seconds, peak)
+    return measured
+
+
+def benchmark_design(
+    shape: str,
+    cells: int,
+    *,
+    seed: int = DEFAULT_SEED,
+    memory: bool = True,
+) -> list[StageResult]:
+    """Benchmark every stage on one generated design.
+
+    Args:
+        shape: Design shape (a key of SHAPES).
+        cells: Number of cells.
+        seed: Generator seed.
+        memory: Also measure peak memory, in a second traced run.
+
+    Returns:
+        One result per stage, in stage order.
+
+    Raises:
+        KeyError: If the shape is unknown.
+    """
+    graph = SHAPES[shape](cells, seed)
+    times = _run_stages(graph, trace_memory=False)
+    peaks = _run_stages(graph, trace_memory=True) if memory else {}
+    return [
+        StageResult(
+            shape=shape,
+            cells=cells,
+            edges=graph.number_of_edges(),
+            stage=name,
+            seconds=seconds,
+            peak_bytes=peaks[name][1] if memory else None,
+        )
+        for name, (seconds, _) in times.items()
+    ]
+
+
+def run_suite(
+    shapes: Iterable[str] = SHAPES,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    *,
+    seed: int = DEFAULT_SEED,
+    memory: bool = True,
+    progress: Callable[[StageResult], None] | None = None,
+) -> dict[str, Any]:
+    """Benchmark every shape at every size.
+
+    Args:
+        shapes: Shapes to generate.
+        sizes: Cell counts.
+        seed: Generator seed.
+        memory: Also measure peak memory per stage.
+        progress: Called with each result as soon as it is measured.
+
+    Returns:
+        A history run record (see the module docstring).
+    """
+    results: list[StageResult] = []
+    for size in sizes:
+        for shape in shapes:
+            for result in benchmark_design(shape, size, seed=seed, memory=memory):
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _git_commit() -> str | None:
+    """Current git commit, or None outside a work tree."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+# =============================================================================
+# History
+# =============================================================================
+
+
+def load_history(path: Path) -> dict[str, Any]:
+    """Read a history file, or start an empty history if there is none.
+
+    Raises:
+        ValueError: If the file exists but is not a version-1 history.
+    """
+    if not path.exists():
+        return {"version": HISTORY_VERSION, "runs": []}
+    history: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    if history.get("version") != HISTORY_VERSION:
+        raise ValueError(f"{path} is not a version {HISTORY_VERSION} benchmark history")
+    return history
+
+
+def append_run(path: Path, run: dict[str, Any]) -> dict[str, Any]:
+    """Append a run to a history file (created with its directory if missing).
+
+    Returns:
+        The updated history.
+    """
+    history = load_history(path)
+    history["runs"].append(run)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=1) + "\n", encoding="utf-8")
+    return history
+
+
+def compare(
+    history: dict[str, Any],
+    run: dict[str, Any],
+    factor: float = DEFAULT_REGRESSION_FACTOR,
+) -> list[str]:
+    """Find stages of a run that are slower than in the latest earlier run.
+
+    Each (shape, cells, stage) is compared with the newest other run in
+    the history that measured it with the same seed. Stages that took less
+    than REGRESSION_FLOOR_SECONDS in both runs are skipped as noise.
+
+    Args:
+        history: Loaded history (may already contain run).
+        run: The run to check.
+        factor: Slowdown treated as a regression.
+
+    Returns:
+        One human-readable line per regressed stage.
+    """
+    baseline: dict[tuple[str, int, str], float] = {}
+    for earlier in history["runs"]:
+        if earlier is run or earlier.get("seed") != run.get("seed"):
+            continue
+        for result in earlier["results"]:
+            baseline[result["shape"], result["cells"], result["stage"]] = result["seconds"]
+
+    regressions: list[str] = []
+    for result in run["results"]:
+        before = baseline.get((result["shape"], result["cells"], result["stage"]))
+        after = result["seconds"]
+        if before is None or max(before, after) < REGRESSION_FLOOR_SECONDS:
+            continue
+        if after > before * factor:
+            regressions.append(
+                f"{result['shape']} {result['cells']} {result['stage']}: "
+                f"{before:.3f}s -> {after:.3f}s ({after / before:.2f}x)"
+            )
+    return regressions
+
+
+# =============================================================================
+# Command Line
+# =============================================================================
+
+
+def _print_result(result: StageResult) -> None:
+    """Print one result as a table row."""
+    memory = "-" if result.peak_bytes is None else f"{result.peak_bytes / 2**20:9.1f} MiB"
+    print(
+        f"{result.shape:<13}{result.cells:>9}{result.edges:>10}  {result.stage:<12}"
+        f"{result.seconds:>9.3f}s  {memory}",
+        flush=True,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the suite from the command line.
+
+    Returns:
+        Exit status: 1 if any stage regressed, else 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--factor", type=float, default=DEFAULT_REGRESSION_FACTOR)
+    args = parser.parse_args(argv)
+
+    run = run_suite(
+        args.shapes,
+        args.sizes,
+        seed=args.seed,
+        memory=not args.no_memory,
+        progress=_print_result,
+    )
+    history = append_run(args.history, run)
+    regressions = compare(history, run, args.factor)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"Appended run to {args.history}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Performance tests for the layout benchmark suite.
+
+These tests run the benchmark of layout_benchmark.py at 1k cells for every
+design shape, so the suite itself cannot rot, and check the history and
+regression bookkeeping:
+- Generators are deterministic and produce the requested cell count
+- Every stage reports a time and a peak memory
+- Runs are appended to the JSON history and compared with earlier runs
+
+Full-size runs (10k to 1M cells) are meant for the command line; see the
+layout_benchmark module docstring. The 100k run here is opt-in with
+INK_PERF_LARGE=1 because it takes minutes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
+import networkx as nx
+import pytest
+
+from tests.performance.layout_benchmark import (
+    SHAPES,
+    STAGES,
+    append_run,
+    benchmark_design,
+    compare,
+    load_history,
+    main,
+    run_suite,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_run(seconds: float, seed: int = 1) -> dict[str, Any]:
+    """A history run with one routing result."""
+    return {
+        "seed": seed,
+        "results": [
+            {"shape": "bus", "cells": 1000, "stage": "routing", "seconds": seconds},
+        ],
+    }
+
+
+class TestGenerators:
+    """Tests for the synthetic design shapes."""
+
+    @pytest.mark.parametrize("shape", list(SHAPES))
+    def test_cell_count_and_determinism(self, shape: str) -> None:
+        """Each shape should give exactly the requested cells, reproducibly."""
+        first = SHAPES[shape](1000, 7)
+        second = SHAPES[shape](1000, 7)
+
+        assert set(first) == set(range(1000))
+        assert first.number_of_edges() >= 1000 * 0.8
+        assert nx.utils.edges_equal(first.edges, second.edges)
+
+    def test_fanout_shape_has_high_fanout_nets(self) -> None:
+        """The control drivers of the fanout shape should reach many cells."""
+        graph = SHAPES["fanout"](1000, 1)
+
+        assert min(graph.out_degree(driver) for driver in range(4)) >= 200
+
+
+class TestBenchmark:
+    """Tests for stage measurement at 1k cells."""
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("shape", list(SHAPES))
+    def test_1k_cells_all_stages(self, shape: str) -> None:
+        """Every stage should report a time and a positive peak memory."""
+        results = benchmark_design(shape, 1000)
+
+        assert [result.stage for result in results] == list(STAGES)
+        for result in results:
+            assert result.cells == 1000
+            assert 0.0 < result.seconds < 10.0, f"{shape} {result.stage} took {result.seconds}s"
+            assert result.peak_bytes is not None
+            assert result.peak_bytes > 0
+            print(f"\n{shape} {result.stage}: {result.seconds * 1000:.1f}ms")
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        os.environ.get("INK_PERF_LARGE") != "1",
+        reason="100k-cell layouts take minutes; set INK_PERF_LARGE=1",
+    )
+    def test_100k_pipeline(self) -> None:
+        """The pipeline shape should lay out and route at 100k cells."""
+        results = benchmark_design("pipeline", 100_000, memory=False)
+
+        assert {result.stage for result in results} == set(STAGES)
+        for result in results:
+            print(f"\n100k pipeline {result.stage}: {result.seconds:.2f}s")
+
+
+class TestHistory:
+    """Tests for the JSON history and regression check."""
+
+    def test_append_creates_and_extends(self, tmp_path: Path) -> None:
+        """Runs should accumulate in a version-1 history file."""
+        path = tmp_path / "bench" / "history.json"
+
+        append_run(path, make_run(1.0))
+        append_run(path, make_run(1.1))
+
+        history = json.loads(path.read_text(encoding="utf-8"))
+        assert history["version"] == 1
+        assert [run["results"][0]["seconds"] for run in history["runs"]] == [1.0, 1.1]
+
+    def test_rejects_foreign_history(self, tmp_path: Path) -> None:
+        """A JSON file of another format should not be overwritten."""
+        path = tmp_path / "history.json"
+        path.write_text('{"version": 99}', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="version 1"):
+            load_history(path)
+
+    def test_compare_flags_slowdowns(self) -> None:
+        """Slowdowns beyond the factor should be reported, noise should not."""
+        slow = make_run(2.0)
+        history = {"version": 1, "runs": [make_run(1.0), make_run(0.5, seed=2), slow]}
+
+        assert compare(history, slow) == ["bus 1000 routing: 1.000s -> 2.000s (2.00x)"]
+        assert compare(history, slow, factor=3.0) == []
+        tiny = make_run(0.04)
+        assert compare({"version": 1, "runs": [make_run(0.01), tiny]}, tiny) == []
+
+    @pytest.mark.slow
+    def test_command_line_run(self, tmp_path: Path) -> None:
+        """main() should measure, append to the history and exit cleanly."""
+        path = tmp_path / "history.json"
+
+        status = main(["--sizes", "200", "--shapes", "bus", "--history", str(path)])
+
+        history = load_history(path)
+        assert status == 0
+        assert len(history["runs"]) == 1
+        assert {result["stage"] for result in history["runs"][0]["results"]} == set(STAGES)
+
+    def test_run_suite_records_environment(self) -> None:
+        """A run should carry its seed, Python version and results."""
+        run = run_suite(["bus"], [100], seed=3, memory=False)
+
+        assert run["seed"] == 3
+        assert run["python"]
+        assert len(run["results"]) == len(STAGES)
+        assert all(result["peak_bytes"] is None for result in run["results"])
@@ -1072,3 +1072,83 @@ class TestIsSequentialCell:
         assert design.is_sequential_cell("XFF1") is True
         assert design.is_sequential_cell("XI2") is False
         assert design.is_sequential_cell("XFF2") is True
+
+
+class TestIncrementalEdits:
+    """Tests for remove_cell, replace_pin and replace_net."""
+
+    def test_remove_cell_drops_cell_name_and_pins(self) -> None:
+        """remove_cell should remove the cell, its name index entry and pins."""
+        design = Design(name="test")
+        design.add_pin(create_test_pin("XI1.A"))
+        design.add_cell(create_test_cell("XI1", pin_ids=["XI1.A"]))
+
+        removed = design.remove_cell(CellId("XI1"))
+
+        assert removed is not None
+        assert removed.id == CellId("XI1")
+        assert design.get_cell(CellId("XI1")) is None
+        assert design.get_cell_by_name("XI1") is None
+        assert design.get_pin(PinId("XI1.A")) is None
+
+    def test_remove_cell_allows_name_reuse(self) -> None:
+        """A removed cell's name should be available again."""
+        design = Design(name="test")
+        design.add_cell(create_test_cell("XI1"))
+        design.remove_cell(CellId("XI1"))
+
+        design.add_cell(create_test_cell("XI1"))
+
+        assert design.cell_count() == 1
+
+    def test_remove_missing_cell_returns_none(self) -> None:
+        """Removing an unknown cell should be a no-op."""
+        design = Design(name="test")
+
+        assert design.remove_cell(CellId("missing")) is None
+
+    def test_replace_pin(self) -> None:
+        """replace_pin should swap in the updated pin."""
+        design = Design(name="test")
+        design.add_pin(create_test_pin("XI1.A", net_id="n1"))
+
+        design.replace_pin(create_test_pin("XI1.A", net_id="n2"))
+
+        pin = design.get_pin(PinId("XI1.A"))
+        assert pin is not None
+        assert pin.net_id == NetId("n2")
+
+    def test_replace_missing_pin_raises(self) -> None:
+        """replace_pin should reject unknown pins."""
+        design = Design(name="test")
+
+        with pytest.raises(KeyError, match="not found"):
+            design.replace_pin(create_test_pin("XI1.A"))
+
+    def test_replace_net_updates_name_index(self) -> None:
+        """replace_net should swap the net and re-index its name."""
+        design = Design(name="test")
+        design.add_net(create_test_net("n1", name="old"))
+
+        design.replace_net(create_test_net("n1", name="new", pin_ids=["XI1.A"]))
+
+        assert design.get_net_by_name("old") is None
+        net = design.get_net_by_name("new")
+        assert net is not None
+        assert net.connected_pin_ids == (PinId("XI1.A"),)
+
+    def test_replace_net_rejects_name_collision(self) -> None:
+        """replace_net should not steal another net's name."""
+        design = Design(name="test")
+        design.add_net(create_test_net("n1"))
+        design.add_net(create_test_net("n2"))
+
+        with pytest.raises(ValueError, match="already exists"):
+            design.replace_net(create_test_net("n1", name="n2"))
+
+    def test_replace_missing_net_raises(self) -> None:
+        """replace_net should reject unknown nets."""
+        design = Design(name="test")
+
+        with pytest.raises(KeyError, match="not found"):
+            design.replace_net(create_test_net("n1"))
@@ -100,3 +100,9 @@ class TestGraphTraverserMethods:
         from ink.domain.services import GraphTraverser
 
         assert hasattr(GraphTraverser, "find_path")
+
+    def test_has_get_fanin_cut_points_method(self) -> None:
+        """GraphTraverser should define get_fanin_cut_points method."""
+        from ink.domain.services import GraphTraverser
+
+        assert hasattr(GraphTraverser, "get_fanin_cut_points")
@@ -121,6 +121,7 @@ override_defaults: true
         assert config.power_patterns == []
         assert config.ground_names == []
         assert config.ground_patterns == []
+        assert config.clock_names == []
         assert config.override_defaults is True
 
     def test_load_handles_empty_file(self, tmp_path: Path) -> None:
@@ -231,6 +232,8 @@ class TestNetClassificationConfigRoundTrip:
             power_patterns=["^VDDQ[0-9]*$", "^PWR_.*$"],
             ground_names=["AVSS", "DVSS"],
             ground_patterns=["^VSSQ[0-9]*$"],
+            clock_names=["PLL_OUT"],
+            clock_patterns=["^SCLK[0-9]*$"],
             override_defaults=True,
         )
 
@@ -241,6 +244,8 @@ class TestNetClassificationConfigRoundTrip:
         assert loaded.power_patterns == original.power_patterns
         assert loaded.ground_names == original.ground_names
         assert loaded.ground_patterns == original.ground_patterns
+        assert loaded.clock_names == original.clock_names
+        assert loaded.clock_patterns == original.clock_patterns
         assert loaded.override_defaults == original.override_defaults
 
     def test_round_trip_with_empty_config(self, tmp_path: Path) -> None:
@@ -286,4 +291,6 @@ class TestNetClassificationConfigValidation:
         assert hasattr(config, "power_patterns")
         assert hasattr(config, "ground_names")
         assert hasattr(config, "ground_patterns")
+        assert hasattr(config, "clock_names")
+        assert hasattr(config, "clock_patterns")
         assert hasattr(config, "override_defaults")
@@ -0,0 +1,106 @@
+"""Shared fixtures for graph infrastructure unit tests.
+
+Provides a compact netlist factory so that index/traversal tests can describe
+cell-level topologies as driver → sink wire lists instead of spelling out
+every Cell, Pin and Net.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+import pytest
+
+from ink.domain.model import Cell, Design, Net, Pin
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.domain.value_objects.pin_direction import PinDirection
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+
+class NetlistFactory(Protocol):
+    """Callable signature of the make_netlist fixture."""
+
+    def __call__(
+        self,
+        wires: Sequence[tuple[str, str]],
+        sequential: Iterable[str] = (),
+        cells: Iterable[str] = (),
+    ) -> Design:
+        """Build a design from driver → sink wires."""
+        ...
+
+
+def build_netlist(
+    wires: Sequence[tuple[str, str]],
+    sequential: Iterable[str] = (),
+    cells: Iterable[str] = (),
+) -> Design:
+    """Build a Design from (driver, sink) cell name pairs.
+
+    Each driver cell gets one output pin ``Y`` on net ``n_<driver>``; every
+    sink of that driver connects a fresh input pin ``A<k>`` to the same net,
+    so multiple wires from one driver form a fanout net.
+
+    Args:
+        wires: (driver, sink) pairs of cell names.
+        sequential: Names of cells to mark as sequential.
+        cells: Extra (possibly unconnected) cell names.
+
+    Returns:
+        Design with cells in first-appearance order.
+    """
+    sequential_names = set(sequential)
+    order: list[str] = []
+    for driver, sink in wires:
+        for name in (driver, sink):
+            if name not in order:
+                order.append(name)
+    for name in cells:
+        if name not in order:
+            order.append(name)
+
+    drivers = {driver for driver, _ in wires}
+    cell_pins: dict[str, list[PinId]] = {name: [] for name in order}
+    net_pins: dict[str, list[PinId]] = {}
+    design = Design(name="netlist")
+
+    for name in order:
+        if name in drivers:
+            pin_id = PinId(f"{name}.Y")
+            net_name = f"n_{name}"
+            design.add_pin(Pin(pin_id, "Y", PinDirection.OUTPUT, NetId(net_name)))
+            cell_pins[name].append(pin_id)
+            net_pins.setdefault(net_name, []).append(pin_id)
+
+    for driver, sink in wires:
+        pin_name = f"A{sum(1 for p in cell_pins[sink] if '.A' in p)}"
+        pin_id = PinId(f"{sink}.{pin_name}")
+        net_name = f"n_{driver}"
+        design.add_pin(Pin(pin_id, pin_name, PinDirection.INPUT, NetId(net_name)))
+        cell_pins[sink].append(pin_id)
+        net_pins[net_name].append(pin_id)
+
+    for name in order:
+        is_seq = name in sequential_names
+        design.add_cell(
+            Cell(
+                id=CellId(name),
+                name=name,
+                cell_type="DFF_X1" if is_seq else "BUF_X1",
+                pin_ids=cell_pins[name],
+                is_sequential=is_seq,
+            )
+        )
+
+    for net_name, pin_ids in net_pins.items():
+        design.add_net(Net(NetId(net_name), net_name, pin_ids))
+
+    return design
+
+
+@pytest.fixture
+def make_netlist() -> NetlistFactory:
+    """Provide the build_netlist factory to tests."""
+    return build_netlist
@@ -0,0 +1,184 @@
+"""Unit tests for CachingGraphTraverser.
+
+Test Coverage Goals:
+- Protocol conformance and result parity with the wrapped traverser
+- Hit/miss counting and argument-sensitive keys
+- Size-bounded LRU eviction
+- Automatic invalidation when the graph version changes
+- Returned lists are copies that cannot corrupt the cache
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Cell, Net
+from ink.domain.services.graph_traverser import GraphTraverser
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.infrastructure.graph import (
+    CachingGraphTraverser,
+    NetworkXGraphBuilder,
+    NetworkXGraphTraverser,
+)
+
+if TYPE_CHECKING:
+    from ink.domain.model import Design
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def chain(make_netlist: NetlistFactory) -> Design:
+    """Chain A -> B -> C -> D with a branch A -> E."""
+    return make_netlist([("A", "B"), ("B", "C"), ("C", "D"), ("A", "E")])
+
+
+@pytest.fixture
+def builder(chain: Design) -> NetworkXGraphBuilder:
+    """Builder holding the chain's graph."""
+    builder = NetworkXGraphBuilder()
+    builder.build_from_design(chain)
+    return builder
+
+
+@pytest.fixture
+def cached(builder: NetworkXGraphBuilder, chain: Design) -> CachingGraphTraverser:
+    """Caching traverser over a NetworkX traverser of the chain."""
+    return CachingGraphTraverser.over_networkx(NetworkXGraphTraverser(builder.graph, chain))
+
+
+def names(cells: list[Cell]) -> list[str]:
+    """Get sorted cell names."""
+    return sorted(cell.name for cell in cells)
+
+
+class TestCachingBehavior:
+    """Tests for cache hits, misses and result parity."""
+
+    def test_is_graph_traverser(self, cached: CachingGraphTraverser) -> None:
+        """The cache should satisfy the GraphTraverser protocol."""
+        assert isinstance(cached, GraphTraverser)
+
+    def test_results_match_wrapped_traverser(self, cached: CachingGraphTraverser) -> None:
+        """Cached and uncached results should be identical."""
+        inner = cached.traverser
+
+        assert cached.get_fanout_cells(CellId("A"), 2) == inner.get_fanout_cells(CellId("A"), 2)
+        assert cached.get_fanin_cells(CellId("D"), 3) == inner.get_fanin_cells(CellId("D"), 3)
+        assert cached.get_cell_pins(CellId("B")) == inner.get_cell_pins(CellId("B"))
+        assert cached.get_pin_net(PinId("A.Y")) == inner.get_pin_net(PinId("A.Y"))
+        assert cached.find_path(CellId("A"), CellId("D")) == inner.find_path(
+            CellId("A"), CellId("D")
+        )
+        assert cached.get_fanin_cut_points(CellId("D")) == inner.get_fanin_cut_points(CellId("D"))
+
+    def test_repeated_query_hits(self, cached: CachingGraphTraverser) -> None:
+        """The second identical query should be a hit."""
+        first = cached.get_fanout_cells(CellId("A"), hops=2)
+        second = cached.get_fanout_cells(CellId("A"), hops=2)
+
+        assert names(first) == names(second) == ["B", "C", "E"]
+        stats = cached.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_arguments_are_part_of_key(self, cached: CachingGraphTraverser) -> None:
+        """Different hops or flags should not share an entry."""
+        cached.get_fanout_cells(CellId("A"), hops=1)
+        cached.get_fanout_cells(CellId("A"), hops=2)
+        cached.get_fanout_cells(CellId("A"), hops=2, stop_at_sequential=True)
+        cached.get_fanin_cells(CellId("A"), hops=2)
+
+        assert cached.stats().misses == 4
+        assert cached.stats().hits == 0
+
+    def test_none_results_are_cached(self, cached: CachingGraphTraverser) -> None:
+        """None results (missing pin, no path) should be cached too."""
+        assert cached.get_pin_net(PinId("missing")) is None
+        assert cached.get_pin_net(PinId("missing")) is None
+        assert cached.find_path(CellId("D"), CellId("missing")) is None
+        assert cached.find_path(CellId("D"), CellId("missing")) is None
+
+        assert cached.stats().hits == 2
+
+    def test_returned_lists_are_copies(self, cached: CachingGraphTraverser) -> None:
+        """Mutating a returned list should not affect later results."""
+        cached.get_connected_cells(NetId("n_A")).clear()
+
+        assert names(cached.get_connected_cells(NetId("n_A"))) == ["A", "B", "E"]
+
+
+class TestSizeBound:
+    """Tests for size-bounded LRU eviction."""
+
+    def test_evicts_least_recently_used(self, builder: NetworkXGraphBuilder, chain: Design) -> None:
+        """Entries beyond the size bound should be evicted LRU-first."""
+        cached = CachingGraphTraverser.over_networkx(
+            NetworkXGraphTraverser(builder.graph, chain), max_cached_size=2
+        )
+
+        cached.get_fanout_cells(CellId("B"))  # size 1
+        cached.get_fanout_cells(CellId("C"))  # size 1
+        cached.get_fanout_cells(CellId("B"))  # hit, B becomes most recent
+        cached.get_fanout_cells(CellId("D"))  # empty, size 1: evicts C
+
+        stats = cached.stats()
+        assert stats.evictions == 1
+        assert stats.cached_size == 2
+        cached.get_fanout_cells(CellId("B"))
+        assert cached.stats().hits == 2
+
+    def test_oversized_results_are_not_cached(
+        self, builder: NetworkXGraphBuilder, chain: Design
+    ) -> None:
+        """A result larger than the whole bound is returned but not stored."""
+        cached = CachingGraphTraverser.over_networkx(
+            NetworkXGraphTraverser(builder.graph, chain), max_cached_size=2
+        )
+
+        assert len(cached.get_fanout_cells(CellId("A"), hops=3)) == 4
+        assert cached.stats().entries == 0
+
+
+class TestInvalidation:
+    """Tests for version-driven invalidation."""
+
+    def test_graph_delta_invalidates(
+        self,
+        cached: CachingGraphTraverser,
+        builder: NetworkXGraphBuilder,
+        chain: Design,
+    ) -> None:
+        """apply_delta() should invalidate cached results."""
+        assert names(cached.get_connected_cells(NetId("n_D"))) == []
+
+        chain.remove_cell(CellId("E"))
+        chain.replace_net(Net(NetId("n_A"), "n_A", [PinId("A.Y"), PinId("B.A0")]))
+        builder.apply_delta(removed_cells=[CellId("E")])
+
+        assert names(cached.get_fanout_cells(CellId("A"))) == ["B"]
+        stats = cached.stats()
+        assert stats.invalidations == 1
+        assert stats.entries == 1
+
+    def test_custom_version_source(self, cached: CachingGraphTraverser) -> None:
+        """Any version callable should drive invalidation."""
+        version = [0]
+        custom = CachingGraphTraverser(cached.traverser, lambda: version[0])
+
+        custom.get_cell_pins(CellId("A"))
+        custom.get_cell_pins(CellId("A"))
+        version[0] += 1
+        custom.get_cell_pins(CellId("A"))
+
+        stats = custom.stats()
+        assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+    def test_clear_keeps_counters(self, cached: CachingGraphTraverser) -> None:
+        """clear() should drop entries but keep the counters."""
+        cached.get_cell_pins(CellId("A"))
+        cached.clear()
+
+        stats = cached.stats()
+        assert (stats.entries, stats.cached_size, stats.misses) == (0, 0, 1)
@@ -0,0 +1,154 @@
+"""Unit tests for CellAdjacency and the CSR helpers.
+
+Test Coverage Goals:
+- Cell numbering and CellId ↔ index lookup
+- Driver → sink edges derived from pin directions and shared nets
+- Fanin as the transpose of fanout
+- Parallel-edge merging, self-loops, floating pins
+- pack_csr / transpose_csr / little-endian round trip
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ink.domain.model import Cell, Design, Net, Pin
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.graph import CellAdjacency
+from ink.infrastructure.graph.csr import (
+    TARGET_TYPECODE,
+    pack_csr,
+    read_le,
+    to_le_bytes,
+    transpose_csr,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+def names(adjacency: CellAdjacency, indices: Iterable[int]) -> list[str]:
+    """Map an iterable of indices to cell names."""
+    return [adjacency.cell_ids[i] for i in indices]
+
+
+class TestCsrHelpers:
+    """Tests for the shared CSR helper functions."""
+
+    def test_pack_csr_sorts_rows(self) -> None:
+        """pack_csr should sort each row and build offsets."""
+        offsets, targets = pack_csr([[2, 1], [], [0]])
+
+        assert list(offsets) == [0, 2, 2, 3]
+        assert list(targets) == [1, 2, 0]
+
+    def test_transpose_csr(self) -> None:
+        """transpose_csr should reverse every edge."""
+        offsets, targets = pack_csr([[1, 2], [2], []])
+
+        t_offsets, t_targets = transpose_csr(3, offsets, targets)
+
+        assert list(t_offsets) == [0, 0, 1, 3]
+        assert list(t_targets) == [0, 0, 1]
+
+    def test_little_endian_round_trip(self) -> None:
+        """to_le_bytes/read_le should round-trip values and advance position."""
+        _, targets = pack_csr([[5, 7, 1_000_000]])
+
+        data = b"pad" + to_le_bytes(targets)
+        restored, end = read_le(data, 3, TARGET_TYPECODE, 3)
+
+        assert list(restored) == [5, 7, 1_000_000]
+        assert end == len(data)
+
+
+class TestCellAdjacencyConstruction:
+    """Tests for CellAdjacency.from_design()."""
+
+    def test_empty_design(self) -> None:
+        """An empty design should produce an empty adjacency."""
+        adjacency = CellAdjacency.from_design(Design(name="empty"))
+
+        assert adjacency.cell_count() == 0
+        assert adjacency.edge_count() == 0
+
+    def test_chain_edges(self, make_netlist: NetlistFactory) -> None:
+        """A chain should produce one driver → sink edge per hop."""
+        adjacency = CellAdjacency.from_design(make_netlist([("A", "B"), ("B", "C")]))
+
+        a = adjacency.index_of(CellId("A"))
+        b = adjacency.index_of(CellId("B"))
+        assert a is not None
+        assert b is not None
+        assert names(adjacency, adjacency.fanout(a)) == ["B"]
+        assert names(adjacency, adjacency.fanin(b)) == ["A"]
+        assert adjacency.edge_count() == 2
+
+    def test_fanout_net_has_one_edge_per_sink(self, make_netlist: NetlistFactory) -> None:
+        """A fanout net should produce one edge to each sink."""
+        adjacency = CellAdjacency.from_design(make_netlist([("D", "S1"), ("D", "S2"), ("D", "S3")]))
+
+        d = adjacency.index_of(CellId("D"))
+        assert d is not None
+        assert sorted(names(adjacency, adjacency.fanout(d))) == ["S1", "S2", "S3"]
+
+    def test_sinks_are_not_fanin_of_each_other(self, make_netlist: NetlistFactory) -> None:
+        """Sibling loads on one net must not appear as each other's drivers."""
+        adjacency = CellAdjacency.from_design(make_netlist([("D", "S1"), ("D", "S2")]))
+
+        s1 = adjacency.index_of(CellId("S1"))
+        assert s1 is not None
+        assert names(adjacency, adjacency.fanin(s1)) == ["D"]
+
+    def test_parallel_edges_are_merged(self) -> None:
+        """Two nets between the same cells produce a single edge."""
+        design = Design(name="parallel")
+        design.add_pin(Pin(PinId("A.Y0"), "Y0", PinDirection.OUTPUT, NetId("n0")))
+        design.add_pin(Pin(PinId("A.Y1"), "Y1", PinDirection.OUTPUT, NetId("n1")))
+        design.add_pin(Pin(PinId("B.A0"), "A0", PinDirection.INPUT, NetId("n0")))
+        design.add_pin(Pin(PinId("B.A1"), "A1", PinDirection.INPUT, NetId("n1")))
+        design.add_cell(Cell(CellId("A"), "A", "X", [PinId("A.Y0"), PinId("A.Y1")]))
+        design.add_cell(Cell(CellId("B"), "B", "X", [PinId("B.A0"), PinId("B.A1")]))
+        design.add_net(Net(NetId("n0"), "n0", [PinId("A.Y0"), PinId("B.A0")]))
+        design.add_net(Net(NetId("n1"), "n1", [PinId("A.Y1"), PinId("B.A1")]))
+
+        adjacency = CellAdjacency.from_design(design)
+
+        assert adjacency.edge_count() == 1
+
+    def test_self_loop_is_kept(self, make_netlist: NetlistFactory) -> None:
+        """A cell driving its own input should keep the self-edge."""
+        adjacency = CellAdjacency.from_design(make_netlist([("A", "A")]))
+
+        a = adjacency.index_of(CellId("A"))
+        assert a is not None
+        assert names(adjacency, adjacency.fanout(a)) == ["A"]
+
+    def test_unconnected_cell_has_no_edges(self, make_netlist: NetlistFactory) -> None:
+        """A cell without connections should have empty rows."""
+        adjacency = CellAdjacency.from_design(make_netlist([("A", "B")], cells=["ISO"]))
+
+        iso = adjacency.index_of(CellId("ISO"))
+        assert iso is not None
+        assert len(adjacency.fanout(iso)) == 0
+        assert len(adjacency.fanin(iso)) == 0
+
+    def test_sequential_flags(self, make_netlist: NetlistFactory) -> None:
+        """Sequential flags should mirror Cell.is_sequential."""
+        adjacency = CellAdjacency.from_design(make_netlist([("FF", "G")], sequential=["FF"]))
+
+        ff = adjacency.index_of(CellId("FF"))
+        g = adjacency.index_of(CellId("G"))
+        assert ff is not None
+        assert g is not None
+        assert adjacency.is_sequential(ff)
+        assert not adjacency.is_sequential(g)
+
+    def test_unknown_cell_index_is_none(self, make_netlist: NetlistFactory) -> None:
+        """index_of should return None for unknown cells."""
+        adjacency = CellAdjacency.from_design(make_netlist([("A", "B")]))
+
+        assert adjacency.index_of(CellId("missing")) is None
@@ -0,0 +1,126 @@
+"""Unit tests for CellProjection.
+
+Test Coverage Goals:
+- Driver pin → sink cell edges labeled with pin and net
+- Fanin view shares annotations with fanout
+- Sibling loads are not connected to each other
+- from_graph() matches from_design() for full and lean builds
+- Unknown cells return empty results
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Cell, Design, Net, Pin
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.graph import CellEdge, CellProjection, NetworkXGraphBuilder
+
+if TYPE_CHECKING:
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def two_output_design() -> Design:
+    """Cell A drives B through two different nets (pins Y0, Y1)."""
+    design = Design(name="two_output")
+    design.add_pin(Pin(PinId("A.Y0"), "Y0", PinDirection.OUTPUT, NetId("n0")))
+    design.add_pin(Pin(PinId("A.Y1"), "Y1", PinDirection.OUTPUT, NetId("n1")))
+    design.add_pin(Pin(PinId("B.A0"), "A0", PinDirection.INPUT, NetId("n0")))
+    design.add_pin(Pin(PinId("B.A1"), "A1", PinDirection.INPUT, NetId("n1")))
+    design.add_cell(Cell(CellId("A"), "A", "X", [PinId("A.Y0"), PinId("A.Y1")]))
+    design.add_cell(Cell(CellId("B"), "B", "X", [PinId("B.A0"), PinId("B.A1")]))
+    design.add_net(Net(NetId("n0"), "n0", [PinId("A.Y0"), PinId("B.A0")]))
+    design.add_net(Net(NetId("n1"), "n1", [PinId("A.Y1"), PinId("B.A1")]))
+    return design
+
+
+class TestAnnotatedEdges:
+    """Tests for labeled fanout/fanin edges."""
+
+    def test_fanout_edge_labels(self, make_netlist: NetlistFactory) -> None:
+        """Edges should carry the driving pin and net."""
+        projection = CellProjection.from_design(make_netlist([("A", "B")]))
+
+        assert projection.get_fanout_edges(CellId("A")) == [
+            CellEdge(CellId("A"), CellId("B"), PinId("A.Y"), NetId("n_A"))
+        ]
+
+    def test_fanin_edges_share_annotations(self, make_netlist: NetlistFactory) -> None:
+        """Fanin edges should be the same edges seen from the sink."""
+        projection = CellProjection.from_design(make_netlist([("A", "C"), ("B", "C")]))
+
+        fanin = projection.get_fanin_edges(CellId("C"))
+
+        assert sorted(fanin, key=lambda e: e.source) == [
+            CellEdge(CellId("A"), CellId("C"), PinId("A.Y"), NetId("n_A")),
+            CellEdge(CellId("B"), CellId("C"), PinId("B.Y"), NetId("n_B")),
+        ]
+
+    def test_parallel_nets_are_separate_edges(self, two_output_design: Design) -> None:
+        """Two nets between the same cells should give two labeled edges."""
+        projection = CellProjection.from_design(two_output_design)
+
+        nets = {edge.net_id for edge in projection.get_fanout_edges(CellId("A"))}
+
+        assert projection.edge_count() == 2
+        assert nets == {NetId("n0"), NetId("n1")}
+
+    def test_sibling_loads_are_not_connected(self, make_netlist: NetlistFactory) -> None:
+        """Loads on one net are not each other's fanin."""
+        projection = CellProjection.from_design(make_netlist([("D", "S1"), ("D", "S2")]))
+
+        s1 = projection.index_of(CellId("S1"))
+        assert s1 is not None
+        assert [projection.cell_ids[i] for i in projection.fanin(s1)] == ["D"]
+        assert projection.get_fanout_edges(CellId("S1")) == []
+
+    def test_unknown_cell_returns_empty(self, make_netlist: NetlistFactory) -> None:
+        """Unknown cells should give empty edge lists."""
+        projection = CellProjection.from_design(make_netlist([("A", "B")]))
+
+        assert projection.index_of(CellId("missing")) is None
+        assert projection.get_fanout_edges(CellId("missing")) == []
+        assert projection.get_fanin_edges(CellId("missing")) == []
+
+
+class TestFromGraph:
+    """Tests for building the projection from a NetworkX graph."""
+
+    @pytest.mark.parametrize("lean", [False, True])
+    def test_matches_design_projection(self, make_netlist: NetlistFactory, lean: bool) -> None:
+        """from_graph() should give the same edges as from_design()."""
+        design = make_netlist([("A", "B"), ("A", "C"), ("B", "FF"), ("FF", "A")], sequential=["FF"])
+        graph = NetworkXGraphBuilder(lean=lean).build_from_design(design)
+
+        from_graph = CellProjection.from_graph(graph, design)
+        from_design = CellProjection.from_design(design)
+
+        assert from_graph.cell_ids == from_design.cell_ids
+        assert from_graph.sequential == from_design.sequential
+        for cell_id in from_design.cell_ids:
+            assert from_graph.get_fanout_edges(cell_id) == from_design.get_fanout_edges(cell_id)
+
+    def test_inout_pin_drives_and_receives(self) -> None:
+        """An INOUT pin should both drive and receive on its net."""
+        design = Design(name="inout")
+        design.add_pin(Pin(PinId("A.IO"), "IO", PinDirection.INOUT, NetId("bus")))
+        design.add_pin(Pin(PinId("B.IO"), "IO", PinDirection.INOUT, NetId("bus")))
+        design.add_cell(Cell(CellId("A"), "A", "X", [PinId("A.IO")]))
+        design.add_cell(Cell(CellId("B"), "B", "X", [PinId("B.IO")]))
+        design.add_net(Net(NetId("bus"), "bus", [PinId("A.IO"), PinId("B.IO")]))
+        graph = NetworkXGraphBuilder().build_from_design(design)
+
+        projection = CellProjection.from_graph(graph, design)
+
+        assert {e.target for e in projection.get_fanout_edges(CellId("A"))} == {
+            CellId("A"),
+            CellId("B"),
+        }
+        assert {e.source for e in projection.get_fanin_edges(CellId("A"))} == {
+            CellId("A"),
+            CellId("B"),
+        }
@@ -0,0 +1,164 @@
+"""Unit tests for ClockDomainIndex.
+
+Test Coverage Goals:
+- Clock roots from ports, default patterns and configured names/patterns
+- Propagation through buffers and gating cells, stopping at registers
+- Internal clock nets (clk_buf behind clk) are not roots
+- Only clock pins label registers when the cell has one
+- Domain lookups, masks and binary round trip
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ink.domain.model import Cell, Design, Net, Pin, Port
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId, PortId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.config.net_classification_config import NetClassificationConfig
+from ink.infrastructure.graph import ClockDomainIndex
+from ink.infrastructure.parsing.net_normalizer import NetNormalizer
+
+
+def add_cell(
+    design: Design,
+    name: str,
+    pins: dict[str, str],
+    sequential: bool = False,
+) -> None:
+    """Add a cell whose pins map name → net; pins named Y/Q are outputs."""
+    pin_ids: list[PinId] = []
+    for pin_name, net_name in pins.items():
+        direction = PinDirection.OUTPUT if pin_name in ("Y", "Q") else PinDirection.INPUT
+        pin_id = PinId(f"{name}.{pin_name}")
+        design.add_pin(Pin(pin_id, pin_name, direction, NetId(net_name)))
+        pin_ids.append(pin_id)
+    design.add_cell(
+        Cell(CellId(name), name, "DFF_X1" if sequential else "BUF_X1", pin_ids, sequential)
+    )
+
+
+def finish(design: Design) -> Design:
+    """Create one Net per net name referenced by the design's pins."""
+    members: dict[NetId, list[PinId]] = {}
+    for pin in design.get_all_pins():
+        assert pin.net_id is not None
+        members.setdefault(pin.net_id, []).append(pin.id)
+    for net_id, pin_ids in members.items():
+        design.add_net(Net(net_id, str(net_id), pin_ids))
+    return design
+
+
+@pytest.fixture
+def clocked() -> Design:
+    """Port CLK on net "clk" buffered to clk_buf; sclk is a second clock.
+
+    FF1, FF2 clocked by clk_buf; FF3 by a gated clk_buf (GATE);
+    FF4 by sclk; FF5 by a divided clock from FF1; DATA feeds every D pin.
+    """
+    design = Design(name="clocked")
+    design.add_port(Port(PortId("CLK"), "CLK", PinDirection.INPUT, NetId("clk")))
+    add_cell(design, "CB", {"A": "clk", "Y": "clk_buf"})
+    add_cell(design, "GATE", {"A": "clk_buf", "B": "en", "Y": "gated"})
+    add_cell(design, "DATA", {"A": "clk_buf", "Y": "d"})
+    add_cell(design, "FF1", {"D": "d", "CK": "clk_buf", "Q": "div"}, sequential=True)
+    add_cell(design, "FF2", {"D": "d", "CK": "clk_buf", "Q": "q2"}, sequential=True)
+    add_cell(design, "FF3", {"D": "d", "CK": "gated", "Q": "q3"}, sequential=True)
+    add_cell(design, "FF4", {"D": "d", "CP": "sclk", "Q": "q4"}, sequential=True)
+    add_cell(design, "FF5", {"D": "d", "CK": "div", "Q": "q5"}, sequential=True)
+    return finish(design)
+
+
+def sclk_normalizer() -> NetNormalizer:
+    """Normalizer with sclk configured as a clock root."""
+    return NetNormalizer.from_config(NetClassificationConfig(clock_patterns=["^SCLK$"]))
+
+
+class TestTracing:
+    """Tests for the clock network sweep."""
+
+    def test_labels_through_buffers_and_gates(self, clocked: Design) -> None:
+        """Buffered and gated clock pins should resolve to the root net."""
+        index = ClockDomainIndex.from_design(clocked)
+
+        assert index.clock_of(CellId("FF1")) == "clk"
+        assert index.clock_of(CellId("FF2")) == "clk"
+        assert index.clock_of(CellId("FF3")) == "clk"
+
+    def test_internal_clock_net_is_not_a_root(self, clocked: Design) -> None:
+        """clk_buf matches the clock patterns but is driven from clk."""
+        index = ClockDomainIndex.from_design(clocked)
+
+        assert "clk_buf" not in index.roots
+        assert "clk" in index.roots
+
+    def test_data_pins_do_not_label(self, clocked: Design) -> None:
+        """Clock logic reaching a D pin must not clock the register."""
+        index = ClockDomainIndex.from_design(clocked)
+
+        assert index.clock_of(CellId("FF5")) is None
+        assert index.clock_of(CellId("DATA")) is None
+
+    def test_configured_clock_patterns(self, clocked: Design) -> None:
+        """Clock roots from NetClassificationConfig should be traced."""
+        assert ClockDomainIndex.from_design(clocked).clock_of(CellId("FF4")) is None
+
+        index = ClockDomainIndex.from_design(clocked, sclk_normalizer())
+
+        assert index.clock_of(CellId("FF4")) == "sclk"
+
+    def test_register_without_clock_pin(self) -> None:
+        """Cells with no recognizable clock pin are labeled on any input."""
+        design = Design(name="odd")
+        add_cell(design, "R", {"IN0": "clk", "IN1": "d", "Q": "q"}, sequential=True)
+
+        index = ClockDomainIndex.from_design(finish(design))
+
+        assert index.clock_of(CellId("R")) == "clk"
+
+    def test_nearest_root_wins_at_a_mux(self) -> None:
+        """Behind a clock mux, the root fewer nets away labels the register."""
+        design = Design(name="mux")
+        add_cell(design, "B", {"A": "clk_a", "Y": "a1"})
+        add_cell(design, "MUX", {"A": "a1", "B": "clk_b", "Y": "muxed"})
+        add_cell(design, "FF", {"D": "d", "CK": "muxed", "Q": "q"}, sequential=True)
+
+        index = ClockDomainIndex.from_design(finish(design))
+
+        assert index.clock_of(CellId("FF")) == "clk_b"
+
+
+class TestLookups:
+    """Tests for domain queries and persistence."""
+
+    def test_cells_in_domain(self, clocked: Design) -> None:
+        """Domains should list their registers in design order."""
+        index = ClockDomainIndex.from_design(clocked, sclk_normalizer())
+
+        assert index.get_cells_in_domain(NetId("clk")) == ["FF1", "FF2", "FF3"]
+        assert index.get_cells_in_domain(NetId("sclk")) == ["FF4"]
+        assert index.get_cells_in_domain(NetId("missing")) == []
+
+    def test_domain_mask_in_foreign_numbering(self, clocked: Design) -> None:
+        """Masks can be laid out in another index's cell numbering."""
+        index = ClockDomainIndex.from_design(clocked)
+        numbering = [CellId("FF3"), CellId("FF4"), CellId("FF1")]
+
+        assert index.domain_mask(NetId("clk"), numbering) == b"\x01\x00\x01"
+        assert sum(index.domain_mask(NetId("clk"))) == 3
+        assert index.domain_mask(NetId("missing")) == bytes(index.cell_count())
+
+    def test_round_trip(self, clocked: Design) -> None:
+        """A restored index should be identical."""
+        index = ClockDomainIndex.from_design(clocked, sclk_normalizer())
+
+        restored = ClockDomainIndex.from_bytes(index.to_bytes())
+
+        assert restored.cell_ids == index.cell_ids
+        assert restored.roots == index.roots
+        assert restored.domain == index.domain
+
+    def test_bad_header(self) -> None:
+        """Foreign data should be rejected."""
+        with pytest.raises(ValueError, match="bad header"):
+            ClockDomainIndex.from_bytes(b"\x00" * 40)
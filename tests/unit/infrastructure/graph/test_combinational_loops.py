@@ -0,0 +1,164 @@
+"""Unit tests for CombinationalLoopIndex.
+
+Test Coverage Goals:
+- Loops found through combinational cells only
+- Sequential cells break loops
+- Self-loops reported, acyclic designs report none
+- Multiple independent loops and nested cycles in one SCC
+- Loop-edge queries for feedback-edge selection
+- Deep chains handled without recursion
+- Binary round trip via to_bytes()/from_bytes()
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Design
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph import CellAdjacency, CombinationalLoopIndex
+from ink.infrastructure.graph.combinational_loops import strongly_connected_components
+
+if TYPE_CHECKING:
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+def ids(values: list[CellId]) -> set[str]:
+    """Convert a CellId list to a set of plain strings."""
+    return {str(value) for value in values}
+
+
+class TestLoopDetection:
+    """Tests for finding combinational loops."""
+
+    def test_acyclic_design_has_no_loops(self, make_netlist: NetlistFactory) -> None:
+        """A chain with reconvergence has no loops."""
+        design = make_netlist([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")])
+
+        loops = CombinationalLoopIndex.from_design(design)
+
+        assert loops.loop_count() == 0
+        assert not loops.has_loops()
+
+    def test_cross_coupled_pair(self, make_netlist: NetlistFactory) -> None:
+        """Two cells driving each other form one loop."""
+        design = make_netlist([("IN", "N1"), ("N1", "N2"), ("N2", "N1"), ("N2", "OUT")])
+
+        loops = CombinationalLoopIndex.from_design(design)
+
+        assert loops.loop_count() == 1
+        assert ids(loops.get_loop_cells(CellId("N1"))) == {"N1", "N2"}
+        assert not loops.is_in_loop(CellId("IN"))
+        assert not loops.is_in_loop(CellId("OUT"))
+
+    def test_self_loop(self, make_netlist: NetlistFactory) -> None:
+        """A cell feeding its own input is a one-cell loop."""
+        loops = CombinationalLoopIndex.from_design(make_netlist([("A", "A"), ("A", "B")]))
+
+        assert loops.get_loops() == [[CellId("A")]]
+
+    def test_sequential_cell_breaks_loop(self, make_netlist: NetlistFactory) -> None:
+        """A cycle through a register is not combinational."""
+        design = make_netlist([("A", "FF"), ("FF", "B"), ("B", "A")], sequential=["FF"])
+
+        loops = CombinationalLoopIndex.from_design(design)
+
+        assert loops.loop_count() == 0
+
+    def test_sequential_self_loop_is_ignored(self, make_netlist: NetlistFactory) -> None:
+        """A register feeding itself is not a combinational loop."""
+        loops = CombinationalLoopIndex.from_design(make_netlist([("FF", "FF")], sequential=["FF"]))
+
+        assert not loops.has_loops()
+
+    def test_independent_loops(self, make_netlist: NetlistFactory) -> None:
+        """Disjoint cycles are reported as separate loops."""
+        design = make_netlist([("A", "B"), ("B", "A"), ("B", "C"), ("C", "D"), ("D", "C")])
+
+        loops = CombinationalLoopIndex.from_design(design)
+
+        assert sorted(sorted(map(str, loop)) for loop in loops.get_loops()) == [
+            ["A", "B"],
+            ["C", "D"],
+        ]
+        assert loops.get_loop_of(CellId("A")) != loops.get_loop_of(CellId("C"))
+
+    def test_overlapping_cycles_form_one_loop(self, make_netlist: NetlistFactory) -> None:
+        """Cycles sharing a cell merge into one strongly connected loop."""
+        design = make_netlist([("A", "B"), ("B", "A"), ("B", "C"), ("C", "B")])
+
+        loops = CombinationalLoopIndex.from_design(design)
+
+        assert loops.loop_count() == 1
+        assert ids(loops.get_loop(0)) == {"A", "B", "C"}
+
+    def test_deep_chain_is_iterative(self, make_netlist: NetlistFactory) -> None:
+        """A ring deeper than the recursion limit is found without recursion."""
+        depth = sys.getrecursionlimit() * 2
+        wires = [(f"G{i}", f"G{i + 1}") for i in range(depth)] + [(f"G{depth}", "G0")]
+
+        loops = CombinationalLoopIndex.from_design(make_netlist(wires))
+
+        assert loops.loop_count() == 1
+        assert len(loops.get_loop(0)) == depth + 1
+
+    def test_component_numbering(self, make_netlist: NetlistFactory) -> None:
+        """Sequential cells get component -1; others get a component."""
+        adjacency = CellAdjacency.from_design(
+            make_netlist([("FF", "A"), ("A", "B")], sequential=["FF"])
+        )
+
+        component_of, components = strongly_connected_components(adjacency)
+
+        ff = adjacency.index_of(CellId("FF"))
+        assert ff is not None
+        assert component_of[ff] == -1
+        assert len(components) == 2
+
+
+class TestLoopEdges:
+    """Tests for loop-edge queries used by feedback-edge selection."""
+
+    def test_loop_edges_are_intra_loop_only(self, make_netlist: NetlistFactory) -> None:
+        """Only edges between cells of the same loop are reported."""
+        design = make_netlist([("IN", "N1"), ("N1", "N2"), ("N2", "N1"), ("N2", "OUT")])
+
+        loops = CombinationalLoopIndex.from_design(design)
+
+        assert sorted(loops.get_loop_edges(0)) == [
+            (CellId("N1"), CellId("N2")),
+            (CellId("N2"), CellId("N1")),
+        ]
+        assert loops.is_loop_edge(CellId("N2"), CellId("N1"))
+        assert not loops.is_loop_edge(CellId("IN"), CellId("N1"))
+        assert not loops.is_loop_edge(CellId("N2"), CellId("OUT"))
+
+
+class TestSerialization:
+    """Tests for to_bytes()/from_bytes()."""
+
+    def test_round_trip(self, make_netlist: NetlistFactory) -> None:
+        """from_bytes(to_bytes()) should restore loops and loop edges."""
+        design = make_netlist([("A", "B"), ("B", "A"), ("C", "C")])
+        loops = CombinationalLoopIndex.from_design(design)
+
+        restored = CombinationalLoopIndex.from_bytes(loops.to_bytes())
+
+        assert restored.get_loops() == loops.get_loops()
+        assert restored.is_loop_edge(CellId("C"), CellId("C"))
+
+    def test_round_trip_empty(self) -> None:
+        """An empty index should round-trip."""
+        loops = CombinationalLoopIndex.from_design(Design(name="empty"))
+
+        restored = CombinationalLoopIndex.from_bytes(loops.to_bytes())
+
+        assert restored.loop_count() == 0
+
+    def test_rejects_bad_header(self) -> None:
+        """from_bytes should reject data without the index header."""
+        with pytest.raises(ValueError, match="bad header"):
+            CombinationalLoopIndex.from_bytes(b"X" * 64)
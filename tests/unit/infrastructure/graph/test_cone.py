@@ -0,0 +1,178 @@
+"""Unit tests for cone extraction and ConeSizeEstimator.
+
+Test Coverage Goals:
+- get_fanout_cone/get_fanin_cone match unlimited-hop fanout/fanin queries
+- Sequential boundary semantics (root always expanded)
+- CellCone membership and materialization
+- Estimator is exact below exact_limit
+- Sketch estimates of large cones (chains, trees, loops) stay within error
+- Traverser-owned estimator follows graph deltas
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Cell, Net, Pin
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.graph import (
+    ConeSizeEstimator,
+    NetworkXGraphBuilder,
+    NetworkXGraphTraverser,
+)
+
+if TYPE_CHECKING:
+    from ink.domain.model import Design
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def pipeline(make_netlist: NetlistFactory) -> Design:
+    """F1 -> A -> B -> F2 -> C, plus A -> D."""
+    return make_netlist(
+        [("F1", "A"), ("A", "B"), ("B", "F2"), ("F2", "C"), ("A", "D")],
+        sequential=["F1", "F2"],
+    )
+
+
+def traverser_for(design: Design) -> NetworkXGraphTraverser:
+    """Build a graph and traverser for a design."""
+    graph = NetworkXGraphBuilder().build_from_design(design)
+    return NetworkXGraphTraverser(graph, design)
+
+
+class TestConeExtraction:
+    """Tests for get_fanout_cone/get_fanin_cone."""
+
+    def test_fanout_cone_stops_at_sequential(self, pipeline: Design) -> None:
+        """The cone should include but not expand sequential cells."""
+        cone = traverser_for(pipeline).get_fanout_cone(CellId("F1"))
+
+        assert sorted(cone.get_cell_ids()) == ["A", "B", "D", "F2"]
+        assert len(cone) == 4
+
+    def test_fanout_cone_through_sequential(self, pipeline: Design) -> None:
+        """With stop_at_sequential=False the cone crosses registers."""
+        cone = traverser_for(pipeline).get_fanout_cone(CellId("F1"), stop_at_sequential=False)
+
+        assert sorted(cone.get_cell_ids()) == ["A", "B", "C", "D", "F2"]
+
+    def test_fanin_cone(self, pipeline: Design) -> None:
+        """The fanin cone should walk drivers back to the boundary."""
+        cone = traverser_for(pipeline).get_fanin_cone(CellId("C"))
+
+        assert cone.get_cell_ids() == [CellId("F2")]
+
+    def test_matches_unlimited_hop_query(self, pipeline: Design) -> None:
+        """A cone should equal a fanout query with enough hops."""
+        traverser = traverser_for(pipeline)
+
+        cone = traverser.get_fanout_cone(CellId("F1"))
+        cells = traverser.get_fanout_cells(CellId("F1"), hops=100, stop_at_sequential=True)
+
+        assert set(cone.get_cell_ids()) == {cell.id for cell in cells}
+
+    def test_indices_sorted_and_searchable(self, pipeline: Design) -> None:
+        """Indices should be sorted; contains_index should agree with them."""
+        traverser = traverser_for(pipeline)
+        cone = traverser.get_fanout_cone(CellId("F1"), stop_at_sequential=False)
+        projection = traverser.projection
+
+        assert list(cone.indices) == sorted(cone.indices)
+        a = projection.index_of(CellId("A"))
+        f1 = projection.index_of(CellId("F1"))
+        assert a is not None
+        assert f1 is not None
+        assert cone.contains_index(a)
+        assert not cone.contains_index(f1)
+
+    def test_unknown_cell_has_empty_cone(self, pipeline: Design) -> None:
+        """An unknown root should produce an empty cone."""
+        assert len(traverser_for(pipeline).get_fanout_cone(CellId("missing"))) == 0
+
+
+class TestConeSizeEstimator:
+    """Tests for exact and sketch-based cone size estimates."""
+
+    @pytest.mark.parametrize("stop_at_sequential", [True, False])
+    def test_exact_for_small_cones(self, pipeline: Design, stop_at_sequential: bool) -> None:
+        """Below exact_limit the estimate should equal the cone size."""
+        traverser = traverser_for(pipeline)
+        estimator = ConeSizeEstimator.from_design(pipeline)
+
+        for cell in pipeline.get_all_cells():
+            fanout = traverser.get_fanout_cone(cell.id, stop_at_sequential)
+            fanin = traverser.get_fanin_cone(cell.id, stop_at_sequential)
+            assert estimator.estimate_fanout_cone(cell.id, stop_at_sequential) == len(fanout)
+            assert estimator.estimate_fanin_cone(cell.id, stop_at_sequential) == len(fanin)
+
+    def test_unknown_cell_estimates_zero(self, pipeline: Design) -> None:
+        """Unknown cells should estimate to 0."""
+        assert ConeSizeEstimator.from_design(pipeline).estimate_fanout_cone(CellId("x")) == 0
+
+    def test_chain_estimate(self, make_netlist: NetlistFactory) -> None:
+        """A long chain should be estimated within sketch error."""
+        size = 3000
+        design = make_netlist([(f"C{i}", f"C{i + 1}") for i in range(size)])
+        estimator = ConeSizeEstimator.from_design(design, exact_limit=100)
+
+        assert estimator.estimate_fanout_cone(CellId("C0")) == pytest.approx(size, rel=0.4)
+        assert estimator.estimate_fanin_cone(CellId(f"C{size}")) == pytest.approx(size, rel=0.4)
+
+    def test_tree_estimate(self, make_netlist: NetlistFactory) -> None:
+        """A fanout tree with reconvergence should not be double-counted."""
+        wires = [(f"T{i}", f"T{2 * i + 1}") for i in range(1023)]
+        wires += [(f"T{i}", f"T{2 * i + 2}") for i in range(1023)]
+        wires += [(f"T{i}", "SINK") for i in range(1023, 2047)]
+        design = make_netlist(wires)
+        estimator = ConeSizeEstimator.from_design(design, exact_limit=100)
+
+        # 2046 tree cells below the root plus the shared sink
+        assert estimator.estimate_fanout_cone(CellId("T0")) == pytest.approx(2047, rel=0.4)
+
+    def test_loop_estimate(self, make_netlist: NetlistFactory) -> None:
+        """A combinational ring should terminate and estimate the ring size."""
+        size = 2000
+        design = make_netlist([(f"R{i}", f"R{(i + 1) % size}") for i in range(size)])
+        estimator = ConeSizeEstimator.from_design(design, exact_limit=100)
+
+        assert estimator.estimate_fanout_cone(CellId("R0")) == pytest.approx(size, rel=0.4)
+
+    def test_sequential_boundary_estimate(self, make_netlist: NetlistFactory) -> None:
+        """Registers should bound the sketch unless stop_at_sequential=False."""
+        wires = [(f"A{i}", f"A{i + 1}") for i in range(1500)]
+        wires += [("A1500", "FF"), ("FF", "B0")]
+        wires += [(f"B{i}", f"B{i + 1}") for i in range(1500)]
+        design = make_netlist(wires, sequential=["FF"])
+        estimator = ConeSizeEstimator.from_design(design, exact_limit=100)
+
+        bounded = estimator.estimate_fanout_cone(CellId("A0"))
+        unbounded = estimator.estimate_fanout_cone(CellId("A0"), stop_at_sequential=False)
+
+        assert bounded == pytest.approx(1501, rel=0.4)
+        assert unbounded == pytest.approx(3002, rel=0.4)
+
+
+class TestTraverserEstimator:
+    """Tests for the traverser-owned estimator."""
+
+    def test_estimator_follows_delta(self, make_netlist: NetlistFactory) -> None:
+        """Estimates should reflect cells added through apply_delta()."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        graph = builder.build_from_design(design)
+        traverser = NetworkXGraphTraverser(graph, design, builder.get_cell_projection())
+        assert traverser.estimate_fanout_cone_size(CellId("A")) == 1
+
+        pin = Pin(PinId("C.A0"), "A0", PinDirection.INPUT, NetId("n_A"))
+        design.add_pin(pin)
+        design.replace_net(Net(NetId("n_A"), "n_A", [PinId("A.Y"), PinId("B.A0"), pin.id]))
+        cell = Cell(CellId("C"), "C", "BUF_X1", [pin.id])
+        design.add_cell(cell)
+        builder.apply_delta(added_cells=[cell])
+
+        assert traverser.estimate_fanout_cone_size(CellId("A")) == 2
+        assert traverser.estimate_fanin_cone_size(CellId("C")) == 1
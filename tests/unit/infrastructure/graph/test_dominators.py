@@ -0,0 +1,175 @@
+"""Unit tests for DominatorTree and fanin cut-point queries.
+
+Test Coverage Goals:
+- Immediate dominators agree with networkx on random cyclic graphs
+- Cut points of reconvergent fanin cones
+- Sequential cells as cone inputs
+- Traverser caching and invalidation on graph deltas
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import networkx as nx
+import pytest
+
+from ink.domain.model import Cell, Net, Pin
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.graph import (
+    CellProjection,
+    DominatorTree,
+    NetworkXGraphBuilder,
+    NetworkXGraphTraverser,
+)
+
+if TYPE_CHECKING:
+    from ink.domain.model import Design
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def funnel(make_netlist: NetlistFactory) -> Design:
+    """Inputs I1, I2 and F1 reconverge on M, which feeds B -> FF via two routes.
+
+    I1 -> X -> M, I2 -> M, F1 -> M, M -> B, B -> P -> FF, B -> Q -> FF.
+    """
+    return make_netlist(
+        [
+            ("I1", "X"),
+            ("X", "M"),
+            ("I2", "M"),
+            ("F1", "M"),
+            ("M", "B"),
+            ("B", "P"),
+            ("B", "Q"),
+            ("P", "FF"),
+            ("Q", "FF"),
+            ("FF", "I1"),
+        ],
+        sequential=["F1", "FF"],
+    )
+
+
+def tree_for(design: Design, sink: str, stop_at_sequential: bool = True) -> DominatorTree:
+    """Build the dominator tree of a sink's fanin cone."""
+    projection = CellProjection.from_design(design)
+    index = projection.index_of(CellId(sink))
+    assert index is not None
+    return DominatorTree.build(projection, index, stop_at_sequential)
+
+
+class TestDominatorTree:
+    """Tests for the Lengauer-Tarjan computation."""
+
+    def test_immediate_dominators(self, funnel: Design) -> None:
+        """Reconvergent routes should be dominated by their fork point."""
+        tree = tree_for(funnel, "FF")
+
+        assert tree.immediate_dominator(CellId("P")) == "FF"
+        assert tree.immediate_dominator(CellId("B")) == "FF"
+        assert tree.immediate_dominator(CellId("M")) == "B"
+        assert tree.immediate_dominator(CellId("I1")) == "X"
+        assert tree.immediate_dominator(CellId("FF")) is None
+
+    def test_dominator_chain(self, funnel: Design) -> None:
+        """dominators() should list the chain up to the sink."""
+        tree = tree_for(funnel, "FF")
+
+        assert tree.dominators(CellId("X")) == ["M", "B", "FF"]
+        assert tree.dominates(CellId("B"), CellId("I2"))
+        assert not tree.dominates(CellId("P"), CellId("M"))
+
+    def test_cut_points(self, funnel: Design) -> None:
+        """Cut points are common dominators of all inputs, sink outward."""
+        assert tree_for(funnel, "FF").get_cut_points() == ["B", "M"]
+
+    def test_sequential_inputs(self, funnel: Design) -> None:
+        """F1 should be a cone input that is not expanded."""
+        tree = tree_for(funnel, "FF")
+
+        assert CellId("F1") in tree
+        assert sorted(tree.cell_ids[tree.cells[v]] for v in tree.inputs) == ["F1", "I2"]
+
+    def test_through_sequential(self, funnel: Design) -> None:
+        """Without the boundary the loop back through FF is followed."""
+        bounded = tree_for(funnel, "M")
+        unbounded = tree_for(funnel, "M", stop_at_sequential=False)
+
+        assert sorted(bounded.cell_ids[bounded.cells[v]] for v in bounded.inputs) == [
+            "F1",
+            "FF",
+            "I2",
+        ]
+        assert sorted(unbounded.cell_ids[unbounded.cells[v]] for v in unbounded.inputs) == [
+            "F1",
+            "I2",
+        ]
+        assert CellId("B") in unbounded
+
+    def test_no_fanin(self, funnel: Design) -> None:
+        """A sink without fanin has a one-vertex tree and no cut points."""
+        tree = tree_for(funnel, "I2")
+
+        assert len(tree) == 1
+        assert tree.get_cut_points() == []
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_matches_networkx(self, make_netlist: NetlistFactory, seed: int) -> None:
+        """Immediate dominators should match networkx on random graphs."""
+        rng = random.Random(seed)
+        names = [f"C{i}" for i in range(40)]
+        wires = list({(rng.choice(names), rng.choice(names)) for _ in range(90)})
+        design = make_netlist(wires, cells=names)
+        tree = tree_for(design, "C0", stop_at_sequential=False)
+
+        reversed_graph = nx.DiGraph()
+        reversed_graph.add_nodes_from(names)
+        reversed_graph.add_edges_from((sink, driver) for driver, sink in wires)
+        expected = nx.immediate_dominators(reversed_graph, "C0")
+        # Older networkx versions map the start node to itself
+        expected.pop("C0", None)
+
+        assert {tree.cell_ids[cell] for cell in tree.cells} == {"C0", *expected}
+        for cell_id, idom in expected.items():
+            assert tree.immediate_dominator(CellId(cell_id)) == idom
+
+
+class TestTraverserCutPoints:
+    """Tests for NetworkXGraphTraverser.get_fanin_cut_points."""
+
+    def test_cut_point_cells(self, funnel: Design) -> None:
+        """Cut points should be resolved to Cell entities."""
+        traverser = NetworkXGraphTraverser(NetworkXGraphBuilder().build_from_design(funnel), funnel)
+
+        assert [cell.name for cell in traverser.get_fanin_cut_points(CellId("FF"))] == ["B", "M"]
+        assert traverser.get_fanin_cut_points(CellId("missing")) == []
+
+    def test_tree_is_cached(self, funnel: Design) -> None:
+        """Repeated queries should reuse the tree."""
+        traverser = NetworkXGraphTraverser(NetworkXGraphBuilder().build_from_design(funnel), funnel)
+
+        first = traverser.get_fanin_dominator_tree(CellId("FF"))
+
+        assert traverser.get_fanin_dominator_tree(CellId("FF")) is first
+        assert traverser.get_fanin_dominator_tree(CellId("FF"), False) is not first
+
+    def test_delta_invalidates(self, make_netlist: NetlistFactory) -> None:
+        """A new bypass route should remove a cut point."""
+        design = make_netlist([("A", "B"), ("B", "S")])
+        builder = NetworkXGraphBuilder()
+        graph = builder.build_from_design(design)
+        traverser = NetworkXGraphTraverser(graph, design, builder.get_cell_projection())
+        assert [cell.name for cell in traverser.get_fanin_cut_points(CellId("S"))] == ["B", "A"]
+
+        pin = Pin(PinId("S.A1"), "A1", PinDirection.INPUT, NetId("n_A"))
+        design.add_pin(pin)
+        design.replace_net(Net(NetId("n_A"), "n_A", [PinId("A.Y"), PinId("B.A0"), pin.id]))
+        design.remove_cell(CellId("S"))
+        sink = Cell(CellId("S"), "S", "AND2_X1", [PinId("S.A0"), pin.id])
+        design.add_cell(sink)
+        builder.apply_delta(added_cells=[sink], removed_cells=[sink.id])
+
+        assert [cell.name for cell in traverser.get_fanin_cut_points(CellId("S"))] == ["A"]
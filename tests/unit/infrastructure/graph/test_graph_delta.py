@@ -0,0 +1,401 @@
+"""Unit tests for incremental graph updates (NetworkXGraphBuilder.apply_delta).
+
+Test Coverage Goals:
+- Removing, adding and rewiring cells yields the same graph as a fresh build
+- GraphDelta reports added, removed and touched cells
+- Graph version bumps on every build and delta
+- The builder-owned CellProjection is patched in place
+- Traversers with a self-built projection notice the version change
+- The builder-owned PinTable is patched in place and shared by
+  NetworkXGraphTraverser.from_builder()
+- Lean mode deltas
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Cell, Design, Net, Pin
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.graph import (
+    CellProjection,
+    NetworkXGraphBuilder,
+    NetworkXGraphTraverser,
+    PinTable,
+)
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+def edges_of(graph: nx.MultiDiGraph) -> Counter[tuple[str, str, str]]:  # type: ignore[no-any-unimported]
+    """Get the typed edge multiset of a graph."""
+    return Counter((u, v, d["edge_type"]) for u, v, d in graph.edges(data=True))
+
+
+def assert_matches_fresh_build(builder: NetworkXGraphBuilder, design: Design) -> None:
+    """Assert the mutated graph equals a graph rebuilt from the design."""
+    fresh = NetworkXGraphBuilder(lean=builder.lean).build_from_design(design)
+    assert set(builder.graph.nodes) == set(fresh.nodes)
+    assert edges_of(builder.graph) == edges_of(fresh)
+    assert dict(builder.graph.nodes(data="node_type")) == dict(fresh.nodes(data="node_type"))
+
+
+def fanout_names(builder: NetworkXGraphBuilder, cell: str) -> list[str]:
+    """Get sorted fanout cell names from the builder's projection."""
+    projection = builder.get_cell_projection()
+    index = projection.index_of(CellId(cell))
+    assert index is not None
+    return sorted(projection.cell_ids[i] for i in projection.fanout(index))
+
+
+def pin_rows(
+    table: PinTable, projection: CellProjection
+) -> tuple[dict[str, tuple[int, str, str | None]], dict[str, tuple[list[str], list[str]]]]:
+    """Get (flags, owner, net) per pin and non-empty (drivers, sinks) per net by name."""
+    pins: dict[str, tuple[int, str, str | None]] = {}
+    for pin_id in table.pin_ids:
+        pin = table.index_of(pin_id)
+        if pin is None:
+            continue  # retired slot
+        net = table.pin_net[pin]
+        net_id = None if net < 0 else str(table.net_ids[net])
+        pins[str(pin_id)] = (table.flags[pin], projection.cell_ids[table.pin_owner[pin]], net_id)
+    nets: dict[str, tuple[list[str], list[str]]] = {}
+    for net, net_id in enumerate(table.net_ids):
+        drivers = sorted(str(projection.cell_ids[i]) for i in table.driver_cells(net))
+        sinks = sorted(str(projection.cell_ids[i]) for i in table.sink_cells(net))
+        if drivers or sinks:
+            nets[str(net_id)] = (drivers, sinks)
+    return pins, nets
+
+
+def assert_pin_table_current(builder: NetworkXGraphBuilder) -> None:
+    """Assert the builder's patched pin table equals one built from scratch."""
+    projection = builder.get_cell_projection()
+    fresh_projection = CellProjection.from_graph(builder.graph, builder.get_design())
+    fresh = PinTable.from_graph(builder.graph, fresh_projection)
+    assert pin_rows(builder.get_pin_table(), projection) == pin_rows(fresh, fresh_projection)
+    assert builder.get_pin_table().pin_count() == fresh.pin_count()
+
+
+def rewire(design: Design, pin_id: str, net_id: str) -> Pin:
+    """Move an input pin to another net, updating both nets in the design."""
+    old = design.get_pin(PinId(pin_id))
+    assert old is not None and old.net_id is not None
+    new = Pin(old.id, old.name, old.direction, NetId(net_id))
+    design.replace_pin(new)
+
+    old_net = design.get_net(old.net_id)
+    new_net = design.get_net(NetId(net_id))
+    assert old_net is not None and new_net is not None
+    design.replace_net(
+        Net(old_net.id, old_net.name, [p for p in old_net.connected_pin_ids if p != old.id])
+    )
+    design.replace_net(Net(new_net.id, new_net.name, [*new_net.connected_pin_ids, old.id]))
+    return new
+
+
+def add_buffer(design: Design, name: str, source_net: str) -> Cell:
+    """Add a buffer reading source_net and driving a new net n_<name>."""
+    in_pin = Pin(PinId(f"{name}.A0"), "A0", PinDirection.INPUT, NetId(source_net))
+    out_pin = Pin(PinId(f"{name}.Y"), "Y", PinDirection.OUTPUT, NetId(f"n_{name}"))
+    design.add_pin(in_pin)
+    design.add_pin(out_pin)
+    design.add_net(Net(NetId(f"n_{name}"), f"n_{name}", [out_pin.id]))
+    source = design.get_net(NetId(source_net))
+    assert source is not None
+    design.replace_net(Net(source.id, source.name, [*source.connected_pin_ids, in_pin.id]))
+    cell = Cell(CellId(name), name, "BUF_X1", [in_pin.id, out_pin.id])
+    design.add_cell(cell)
+    return cell
+
+
+class TestApplyDelta:
+    """Tests for graph mutation through apply_delta()."""
+
+    def test_requires_built_graph(self) -> None:
+        """apply_delta() before build_from_design() should raise."""
+        with pytest.raises(ValueError, match="build_from_design"):
+            NetworkXGraphBuilder().apply_delta()
+
+    def test_remove_cell(self, make_netlist: NetlistFactory) -> None:
+        """Removing a cell should drop it and its pins, keeping its nets."""
+        design = make_netlist([("A", "B"), ("B", "C")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+
+        design.remove_cell(CellId("B"))
+        design.replace_net(Net(NetId("n_A"), "n_A", [PinId("A.Y")]))
+        delta = builder.apply_delta(removed_cells=[CellId("B")])
+
+        assert CellId("B") not in builder.graph
+        assert PinId("B.A0") not in builder.graph
+        assert NetId("n_B") in builder.graph
+        assert delta.removed_cells == (CellId("B"),)
+        assert delta.touched_cells == {CellId("A"), CellId("C")}
+        assert_matches_fresh_build(builder, design)
+
+    def test_add_cell(self, make_netlist: NetlistFactory) -> None:
+        """Adding a cell should add its pins, new nets and signal edges."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+
+        cell = add_buffer(design, "D", "n_A")
+        delta = builder.apply_delta(added_cells=[cell])
+
+        assert builder.get_node_entity(CellId("D")) == cell
+        assert delta.added_cells == (CellId("D"),)
+        assert delta.touched_cells == {CellId("A"), CellId("B"), CellId("D")}
+        assert_matches_fresh_build(builder, design)
+
+    def test_rewire_pin(self, make_netlist: NetlistFactory) -> None:
+        """A changed pin should move its drives edges to the new net."""
+        design = make_netlist([("A", "C"), ("B", "D")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+
+        pin = rewire(design, "C.A0", "n_B")
+        builder.apply_delta(changed_pins=[pin])
+
+        assert builder.graph.nodes[PinId("C.A0")]["net_id"] == NetId("n_B")
+        assert_matches_fresh_build(builder, design)
+
+    def test_unknown_changed_pin_rejected(self, make_netlist: NetlistFactory) -> None:
+        """A changed pin that no cell in the graph owns should raise, changing nothing."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        version = builder.version
+        stray = Pin(PinId("X.A0"), "A0", PinDirection.INPUT, NetId("n_A"))
+        design.add_pin(stray)
+
+        with pytest.raises(ValueError, match=r"X\.A0"):
+            builder.apply_delta(removed_cells=[CellId("B")], added_cells=[], changed_pins=[stray])
+
+        assert CellId("B") in builder.graph
+        assert builder.version == version
+
+    def test_changed_pin_of_added_cell(self, make_netlist: NetlistFactory) -> None:
+        """A changed pin may belong to a cell added in the same delta."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+
+        cell = add_buffer(design, "D", "n_A")
+        pin = design.get_pin(PinId("D.A0"))
+        assert pin is not None
+        builder.apply_delta(added_cells=[cell], changed_pins=[pin])
+
+        assert_matches_fresh_build(builder, design)
+
+    def test_lean_mode(self, make_netlist: NetlistFactory) -> None:
+        """Lean builders should apply deltas with lean node attributes."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder(lean=True)
+        builder.build_from_design(design)
+
+        cell = add_buffer(design, "D", "n_A")
+        builder.apply_delta(added_cells=[cell])
+
+        assert builder.graph.nodes[CellId("D")] == {"node_type": "cell"}
+        assert_matches_fresh_build(builder, design)
+
+
+class TestGraphVersion:
+    """Tests for graph version tracking."""
+
+    def test_build_and_delta_bump_version(self, make_netlist: NetlistFactory) -> None:
+        """Every build and delta should advance the version monotonically."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+
+        builder.build_from_design(design)
+        first = builder.graph.graph["version"]
+        delta = builder.apply_delta()
+        builder.build_from_design(design)
+
+        assert delta.version == first + 1
+        assert builder.graph.graph["version"] == first + 2 == builder.version
+
+
+class TestProjectionMaintenance:
+    """Tests for keeping cell projections current across deltas."""
+
+    def test_projection_patched_on_add(self, make_netlist: NetlistFactory) -> None:
+        """The builder's projection should gain edges to an added cell."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        projection = builder.get_cell_projection()
+
+        cell = add_buffer(design, "D", "n_A")
+        builder.apply_delta(added_cells=[cell])
+
+        assert builder.get_cell_projection() is projection
+        assert fanout_names(builder, "A") == ["B", "D"]
+        assert projection.cell_count() == 3
+        assert projection.edge_count() == 2
+
+    def test_projection_patched_on_remove(self, make_netlist: NetlistFactory) -> None:
+        """A removed cell should disappear from the projection."""
+        design = make_netlist([("A", "B"), ("A", "C")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        projection = builder.get_cell_projection()
+
+        design.remove_cell(CellId("B"))
+        design.replace_net(Net(NetId("n_A"), "n_A", [PinId("A.Y"), PinId("C.A0")]))
+        builder.apply_delta(removed_cells=[CellId("B")])
+
+        assert projection.index_of(CellId("B")) is None
+        assert fanout_names(builder, "A") == ["C"]
+        assert projection.edge_count() == 1
+
+    def test_projection_edges_after_rewire(self, make_netlist: NetlistFactory) -> None:
+        """Patched rows should carry the new driving pin and net."""
+        design = make_netlist([("A", "C"), ("B", "D")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        projection = builder.get_cell_projection()
+
+        builder.apply_delta(changed_pins=[rewire(design, "C.A0", "n_B")])
+
+        assert fanout_names(builder, "A") == []
+        assert fanout_names(builder, "B") == ["C", "D"]
+        [edge] = projection.get_fanin_edges(CellId("C"))
+        assert (edge.source, edge.pin_id, edge.net_id) == ("B", "B.Y", "n_B")
+
+    def test_projection_after_disconnecting_load(self, make_netlist: NetlistFactory) -> None:
+        """A load pin moved off every net should drop its cell's fanin."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        projection = builder.get_cell_projection()
+
+        old = design.get_pin(PinId("B.A0"))
+        assert old is not None
+        pin = Pin(old.id, old.name, old.direction, None)
+        design.replace_pin(pin)
+        design.replace_net(Net(NetId("n_A"), "n_A", [PinId("A.Y")]))
+        delta = builder.apply_delta(changed_pins=[pin])
+
+        assert delta.touched_cells == {CellId("A"), CellId("B")}
+        assert fanout_names(builder, "A") == []
+        assert projection.get_fanin_edges(CellId("B")) == []
+        assert_matches_fresh_build(builder, design)
+
+    def test_repeated_deltas_recycle_edge_records(self, make_netlist: NetlistFactory) -> None:
+        """Patching the same rows again should not grow the edge arrays."""
+        design = make_netlist([("A", "C"), ("B", "D")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        projection = builder.get_cell_projection()
+
+        builder.apply_delta(changed_pins=[rewire(design, "C.A0", "n_B")])
+        builder.apply_delta(changed_pins=[rewire(design, "C.A0", "n_A")])
+        size = len(projection.fanout_targets)
+        for _ in range(10):
+            builder.apply_delta(changed_pins=[rewire(design, "C.A0", "n_B")])
+            builder.apply_delta(changed_pins=[rewire(design, "C.A0", "n_A")])
+
+        assert len(projection.fanout_targets) == size
+        assert len(projection.driver_pins) == len(projection.driver_nets)
+        assert fanout_names(builder, "A") == ["C"]
+        [edge] = projection.get_fanin_edges(CellId("C"))
+        assert (edge.source, edge.pin_id, edge.net_id) == ("A", "A.Y", "n_A")
+
+    def test_traverser_with_builder_projection(self, make_netlist: NetlistFactory) -> None:
+        """A traverser sharing the builder's projection sees patched rows."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        graph = builder.build_from_design(design)
+        traverser = NetworkXGraphTraverser(graph, design, builder.get_cell_projection())
+
+        cell = add_buffer(design, "D", "n_A")
+        builder.apply_delta(added_cells=[cell])
+
+        fanout = traverser.get_fanout_cells(CellId("A"), hops=1)
+        assert sorted(c.name for c in fanout) == ["B", "D"]
+
+    def test_traverser_rebuilds_stale_projection(self, make_netlist: NetlistFactory) -> None:
+        """A traverser's own projection is rebuilt after a version change."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        graph = builder.build_from_design(design)
+        traverser = NetworkXGraphTraverser(graph, design)
+        before = traverser.projection
+
+        cell = add_buffer(design, "D", "n_A")
+        builder.apply_delta(added_cells=[cell])
+
+        assert traverser.projection is not before
+        fanout = traverser.get_fanout_cells(CellId("A"), hops=2)
+        assert sorted(c.name for c in fanout) == ["B", "D"]
+
+
+class TestPinTableMaintenance:
+    """Tests for keeping the builder's PinTable current across deltas."""
+
+    def test_patched_on_add_remove_and_rewire(self, make_netlist: NetlistFactory) -> None:
+        """Every kind of delta should leave the table equal to a fresh build."""
+        design = make_netlist([("A", "C"), ("B", "D"), ("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        table = builder.get_pin_table()
+
+        builder.apply_delta(added_cells=[add_buffer(design, "E", "n_A")])
+        assert_pin_table_current(builder)
+        builder.apply_delta(changed_pins=[rewire(design, "C.A0", "n_B")])
+        assert_pin_table_current(builder)
+        design.remove_cell(CellId("D"))
+        design.replace_net(Net(NetId("n_B"), "n_B", [PinId("B.Y"), PinId("C.A0")]))
+        builder.apply_delta(removed_cells=[CellId("D")])
+        assert_pin_table_current(builder)
+
+        assert builder.get_pin_table() is table
+        assert table.graph_version == builder.version
+
+    def test_removed_pin_slots_are_reused(self, make_netlist: NetlistFactory) -> None:
+        """Removing and re-adding cells should not grow the pin arrays."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        table = builder.get_pin_table()
+
+        for step in range(5):
+            cell = add_buffer(design, f"T{step}", "n_A")
+            builder.apply_delta(added_cells=[cell])
+            design.remove_cell(cell.id)
+            design.replace_net(Net(NetId("n_A"), "n_A", [PinId("A.Y"), PinId("B.A0")]))
+            builder.apply_delta(removed_cells=[cell.id])
+
+        assert len(table.pin_ids) == 2 + 2
+        assert_pin_table_current(builder)
+
+    def test_traverser_from_builder_is_not_rebuilt(
+        self, make_netlist: NetlistFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """from_builder() should share the live indexes instead of rebuilding them."""
+        design = make_netlist([("A", "B")])
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        traverser = NetworkXGraphTraverser.from_builder(builder)
+
+        def fail(*_: object) -> None:
+            raise AssertionError("unexpected rebuild")
+
+        monkeypatch.setattr(PinTable, "from_graph", fail)
+        monkeypatch.setattr(CellProjection, "from_graph", fail)
+        builder.apply_delta(added_cells=[add_buffer(design, "D", "n_A")])
+
+        fanout = traverser.get_fanout_from_pin(PinId("A.Y"), hops=2)
+        assert sorted(c.name for c in fanout) == ["B", "D"]
+        assert traverser.pin_table is builder.get_pin_table()
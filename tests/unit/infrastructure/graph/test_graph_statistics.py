@@ -0,0 +1,184 @@
+"""Unit tests for GraphStatistics.
+
+Test Coverage Goals:
+- Node/edge counts by type match the built graph
+- Fanout/fanin histograms, top-N nets and cell-type frequency
+- Builder caching per graph version and count methods
+- Binary round trip and the command line tool
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Cell, Design, Net, Pin, Port
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId, PortId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.graph import (
+    GraphStatistics,
+    IndexBundle,
+    NetworkXGraphBuilder,
+    default_bundle_path,
+    netlist_digest,
+)
+from ink.infrastructure.graph.graph_statistics import bucket_label, bucket_of, main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def design(make_netlist: NetlistFactory) -> Design:
+    """R fans out to A..E; A feeds B; F is a register fed by nothing."""
+    return make_netlist(
+        [("R", "A"), ("R", "B"), ("R", "C"), ("R", "D"), ("R", "E"), ("A", "B")],
+        sequential=["F"],
+        cells=["F"],
+    )
+
+
+class TestBuckets:
+    """Tests for the power-of-two histogram buckets."""
+
+    @pytest.mark.parametrize(
+        ("value", "label"),
+        [(0, "0"), (1, "1"), (2, "2"), (3, "3-4"), (4, "3-4"), (5, "5-8"), (9, "9-16")],
+    )
+    def test_bucket_labels(self, value: int, label: str) -> None:
+        """Values should land in the bucket whose label covers them."""
+        assert bucket_label(bucket_of(value)) == label
+
+
+class TestCollection:
+    """Tests for GraphStatistics.from_graph."""
+
+    def test_counts_match_graph(self, design: Design) -> None:
+        """Per-type counts should add up to the graph totals."""
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+
+        stats = builder.statistics()
+
+        assert stats.cell_count == 7
+        assert stats.sequential_cell_count == 1
+        assert sum(stats.node_counts.values()) == builder.node_count()
+        assert sum(stats.edge_counts.values()) == builder.edge_count()
+        assert stats.graph_version == builder.version
+
+    def test_fanout_distribution(self, design: Design) -> None:
+        """Histograms and top nets should follow sink counts."""
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+
+        stats = builder.statistics(top_n=2)
+
+        assert stats.top_fanout_nets == (("n_R", 5), ("n_A", 1))
+        assert dict(stats.net_fanout_histogram) == {"0": 0, "1": 1, "2": 0, "3-4": 0, "5-8": 1}
+        # B has two inputs; R and F have none
+        assert dict(stats.cell_fanin_histogram) == {"0": 2, "1": 4, "2": 1}
+        assert dict(stats.cell_fanout_histogram)["5-8"] == 1
+        assert stats.cell_type_counts == (("BUF_X1", 6), ("DFF_X1", 1))
+
+    def test_ports_and_floating_pins(self) -> None:
+        """Output ports are sinks; unconnected pins are counted as floating."""
+        design = Design(name="io")
+        design.add_port(Port(PortId("IN"), "IN", PinDirection.INPUT, NetId("a")))
+        design.add_port(Port(PortId("OUT"), "OUT", PinDirection.OUTPUT, NetId("a")))
+        design.add_port(Port(PortId("X"), "X", PinDirection.OUTPUT, NetId("b")))
+        design.add_pin(Pin(PinId("U.A"), "A", PinDirection.INPUT, NetId("a")))
+        design.add_pin(Pin(PinId("U.B"), "B", PinDirection.INPUT, None))
+        design.add_cell(Cell(CellId("U"), "U", "AND2_X1", [PinId("U.A"), PinId("U.B")]))
+        design.add_net(Net(NetId("a"), "a", [PinId("U.A")]))
+        design.add_net(Net(NetId("b"), "b", []))
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+
+        stats = builder.statistics()
+
+        assert stats.top_fanout_nets[0] == ("a", 2)
+        assert stats.floating_pin_count == 1
+        assert stats.undriven_net_count == 1
+
+    def test_memory_estimates(self, design: Design) -> None:
+        """Lean graphs should be estimated smaller than full ones."""
+        full = NetworkXGraphBuilder()
+        full.build_from_design(design)
+        lean = NetworkXGraphBuilder(lean=True)
+        lean.build_from_design(design)
+
+        assert 0 < lean.statistics().estimated_graph_bytes < full.statistics().estimated_graph_bytes
+        assert full.statistics().estimated_projection_bytes > 0
+
+
+class TestBuilderCache:
+    """Tests for NetworkXGraphBuilder.statistics caching."""
+
+    def test_cached_per_version(self, design: Design) -> None:
+        """The report should be reused until the graph changes."""
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        first = builder.statistics()
+
+        assert builder.statistics() is first
+        assert builder.cell_node_count() == 7
+
+        design.remove_cell(CellId("E"))
+        builder.apply_delta(removed_cells=[CellId("E")])
+
+        assert builder.statistics() is not first
+        assert builder.cell_node_count() == 6
+
+    def test_requires_build(self) -> None:
+        """statistics() needs a graph; the count methods report zero."""
+        builder = NetworkXGraphBuilder()
+
+        assert builder.cell_node_count() == 0
+        assert builder.net_node_count() == 0
+        with pytest.raises(ValueError, match="build_from_design"):
+            builder.statistics()
+
+
+class TestPersistence:
+    """Tests for the binary form and the command line tool."""
+
+    def test_round_trip(self, design: Design) -> None:
+        """A restored report should equal the original apart from the version."""
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        stats = builder.statistics()
+
+        restored = GraphStatistics.from_bytes(stats.to_bytes())
+
+        assert restored.graph_version is None
+        assert restored.to_dict() == {**stats.to_dict(), "graph_version": None}
+
+    def test_bad_header(self) -> None:
+        """Foreign data should be rejected."""
+        with pytest.raises(ValueError, match="bad header"):
+            GraphStatistics.from_bytes(b"INKPRJ\x01\x00{}")
+
+    def test_cli_prints_bundled_report(
+        self, tmp_path: Path, design: Design, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """The CLI should print the report saved in the netlist's bundle."""
+        netlist = tmp_path / "top.cdl"
+        netlist.write_text(".SUBCKT top\n.ENDS\n")
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        IndexBundle.write(
+            default_bundle_path(netlist), netlist_digest(netlist), [builder.statistics()]
+        )
+
+        assert main([str(netlist)]) == 0
+        assert "n_R" in capsys.readouterr().out
+
+    def test_cli_without_bundle(self, tmp_path: Path) -> None:
+        """Without a current bundle the CLI should fail cleanly."""
+        netlist = tmp_path / "top.cdl"
+        netlist.write_text(".SUBCKT top\n.ENDS\n")
+
+        assert main([str(netlist)]) == 1
@@ -0,0 +1,350 @@
+"""Unit tests for IndexBundle and index serialization.
+
+Test Coverage Goals:
+- Every bundled index type round-trips through a memory-mapped bundle
+- Stale, foreign, truncated and missing bundles are treated as absent
+- Sections are decoded lazily and cached
+- update() replaces given sections and keeps the rest
+- Other layers can register their own section types
+- Traverser restores its projection from a bundle and drops it on deltas
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph import (
+    CellAdjacency,
+    CellProjection,
+    ClockDomainIndex,
+    CombinationalLoopIndex,
+    IndexBundle,
+    LevelIndex,
+    NetworkXGraphBuilder,
+    NetworkXGraphTraverser,
+    SequentialReachabilityIndex,
+    default_bundle_path,
+    netlist_digest,
+    register_section,
+)
+from ink.infrastructure.graph.index_bundle import SECTION_NAMES
+from ink.infrastructure.layout import LayoutCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from ink.domain.model import Design
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+KEY = hashlib.sha256(b"netlist").hexdigest()
+
+
+@pytest.fixture
+def design(make_netlist: NetlistFactory) -> Design:
+    """Two registers with a combinational loop between them."""
+    return make_netlist(
+        [("F1", "A"), ("A", "B"), ("B", "A"), ("B", "F2"), ("F2", "C"), ("C", "F1")],
+        sequential=["F1", "F2"],
+    )
+
+
+@pytest.fixture
+def bundle_path(tmp_path: Path, design: Design) -> Path:
+    """Write a bundle with every index type and return its path."""
+    path = tmp_path / "indexes" / "design.inkidx"
+    graph = NetworkXGraphBuilder().build_from_design(design)
+    IndexBundle.write(
+        path,
+        KEY,
+        [
+            CellProjection.from_graph(graph, design),
+            CellAdjacency.from_design(design),
+            LevelIndex.from_design(design),
+            CombinationalLoopIndex.from_design(design),
+            SequentialReachabilityIndex.from_design(design),
+            ClockDomainIndex.from_design(design),
+        ],
+    )
+    return path
+
+
+class TestRoundTrip:
+    """Tests for writing and mapping bundles."""
+
+    def test_indexes_round_trip(self, bundle_path: Path, design: Design) -> None:
+        """Restored indexes should answer like freshly built ones."""
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+        with bundle:
+            adjacency = bundle.get(CellAdjacency)
+            projection = bundle.get(CellProjection)
+            levels = bundle.get(LevelIndex)
+            loops = bundle.get(CombinationalLoopIndex)
+            reach = bundle.get(SequentialReachabilityIndex)
+
+        fresh = CellAdjacency.from_design(design)
+        assert adjacency is not None
+        assert adjacency.cell_ids == fresh.cell_ids
+        assert adjacency.fanin_targets == fresh.fanin_targets
+        assert projection is not None
+        assert projection.get_fanout_edges(CellId("B")) == (
+            CellProjection.from_design(design).get_fanout_edges(CellId("B"))
+        )
+        assert levels is not None
+        assert levels.levels == LevelIndex.from_design(design).levels
+        assert loops is not None
+        assert loops.loop_count() == 1
+        assert reach is not None
+        assert reach.get_fanin_sequential_cells(CellId("F2")) == ["F1"]
+
+    @pytest.mark.skipif(sys.byteorder != "little", reason="views need little-endian")
+    def test_arrays_view_the_mapping(self, bundle_path: Path, design: Design) -> None:
+        """CSR arrays should be read in place and outlive close()."""
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+        with bundle:
+            projection = bundle.get(CellProjection)
+            adjacency = bundle.get(CellAdjacency)
+
+        assert projection is not None
+        assert isinstance(projection.fanout_targets, memoryview)
+        assert isinstance(projection.fanin_edges, memoryview)
+        assert adjacency is not None
+        assert isinstance(adjacency.fanin_targets, memoryview)
+        assert projection.get_fanin_edges(CellId("A")) == (
+            CellProjection.from_design(design).get_fanin_edges(CellId("A"))
+        )
+
+    def test_restored_projection_accepts_deltas(self, bundle_path: Path, design: Design) -> None:
+        """A projection read from a bundle should be patchable like a built one."""
+        builder = NetworkXGraphBuilder()
+        graph = builder.build_from_design(design)
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+        with bundle:
+            projection = bundle.get(CellProjection)
+        assert projection is not None
+
+        design.remove_cell(CellId("C"))
+        projection.apply_delta(graph, design, builder.apply_delta(removed_cells=[CellId("C")]))
+
+        assert projection.cell_count() == 4
+        assert projection.get_fanin_edges(CellId("F1")) == []
+        assert projection.get_fanout_edges(CellId("B")) == (
+            CellProjection.from_graph(graph, design).get_fanout_edges(CellId("B"))
+        )
+
+    def test_sections_are_cached(self, bundle_path: Path) -> None:
+        """get() should decode once and return the same object."""
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+
+        first = bundle.get(LevelIndex)
+        bundle.close()
+
+        assert bundle.get(LevelIndex) is first
+        with pytest.raises(ValueError, match="closed"):
+            bundle.get(CellAdjacency)
+
+    def test_missing_section(self, tmp_path: Path, design: Design) -> None:
+        """A type not written to the bundle should come back as None."""
+        path = tmp_path / "levels.inkidx"
+        IndexBundle.write(path, KEY, [LevelIndex.from_design(design)])
+
+        bundle = IndexBundle.open(path, KEY)
+        assert bundle is not None
+        with bundle:
+            assert LevelIndex in bundle
+            assert CellAdjacency not in bundle
+            assert bundle.get(CellAdjacency) is None
+
+    def test_update_keeps_other_sections(self, bundle_path: Path, design: Design) -> None:
+        """update() should replace the given section and copy the others."""
+        first = LayoutCache(max_bytes=1 << 20)
+        IndexBundle.update(bundle_path, KEY, [first])
+        second = LayoutCache(max_bytes=2 << 20)
+        IndexBundle.update(bundle_path, KEY, [second])
+
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+        with bundle:
+            levels = bundle.get(LevelIndex)
+            layouts = bundle.get(LayoutCache)
+
+        assert levels is not None
+        assert levels.levels == LevelIndex.from_design(design).levels
+        assert layouts is not None
+        assert layouts.max_bytes == 2 << 20
+
+    def test_update_without_bundle(self, tmp_path: Path) -> None:
+        """update() on a missing bundle should write just the given sections."""
+        path = tmp_path / "new.inkidx"
+
+        IndexBundle.update(path, KEY, [LayoutCache()])
+
+        bundle = IndexBundle.open(path, KEY)
+        assert bundle is not None
+        with bundle:
+            assert LayoutCache in bundle
+            assert LevelIndex not in bundle
+
+    def test_rejects_bad_key(self, tmp_path: Path) -> None:
+        """Keys must be SHA-256 hex digests."""
+        with pytest.raises(ValueError, match="SHA-256"):
+            IndexBundle.write(tmp_path / "x.inkidx", "abcd", [])
+
+
+class Note:
+    """Minimal section type defined outside the graph layer."""
+
+    def __init__(self, text: str) -> None:
+        """Store the text."""
+        self.text = text
+
+    def to_bytes(self) -> bytes:
+        """Serialize the text."""
+        return self.text.encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> Note:
+        """Restore the text."""
+        return cls(str(data, "utf-8"))
+
+
+@pytest.fixture
+def registry() -> Iterator[None]:
+    """Restore the section registry after a test registers types."""
+    saved = dict(SECTION_NAMES)
+    yield
+    SECTION_NAMES.clear()
+    SECTION_NAMES.update(saved)
+
+
+class TestSectionRegistry:
+    """Tests for register_section()."""
+
+    def test_layout_cache_registered_by_layout_package(self) -> None:
+        """Importing the layout package should register its cache section."""
+        assert SECTION_NAMES[LayoutCache] == b"layouts"
+
+    @pytest.mark.usefixtures("registry")
+    def test_registered_type_round_trips(self, bundle_path: Path) -> None:
+        """A registered type should be stored next to the graph indexes."""
+        register_section(Note, b"notes")
+        register_section(Note, b"notes")
+        IndexBundle.update(bundle_path, KEY, [Note("hello")])
+
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+        with bundle:
+            note = bundle.get(Note)
+            assert LevelIndex in bundle
+
+        assert note is not None
+        assert note.text == "hello"
+
+    @pytest.mark.usefixtures("registry")
+    def test_conflicting_registrations_rejected(self) -> None:
+        """Names and types should each be registered once."""
+        with pytest.raises(ValueError, match="already registered"):
+            register_section(Note, b"levels")
+        register_section(Note, b"notes")
+        with pytest.raises(ValueError, match="already registered"):
+            register_section(Note, b"other")
+        with pytest.raises(ValueError, match="1 to 8 bytes"):
+            register_section(Note, b"much too long")
+
+    def test_unregistered_type_rejected(self, tmp_path: Path) -> None:
+        """Writing a type nobody registered should fail clearly."""
+        with pytest.raises(ValueError, match="not a registered"):
+            IndexBundle.write(tmp_path / "x.inkidx", KEY, [Note("hello")])
+
+
+class TestStaleBundles:
+    """Tests for bundles that must not be used."""
+
+    def test_other_key(self, bundle_path: Path) -> None:
+        """A bundle for a different netlist should be ignored."""
+        assert IndexBundle.open(bundle_path, hashlib.sha256(b"other").hexdigest()) is None
+
+    def test_missing_or_empty_file(self, tmp_path: Path) -> None:
+        """Missing and empty files should be ignored."""
+        empty = tmp_path / "empty.inkidx"
+        empty.write_bytes(b"")
+
+        assert IndexBundle.open(tmp_path / "missing.inkidx", KEY) is None
+        assert IndexBundle.open(empty, KEY) is None
+
+    def test_truncated_file(self, bundle_path: Path) -> None:
+        """A bundle cut short should be ignored."""
+        bundle_path.write_bytes(bundle_path.read_bytes()[:80])
+
+        assert IndexBundle.open(bundle_path, KEY) is None
+
+
+class TestTraverserIntegration:
+    """Tests for NetworkXGraphTraverser(indexes=...)."""
+
+    def test_projection_from_bundle(self, bundle_path: Path, design: Design) -> None:
+        """The traverser should use the bundled projection, not rebuild it."""
+        graph = NetworkXGraphBuilder().build_from_design(design)
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+        traverser = NetworkXGraphTraverser(graph, design, indexes=bundle)
+
+        assert traverser.projection is bundle.get(CellProjection)
+        assert [cell.name for cell in traverser.get_fanout_cells(CellId("A"))] == ["B"]
+        assert traverser.estimate_fanout_cone_size(CellId("F1")) == len(
+            traverser.get_fanout_cone(CellId("F1"))
+        )
+        bundle.close()
+
+    def test_delta_drops_bundled_projection(self, bundle_path: Path, design: Design) -> None:
+        """After a graph delta the projection should be rebuilt from the graph."""
+        builder = NetworkXGraphBuilder()
+        graph = builder.build_from_design(design)
+        bundle = IndexBundle.open(bundle_path, KEY)
+        assert bundle is not None
+        with bundle:
+            traverser = NetworkXGraphTraverser(graph, design, indexes=bundle)
+            restored = traverser.projection
+
+            design.remove_cell(CellId("C"))
+            builder.apply_delta(removed_cells=[CellId("C")])
+
+            assert traverser.projection is not restored
+            assert traverser.get_fanin_cells(CellId("F1")) == []
+
+    def test_patched_projection_is_not_serialized(self, design: Design) -> None:
+        """Projections with delta overlays must be rebuilt before saving."""
+        builder = NetworkXGraphBuilder()
+        builder.build_from_design(design)
+        projection = builder.get_cell_projection()
+        design.remove_cell(CellId("C"))
+        builder.apply_delta(removed_cells=[CellId("C")])
+
+        with pytest.raises(ValueError, match="patched"):
+            projection.to_bytes()
+
+
+class TestKeying:
+    """Tests for bundle keys and locations."""
+
+    def test_netlist_digest(self, tmp_path: Path) -> None:
+        """The key should be the SHA-256 of the file contents."""
+        netlist = tmp_path / "top.cdl"
+        netlist.write_bytes(b".SUBCKT top\n.ENDS\n")
+
+        assert netlist_digest(netlist) == hashlib.sha256(netlist.read_bytes()).hexdigest()
+
+    def test_default_bundle_path(self, tmp_path: Path) -> None:
+        """Bundles should live under the netlist's .ink folder."""
+        path = default_bundle_path(tmp_path / "top.cdl")
+
+        assert path == tmp_path / ".ink" / "indexes" / "top.cdl.inkidx"
@@ -0,0 +1,127 @@
+"""Unit tests for LevelIndex.
+
+Test Coverage Goals:
+- Logic levels restart at sequential cells and ports
+- Longest path wins on reconvergent logic
+- Combinational loops terminate; register loops don't shorten paths
+- Rank is a topological order of the feedback-free graph
+- Binary round trip
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Design
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph import LevelIndex
+
+if TYPE_CHECKING:
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def pipeline(make_netlist: NetlistFactory) -> Design:
+    """F1 -> A -> B -> F2 -> C, plus F1 -> B and F2 -> F1."""
+    return make_netlist(
+        [("F1", "A"), ("A", "B"), ("F1", "B"), ("B", "F2"), ("F2", "C"), ("F2", "F1")],
+        sequential=["F1", "F2"],
+    )
+
+
+def levels_of(index: LevelIndex, *names: str) -> list[int | None]:
+    """Look up the levels of several cells."""
+    return [index.level_of(CellId(name)) for name in names]
+
+
+class TestLevels:
+    """Tests for logic level assignment."""
+
+    def test_levels_restart_at_registers(self, pipeline: Design) -> None:
+        """Registers are level 0 and the first gate after them level 1."""
+        index = LevelIndex.from_design(pipeline)
+
+        assert levels_of(index, "F1", "A", "B", "F2", "C") == [0, 1, 2, 0, 1]
+        assert index.max_level() == 2
+
+    def test_port_driven_cells_are_level_one(self, make_netlist: NetlistFactory) -> None:
+        """Cells without cell drivers (port or undriven inputs) start at 1."""
+        index = LevelIndex.from_design(make_netlist([("A", "B")], cells=["LONE"]))
+
+        assert levels_of(index, "A", "B", "LONE") == [1, 2, 1]
+
+    def test_longest_path_wins(self, make_netlist: NetlistFactory) -> None:
+        """A reconvergent cell takes the deeper of its input paths."""
+        design = make_netlist([("A", "B"), ("B", "C"), ("C", "D"), ("A", "D")])
+
+        assert LevelIndex.from_design(design).level_of(CellId("D")) == 4
+
+    def test_register_cycle_keeps_full_depth(self, make_netlist: NetlistFactory) -> None:
+        """A cycle through a register must not break a combinational path."""
+        design = make_netlist([("B", "FF"), ("FF", "A"), ("A", "B")], sequential=["FF"])
+
+        assert levels_of(LevelIndex.from_design(design), "FF", "A", "B") == [0, 1, 2]
+
+    def test_combinational_loop_terminates(self, make_netlist: NetlistFactory) -> None:
+        """Loop cells get finite levels; one loop edge is broken."""
+        design = make_netlist([("IN", "X"), ("X", "Y"), ("Y", "X"), ("Y", "OUT")])
+        index = LevelIndex.from_design(design)
+
+        assert levels_of(index, "IN", "X", "Y", "OUT") == [1, 2, 3, 4]
+
+    def test_cells_at_level(self, pipeline: Design) -> None:
+        """get_cells_at_level should group cells by level."""
+        index = LevelIndex.from_design(pipeline)
+
+        assert sorted(index.get_cells_at_level(1)) == ["A", "C"]
+        assert index.level_of(CellId("missing")) is None
+
+    def test_empty_design(self) -> None:
+        """An empty design has no cells and max level 0."""
+        index = LevelIndex.from_design(Design(name="empty"))
+
+        assert index.cell_count() == 0
+        assert index.max_level() == 0
+
+
+class TestRank:
+    """Tests for the global topological rank."""
+
+    def test_rank_is_a_permutation(self, pipeline: Design) -> None:
+        """Every cell should get a distinct rank in 0..N-1."""
+        index = LevelIndex.from_design(pipeline)
+
+        assert sorted(index.rank) == list(range(index.cell_count()))
+
+    def test_acyclic_edges_point_forward(self, make_netlist: NetlistFactory) -> None:
+        """In a DAG every edge should go from lower to higher rank."""
+        wires = [("A", "B"), ("B", "C"), ("A", "C"), ("D", "B")]
+        index = LevelIndex.from_design(make_netlist(wires))
+
+        for driver, sink in wires:
+            driver_rank = index.rank_of(CellId(driver))
+            sink_rank = index.rank_of(CellId(sink))
+            assert driver_rank is not None
+            assert sink_rank is not None
+            assert driver_rank < sink_rank
+
+
+class TestPersistence:
+    """Tests for to_bytes()/from_bytes()."""
+
+    def test_round_trip(self, pipeline: Design) -> None:
+        """A restored index should be identical."""
+        index = LevelIndex.from_design(pipeline)
+
+        restored = LevelIndex.from_bytes(index.to_bytes())
+
+        assert restored.cell_ids == index.cell_ids
+        assert restored.levels == index.levels
+        assert restored.rank == index.rank
+
+    def test_bad_header(self) -> None:
+        """Foreign data should be rejected."""
+        with pytest.raises(ValueError, match="bad header"):
+            LevelIndex.from_bytes(b"\x00" * 32)
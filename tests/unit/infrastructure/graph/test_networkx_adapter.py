@@ -1051,3 +1051,81 @@ class TestComplexScenarios:
         pin_ids = [PinId("XFF1.D"), PinId("XFF1.CLK"), PinId("XFF1.Q")]
         for pin_id in pin_ids:
             assert graph.has_edge(cell_id, pin_id)
+
+
+# =============================================================================
+# Lean Build Mode
+# =============================================================================
+
+
+class TestLeanBuildMode:
+    """Tests for NetworkXGraphBuilder(lean=True)."""
+
+    @pytest.mark.parametrize(
+        "design_fixture",
+        ["simple_design", "fanout_design", "sequential_design", "inout_design",
+         "floating_pin_design"],
+    )
+    def test_same_nodes_and_edges_as_full_build(
+        self, design_fixture: str, request: pytest.FixtureRequest
+    ) -> None:
+        """Lean build should produce the same topology as the full build."""
+        design: Design = request.getfixturevalue(design_fixture)
+
+        full = NetworkXGraphBuilder().build_from_design(design)
+        lean = NetworkXGraphBuilder(lean=True).build_from_design(design)
+
+        assert set(lean.nodes) == set(full.nodes)
+        assert sorted(lean.edges(data="edge_type")) == sorted(full.edges(data="edge_type"))
+
+    def test_nodes_store_only_node_type(self, simple_design: Design) -> None:
+        """Lean nodes should carry node_type and nothing else."""
+        builder = NetworkXGraphBuilder(lean=True)
+        graph = builder.build_from_design(simple_design)
+
+        assert graph.nodes[CellId("XI1")] == {"node_type": "cell"}
+        assert graph.nodes[PinId("XI1.A")] == {"node_type": "pin"}
+        assert graph.nodes[NetId("net_in")] == {"node_type": "net"}
+        assert graph.nodes[PortId("IN")] == {"node_type": "port"}
+
+    def test_entity_lookup_goes_through_design(self, simple_design: Design) -> None:
+        """get_node_entity should resolve entities from the Design."""
+        builder = NetworkXGraphBuilder(lean=True)
+        builder.build_from_design(simple_design)
+
+        assert builder.get_node_entity(CellId("XI1")) is simple_design.get_cell(CellId("XI1"))
+        assert builder.get_node_entity(PinId("XI1.A")) is simple_design.get_pin(PinId("XI1.A"))
+        assert builder.get_node_entity(NetId("net_in")) is simple_design.get_net(NetId("net_in"))
+        assert builder.get_node_entity(PortId("IN")) is simple_design.get_port(PortId("IN"))
+        assert builder.get_node_type(CellId("XI1")) == "cell"
+
+    def test_statistics_match_full_build(self, fanout_design: Design) -> None:
+        """Statistics methods should work on lean graphs."""
+        full = NetworkXGraphBuilder()
+        full.build_from_design(fanout_design)
+        lean = NetworkXGraphBuilder(lean=True)
+        lean.build_from_design(fanout_design)
+
+        assert lean.node_count() == full.node_count()
+        assert lean.edge_count() == full.edge_count()
+        assert lean.cell_node_count() == full.cell_node_count()
+        assert lean.net_node_count() == full.net_node_count()
+
+    def test_traverser_works_on_lean_graph(self, fanout_design: Design) -> None:
+        """NetworkXGraphTraverser should give the same answers on lean graphs."""
+        from ink.infrastructure.graph import NetworkXGraphTraverser
+
+        graph = NetworkXGraphBuilder(lean=True).build_from_design(fanout_design)
+        traverser = NetworkXGraphTraverser(graph, fanout_design)
+
+        fanout = traverser.get_fanout_cells(CellId("XI1"), hops=1)
+
+        assert {cell.name for cell in fanout} == {"XI2", "XI3"}
+
+    def test_gc_state_restored(self, simple_design: Design) -> None:
+        """The lean build should re-enable garbage collection afterwards."""
+        import gc
+
+        NetworkXGraphBuilder(lean=True).build_from_design(simple_design)
+
+        assert gc.isenabled()
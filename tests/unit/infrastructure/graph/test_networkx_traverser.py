@@ -675,6 +675,15 @@ class TestGetFanoutCells:
 class TestGetFaninCells:
     """Tests for get_fanin_cells method."""
 
+    def test_fanin_excludes_sibling_loads(self, fanout_design: Design) -> None:
+        """Other loads on the same input net are not fanin."""
+        traverser = build_traverser(fanout_design)
+
+        # XI1 drives net_fanout -> XI2, XI3, XI4
+        fanin = traverser.get_fanin_cells(CellId("XI2"), hops=1)
+
+        assert {cell.name for cell in fanin} == {"XI1"}
+
     def test_single_hop_fanin(self, inverter_chain_design: Design) -> None:
         """Should return immediate fanin (1 hop)."""
         traverser = build_traverser(inverter_chain_design)
@@ -902,3 +911,146 @@ class TestEdgeCases:
 
         # Should return all reachable cells (2 cells in chain after XI1)
         assert len(fanout) == 2
+
+
+class TestCellProjectionIntegration:
+    """Tests for traversal over the cell projection."""
+
+    def test_projection_built_lazily_from_graph(
+        self, inverter_chain_design: Design
+    ) -> None:
+        """The projection should be derived from the graph on first use."""
+        traverser = build_traverser(inverter_chain_design)
+
+        projection = traverser.projection
+
+        assert projection.cell_count() == 3
+        assert traverser.projection is projection
+
+    def test_uses_injected_projection(self, inverter_chain_design: Design) -> None:
+        """A pre-built projection should be used as-is."""
+        from ink.infrastructure.graph import CellProjection, NetworkXGraphTraverser
+
+        graph = NetworkXGraphBuilder().build_from_design(inverter_chain_design)
+        projection = CellProjection.from_design(inverter_chain_design)
+
+        traverser = NetworkXGraphTraverser(graph, inverter_chain_design, projection)
+
+        assert traverser.projection is projection
+        assert [c.name for c in traverser.get_fanout_cells(CellId("XI1"))] == ["XI2"]
+
+    def test_lean_graph_traversal(self, inverter_chain_design: Design) -> None:
+        """Traversal should work on graphs built in lean mode."""
+        from ink.infrastructure.graph import NetworkXGraphTraverser
+
+        graph = NetworkXGraphBuilder(lean=True).build_from_design(inverter_chain_design)
+        traverser = NetworkXGraphTraverser(graph, inverter_chain_design)
+
+        fanin = traverser.get_fanin_cells(CellId("XI3"), hops=2)
+
+        assert {cell.name for cell in fanin} == {"XI1", "XI2"}
+
+
+@pytest.fixture
+def two_output_design() -> Design:
+    """Cell XA with two outputs feeding different loads.
+
+    Structure::
+
+        XD.Y -> n_in -> XA.I
+        XA.Y0 -> n0 -> XB.A ; XB.Y -> n_b -> XE.A
+        XA.Y1 -> n1 -> XC.A
+    """
+    design = Design(name="two_output")
+    pins = [
+        Pin(PinId("XD.Y"), "Y", PinDirection.OUTPUT, NetId("n_in")),
+        Pin(PinId("XA.I"), "I", PinDirection.INPUT, NetId("n_in")),
+        Pin(PinId("XA.Y0"), "Y0", PinDirection.OUTPUT, NetId("n0")),
+        Pin(PinId("XA.Y1"), "Y1", PinDirection.OUTPUT, NetId("n1")),
+        Pin(PinId("XB.A"), "A", PinDirection.INPUT, NetId("n0")),
+        Pin(PinId("XB.Y"), "Y", PinDirection.OUTPUT, NetId("n_b")),
+        Pin(PinId("XC.A"), "A", PinDirection.INPUT, NetId("n1")),
+        Pin(PinId("XE.A"), "A", PinDirection.INPUT, NetId("n_b")),
+    ]
+    for pin in pins:
+        design.add_pin(pin)
+    for name, pin_names in [
+        ("XD", ["Y"]),
+        ("XA", ["I", "Y0", "Y1"]),
+        ("XB", ["A", "Y"]),
+        ("XC", ["A"]),
+        ("XE", ["A"]),
+    ]:
+        design.add_cell(Cell(CellId(name), name, "X", [PinId(f"{name}.{p}") for p in pin_names]))
+    for net, members in [
+        ("n_in", ["XD.Y", "XA.I"]),
+        ("n0", ["XA.Y0", "XB.A"]),
+        ("n1", ["XA.Y1", "XC.A"]),
+        ("n_b", ["XB.Y", "XE.A"]),
+    ]:
+        design.add_net(Net(NetId(net), net, [PinId(p) for p in members]))
+    return design
+
+
+class TestPinLevelTraversal:
+    """Tests for pin-precise traversal over the packed pin table."""
+
+    def test_fanout_from_pin_follows_only_its_net(self, two_output_design: Design) -> None:
+        """Fanout from one output should not include the other output's loads."""
+        traverser = build_traverser(two_output_design)
+
+        fanout = traverser.get_fanout_from_pin(PinId("XA.Y0"), hops=1)
+
+        assert [cell.name for cell in fanout] == ["XB"]
+
+    def test_fanout_from_pin_continues_by_cell(self, two_output_design: Design) -> None:
+        """Hops after the first should continue cell by cell."""
+        traverser = build_traverser(two_output_design)
+
+        fanout = traverser.get_fanout_from_pin(PinId("XA.Y0"), hops=2)
+
+        assert {cell.name for cell in fanout} == {"XB", "XE"}
+
+    def test_fanout_from_input_pin_uses_owner(self, two_output_design: Design) -> None:
+        """An input pin's fanout is the owning cell's fanout."""
+        traverser = build_traverser(two_output_design)
+
+        fanout = traverser.get_fanout_from_pin(PinId("XA.I"), hops=1)
+
+        assert {cell.name for cell in fanout} == {"XB", "XC"}
+
+    def test_fanin_to_pin_follows_only_its_net(self, two_output_design: Design) -> None:
+        """Fanin to an input pin should only reach drivers of its net."""
+        traverser = build_traverser(two_output_design)
+
+        assert [c.name for c in traverser.get_fanin_to_pin(PinId("XE.A"), hops=1)] == ["XB"]
+        fanin = traverser.get_fanin_to_pin(PinId("XE.A"), hops=3)
+        assert {cell.name for cell in fanin} == {"XB", "XA", "XD"}
+
+    def test_no_design_lookups_until_results(
+        self, two_output_design: Design, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Pin traversal should only touch the Design to materialize cells."""
+        traverser = build_traverser(two_output_design)
+        traverser.pin_table  # noqa: B018 - build indexes before patching
+
+        def fail(*_: object) -> None:
+            raise AssertionError("unexpected Design lookup")
+
+        monkeypatch.setattr(two_output_design, "get_pin", fail)
+        monkeypatch.setattr(two_output_design, "get_net", fail)
+
+        fanout = traverser.get_fanout_from_pin(PinId("XA.Y1"), hops=2)
+
+        assert [cell.name for cell in fanout] == ["XC"]
+
+    def test_lean_graph_pin_traversal(self, two_output_design: Design) -> None:
+        """Pin directions should be read from edges on lean graphs."""
+        from ink.infrastructure.graph import NetworkXGraphTraverser
+
+        graph = NetworkXGraphBuilder(lean=True).build_from_design(two_output_design)
+        traverser = NetworkXGraphTraverser(graph, two_output_design)
+
+        fanout = traverser.get_fanout_from_pin(PinId("XA.Y1"), hops=1)
+
+        assert [cell.name for cell in fanout] == ["XC"]
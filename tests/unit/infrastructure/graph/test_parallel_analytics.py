@@ -0,0 +1,127 @@
+"""Unit tests for shared-memory parallel analytics.
+
+Test Coverage Goals:
+- Cone-size kernels match NetworkXGraphTraverser cones
+- Serial and multi-process runs return identical, seed-ordered results
+- SharedCsr round-trips the adjacency arrays through shared memory
+- Empty seed lists and empty designs
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Design
+from ink.infrastructure.graph import (
+    CellAdjacency,
+    CsrView,
+    NetworkXGraphBuilder,
+    NetworkXGraphTraverser,
+    ParallelAnalyticsRunner,
+    SharedCsr,
+    fanin_cone_sizes,
+    fanout_cone_sizes,
+)
+
+if TYPE_CHECKING:
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def pipeline(make_netlist: NetlistFactory) -> Design:
+    """F1 -> A -> B -> F2 -> C, plus A -> D and a B <-> E loop."""
+    return make_netlist(
+        [("F1", "A"), ("A", "B"), ("B", "F2"), ("F2", "C"), ("A", "D"), ("B", "E"), ("E", "B")],
+        sequential=["F1", "F2"],
+    )
+
+
+class TestConeSizeKernels:
+    """Tests for fanout_cone_sizes/fanin_cone_sizes."""
+
+    def test_match_traverser_cones(self, pipeline: Design) -> None:
+        """Kernel sizes should equal the traverser's cone lengths."""
+        adjacency = CellAdjacency.from_design(pipeline)
+        traverser = NetworkXGraphTraverser(
+            NetworkXGraphBuilder().build_from_design(pipeline), pipeline
+        )
+        seeds = list(range(adjacency.cell_count()))
+        view = CsrView.of(adjacency)
+
+        fanout = fanout_cone_sizes(view, seeds)
+        fanin = fanin_cone_sizes(view, seeds)
+
+        for seed in seeds:
+            cell_id = adjacency.cell_ids[seed]
+            assert fanout[seed] == len(traverser.get_fanout_cone(cell_id))
+            assert fanin[seed] == len(traverser.get_fanin_cone(cell_id))
+
+    def test_repeated_seeds(self, pipeline: Design) -> None:
+        """A seed listed twice should get the same size both times."""
+        adjacency = CellAdjacency.from_design(pipeline)
+        f1 = adjacency.index_of(pipeline.get_all_cells()[0].id)
+        assert f1 is not None
+
+        sizes = fanout_cone_sizes(CsrView.of(adjacency), [f1, f1])
+
+        assert sizes[0] == sizes[1]
+
+
+class TestParallelAnalyticsRunner:
+    """Tests for serial/parallel parity of the runner."""
+
+    def test_parallel_matches_serial(self, make_netlist: NetlistFactory) -> None:
+        """Two workers should return the serial results in seed order."""
+        wires = [(f"C{i}", f"C{i + 1}") for i in range(60)]
+        wires += [(f"C{i}", f"S{i}") for i in range(0, 60, 3)]
+        design = make_netlist(wires, sequential=[f"C{i}" for i in range(0, 60, 10)])
+        adjacency = CellAdjacency.from_design(design)
+        seeds = list(reversed(range(adjacency.cell_count())))
+
+        serial = ParallelAnalyticsRunner(adjacency, max_workers=1)
+        parallel = ParallelAnalyticsRunner(adjacency, max_workers=2)
+
+        assert parallel.run(fanout_cone_sizes, seeds) == serial.run(fanout_cone_sizes, seeds)
+        assert parallel.run(fanin_cone_sizes, seeds) == serial.run(fanin_cone_sizes, seeds)
+
+    def test_empty_seeds(self, pipeline: Design) -> None:
+        """No seeds should produce no results (and no pool)."""
+        runner = ParallelAnalyticsRunner(CellAdjacency.from_design(pipeline), max_workers=4)
+
+        assert runner.run(fanout_cone_sizes, []) == []
+
+    def test_default_worker_count(self, pipeline: Design) -> None:
+        """max_workers should default to at least one worker."""
+        assert ParallelAnalyticsRunner(CellAdjacency.from_design(pipeline)).max_workers >= 1
+
+
+class TestSharedCsr:
+    """Tests for the shared memory copy of an adjacency."""
+
+    def test_round_trip(self, pipeline: Design) -> None:
+        """An attached view should expose the original arrays."""
+        adjacency = CellAdjacency.from_design(pipeline)
+
+        with SharedCsr(adjacency) as shared:
+            block, view = shared.layout.attach()
+            try:
+                assert view.cell_count() == adjacency.cell_count()
+                assert list(view.fanout_offsets) == list(adjacency.fanout_offsets)
+                assert list(view.fanout_targets) == list(adjacency.fanout_targets)
+                assert list(view.fanin_offsets) == list(adjacency.fanin_offsets)
+                assert list(view.fanin_targets) == list(adjacency.fanin_targets)
+                assert bytes(view.sequential) == bytes(adjacency.sequential)
+            finally:
+                # Views must be released before the block can be closed
+                del view
+                block.close()
+
+    def test_empty_design(self) -> None:
+        """An empty design should still get a (1-byte) block."""
+        adjacency = CellAdjacency.from_design(Design(name="empty"))
+
+        with SharedCsr(adjacency) as shared:
+            assert shared.layout.cell_count == 0
+            assert shared.layout.edge_count == 0
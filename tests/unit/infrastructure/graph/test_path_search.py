@@ -0,0 +1,226 @@
+"""Unit tests for PathSearch and the traverser's multi-path queries.
+
+Test Coverage Goals:
+- Yen's k-shortest paths: order, distinctness, hop limit, path count
+- Simple path enumeration: completeness, loop-freedom, hop pruning
+- Sequential boundaries
+- Visit budget truncates instead of hanging on reconvergent logic
+- Traverser wrappers resolve cells and handle unknown endpoints
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph import (
+    CellProjection,
+    NetworkXGraphBuilder,
+    NetworkXGraphTraverser,
+    PathLimits,
+    PathSearch,
+)
+
+if TYPE_CHECKING:
+    from ink.domain.model import Design
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def diamond(make_netlist: NetlistFactory) -> Design:
+    """S fans out to A, B, C; A and B reach T directly, C via D; plus T -> S."""
+    return make_netlist(
+        [
+            ("S", "A"),
+            ("S", "B"),
+            ("S", "C"),
+            ("A", "T"),
+            ("B", "T"),
+            ("C", "D"),
+            ("D", "T"),
+            ("A", "B"),
+            ("T", "S"),
+        ]
+    )
+
+
+def names(projection: CellProjection, path: list[int]) -> list[str]:
+    """Resolve an index path to cell names."""
+    return [projection.cell_ids[i] for i in path]
+
+
+def search_for(design: Design, limits: PathLimits | None = None) -> PathSearch:
+    """Build a PathSearch over a design's projection."""
+    return PathSearch(CellProjection.from_design(design), limits)
+
+
+def endpoints(search: PathSearch, source: str, target: str) -> tuple[int, int]:
+    """Look up the projection indices of two cells."""
+    s = search.projection.index_of(CellId(source))
+    t = search.projection.index_of(CellId(target))
+    assert s is not None
+    assert t is not None
+    return s, t
+
+
+class TestKShortestPaths:
+    """Tests for Yen's k-shortest paths."""
+
+    def test_paths_in_length_order(self, diamond: Design) -> None:
+        """All four S -> T paths should come out shortest first."""
+        search = search_for(diamond)
+        paths = [
+            names(search.projection, p)
+            for p in search.k_shortest_paths(*endpoints(search, "S", "T"))
+        ]
+
+        assert paths[:2] == [["S", "A", "T"], ["S", "B", "T"]]
+        assert sorted(paths[2:]) == [["S", "A", "B", "T"], ["S", "C", "D", "T"]]
+        assert [len(p) for p in paths] == sorted(len(p) for p in paths)
+
+    def test_respects_max_paths(self, diamond: Design) -> None:
+        """No more than max_paths paths should be yielded."""
+        search = search_for(diamond, PathLimits(max_paths=2))
+
+        assert len(list(search.k_shortest_paths(*endpoints(search, "S", "T")))) == 2
+
+    def test_respects_max_hops(self, diamond: Design) -> None:
+        """Paths longer than max_hops edges should be excluded."""
+        search = search_for(diamond, PathLimits(max_hops=2))
+
+        paths = list(search.k_shortest_paths(*endpoints(search, "S", "T")))
+
+        assert len(paths) == 2
+        assert all(len(path) <= 3 for path in paths)
+
+    def test_follows_signal_direction(self, diamond: Design) -> None:
+        """A path against signal flow should not exist."""
+        search = search_for(diamond, PathLimits(max_hops=1))
+
+        assert list(search.k_shortest_paths(*endpoints(search, "A", "S"))) == []
+
+    def test_stream_is_lazy(self, diamond: Design) -> None:
+        """Taking the first path should not run the whole search."""
+        search = search_for(diamond)
+        stream = search.k_shortest_paths(*endpoints(search, "S", "T"))
+
+        next(stream)
+        after_first = search.visited
+        list(stream)
+
+        assert search.visited > after_first
+
+
+class TestSimplePaths:
+    """Tests for bounded simple path enumeration."""
+
+    def test_enumerates_all_loop_free_paths(self, diamond: Design) -> None:
+        """Every loop-free S -> T path should be found once."""
+        search = search_for(diamond)
+        paths = [
+            names(search.projection, p) for p in search.simple_paths(*endpoints(search, "S", "T"))
+        ]
+
+        assert sorted(paths) == [
+            ["S", "A", "B", "T"],
+            ["S", "A", "T"],
+            ["S", "B", "T"],
+            ["S", "C", "D", "T"],
+        ]
+
+    def test_hop_limit(self, diamond: Design) -> None:
+        """Paths longer than max_hops edges should be pruned."""
+        search = search_for(diamond, PathLimits(max_hops=2))
+
+        assert len(list(search.simple_paths(*endpoints(search, "S", "T")))) == 2
+
+    def test_same_cell(self, diamond: Design) -> None:
+        """A cell should have the trivial path to itself."""
+        search = search_for(diamond)
+        s, _ = endpoints(search, "S", "T")
+
+        assert list(search.simple_paths(s, s)) == [[s]]
+
+    def test_sequential_cells_end_but_do_not_carry_paths(
+        self, make_netlist: NetlistFactory
+    ) -> None:
+        """With stop_at_sequential, paths may not pass through registers."""
+        design = make_netlist([("A", "FF"), ("FF", "B"), ("A", "C"), ("C", "B")], ["FF"])
+        projection = CellProjection.from_design(design)
+        search = PathSearch(projection, stop_at_sequential=True)
+        a = projection.index_of(CellId("A"))
+        b = projection.index_of(CellId("B"))
+        ff = projection.index_of(CellId("FF"))
+        assert a is not None
+        assert b is not None
+        assert ff is not None
+
+        assert [names(projection, p) for p in search.simple_paths(a, b)] == [["A", "C", "B"]]
+        assert [names(projection, p) for p in search.simple_paths(a, ff)] == [["A", "FF"]]
+
+
+class TestLimits:
+    """Tests for the visit budget on reconvergent logic."""
+
+    @pytest.fixture
+    def ladder(self, make_netlist: NetlistFactory) -> Design:
+        """30 stages of two parallel cells: 2**30 distinct paths."""
+        wires: list[tuple[str, str]] = []
+        for stage in range(30):
+            for side in "XY":
+                wires += [(f"J{stage}", f"{side}{stage}"), (f"{side}{stage}", f"J{stage + 1}")]
+        return make_netlist(wires)
+
+    def test_simple_paths_stop_at_max_paths(self, ladder: Design) -> None:
+        """Enumeration should end after max_paths paths."""
+        search = search_for(ladder, PathLimits(max_paths=50, max_hops=60))
+
+        assert len(list(search.simple_paths(*endpoints(search, "J0", "J30")))) == 50
+        assert not search.truncated
+
+    def test_visit_budget_truncates(self, ladder: Design) -> None:
+        """Exhausting max_visited should end the stream and set truncated."""
+        search = search_for(ladder, PathLimits(max_paths=10_000, max_hops=60, max_visited=500))
+
+        paths = list(search.simple_paths(*endpoints(search, "J0", "J30")))
+
+        assert search.truncated
+        assert search.visited <= 501
+        assert len(paths) < 10_000
+
+    def test_k_shortest_visit_budget(self, ladder: Design) -> None:
+        """Yen's algorithm should honor the visit budget too."""
+        search = search_for(ladder, PathLimits(max_paths=1000, max_hops=60, max_visited=2000))
+
+        list(search.k_shortest_paths(*endpoints(search, "J0", "J30")))
+
+        assert search.truncated
+
+
+class TestTraverserPathQueries:
+    """Tests for NetworkXGraphTraverser.iter_*_paths."""
+
+    def test_k_shortest_returns_cells(self, diamond: Design) -> None:
+        """Paths should be resolved to Cell entities."""
+        graph = NetworkXGraphBuilder().build_from_design(diamond)
+        traverser = NetworkXGraphTraverser(graph, diamond)
+
+        paths = traverser.iter_k_shortest_paths(CellId("S"), CellId("T"), PathLimits(max_paths=1))
+
+        assert [[cell.name for cell in path] for path in paths] == [["S", "A", "T"]]
+
+    def test_simple_paths_count(self, diamond: Design) -> None:
+        """The traverser should stream all simple paths."""
+        graph = NetworkXGraphBuilder().build_from_design(diamond)
+        traverser = NetworkXGraphTraverser(graph, diamond)
+
+        assert len(list(traverser.iter_simple_paths(CellId("S"), CellId("T")))) == 4
+
+    def test_unknown_cell_has_no_paths(self, diamond: Design) -> None:
+        """Unknown endpoints should produce an empty stream."""
+        graph = NetworkXGraphBuilder().build_from_design(diamond)
+        traverser = NetworkXGraphTraverser(graph, diamond)
+
+        assert list(traverser.iter_simple_paths(CellId("S"), CellId("missing"))) == []
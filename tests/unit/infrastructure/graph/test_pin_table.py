@@ -0,0 +1,87 @@
+"""Unit tests for PinTable.
+
+Test Coverage Goals:
+- Direction flags read from 'drives' edges (INPUT, OUTPUT, INOUT, floating)
+- Pin → net and pin → owner arrays
+- Per-net driver and sink cell rows
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ink.domain.model import Cell, Design, Net, Pin
+from ink.domain.value_objects.identifiers import CellId, NetId, PinId
+from ink.domain.value_objects.pin_direction import PinDirection
+from ink.infrastructure.graph import CellProjection, NetworkXGraphBuilder, PinTable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def build_table(design: Design) -> tuple[PinTable, CellProjection]:
+    """Build a graph, projection and pin table for a design."""
+    graph = NetworkXGraphBuilder().build_from_design(design)
+    projection = CellProjection.from_graph(graph, design)
+    return PinTable.from_graph(graph, projection), projection
+
+
+def bus_design() -> Design:
+    """Cells A (out Y, floating F) and B (inout IO) on net n, C (in) on n."""
+    design = Design(name="bus")
+    design.add_pin(Pin(PinId("A.Y"), "Y", PinDirection.OUTPUT, NetId("n")))
+    design.add_pin(Pin(PinId("A.F"), "F", PinDirection.INPUT, None))
+    design.add_pin(Pin(PinId("B.IO"), "IO", PinDirection.INOUT, NetId("n")))
+    design.add_pin(Pin(PinId("C.A"), "A", PinDirection.INPUT, NetId("n")))
+    design.add_cell(Cell(CellId("A"), "A", "X", [PinId("A.Y"), PinId("A.F")]))
+    design.add_cell(Cell(CellId("B"), "B", "X", [PinId("B.IO")]))
+    design.add_cell(Cell(CellId("C"), "C", "X", [PinId("C.A")]))
+    design.add_net(Net(NetId("n"), "n", [PinId("A.Y"), PinId("B.IO"), PinId("C.A")]))
+    return design
+
+
+class TestPinTable:
+    """Tests for PinTable.from_graph()."""
+
+    def test_direction_flags(self) -> None:
+        """Flags should reflect edge direction; floating pins have none."""
+        table, _ = build_table(bus_design())
+
+        def flags(pin: str) -> tuple[bool, bool]:
+            index = table.index_of(PinId(pin))
+            assert index is not None
+            return table.drives(index), table.receives(index)
+
+        assert flags("A.Y") == (True, False)
+        assert flags("C.A") == (False, True)
+        assert flags("B.IO") == (True, True)
+        assert flags("A.F") == (False, False)
+
+    def test_pin_net_and_owner(self) -> None:
+        """Pins should map to their net ordinal and owning cell index."""
+        table, projection = build_table(bus_design())
+
+        y = table.index_of(PinId("A.Y"))
+        floating = table.index_of(PinId("A.F"))
+        assert y is not None
+        assert floating is not None
+        assert table.net_ids[table.pin_net[y]] == "n"
+        assert table.pin_net[floating] == -1
+        assert table.pin_owner[y] == projection.index_of(CellId("A"))
+        assert table.pin_count() == 4
+
+    def test_net_rows(self) -> None:
+        """Nets should list distinct driver and sink cells."""
+        table, projection = build_table(bus_design())
+
+        def names(indices: Iterable[int]) -> set[str]:
+            return {projection.cell_ids[i] for i in indices}
+
+        assert names(table.driver_cells(0)) == {"A", "B"}
+        assert names(table.sink_cells(0)) == {"B", "C"}
+
+    def test_unknown_pin(self) -> None:
+        """index_of should return None for unknown pins."""
+        table, _ = build_table(bus_design())
+
+        assert table.index_of(PinId("missing")) is None
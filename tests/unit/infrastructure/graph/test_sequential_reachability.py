@@ -0,0 +1,154 @@
+"""Unit tests for SequentialReachabilityIndex.
+
+Test Coverage Goals:
+- Register-to-register pairs through combinational logic
+- Sequential cells as hard boundaries (no pass-through)
+- Self-reachability through feedback logic
+- Combinational cycles between registers terminate
+- Parallel (process pool) build matches in-process build
+- Binary round trip via to_bytes()/from_bytes()
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ink.domain.model import Design
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph import CellAdjacency, SequentialReachabilityIndex
+
+if TYPE_CHECKING:
+    from tests.unit.infrastructure.graph.conftest import NetlistFactory
+
+
+@pytest.fixture
+def pipeline(make_netlist: NetlistFactory) -> Design:
+    r"""Two-stage pipeline with reconvergence.
+
+    Structure::
+
+        F1 -> G1 -> G2 -> F2 -> G3 -> F3
+               \______________/
+        F1 also feeds F3 through G4: F1 -> G4 -> F3
+    """
+    return make_netlist(
+        [
+            ("F1", "G1"),
+            ("G1", "G2"),
+            ("G2", "F2"),
+            ("F2", "G3"),
+            ("G3", "F3"),
+            ("F1", "G4"),
+            ("G4", "F3"),
+        ],
+        sequential=["F1", "F2", "F3"],
+    )
+
+
+def ids(values: list[CellId]) -> set[str]:
+    """Convert a CellId list to a set of plain strings."""
+    return {str(value) for value in values}
+
+
+class TestReachability:
+    """Tests for reachability queries."""
+
+    def test_fanout_sequential_cells(self, pipeline: Design) -> None:
+        """Should return registers reachable through logic."""
+        index = SequentialReachabilityIndex.from_design(pipeline, max_workers=1)
+
+        assert ids(index.get_fanout_sequential_cells(CellId("F1"))) == {"F2", "F3"}
+        assert ids(index.get_fanout_sequential_cells(CellId("F2"))) == {"F3"}
+        assert index.get_fanout_sequential_cells(CellId("F3")) == []
+
+    def test_fanin_sequential_cells(self, pipeline: Design) -> None:
+        """Should return registers that feed a register."""
+        index = SequentialReachabilityIndex.from_design(pipeline, max_workers=1)
+
+        assert ids(index.get_fanin_sequential_cells(CellId("F3"))) == {"F1", "F2"}
+        assert ids(index.get_fanin_sequential_cells(CellId("F2"))) == {"F1"}
+        assert index.get_fanin_sequential_cells(CellId("F1")) == []
+
+    def test_does_not_pass_through_registers(self, pipeline: Design) -> None:
+        """F1 reaches F3 only via G4; the F2 path must not count twice."""
+        index = SequentialReachabilityIndex.from_design(pipeline, max_workers=1)
+
+        assert index.pair_count() == 3
+
+    def test_non_sequential_cell_returns_empty(self, pipeline: Design) -> None:
+        """Non-sequential and unknown cells should return empty lists."""
+        index = SequentialReachabilityIndex.from_design(pipeline, max_workers=1)
+
+        assert index.get_fanout_sequential_cells(CellId("G1")) == []
+        assert index.get_fanin_sequential_cells(CellId("missing")) == []
+
+    def test_self_feedback(self, make_netlist: NetlistFactory) -> None:
+        """A toggle flop (Q -> INV -> D) feeds itself."""
+        design = make_netlist([("F", "INV"), ("INV", "F")], sequential=["F"])
+
+        index = SequentialReachabilityIndex.from_design(design, max_workers=1)
+
+        assert ids(index.get_fanout_sequential_cells(CellId("F"))) == {"F"}
+
+    def test_combinational_loop_terminates(self, make_netlist: NetlistFactory) -> None:
+        """A combinational loop between registers should not hang."""
+        design = make_netlist(
+            [("F1", "A"), ("A", "B"), ("B", "A"), ("B", "F2")],
+            sequential=["F1", "F2"],
+        )
+
+        index = SequentialReachabilityIndex.from_design(design, max_workers=1)
+
+        assert ids(index.get_fanout_sequential_cells(CellId("F1"))) == {"F2"}
+
+    def test_sequential_count(self, pipeline: Design) -> None:
+        """Should index every sequential cell."""
+        index = SequentialReachabilityIndex.from_design(pipeline)
+
+        assert index.sequential_count() == 3
+
+
+class TestParallelBuild:
+    """Tests for the process-pool build path."""
+
+    def test_parallel_matches_serial(self, make_netlist: NetlistFactory) -> None:
+        """Process-pool build should match the in-process build."""
+        wires = [(f"F{i}", f"G{i}") for i in range(20)]
+        wires += [(f"G{i}", f"F{(i + 1) % 20}") for i in range(20)]
+        design = make_netlist(wires, sequential=[f"F{i}" for i in range(20)])
+        adjacency = CellAdjacency.from_design(design)
+
+        serial = SequentialReachabilityIndex.build(adjacency, max_workers=1)
+        parallel = SequentialReachabilityIndex.build(adjacency, max_workers=2)
+
+        assert parallel.sequential_ids == serial.sequential_ids
+        assert list(parallel.forward_offsets) == list(serial.forward_offsets)
+        assert list(parallel.forward_targets) == list(serial.forward_targets)
+
+
+class TestSerialization:
+    """Tests for to_bytes()/from_bytes()."""
+
+    def test_round_trip(self, pipeline: Design) -> None:
+        """from_bytes(to_bytes()) should restore the same index."""
+        index = SequentialReachabilityIndex.from_design(pipeline, max_workers=1)
+
+        restored = SequentialReachabilityIndex.from_bytes(index.to_bytes())
+
+        assert restored.sequential_ids == index.sequential_ids
+        assert ids(restored.get_fanin_sequential_cells(CellId("F3"))) == {"F1", "F2"}
+
+    def test_round_trip_empty(self) -> None:
+        """An empty index should round-trip."""
+        index = SequentialReachabilityIndex.from_design(Design(name="empty"))
+
+        restored = SequentialReachabilityIndex.from_bytes(index.to_bytes())
+
+        assert restored.sequential_count() == 0
+
+    def test_rejects_bad_header(self) -> None:
+        """from_bytes should reject data without the index header."""
+        with pytest.raises(ValueError, match="bad header"):
+            SequentialReachabilityIndex.from_bytes(b"X" * 64)
@@ -18,6 +18,8 @@ See Also:
     - TopologyBasedLatchIdentifier implementation
 """
 
+import sys
+
 import pytest
 
 from ink.domain.services.latch_identifier import (
@@ -697,6 +699,34 @@ class TestEdgeCases:
         assert result.is_sequential is True
         assert result.strategy == DetectionStrategy.FEEDBACK_LOOP
 
+    def test_deep_chain_does_not_hit_recursion_limit(self) -> None:
+        """Chains deeper than the recursion limit are handled iteratively."""
+        identifier = TopologyBasedLatchIdentifier()
+        depth = sys.getrecursionlimit() * 2
+        chain = [(f"n{i}", f"n{i + 1}") for i in range(depth)]
+
+        identifier.register_subcircuit_topology("DEEP_CHAIN", chain)
+        identifier.register_subcircuit_topology("DEEP_LOOP", [*chain, (f"n{depth}", "n0")])
+
+        assert identifier.detect_with_reason("DEEP_CHAIN").strategy != (
+            DetectionStrategy.FEEDBACK_LOOP
+        )
+        assert identifier.detect_with_reason("DEEP_LOOP").strategy == (
+            DetectionStrategy.FEEDBACK_LOOP
+        )
+
+    def test_reconvergent_paths_are_not_feedback(self) -> None:
+        """A diamond (two paths to one node) is not a cycle."""
+        identifier = TopologyBasedLatchIdentifier()
+
+        identifier.register_subcircuit_topology(
+            "DIAMOND",
+            [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")],
+        )
+
+        result = identifier.detect_with_reason("DIAMOND")
+        assert result.strategy != DetectionStrategy.FEEDBACK_LOOP
+
 
 # =============================================================================
 # PERFORMANCE (Benchmark tests - run with pytest-benchmark)
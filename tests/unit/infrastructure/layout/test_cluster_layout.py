@@ -0,0 +1,175 @@
+"""Unit tests for clustered layout (super-nodes with lazy interiors).
+
+Test Coverage Goals:
+- Hierarchy clustering splits oversized instances one level at a time
+- Component clustering puts each weakly connected component in one cluster
+- Clusters are placed without overlap, following signal flow
+- Interiors are laid out once, on demand, inside their (resized) box
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import networkx as nx
+import pytest
+
+from ink.infrastructure.layout import (
+    CancellationToken,
+    ClusteredLayout,
+    LayoutCancelledError,
+    cluster_by_component,
+    cluster_by_hierarchy,
+)
+
+if TYPE_CHECKING:
+    from ink.infrastructure.layout import ClusterBox
+
+
+def hierarchical_graph() -> nx.DiGraph:  # type: ignore[no-any-unimported]
+    """Two blocks of four-cell chains, the first feeding the second."""
+    g = nx.DiGraph()
+    for block in ("XA", "XB"):
+        cells = [f"{block}/XI{i}" for i in range(4)]
+        nx.add_path(g, cells)
+    g.add_edge("XA/XI3", "XB/XI0")
+    return g
+
+
+def overlaps(a: ClusterBox, b: ClusterBox) -> bool:
+    """Check whether two cluster frames intersect."""
+    return (
+        a.position.x < b.position.x + b.width
+        and b.position.x < a.position.x + a.width
+        and a.position.y < b.position.y + b.height
+        and b.position.y < a.position.y + a.height
+    )
+
+
+class TestClusterByHierarchy:
+    """Tests for clustering by instance path prefix."""
+
+    def test_small_design_is_one_cluster(self) -> None:
+        """A design within the bound should stay a single top-level cluster."""
+        clusters = cluster_by_hierarchy(["XA/XI1", "XB/XI2", "XI3"], max_cells=3)
+
+        assert clusters == {"": ["XA/XI1", "XB/XI2", "XI3"]}
+
+    def test_splits_oversized_levels_only(self) -> None:
+        """Only instances over the bound should be split further."""
+        nodes = ["XI0", "XA/XI1", "XA/XS/XI2", "XA/XS/XI3", "XA/XT/XI4", "XB/XI5"]
+
+        clusters = cluster_by_hierarchy(nodes, max_cells=2)
+
+        assert clusters == {
+            "": ["XI0"],
+            "XA": ["XA/XI1"],
+            "XA/XS": ["XA/XS/XI2", "XA/XS/XI3"],
+            "XA/XT": ["XA/XT/XI4"],
+            "XB": ["XB/XI5"],
+        }
+
+    def test_flat_instance_stays_oversized(self) -> None:
+        """Cells without a deeper path cannot be split and should stay together."""
+        nodes = [f"XA/XI{i}" for i in range(5)]
+
+        assert cluster_by_hierarchy(nodes, max_cells=2) == {"XA": nodes}
+
+    def test_custom_separator(self) -> None:
+        """The separator should be configurable."""
+        clusters = cluster_by_hierarchy(["XA.XI1", "XB.XI2"], separator=".", max_cells=1)
+
+        assert set(clusters) == {"XA", "XB"}
+
+
+class TestClusterByComponent:
+    """Tests for clustering by weakly connected component."""
+
+    def test_components_largest_first(self) -> None:
+        """Each component should be one cluster, numbered by size."""
+        g = nx.DiGraph([("A", "B"), ("C", "B"), ("D", "E")])
+        g.add_node("F")
+
+        clusters = cluster_by_component(g)
+
+        assert [sorted(members, key=str) for members in clusters.values()] == [
+            ["A", "B", "C"],
+            ["D", "E"],
+            ["F"],
+        ]
+        assert list(clusters) == ["component-0", "component-1", "component-2"]
+
+
+class TestClusteredLayout:
+    """Tests for super-node placement and lazy interiors."""
+
+    def test_super_graph_joins_connected_clusters(self) -> None:
+        """The quotient graph should have one edge per connected cluster pair."""
+        g = hierarchical_graph()
+        layout = ClusteredLayout(g, cluster_by_hierarchy(g.nodes(), max_cells=4))
+
+        assert set(layout.super_graph.edges()) == {("XA", "XB")}
+        assert layout.cluster_of("XB/XI2") == "XB"
+        assert layout.members("XA") == [f"XA/XI{i}" for i in range(4)]
+
+    def test_boxes_follow_signal_flow_without_overlap(self) -> None:
+        """A driving cluster should sit left of its load, frames apart."""
+        g = hierarchical_graph()
+        g.add_edges_from([("XA/XI0", "XC/XI0")])
+        layout = ClusteredLayout(g, cluster_by_hierarchy(g.nodes(), max_cells=4))
+        boxes = layout.boxes
+
+        assert boxes["XA"].position.x + boxes["XA"].width < boxes["XB"].position.x
+        assert not overlaps(boxes["XB"], boxes["XC"])
+        assert boxes["XA"].cell_count == 4
+
+    def test_interior_is_lazy_and_cached(self) -> None:
+        """Interiors should be computed on first request only."""
+        g = hierarchical_graph()
+        layout = ClusteredLayout(g, cluster_by_hierarchy(g.nodes(), max_cells=4))
+
+        assert not layout.is_laid_out("XA")
+        first = layout.interior("XA")
+        second = layout.interior("XA")
+
+        assert layout.is_laid_out("XA")
+        assert not layout.is_laid_out("XB")
+        assert first == second
+        assert set(first.positions) == set(layout.members("XA"))
+
+    def test_interior_fits_resized_box(self) -> None:
+        """After layout, the box should wrap the interior and not overlap others."""
+        g = hierarchical_graph()
+        layout = ClusteredLayout(g, cluster_by_hierarchy(g.nodes(), max_cells=4))
+
+        interior = layout.interior("XA")
+        box = layout.boxes["XA"]
+
+        assert box.width == pytest.approx(interior.width + 2 * layout.padding)
+        assert box.height == pytest.approx(interior.height + 2 * layout.padding)
+        for point in interior.positions.values():
+            assert box.position.x + layout.padding <= point.x
+            assert box.position.y + layout.padding <= point.y
+        assert not overlaps(box, layout.boxes["XB"])
+
+    def test_node_outside_clusters_rejected(self) -> None:
+        """Every node should belong to exactly one cluster."""
+        g = hierarchical_graph()
+
+        with pytest.raises(ValueError, match="not in any cluster"):
+            ClusteredLayout(g, {"XA": [f"XA/XI{i}" for i in range(4)]})
+        with pytest.raises(ValueError, match="more than one"):
+            ClusteredLayout(g, {"all": list(g.nodes()), "XA": ["XA/XI0"]})
+
+    def test_cancelled_interior_is_not_cached(self) -> None:
+        """A cancelled interior layout should be retried on the next request."""
+        g = hierarchical_graph()
+        layout = ClusteredLayout(g, cluster_by_hierarchy(g.nodes(), max_cells=4))
+        token = CancellationToken()
+        token.cancel()
+
+        with pytest.raises(LayoutCancelledError):
+            layout.interior("XA", token)
+
+        assert not layout.is_laid_out("XA")
+        assert layout.interior("XA").positions
@@ -0,0 +1,118 @@
+"""Unit tests for CoordinateAssigner (Sugiyama phase 3, Brandes-Köpf).
+
+Test Coverage Goals:
+- Columns follow layers; chains are drawn straight
+- Variable cell heights never overlap within a column
+- Long edges get one bend point per intermediate column
+- Empty orderings
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from collections import defaultdict
+
+import networkx as nx
+import pytest
+
+from ink.domain.value_objects.geometry import Point
+from ink.infrastructure.layout import (
+    CoordinateAssigner,
+    CoordinateAssignment,
+    CrossingMinimizer,
+    LayerAssignmentAlgorithm,
+    LayerOrdering,
+)
+
+
+def ordering_of(graph: nx.DiGraph) -> LayerOrdering:  # type: ignore[no-any-unimported]
+    """Run layer assignment and crossing minimization."""
+    assignment = LayerAssignmentAlgorithm().assign_layers(graph)
+    return CrossingMinimizer().minimize(graph, assignment)
+
+
+def assert_no_overlaps(
+    result: CoordinateAssignment, heights: dict[object, float], spacing: float
+) -> None:
+    """Cells sharing a column must be at least spacing apart."""
+    columns: dict[float, list[tuple[float, float]]] = defaultdict(list)
+    for node, point in result.positions.items():
+        columns[point.x].append((point.y, point.y + heights.get(node, 80.0)))
+    for spans in columns.values():
+        spans.sort()
+        for (_, bottom), (top, _) in itertools.pairwise(spans):
+            assert top >= bottom + spacing - 1e-6
+
+
+class TestPlacement:
+    """Tests for the overall geometry."""
+
+    def test_chain_is_straight(self) -> None:
+        """A simple chain should sit on one row, one column per layer."""
+        g = nx.DiGraph([("IN", "A"), ("A", "B")])
+
+        result = CoordinateAssigner(layer_spacing=80.0, cell_width=120.0).assign(ordering_of(g))
+
+        assert result.positions == {
+            "IN": Point(0.0, 0.0),
+            "A": Point(200.0, 0.0),
+            "B": Point(400.0, 0.0),
+        }
+        assert result.width == 520.0
+        assert result.height == 80.0
+
+    def test_fanout_is_centered_on_driver(self) -> None:
+        """A driver should sit between its two loads."""
+        g = nx.DiGraph([("D", "X"), ("D", "Y")])
+
+        result = CoordinateAssigner(node_spacing=40.0).assign(ordering_of(g))
+
+        positions = result.positions
+        assert positions["Y"].y - positions["X"].y == 120.0
+        assert positions["D"].y == (positions["X"].y + positions["Y"].y) / 2
+
+    def test_long_edge_bend_points(self) -> None:
+        """Dummies should give one bend point per intermediate column."""
+        g = nx.DiGraph([("IN", "A"), ("A", "B"), ("B", "OUT"), ("IN", "OUT")])
+
+        result = CoordinateAssigner().assign(ordering_of(g))
+
+        bends = result.bend_points[("IN", "OUT")]
+        assert [point.x for point in bends] == [260.0, 460.0]
+        assert bends[0].y == bends[1].y
+
+    def test_empty(self) -> None:
+        """An empty ordering should give an empty result."""
+        result = CoordinateAssigner().assign(ordering_of(nx.DiGraph()))
+
+        assert result == CoordinateAssignment(positions={}, bend_points={}, width=0.0, height=0.0)
+
+
+class TestCellSizes:
+    """Tests for variable cell heights."""
+
+    def test_tall_cell_pushes_neighbor(self) -> None:
+        """A tall cell's neighbor should start below it plus spacing."""
+        g = nx.DiGraph([("D", "T"), ("D", "S")])
+        heights = {"T": 170.0}
+
+        result = CoordinateAssigner(node_spacing=40.0).assign(ordering_of(g), heights)
+
+        top, bottom = sorted(("T", "S"), key=lambda n: result.positions[n].y)
+        assert result.positions[bottom].y - result.positions[top].y == (
+            heights.get(top, 80.0) + 40.0
+        )
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_layouts_do_not_overlap(self, seed: int) -> None:
+        """Random graphs with mixed heights should pack without overlap."""
+        rng = random.Random(seed)
+        g = nx.gnp_random_graph(60, 0.05, seed=seed, directed=True)
+        heights: dict[object, float] = {n: rng.choice((80.0, 80.0, 170.0, 320.0)) for n in g}
+
+        result = CoordinateAssigner(node_spacing=30.0).assign(ordering_of(g), heights)
+
+        assert set(result.positions) == set(g.nodes())
+        assert min(point.y for point in result.positions.values()) >= 0.0
+        assert_no_overlaps(result, heights, 30.0)
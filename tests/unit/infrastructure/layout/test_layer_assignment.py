@@ -24,11 +24,15 @@ Acceptance Scenarios from Spec:
 
 from __future__ import annotations
 
+import random
 import time
 
 import networkx as nx
 import pytest
 
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.graph import CellAdjacency, LevelIndex
+from ink.infrastructure.graph.csr import pack_csr
 from ink.infrastructure.layout import LayerAssignment, LayerAssignmentAlgorithm
 
 # =============================================================================
@@ -910,3 +914,291 @@ class TestEdgeCases:
             assert result.layer_map[f"N{i}"] == 0
 
         assert result.layer_count == 1
+
+
+# =============================================================================
+# Test: Precomputed Levels
+# =============================================================================
+
+
+def level_index(graph: nx.DiGraph, sequential: frozenset[str] = frozenset()) -> LevelIndex:
+    """Levelize a cell graph given as a NetworkX DiGraph."""
+    names = list(graph.nodes())
+    position = {name: i for i, name in enumerate(names)}
+    adjacency = CellAdjacency(
+        cell_ids=tuple(CellId(name) for name in names),
+        sequential=bytes(name in sequential for name in names),
+        fanout=pack_csr([position[v] for v in graph.successors(u)] for u in names),
+    )
+    return LevelIndex.build(adjacency)
+
+
+def assert_valid_layering(graph: nx.DiGraph, result: LayerAssignment) -> None:
+    """Every non-reversed edge goes forward; every reversed edge backward."""
+    for u, v in graph.edges():
+        if (u, v) in result.reverse_edges:
+            assert result.layer_map[u] >= result.layer_map[v]
+        else:
+            assert result.layer_map[u] < result.layer_map[v]
+
+
+class TestPrecomputedLevels:
+    """Tests for layering subgraphs with a design-wide LevelIndex."""
+
+    def test_matches_full_algorithm_on_dag(self, diamond_graph: nx.DiGraph) -> None:
+        """On a DAG the rank-based path should give the same layers."""
+        algo = LayerAssignmentAlgorithm(levels=level_index(diamond_graph))
+
+        result = algo.assign_layers(diamond_graph)
+
+        assert result == LayerAssignmentAlgorithm().assign_layers(diamond_graph)
+
+    def test_subgraph_reuses_levels(self, wide_graph: nx.DiGraph) -> None:
+        """Any subgraph should be layered from the same index."""
+        algo = LayerAssignmentAlgorithm(levels=level_index(wide_graph))
+        nodes = list(wide_graph.nodes())[: len(wide_graph) // 2]
+        subgraph = wide_graph.subgraph(nodes)
+
+        result = algo.assign_layers(subgraph)
+
+        assert set(result.layer_map) == set(nodes)
+        assert min(result.layer_map.values()) == 0
+        assert_valid_layering(subgraph, result)
+
+    def test_cycle_edges_reversed(self, simple_cycle_graph: nx.DiGraph) -> None:
+        """Exactly one edge of a simple cycle should be reversed."""
+        algo = LayerAssignmentAlgorithm(levels=level_index(simple_cycle_graph))
+
+        result = algo.assign_layers(simple_cycle_graph)
+
+        assert len(result.reverse_edges) == 1
+        assert result.layer_count == 3
+        assert_valid_layering(simple_cycle_graph, result)
+
+    def test_self_loop_reversed(self) -> None:
+        """Self-loops should be reported as reverse edges."""
+        g = nx.DiGraph()
+        g.add_edges_from([("A", "A"), ("A", "B")])
+
+        result = LayerAssignmentAlgorithm(levels=level_index(g)).assign_layers(g)
+
+        assert ("A", "A") in result.reverse_edges
+        assert result.layer_map == {"A": 0, "B": 1}
+
+    def test_unknown_nodes_fall_back(self, sequential_circuit_graph: nx.DiGraph) -> None:
+        """Nodes missing from the index should use the full algorithm."""
+        cells = sequential_circuit_graph.subgraph(["LOGIC1", "FF", "LOGIC2"])
+        algo = LayerAssignmentAlgorithm(levels=level_index(cells, frozenset({"FF"})))
+
+        result = algo.assign_layers(sequential_circuit_graph)
+
+        assert result == LayerAssignmentAlgorithm().assign_layers(sequential_circuit_graph)
+
+
+class TestIncrementalUpdate:
+    """Tests for LayerAssignmentAlgorithm.update_layers."""
+
+    def test_fanout_expansion(self, simple_chain_graph: nx.DiGraph) -> None:
+        """New fanout cells should be placed right of their driver."""
+        algo = LayerAssignmentAlgorithm()
+        previous = algo.assign_layers(simple_chain_graph)
+        simple_chain_graph.add_edges_from([("A", "X"), ("X", "Y")])
+
+        result = algo.update_layers(previous, simple_chain_graph, added_nodes=["X", "Y"])
+
+        assert result.layer_map == {**previous.layer_map, "X": 2, "Y": 3}
+        assert_valid_layering(simple_chain_graph, result)
+
+    def test_fanin_expansion_keeps_existing_layers(self, simple_chain_graph: nx.DiGraph) -> None:
+        """A new driver of B should land left of B without moving anything."""
+        algo = LayerAssignmentAlgorithm()
+        previous = algo.assign_layers(simple_chain_graph)
+        simple_chain_graph.add_edge("D", "B")
+
+        result = algo.update_layers(previous, simple_chain_graph, added_nodes=["D"])
+
+        assert result.layer_map == {**previous.layer_map, "D": 1}
+
+    def test_push_only_downstream(self) -> None:
+        """A longer new path should push its sink and the sink's fanout only."""
+        g = nx.DiGraph()
+        g.add_edges_from([("IN", "A"), ("A", "OUT"), ("IN", "S"), ("S", "T")])
+        algo = LayerAssignmentAlgorithm()
+        previous = algo.assign_layers(g)
+        g.add_edges_from([("T", "P"), ("P", "A")])
+
+        result = algo.update_layers(previous, g, added_nodes=["P"])
+
+        assert result.layer_map == {"IN": 0, "S": 1, "T": 2, "P": 3, "A": 4, "OUT": 5}
+        assert result.layer_count == 6
+
+    def test_new_edge_closing_cycle_is_reversed(self, simple_chain_graph: nx.DiGraph) -> None:
+        """An edge back to an ancestor should become a feedback edge."""
+        algo = LayerAssignmentAlgorithm()
+        previous = algo.assign_layers(simple_chain_graph)
+        simple_chain_graph.add_edge("C", "A")
+
+        result = algo.update_layers(previous, simple_chain_graph, added_edges=[("C", "A")])
+
+        assert result.reverse_edges == {("C", "A")}
+        assert result.layer_map == previous.layer_map
+
+    def test_removed_nodes_are_dropped(self, simple_cycle_graph: nx.DiGraph) -> None:
+        """Nodes and reverse edges no longer in the graph should disappear."""
+        algo = LayerAssignmentAlgorithm()
+        previous = algo.assign_layers(simple_cycle_graph)
+        ((u, _),) = previous.reverse_edges
+        simple_cycle_graph.remove_node(u)
+
+        result = algo.update_layers(previous, simple_cycle_graph)
+
+        assert u not in result.layer_map
+        assert result.reverse_edges == set()
+
+    def test_self_loop_then_closing_edge(self) -> None:
+        """A self-loop must not flatten the layering or hang a later update."""
+        g = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "C")])
+        algo = LayerAssignmentAlgorithm()
+        previous = algo.assign_layers(g)
+        g.add_edge("C", "A")
+
+        result = algo.update_layers(previous, g, added_edges=[("C", "A")])
+
+        assert previous.layer_map == {"A": 0, "B": 1, "C": 2}
+        assert result.reverse_edges == {("C", "C"), ("C", "A")}
+        assert_valid_layering(g, result)
+
+    def test_inconsistent_previous_is_repaired(self) -> None:
+        """Edges of previous that break the layer order should be oriented again."""
+        g = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "C"), ("C", "A")])
+        previous = LayerAssignment(
+            layer_map={"A": 0, "B": 0, "C": 0}, reverse_edges={("C", "C")}, layer_count=1
+        )
+
+        result = LayerAssignmentAlgorithm().update_layers(previous, g, added_edges=[("C", "A")])
+
+        assert len(result.reverse_edges) == 2
+        assert_valid_layering(g, result)
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_random_expansions_stay_valid(self, seed: int) -> None:
+        """Repeated expansions should keep layers valid and never move cells left."""
+        rng = random.Random(seed)
+        g = nx.DiGraph()
+        g.add_nodes_from(range(5))
+        algo = LayerAssignmentAlgorithm()
+        result = algo.assign_layers(g)
+
+        for step in range(10):
+            new = [5 + step * 4 + k for k in range(4)]
+            nodes = list(g.nodes())
+            edges = [(rng.choice(nodes + new), n) for n in new]
+            edges += [(n, rng.choice(nodes + new)) for n in new]
+            extra = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(2)]
+            extra = [edge for edge in extra if not g.has_edge(*edge)]
+            g.add_edges_from(edges + extra)
+
+            updated = algo.update_layers(result, g, added_nodes=new, added_edges=extra)
+
+            assert set(updated.layer_map) == set(g.nodes())
+            assert all(updated.layer_map[n] >= layer for n, layer in result.layer_map.items())
+            assert_valid_layering(g, updated)
+            result = updated
+
+
+class TestGreedyFeedback:
+    """Tests for the Eades-Lin-Smyth feedback arc set option."""
+
+    def test_reconvergent_loop_reverses_one_edge(self) -> None:
+        """Greedy FAS should reverse only the loop edge where DFS reverses every path."""
+        g = nx.DiGraph()
+        g.add_node("C")  # DFS starting here finds k back edges
+        g.add_edges_from(("A", f"M{i}") for i in range(5))
+        g.add_edges_from((f"M{i}", "C") for i in range(5))
+        g.add_edge("C", "A")
+
+        dfs = LayerAssignmentAlgorithm().assign_layers(g)
+        greedy = LayerAssignmentAlgorithm(feedback="greedy").assign_layers(g)
+
+        assert len(dfs.reverse_edges) == 5
+        assert greedy.reverse_edges == {("C", "A")}
+        assert greedy.layer_map == {"A": 0, "C": 2, **{f"M{i}": 1 for i in range(5)}}
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_graphs_valid_and_within_bound(self, seed: int) -> None:
+        """Layerings should be valid and reverse at most E/2 - V/6 edges."""
+        g = nx.gnp_random_graph(80, 0.06, seed=seed, directed=True)
+        g.remove_edges_from([(u, v) for u, v in list(g.edges()) if u > v and g.has_edge(v, u)])
+
+        result = LayerAssignmentAlgorithm(feedback="greedy").assign_layers(g)
+
+        assert_valid_layering(g, result)
+        assert len(result.reverse_edges) <= g.number_of_edges() / 2 - g.number_of_nodes() / 6
+
+    def test_fewer_reversals_than_dfs(self) -> None:
+        """Over random graphs, greedy should reverse fewer edges than DFS in total."""
+        graphs = [nx.gnp_random_graph(100, 0.04, seed=s, directed=True) for s in range(5)]
+
+        def total(algo: LayerAssignmentAlgorithm) -> int:
+            return sum(len(algo.assign_layers(g).reverse_edges) for g in graphs)
+
+        assert total(LayerAssignmentAlgorithm(feedback="greedy")) < total(
+            LayerAssignmentAlgorithm()
+        )
+
+    def test_skip_sequential_breaks_loops_at_flops(self) -> None:
+        """Flops should sit right of their D logic, with loops cut at their outputs."""
+        g = nx.DiGraph()
+        g.add_node("FF", is_sequential=True)
+        g.add_edges_from([("IN", "A"), ("A", "B"), ("B", "FF"), ("FF", "A"), ("FF", "OUT")])
+
+        result = LayerAssignmentAlgorithm(feedback="greedy", skip_sequential=True).assign_layers(
+            g
+        )
+
+        assert result.reverse_edges == {("FF", "A")}
+        assert result.layer_map["FF"] == result.layer_map["B"] + 1
+        assert_valid_layering(g, result)
+
+    def test_self_loop_is_feedback(self) -> None:
+        """Self-loops should always be marked as feedback edges."""
+        g = nx.DiGraph([("A", "A"), ("A", "B")])
+
+        result = LayerAssignmentAlgorithm(feedback="greedy")._find_feedback_edges_greedy(g)
+
+        assert result == {("A", "A")}
+
+    def test_self_loop_keeps_layering(self) -> None:
+        """A self-loop should not collapse the layers of the rest of the graph."""
+        g = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "C")])
+
+        result = LayerAssignmentAlgorithm(feedback="greedy").assign_layers(g)
+
+        assert result.layer_map == {"A": 0, "B": 1, "C": 2}
+        assert result.reverse_edges == {("C", "C")}
+
+    @pytest.mark.parametrize("skip_sequential", [False, True])
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_graphs_with_self_loops(self, seed: int, skip_sequential: bool) -> None:
+        """Every non-reversed edge should point strictly right despite self-loops."""
+        rng = random.Random(seed)
+        g = nx.gnp_random_graph(60, 0.05, seed=seed, directed=True)
+        g.add_edges_from((n, n) for n in rng.sample(list(g.nodes()), 10))
+        for n in rng.sample(list(g.nodes()), 10):
+            g.nodes[n]["is_sequential"] = True
+
+        result = LayerAssignmentAlgorithm(
+            feedback="greedy", skip_sequential=skip_sequential
+        ).assign_layers(g)
+
+        assert {(n, n) for n in nx.nodes_with_selfloops(g)} <= result.reverse_edges
+        for u, v in g.edges():
+            if (u, v) not in result.reverse_edges:
+                assert result.layer_map[u] < result.layer_map[v]
+            elif u != v:
+                assert result.layer_map[v] < result.layer_map[u]
+
+    def test_unknown_method_rejected(self) -> None:
+        """Unknown feedback strategies should be rejected."""
+        with pytest.raises(ValueError, match="feedback"):
+            LayerAssignmentAlgorithm(feedback="sort")  # type: ignore[arg-type]
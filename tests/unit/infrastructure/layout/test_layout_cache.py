@@ -0,0 +1,163 @@
+"""Unit tests for LayoutCache and layout_signature.
+
+Test Coverage Goals:
+- Signatures depend on the visible graph only, not on insertion order
+- Least recently used layouts are evicted to respect the memory bound
+- Cached layouts round-trip through to_bytes()/from_bytes()
+"""
+
+from __future__ import annotations
+
+import networkx as nx
+import pytest
+
+from ink.domain.value_objects.geometry import LineSegment, NetGeometry, Point
+from ink.domain.value_objects.identifiers import NetId
+from ink.infrastructure.layout import (
+    CachedLayout,
+    CoordinateAssignment,
+    LayerAssignment,
+    LayoutCache,
+    LayoutPipeline,
+    layout_signature,
+)
+
+
+def make_layout(cells: int) -> CachedLayout:
+    """Create a layout of a chain with the given number of cells."""
+    g = nx.path_graph([f"C{i}" for i in range(cells)], create_using=nx.DiGraph)
+    result = LayoutPipeline().run(g)
+    return CachedLayout(result.assignment, result.layers)
+
+
+class TestSignature:
+    """Tests for the canonical subgraph signature."""
+
+    def test_independent_of_insertion_order(self) -> None:
+        """The same view reached in a different order should match."""
+        first = nx.DiGraph([("A", "B"), ("B", "C")])
+        second = nx.DiGraph()
+        second.add_nodes_from(["C", "B", "A"])
+        second.add_edges_from([("B", "C"), ("A", "B")])
+
+        assert layout_signature(first) == layout_signature(second)
+
+    def test_parallel_edges_collapse(self) -> None:
+        """Parallel edges lay out like one edge, so they should match."""
+        multi = nx.MultiDiGraph([("A", "B"), ("A", "B")])
+
+        assert layout_signature(multi) == layout_signature(nx.DiGraph([("A", "B")]))
+
+    def test_structure_and_heights_matter(self) -> None:
+        """Different edges, cells or heights should give different signatures."""
+        g = nx.DiGraph([("A", "B")])
+        signatures = {
+            layout_signature(g),
+            layout_signature(nx.DiGraph([("B", "A")])),
+            layout_signature(nx.DiGraph([("A", "B"), ("A", "C")])),
+            layout_signature(g, {"A": 170.0}),
+            layout_signature(g, {"A": 0.0}),
+        }
+
+        assert len(signatures) == 5
+        assert layout_signature(g, {"A": 80}) == layout_signature(g, {"A": 80.0})
+
+
+class TestLayoutCache:
+    """Tests for the LRU behavior and counters."""
+
+    def test_hit_and_miss(self) -> None:
+        """get() should return the stored layout and count lookups."""
+        cache = LayoutCache()
+        layout = make_layout(3)
+        cache.put("a", layout)
+
+        assert cache.get("a") is layout
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+        assert stats.cached_bytes == layout.estimated_bytes
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Exceeding the bound should drop the least recently used layout."""
+        layout = make_layout(10)
+        cache = LayoutCache(max_bytes=2 * layout.estimated_bytes)
+        cache.put("a", layout)
+        cache.put("b", layout)
+        cache.get("a")
+
+        cache.put("c", layout)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats().evictions == 1
+
+    def test_oversized_layout_is_not_cached(self) -> None:
+        """A layout larger than the bound should leave the cache untouched."""
+        small = make_layout(2)
+        cache = LayoutCache(max_bytes=small.estimated_bytes)
+        cache.put("small", small)
+
+        cache.put("big", make_layout(20))
+
+        assert len(cache) == 1
+        assert "small" in cache
+
+    def test_replace_updates_size(self) -> None:
+        """Putting the same signature twice should not double count."""
+        cache = LayoutCache()
+        cache.put("a", make_layout(10))
+        cache.put("a", make_layout(2))
+
+        assert cache.stats().cached_bytes == make_layout(2).estimated_bytes
+
+
+class TestPersistence:
+    """Tests for serialization."""
+
+    def test_round_trip(self) -> None:
+        """Layouts, geometries and recency order should survive."""
+        geometry = NetGeometry(
+            net_id=NetId("n1"),
+            segments=(LineSegment(Point(0.0, 0.0), Point(10.0, 0.0)),),
+            junctions=(),
+            crossings=(),
+        )
+        layout = make_layout(4)
+        routed = CachedLayout(layout.assignment, layout.layers, {NetId("n1"): geometry})
+        cache = LayoutCache(max_bytes=1 << 20)
+        cache.put("a", layout)
+        cache.put("b", routed)
+        cache.get("a")
+
+        restored = LayoutCache.from_bytes(memoryview(cache.to_bytes()))
+
+        assert restored.max_bytes == 1 << 20
+        assert list(restored._entries) == ["b", "a"]
+        assert restored.get("a") == layout
+        assert restored.get("b") == routed
+
+    def test_bend_points_round_trip(self) -> None:
+        """Bend points of long edges should be restored."""
+        layout = CachedLayout(
+            CoordinateAssignment(
+                positions={"A": Point(0.0, 0.0), "B": Point(400.0, 0.0)},
+                bend_points={("A", "B"): [Point(200.0, 40.0)]},
+                width=520.0,
+                height=80.0,
+            ),
+            LayerAssignment(layer_map={"A": 0, "B": 2}, reverse_edges=set(), layer_count=3),
+        )
+        cache = LayoutCache()
+        cache.put("s", layout)
+
+        assert LayoutCache.from_bytes(cache.to_bytes()).get("s") == layout
+
+    def test_rejects_foreign_data(self) -> None:
+        """Bytes of another format should be rejected."""
+        with pytest.raises(ValueError, match="bad header"):
+            LayoutCache.from_bytes(b"INKSTA\x01\x00{}")
+        with pytest.raises(ValueError, match="bad header"):
+            LayoutCache.from_bytes(b"INK")
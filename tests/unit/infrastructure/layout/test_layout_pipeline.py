@@ -0,0 +1,105 @@
+"""Unit tests for LayoutPipeline and quick_placement.
+
+Test Coverage Goals:
+- The pipeline equals running the three phases by hand
+- Expansions keep existing columns via the previous assignment
+- Cancelled tokens stop the pipeline
+- Quick placement puts loads right and drivers left of their anchors,
+  without overlaps
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import networkx as nx
+import pytest
+
+from ink.domain.value_objects.geometry import Point
+from ink.infrastructure.layout import (
+    CancellationToken,
+    CoordinateAssigner,
+    CrossingMinimizer,
+    LayerAssignmentAlgorithm,
+    LayoutCancelledError,
+    LayoutPipeline,
+    quick_placement,
+)
+
+
+class TestLayoutPipeline:
+    """Tests for the phase composition."""
+
+    def test_matches_phases(self) -> None:
+        """run() should give the same result as the phases in sequence."""
+        g = nx.gnp_random_graph(30, 0.1, seed=3, directed=True)
+        heights = {0: 170.0}
+
+        result = LayoutPipeline().run(g, heights)
+
+        assignment = LayerAssignmentAlgorithm().assign_layers(g)
+        ordering = CrossingMinimizer().minimize(g, assignment)
+        assert result.layers == assignment
+        assert result.assignment == CoordinateAssigner().assign(ordering, heights)
+
+    def test_previous_assignment_keeps_columns(self) -> None:
+        """An expansion should not move existing cells to other columns."""
+        g = nx.DiGraph([("A", "B"), ("B", "C")])
+        pipeline = LayoutPipeline()
+        before = pipeline.run(g)
+        g.add_edges_from([("X", "C"), ("C", "A")])
+
+        after = pipeline.run(g, previous=before.layers)
+
+        for node in "ABC":
+            assert after.assignment.positions[node].x == before.assignment.positions[node].x
+            assert after.layers.layer_map[node] == before.layers.layer_map[node]
+        assert after.assignment.positions["X"].x < after.assignment.positions["C"].x
+
+    def test_cancelled_token(self) -> None:
+        """A cancelled token should stop the run with LayoutCancelledError."""
+        token = CancellationToken()
+        token.cancel()
+
+        with pytest.raises(LayoutCancelledError):
+            LayoutPipeline().run(nx.DiGraph([("A", "B")]), token=token)
+        assert token.cancelled
+
+
+class TestQuickPlacement:
+    """Tests for the provisional placement heuristic."""
+
+    def test_neighbors_of_anchor(self) -> None:
+        """Loads go one column right, drivers one column left."""
+        g = nx.DiGraph([("D", "A"), ("A", "L1"), ("A", "L2")])
+        anchors = {"A": Point(400.0, 120.0)}
+
+        placed = quick_placement(g, anchors, layer_spacing=80.0, cell_width=120.0)
+
+        assert placed == {
+            "D": Point(200.0, 120.0),
+            "L1": Point(600.0, 120.0),
+            "L2": Point(600.0, 240.0),
+        }
+
+    def test_anchors_are_obstacles(self) -> None:
+        """A new cell should skip slots taken by anchored cells."""
+        g = nx.DiGraph([("A", "N")])
+        anchors = {"A": Point(0.0, 0.0), "B": Point(200.0, 0.0)}
+
+        placed = quick_placement(g, anchors, {"B": 170.0})
+
+        assert placed == {"N": Point(200.0, 240.0)}
+
+    def test_unanchored_components_do_not_overlap(self) -> None:
+        """Disconnected new cells should start below everything placed."""
+        g = nx.gnp_random_graph(40, 0.05, seed=2, directed=True)
+        anchors = {0: Point(0.0, 0.0)}
+        heights = {n: 80.0 if n % 3 else 250.0 for n in g}
+
+        placed = quick_placement(g, anchors, heights)
+
+        assert set(placed) == set(g) - {0}
+        boxes = [(p.x, p.y, p.y + heights[n]) for n, p in {**anchors, **placed}.items()]
+        for (x1, top1, bottom1), (x2, top2, bottom2) in itertools.combinations(boxes, 2):
+            assert x1 != x2 or bottom1 <= top2 or bottom2 <= top1
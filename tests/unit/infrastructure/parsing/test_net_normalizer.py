@@ -771,3 +771,58 @@ class TestNetNormalizerPatternMethods:
         # Normalize again - VDD no longer matches (different result)
         info2 = normalizer.normalize("VDD_new")
         assert info2.net_type == NetType.SIGNAL
+
+
+class TestNetNormalizerClockRoots:
+    """Tests for clock root identification (is_clock)."""
+
+    @pytest.mark.parametrize(
+        "name", ["clk", "CLK", "CLK2", "CK", "core_clk", "clk<0>", "CLK_CORE", "CLOCK_IN", "sys_ck"]
+    )
+    def test_default_clock_names(self, name: str) -> None:
+        """Test that common clock names are recognized by default."""
+        assert NetNormalizer().is_clock(name) is True
+
+    @pytest.mark.parametrize("name", ["data", "ckd", "block", "VDD"])
+    def test_non_clock_names(self, name: str) -> None:
+        """Test that other names are not clock roots."""
+        assert NetNormalizer().is_clock(name) is False
+
+    @pytest.mark.parametrize(
+        "name",
+        ["clk_en", "CLKEN", "CLKGATE_EN", "clk_gate", "clock_en", "core_clk_en", "sys_clk_gate"],
+    )
+    def test_enable_nets_are_not_clocks(self, name: str) -> None:
+        """Test that clock enables and gate controls are not clock roots."""
+        assert NetNormalizer().is_clock(name) is False
+
+    @pytest.mark.parametrize("name", ["clkdata", "CLKA_sel", "clocking", "clk_d_en"])
+    def test_data_nets_with_clock_prefix(self, name: str) -> None:
+        """Test that data nets merely starting with CLK are not clock roots."""
+        assert NetNormalizer().is_clock(name) is False
+
+    def test_clock_does_not_change_net_type(self) -> None:
+        """Test that clock nets are still classified as SIGNAL."""
+        assert NetNormalizer().normalize("clk").net_type == NetType.SIGNAL
+
+    def test_custom_clock_names_and_patterns(self) -> None:
+        """Test custom clock names and patterns, including after clearing defaults."""
+        normalizer = NetNormalizer(clock_nets=["PLL_OUT"])
+        normalizer.add_clock_patterns(["^SCLK[0-9]*$"])
+        normalizer.clear_default_patterns()
+
+        assert normalizer.is_clock("pll_out") is True
+        assert normalizer.is_clock("SCLK2") is True
+        assert normalizer.is_clock("clk") is False
+
+    def test_from_config_clock_settings(self) -> None:
+        """Test that from_config applies clock names and patterns."""
+        from ink.infrastructure.config.net_classification_config import (
+            NetClassificationConfig,
+        )
+
+        config = NetClassificationConfig(clock_names=["REF"], clock_patterns=["^MCK$"])
+        normalizer = NetNormalizer.from_config(config)
+
+        assert normalizer.is_clock("REF") is True
+        assert normalizer.is_clock("MCK") is True
@@ -0,0 +1 @@
+"""Unit tests for routing infrastructure module."""
@@ -0,0 +1,120 @@
+"""Unit tests for GeometryStore (array-backed routed geometry).
+
+Test Coverage Goals:
+- NetGeometry views match the geometry that was stored
+- Flat appends are validated and leave the store unchanged on error
+- segment_view() shares memory with the coordinate buffer
+- Stores round-trip through to_bytes()/from_bytes()
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ink.domain.value_objects.geometry import LineSegment, NetGeometry, Point
+from ink.domain.value_objects.identifiers import NetId
+from ink.infrastructure.routing import GeometryStore
+
+L_SHAPE = NetGeometry(
+    net_id=NetId("a"),
+    segments=(
+        LineSegment(Point(0.0, 0.0), Point(10.0, 0.0)),
+        LineSegment(Point(10.0, 0.0), Point(10.0, 5.0)),
+    ),
+    junctions=(Point(10.0, 0.0),),
+    crossings=(Point(4.0, 0.0),),
+)
+STRAIGHT = NetGeometry(
+    net_id=NetId("b"),
+    segments=(LineSegment(Point(0.0, 20.0), Point(40.0, 20.0)),),
+    junctions=(),
+    crossings=(),
+)
+
+
+class TestViews:
+    """Tests for the mapping interface."""
+
+    def test_views_match_stored_geometry(self) -> None:
+        """store[net] should equal the NetGeometry that was added."""
+        store = GeometryStore.from_geometries([L_SHAPE, STRAIGHT])
+
+        assert list(store) == [NetId("a"), NetId("b")]
+        assert store[NetId("a")] == L_SHAPE
+        assert store[NetId("b")] == STRAIGHT
+        assert store[NetId("a")].bend_count == 1
+        assert store == {NetId("a"): L_SHAPE, NetId("b"): STRAIGHT}
+        assert store.segment_count == 3
+
+    def test_missing_net(self) -> None:
+        """Unknown nets should raise KeyError and not be contained."""
+        store = GeometryStore.from_geometries([STRAIGHT])
+
+        assert NetId("a") not in store
+        assert store.get(NetId("a")) is None
+        with pytest.raises(KeyError):
+            store[NetId("a")]
+
+    def test_coordinates_are_float32(self) -> None:
+        """Coordinates should be rounded to float32 precision."""
+        store = GeometryStore()
+        store.append(NetId("n"), [0.0, 1 / 3, 10.0, 1 / 3])
+
+        y = store[NetId("n")].segments[0].start.y
+        assert y != 1 / 3
+        assert y == pytest.approx(1 / 3, abs=1e-7)
+
+
+class TestAppend:
+    """Tests for building the store."""
+
+    def test_rejects_duplicates_and_partial_records(self) -> None:
+        """Bad appends should raise and leave the store unchanged."""
+        store = GeometryStore.from_geometries([STRAIGHT])
+        before = store.nbytes
+
+        with pytest.raises(ValueError, match="already"):
+            store.add(STRAIGHT)
+        with pytest.raises(ValueError, match="multiple of 4"):
+            store.append(NetId("c"), [0.0, 0.0, 1.0])
+        with pytest.raises(ValueError, match="multiple of 2"):
+            store.append(NetId("c"), [], [1.0])
+
+        assert len(store) == 1
+        assert store.nbytes == before
+
+    def test_segment_view_is_zero_copy(self) -> None:
+        """A view should read the buffer and block growth until released."""
+        store = GeometryStore.from_geometries([L_SHAPE, STRAIGHT])
+
+        with store.segment_view(NetId("b")) as coords:
+            assert coords.tolist() == [0.0, 20.0, 40.0, 20.0]
+            store.segment_coords[4 * 2] = 1.0
+            assert coords[0] == 1.0
+            with pytest.raises(BufferError):
+                store.append(NetId("c"), [0.0, 0.0, 1.0, 0.0])
+
+        store.append(NetId("c"), [0.0, 0.0, 1.0, 0.0])
+        assert len(store) == 3
+
+
+class TestPersistence:
+    """Tests for serialization."""
+
+    def test_round_trip(self) -> None:
+        """Arrays and net order should survive serialization."""
+        store = GeometryStore.from_geometries([L_SHAPE, STRAIGHT])
+
+        restored = GeometryStore.from_bytes(memoryview(store.to_bytes()))
+
+        assert restored == store
+        assert restored[NetId("a")] == L_SHAPE
+
+    def test_rejects_bad_data(self) -> None:
+        """Foreign or truncated data should be rejected."""
+        data = GeometryStore.from_geometries([L_SHAPE]).to_bytes()
+
+        with pytest.raises(ValueError, match="bad header"):
+            GeometryStore.from_bytes(b"INKLAY" + data[6:])
+        with pytest.raises(ValueError, match="Truncated"):
+            GeometryStore.from_bytes(data[:60])
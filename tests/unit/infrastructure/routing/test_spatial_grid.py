@@ -0,0 +1,82 @@
+"""Unit tests for SpatialGrid.
+
+Test Coverage Goals:
+- Queries find exactly the intersecting rectangles, across buckets
+- Touching rectangles intersect (closed rectangles)
+- Negative coordinates and argument validation
+- Rectangle lookup by number and the lowest bottom edge
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ink.infrastructure.routing import SpatialGrid
+
+
+class TestSpatialGrid:
+    """Tests for insertion and queries."""
+
+    def test_query_across_buckets(self) -> None:
+        """A long thin query should find rectangles in every bucket it spans."""
+        grid = SpatialGrid(bucket_size=10.0)
+        left = grid.insert(0.0, 0.0, 5.0, 5.0)
+        right = grid.insert(95.0, 0.0, 99.0, 5.0)
+        grid.insert(40.0, 50.0, 60.0, 60.0)
+
+        assert grid.query(0.0, 2.0, 100.0, 3.0) == {left, right}
+        assert len(grid) == 3
+
+    def test_touching_edges_intersect(self) -> None:
+        """Rectangles sharing only an edge should count as intersecting."""
+        grid = SpatialGrid()
+        grid.insert(0.0, 0.0, 120.0, 80.0)
+
+        assert grid.intersects(120.0, 10.0, 200.0, 10.0)
+        assert not grid.intersects(120.5, 10.0, 200.0, 10.0)
+
+    def test_negative_coordinates(self) -> None:
+        """Rectangles left of or above the origin should be found."""
+        grid = SpatialGrid(bucket_size=50.0)
+        number = grid.insert(-130.0, -20.0, -10.0, 60.0)
+
+        assert grid.query(-200.0, 0.0, -100.0, 0.0) == {number}
+        assert not grid.intersects(0.0, -100.0, 10.0, 100.0)
+
+    def test_matches_brute_force(self) -> None:
+        """Random queries should agree with a linear scan."""
+        rng = random.Random(4)
+        grid = SpatialGrid(bucket_size=30.0)
+        rects = []
+        for _ in range(200):
+            x, y = rng.uniform(-500, 500), rng.uniform(-500, 500)
+            rects.append((x, y, x + rng.uniform(0, 120), y + rng.uniform(0, 80)))
+            grid.insert(*rects[-1])
+
+        for _ in range(100):
+            x, y = rng.uniform(-500, 500), rng.uniform(-500, 500)
+            q = (x, y, x + rng.uniform(0, 300), y + rng.uniform(0, 20))
+            expected = {
+                i
+                for i, (x0, y0, x1, y1) in enumerate(rects)
+                if x0 <= q[2] and q[0] <= x1 and y0 <= q[3] and q[1] <= y1
+            }
+            assert grid.query(*q) == expected
+
+    def test_rect_and_bottom(self) -> None:
+        """Rectangles should be readable by number; bottom tracks the lowest edge."""
+        grid = SpatialGrid()
+        assert grid.bottom == float("-inf")
+
+        first = grid.insert(0.0, 10.0, 20.0, 90.0)
+        grid.insert(0.0, -40.0, 20.0, 30.0)
+
+        assert grid.rect(first) == (0.0, 10.0, 20.0, 90.0)
+        assert grid.bottom == 90.0
+
+    def test_invalid_bucket_size(self) -> None:
+        """Non-positive bucket sizes should be rejected."""
+        with pytest.raises(ValueError, match="bucket_size"):
+            SpatialGrid(bucket_size=0.0)
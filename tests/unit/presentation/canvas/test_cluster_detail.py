@@ -0,0 +1,89 @@
+"""Unit tests for ClusterDetailController (zoom-driven cluster expansion).
+
+Test Coverage Goals:
+- Nothing is expanded below the minimum detail level
+- Visible clusters are expanded, off-screen ones collapsed
+- The per-update budget defers further interior layouts
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import networkx as nx
+from PySide6.QtCore import QRectF
+
+from ink.infrastructure.layout import ClusteredLayout, cluster_by_hierarchy
+from ink.presentation.canvas import ClusterDetailController, DetailLevel
+
+if TYPE_CHECKING:
+    from pytestqt.qtbot import QtBot
+
+# Larger than any test layout
+EVERYTHING = QRectF(-1e6, -1e6, 2e6, 2e6)
+
+
+def make_controller(max_cells_per_update: int = 100) -> ClusterDetailController:
+    """Controller over three four-cell blocks in a chain."""
+    g = nx.DiGraph()
+    for block in ("XA", "XB", "XC"):
+        nx.add_path(g, [f"{block}/XI{i}" for i in range(4)])
+    g.add_edges_from([("XA/XI3", "XB/XI0"), ("XB/XI3", "XC/XI0")])
+    layout = ClusteredLayout(g, cluster_by_hierarchy(g.nodes(), max_cells=4))
+    return ClusterDetailController(layout, max_cells_per_update=max_cells_per_update)
+
+
+class TestClusterDetailController:
+    """Tests for expansion by detail level and viewport."""
+
+    def test_minimal_level_shows_no_interiors(self, qtbot: QtBot) -> None:
+        """Zoomed out, every cluster should stay a super-node."""
+        controller = make_controller()
+        shown: list[str] = []
+        controller.interior_shown.connect(lambda name, _: shown.append(name))
+
+        assert controller.update_view(DetailLevel.MINIMAL, EVERYTHING)
+        assert shown == []
+        assert not controller.layout.is_laid_out("XA")
+
+    def test_visible_clusters_expand_and_collapse(self, qtbot: QtBot) -> None:
+        """Only clusters in view should be expanded; zooming out hides them."""
+        controller = make_controller()
+        hidden: list[str] = []
+        controller.interior_hidden.connect(hidden.append)
+        box = controller.layout.boxes["XA"]
+        view = QRectF(box.position.x, box.position.y, 1.0, 1.0)
+
+        controller.update_view(DetailLevel.BASIC, view)
+        assert controller.shown == {"XA"}
+
+        controller.update_view(DetailLevel.FULL, EVERYTHING)
+        assert controller.shown == {"XA", "XB", "XC"}
+
+        controller.update_view(DetailLevel.MINIMAL, EVERYTHING)
+        assert controller.shown == frozenset()
+        assert hidden == ["XA", "XB", "XC"]
+
+    def test_shown_interiors_are_in_scene_coordinates(self, qtbot: QtBot) -> None:
+        """Emitted positions should lie inside the cluster's final box."""
+        controller = make_controller()
+        shown: dict[str, object] = {}
+        controller.interior_shown.connect(shown.__setitem__)
+
+        controller.update_view(DetailLevel.FULL, EVERYTHING)
+
+        for name, box in controller.layout.boxes.items():
+            assignment = controller.layout.interior(name)
+            assert shown[name] == assignment
+            for point in assignment.positions.values():
+                assert box.position.x <= point.x <= box.position.x + box.width
+
+    def test_budget_defers_interior_layouts(self, qtbot: QtBot) -> None:
+        """A small budget should expand one new cluster per update."""
+        controller = make_controller(max_cells_per_update=4)
+
+        assert not controller.update_view(DetailLevel.FULL, EVERYTHING)
+        assert len(controller.shown) == 1
+        assert not controller.update_view(DetailLevel.FULL, EVERYTHING)
+        assert controller.update_view(DetailLevel.FULL, EVERYTHING)
+        assert controller.shown == {"XA", "XB", "XC"}
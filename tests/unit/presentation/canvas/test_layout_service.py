@@ -0,0 +1,174 @@
+"""Unit tests for LayoutService (background layout with progressive placement).
+
+Test Coverage Goals:
+- Quick placement is emitted synchronously, the full layout later
+- A newer request cancels the stale job and drops its result
+- Pipeline errors are reported through layout_failed
+- Cached layouts are restored synchronously without a job
+- animate_to() moves cell items to their refined positions
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import networkx as nx
+
+from ink.domain.model.cell import Cell
+from ink.domain.value_objects.geometry import Point
+from ink.domain.value_objects.identifiers import CellId
+from ink.infrastructure.layout import CancellationToken, LayoutCache, LayoutPipeline
+from ink.presentation.canvas import CellItem, LayoutService
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytestqt.qtbot import QtBot
+
+    from ink.infrastructure.layout import LayerAssignment, LayoutResult
+
+
+class BlockingPipeline(LayoutPipeline):
+    """Pipeline whose first run waits until released."""
+
+    def __init__(self) -> None:
+        """Create the pipeline with an unreleased gate."""
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.tokens: list[CancellationToken | None] = []
+
+    def run(  # type: ignore[no-any-unimported]
+        self,
+        graph: nx.DiGraph | nx.MultiDiGraph,
+        heights: Mapping[Any, float] | None = None,
+        token: CancellationToken | None = None,
+        previous: LayerAssignment | None = None,
+    ) -> LayoutResult:
+        """Block the first call, then lay out normally."""
+        self.tokens.append(token)
+        if len(self.tokens) == 1:
+            self.started.set()
+            self.release.wait(5.0)
+        return super().run(graph, heights, token, previous)
+
+
+class FailingPipeline(LayoutPipeline):
+    """Pipeline that always raises."""
+
+    def run(self, *_args: object, **_kwargs: object) -> LayoutResult:
+        """Raise a layout error."""
+        raise RuntimeError("no layers")
+
+
+def make_item(name: str) -> CellItem:
+    """Create a cell item for a buffer."""
+    return CellItem(Cell(id=CellId(name), name=name, cell_type="BUF_X1", pin_ids=[]))
+
+
+class TestRequests:
+    """Tests for the request/response flow."""
+
+    def test_quick_then_full_layout(self, qtbot: QtBot) -> None:
+        """Quick positions arrive at once, the full layout from the worker."""
+        service = LayoutService()
+        quick: list[tuple[int, object]] = []
+        service.quick_layout_ready.connect(lambda job, pos: quick.append((job, pos)))
+        g = nx.DiGraph([("A", "B")])
+
+        with qtbot.waitSignal(service.layout_ready, timeout=5000) as blocker:
+            job = service.request_layout(g, anchors={"A": Point(0.0, 0.0)})
+            assert quick == [(job, {"B": Point(200.0, 0.0)})]
+            assert service.is_busy
+
+        assert blocker.args is not None
+        assert blocker.args[0] == job
+        assert blocker.args[1] == LayoutPipeline().run(g)
+        assert not service.is_busy
+
+    def test_newer_request_cancels_stale_job(self, qtbot: QtBot) -> None:
+        """Only the newest job should reach layout_ready."""
+        pipeline = BlockingPipeline()
+        service = LayoutService(pipeline)
+        results: list[int] = []
+        service.layout_ready.connect(lambda job, _: results.append(job))
+
+        first = service.request_layout(nx.DiGraph([("A", "B")]))
+        assert pipeline.started.wait(5.0)
+        with qtbot.waitSignal(service.layout_ready, timeout=5000):
+            second = service.request_layout(nx.DiGraph([("A", "B"), ("B", "C")]))
+            pipeline.release.set()
+
+        assert service.wait(5000)
+        qtbot.wait(10)
+        assert results == [second]
+        assert first != second
+        assert pipeline.tokens[0] is not None
+        assert pipeline.tokens[0].cancelled
+
+    def test_failure_is_reported(self, qtbot: QtBot) -> None:
+        """Pipeline errors should arrive as layout_failed with the message."""
+        service = LayoutService(FailingPipeline())
+
+        with qtbot.waitSignal(service.layout_failed, timeout=5000) as blocker:
+            job = service.request_layout(nx.DiGraph([("A", "B")]))
+
+        assert blocker.args == [job, "no layers"]
+        assert not service.is_busy
+
+
+class TestCache:
+    """Tests for restoring layouts from a LayoutCache."""
+
+    def test_revisited_view_is_instant(self, qtbot: QtBot) -> None:
+        """A view laid out before should be answered before returning."""
+        pipeline = BlockingPipeline()
+        pipeline.release.set()
+        service = LayoutService(pipeline, cache=LayoutCache())
+        g = nx.DiGraph([("A", "B")])
+        with qtbot.waitSignal(service.layout_ready, timeout=5000) as first:
+            service.request_layout(g)
+        results: list[tuple[int, object]] = []
+        service.layout_ready.connect(lambda job, result: results.append((job, result)))
+
+        same = nx.DiGraph()
+        same.add_nodes_from(["B", "A"])
+        same.add_edge("A", "B")
+        job = service.request_layout(same)
+
+        assert first.args is not None
+        assert results == [(job, first.args[1])]
+        assert not service.is_busy
+        assert len(pipeline.tokens) == 1
+        assert service.cache is not None
+        assert service.cache.stats().hits == 1
+
+
+class TestAnimation:
+    """Tests for animating cells to refined positions."""
+
+    def test_animate_to_reaches_targets(self, qtbot: QtBot) -> None:
+        """Items should end at their targets; others should not move."""
+        service = LayoutService()
+        items = {"A": make_item("A"), "B": make_item("B")}
+        items["B"].set_position(10.0, 20.0)
+
+        animation = service.animate_to(items, {"A": Point(200.0, 120.0)}, duration_ms=50)
+
+        with qtbot.waitSignal(animation.finished, timeout=2000):
+            pass
+        assert (items["A"].pos().x(), items["A"].pos().y()) == (200.0, 120.0)
+        assert (items["B"].pos().x(), items["B"].pos().y()) == (10.0, 20.0)
+
+    def test_new_request_stops_animation(self) -> None:
+        """Starting a new layout should stop a running animation."""
+        service = LayoutService()
+        animation = service.animate_to(
+            {"A": make_item("A")}, {"A": Point(500.0, 0.0)}, duration_ms=10_000
+        )
+
+        service.request_layout(nx.DiGraph([("A", "B")]))
+
+        assert animation.state() == animation.State.Stopped
+        service.wait(5000)
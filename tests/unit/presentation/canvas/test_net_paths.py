@@ -0,0 +1,72 @@
+"""Unit tests for build_net_path (GeometryStore to QPainterPath).
+
+Test Coverage Goals:
+- Touching segments become one subpath, separate runs start new ones
+- A subset of nets can be selected
+- The bulk-built path equals one built with moveTo()/lineTo()
+"""
+
+from __future__ import annotations
+
+import pytest
+from PySide6.QtGui import QPainterPath
+
+from ink.domain.value_objects.identifiers import NetId
+from ink.infrastructure.routing import GeometryStore
+from ink.presentation.canvas import build_net_path
+
+
+def elements(path: QPainterPath) -> list[tuple[int, float, float]]:
+    """List a path's elements as (type, x, y)."""
+    return [
+        (path.elementAt(i).type.value, path.elementAt(i).x, path.elementAt(i).y)
+        for i in range(path.elementCount())
+    ]
+
+
+@pytest.fixture
+def store() -> GeometryStore:
+    """An L-shaped net with a branch, and a straight net."""
+    store = GeometryStore()
+    store.append(NetId("a"), [0.0, 0.0, 10.0, 0.0, 10.0, 0.0, 10.0, 5.0, 10.0, 0.0, 20.0, 0.0])
+    store.append(NetId("b"), [0.0, 20.0, 40.0, 20.0])
+    return store
+
+
+class TestBuildNetPath:
+    """Tests for the batched path."""
+
+    def test_polylines_and_subpaths(self, store: GeometryStore) -> None:
+        """Connected segments should share a subpath; others start a new one."""
+        path = build_net_path(store)
+
+        assert elements(path) == [
+            (0, 0.0, 0.0),
+            (1, 10.0, 0.0),
+            (1, 10.0, 5.0),
+            (0, 10.0, 0.0),
+            (1, 20.0, 0.0),
+            (0, 0.0, 20.0),
+            (1, 40.0, 20.0),
+        ]
+
+    def test_matches_incremental_path(self, store: GeometryStore) -> None:
+        """The path should equal one built element by element."""
+        expected = QPainterPath()
+        expected.moveTo(0.0, 20.0)
+        expected.lineTo(40.0, 20.0)
+
+        path = build_net_path(store, [NetId("b")])
+
+        assert path == expected
+        assert path.boundingRect() == expected.boundingRect()
+
+    def test_empty_selection(self, store: GeometryStore) -> None:
+        """No nets should give an empty path."""
+        assert build_net_path(store, []).isEmpty()
+        assert build_net_path(GeometryStore()).isEmpty()
+
+    def test_unknown_net(self, store: GeometryStore) -> None:
+        """Requesting a net that is not stored should raise KeyError."""
+        with pytest.raises(KeyError):
+            build_net_path(store, [NetId("missing")])
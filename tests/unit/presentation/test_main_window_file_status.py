@@ -401,6 +401,34 @@ class TestUpdateObjectCountStatusUpdates:
         assert main_window.object_count_label.text() == "Cells: 42 / Nets: 84"
 
 
+class TestUpdateGraphStatistics:
+    """Tests for update_graph_statistics() status bar display."""
+
+    def test_shows_summary_and_report(self, main_window: InkMainWindow) -> None:
+        """Summary should flash in the status bar; report goes to the tooltip."""
+        stats = Mock()
+        stats.format_summary.return_value = "3 cells · 4 nets · max fanout 2 (clk)"
+        stats.format_report.return_value = "Design: top"
+
+        main_window.update_graph_statistics(stats)
+
+        assert main_window.statusBar().currentMessage() == (
+            "3 cells · 4 nets · max fanout 2 (clk)"
+        )
+        assert main_window.object_count_label.toolTip() == "Design: top"
+
+    def test_none_clears_report(self, main_window: InkMainWindow) -> None:
+        """Closing the design should clear the report tooltip."""
+        stats = Mock()
+        stats.format_summary.return_value = "3 cells"
+        stats.format_report.return_value = "Design: top"
+        main_window.update_graph_statistics(stats)
+
+        main_window.update_graph_statistics(None)
+
+        assert main_window.object_count_label.toolTip() == ""
+
+
 # =============================================================================
 # Test Classes - _update_view_counts() Helper Method
 # =============================================================================